@@ -28,6 +28,7 @@ from modules.observability import (
     ConfigurationError
 )
 from modules.observability.rate_limiter import init_rate_limiter as init_monitoring_rate_limiter
+from modules.observability.multiprocess_metrics import get_multiprocess_metrics
 
 # Webhook handlers moved to archived_files/ - no longer using Make.com integration
 # from modules.webhook_handler import webhook_bp
@@ -374,7 +375,22 @@ def health_check():
 
 @app.route('/metrics')
 def metrics_endpoint():
-    """Metrics endpoint for monitoring and observability"""
+    """
+    Metrics endpoint for monitoring and observability
+
+    Serves the Prometheus text exposition (aggregated across all gunicorn
+    workers) when multi-process metrics are enabled and the client prefers
+    text/plain (Prometheus scrapers) or passes ?format=prometheus. Otherwise
+    returns this worker's JSON metrics export.
+    """
+    shared_metrics = get_multiprocess_metrics()
+    wants_text = (
+        request.args.get('format') == 'prometheus'
+        or request.accept_mimetypes.best_match(['application/json', 'text/plain']) == 'text/plain'
+    )
+    if shared_metrics and wants_text:
+        return shared_metrics.render(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
     # Export all metrics
     metrics_data = metrics_collector.export_metrics()
 
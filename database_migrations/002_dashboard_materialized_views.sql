@@ -169,11 +169,15 @@ LIMIT 20;
 -- CREATE EXTENSION IF NOT EXISTS pg_cron;
 -- SELECT cron.schedule('refresh-app-summary', '*/5 * * * *', 'SELECT refresh_application_summary();');
 
--- Option 2: Python cron job (recommended for this project)
--- Add to crontab: */5 * * * * /usr/bin/python3 /path/to/refresh_materialized_views.py
+-- Option 2: In-app refresh coordinator (recommended for this project)
+-- modules/database/materialized_view_refresher.py debounces refreshes triggered by
+-- writes to job_applications, holds pg_try_advisory_lock so only one worker refreshes,
+-- and enforces a per-view max_staleness (MV_REFRESH_MAX_STALENESS_SECONDS, default 300).
+-- NOTE: CONCURRENTLY requires a unique index, created by
+-- 008_application_summary_mv_unique_index.sql
 
 -- Option 3: Manual refresh via API endpoint
--- POST /api/admin/refresh-materialized-views
+-- POST /api/v2/dashboard/materialized-views/refresh
 
 -- ============================================================
 -- ROLLBACK SCRIPT
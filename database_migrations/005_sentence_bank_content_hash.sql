@@ -0,0 +1,21 @@
+-- Migration 005: Sentence Bank Content Hash Indexes
+-- Created: 2026-10-18
+-- Purpose: Unique content hash per sentence bank table so CSV bulk loads can
+--          merge with INSERT ... ON CONFLICT ((md5(content_text))) DO NOTHING
+--          instead of one duplicate-check SELECT per row
+--          (see modules/content/copywriting_evaluator/sentence_bulk_loader.py)
+
+-- md5() keeps the index entries small; content_text may be up to 10,000 chars,
+-- which exceeds the btree entry limit when indexed directly.
+
+-- Existing duplicates make the CREATE UNIQUE INDEX fail. Check first with:
+--   SELECT md5(content_text), COUNT(*) FROM sentence_bank_cover_letter
+--   GROUP BY 1 HAVING COUNT(*) > 1;
+--   SELECT md5(content_text), COUNT(*) FROM sentence_bank_resume
+--   GROUP BY 1 HAVING COUNT(*) > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_sentence_bank_cover_letter_content_md5
+    ON sentence_bank_cover_letter (md5(content_text));
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_sentence_bank_resume_content_md5
+    ON sentence_bank_resume (md5(content_text));
@@ -0,0 +1,25 @@
+-- Migration 006: Copywriting Verdict Cache
+-- Created: 2026-10-18
+-- Purpose: Content-addressed store of truthfulness, tone and skill stage
+--          results so identical sentences (seed variation runs) are not
+--          re-evaluated by Gemini
+--          (see modules/content/copywriting_evaluator/verdict_cache.py)
+
+-- text_hash is SHA-256 of the normalized sentence text; prompt_version is a
+-- hash of the stage's static prompt prefix, so prompt changes start fresh.
+
+CREATE TABLE IF NOT EXISTS copywriting_verdict_cache (
+    text_hash CHAR(64) NOT NULL,
+    stage_name VARCHAR(50) NOT NULL,
+    prompt_version VARCHAR(64) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    verdict JSONB NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    last_hit_at TIMESTAMP,
+    PRIMARY KEY (text_hash, stage_name, prompt_version, model)
+);
+
+-- Pruning stale prompt versions / unused entries
+CREATE INDEX IF NOT EXISTS idx_copywriting_verdict_cache_last_used
+    ON copywriting_verdict_cache (stage_name, COALESCE(last_hit_at, created_at));
@@ -0,0 +1,30 @@
+-- Migration 007: Set-Based Pre-Analyzed Transfer
+-- Created: 2026-10-18
+-- Purpose: Track which cleaned_job_scrapes rows the pre_analyzed_jobs transfer
+--          has consumed (duplicates included) and enforce one pre_analyzed_jobs
+--          row per deduplication key, so the transfer can select with an
+--          indexed range scan and insert with ON CONFLICT DO NOTHING
+--          (see WorkflowManager.transfer_cleaned_to_pre_analyzed in
+--          modules/database/workflow_manager.py)
+
+ALTER TABLE cleaned_job_scrapes
+    ADD COLUMN IF NOT EXISTS pre_analyzed_at TIMESTAMP;
+
+-- Rows already transferred before this migration
+UPDATE cleaned_job_scrapes c
+SET pre_analyzed_at = p.created_at
+FROM pre_analyzed_jobs p
+WHERE p.cleaned_scrape_id = c.cleaned_job_id
+AND c.pre_analyzed_at IS NULL;
+
+-- Transfer selection: WHERE pre_analyzed_at IS NULL ORDER BY cleaned_timestamp DESC
+CREATE INDEX IF NOT EXISTS idx_cleaned_job_scrapes_pending_pre_analysis
+    ON cleaned_job_scrapes (cleaned_timestamp DESC)
+    WHERE pre_analyzed_at IS NULL;
+
+-- Existing duplicates make the CREATE UNIQUE INDEX fail. Check first with:
+--   SELECT deduplication_key, COUNT(*) FROM pre_analyzed_jobs
+--   GROUP BY 1 HAVING COUNT(*) > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_pre_analyzed_jobs_deduplication_key
+    ON pre_analyzed_jobs (deduplication_key);
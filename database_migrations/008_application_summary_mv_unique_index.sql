@@ -0,0 +1,13 @@
+-- Migration 008: Unique Index for Concurrent Materialized View Refresh
+-- Created: 2026-10-18
+-- Purpose: REFRESH MATERIALIZED VIEW CONCURRENTLY requires a unique index on
+--          every refreshed view. Without it MaterializedViewRefresher
+--          (modules/database/materialized_view_refresher.py) falls back to a
+--          blocking refresh that locks out dashboard reads. One index per view
+--          in DEFAULT_VIEWS.
+
+-- application_summary_mv has one row per job_applications.id. The name matches
+-- 002_dashboard_materialized_views_FIXED.sql so databases built from that
+-- script skip this statement.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_app_summary_application_id
+    ON application_summary_mv (application_id);
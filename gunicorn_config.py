@@ -6,6 +6,7 @@ with appropriate worker counts, timeouts, and logging for production use.
 """
 
 import os
+import glob
 import multiprocessing
 
 # Server Socket
@@ -91,12 +92,30 @@ limit_request_line = 4094
 limit_request_fields = 100
 limit_request_field_size = 8190
 
+# Multi-process metrics: workers write counters/histograms to per-process files
+# in this directory and /metrics aggregates them (see modules/observability/multiprocess_metrics.py)
+metrics_multiproc_dir = os.environ.setdefault('METRICS_MULTIPROC_DIR', '/tmp/merlin_metrics')
+
+# Shared circuit breakers: once any worker trips a breaker, every worker short-circuits
+# (see modules/resilience/shared_circuit_state.py); other processes set the same variable to join
+circuit_breaker_state_dir = os.environ.setdefault('CIRCUIT_BREAKER_STATE_DIR', '/tmp/merlin_circuit_breakers')
+
 # Server Hooks
 def on_starting(server):
     """Called just before the master process is initialized."""
     server.log.info("Starting Merlin Job Application System")
     server.log.info(f"Workers: {workers}, Timeout: {timeout}s")
 
+    # Clear counters left over from a previous run before any worker writes
+    from modules.observability.multiprocess_metrics import clear_multiprocess_directory
+    clear_multiprocess_directory(metrics_multiproc_dir)
+    server.log.info(f"Multi-process metrics directory: {metrics_multiproc_dir}")
+
+    # Start with every breaker closed
+    os.makedirs(circuit_breaker_state_dir, exist_ok=True)
+    for stale_file in glob.glob(os.path.join(circuit_breaker_state_dir, '*.breaker')):
+        os.remove(stale_file)
+
 def on_reload(server):
     """Called to recycle workers during a reload via SIGHUP."""
     server.log.info("Reloading Merlin Job Application System")
@@ -2,8 +2,9 @@
 Module: ai_analyzer.py
 Purpose: Google Gemini AI integration for job description analysis
 Created: 2024-08-25
-Modified: 2025-10-21
-Dependencies: google-genai, requests, modules.security.security_patch
+Modified: 2026-10-18
+Dependencies: google-genai, requests, modules.security.security_patch,
+              modules.resilience.timeout_manager
 Related: batch_analyzer.py, prompt_security_manager.py, ai_integration_routes.py
 Description: Core AI analyzer using Google Gemini for skills extraction, job
              authenticity validation, and industry classification. Implements
@@ -23,6 +24,12 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
 from modules.security.security_patch import SecurityPatch
+from modules.resilience.timeout_manager import (
+    ResilienceTimeoutError,
+    bounded_timeout,
+    hedged_call,
+    sleep_within_deadline,
+)
 
 
 # On-demand loading of external dependencies
@@ -339,6 +346,10 @@ class GeminiJobAnalyzer:
         self.max_retries = 3
         self.retry_delay = 1.0
 
+        # Hedged requests: resend a request slower than the model's recent p95
+        # to the fallback model and take whichever answers first
+        self.hedge_requests = os.environ.get("GEMINI_HEDGED_REQUESTS", "false").lower() == "true"
+
         # Initialize optimization modules
         from modules.ai_job_description_analysis.token_optimizer import TokenOptimizer
         from modules.ai_job_description_analysis.model_selector import ModelSelector
@@ -1115,6 +1126,19 @@ class GeminiJobAnalyzer:
             logger.warning(f"Error fetching models from API: {e}, using cached list")
             return self.available_models
 
+    def _get_hedge_model(self) -> Optional[str]:
+        """
+        Free-tier model to send a hedged copy of a slow request to
+
+        Returns:
+            str: Model other than the current one, or None if every free
+                 alternative is overloaded
+        """
+        for model_id in (self.fallback_model, self.primary_model):
+            if model_id != self.current_model and model_id not in self._503_tried_models:
+                return model_id
+        return None
+
     def _get_next_available_model(self) -> str:
         """
         Get the next available model to try when current model returns 503.
@@ -1434,17 +1458,31 @@ DESCRIPTION: {sanitized_description[:2000]}...
             },
         }
 
+        def post(model: str):
+            # Construct full API endpoint URL
+            api_endpoint = f"{self.base_url}/v1beta/models/{model}:generateContent?key={self.api_key}"
+            return model, requests.post(
+                api_endpoint,
+                headers=headers,
+                json=data,
+                timeout=bounded_timeout(30, "gemini_request"),
+            )
+
         for attempt in range(self.max_retries):
             try:
-                # Construct full API endpoint URL
-                api_endpoint = f"{self.base_url}/v1beta/models/{self.current_model}:generateContent?key={self.api_key}"
-
-                response = requests.post(
-                    api_endpoint,
-                    headers=headers,
-                    json=data,
-                    timeout=30,
-                )
+                hedge_model = self._get_hedge_model() if self.hedge_requests else None
+                if hedge_model:
+                    primary_model = self.current_model
+                    model, response = hedged_call(
+                        lambda: post(primary_model),
+                        lambda: post(hedge_model),
+                        operation_name=f"gemini_request:{primary_model}",
+                        accept=lambda result: result[1].status_code == 200,
+                    )
+                    if model != primary_model:
+                        logger.info(f"Hedged request to {model} answered before {primary_model}")
+                else:
+                    model, response = post(self.current_model)
 
                 if response.status_code == 200:
                     # Reset 503 tracking on success
@@ -1470,7 +1508,10 @@ DESCRIPTION: {sanitized_description[:2000]}...
                             f"Switching from {self.current_model} to {fallback_model} "
                             f"after 30 second delay..."
                         )
-                        time.sleep(30)  # Wait 30 seconds before trying different model
+                        # Wait 30 seconds before trying different model
+                        if not sleep_within_deadline(30):
+                            logger.error("Deadline reached before switching model")
+                            break
                         self.current_model = fallback_model
                         self.model_switches += 1
                         continue
@@ -1482,7 +1523,9 @@ DESCRIPTION: {sanitized_description[:2000]}...
                                 f"No alternative models available. "
                                 f"Waiting {wait_time}s before retry..."
                             )
-                            time.sleep(wait_time)
+                            if not sleep_within_deadline(wait_time):
+                                logger.error("Deadline reached before retry")
+                                break
                             continue
                         else:
                             response_text = getattr(
@@ -1496,7 +1539,9 @@ DESCRIPTION: {sanitized_description[:2000]}...
                 elif response.status_code == 429:  # Rate limit
                     wait_time = self.retry_delay * (2**attempt)
                     logger.warning(f"Rate limited, waiting {wait_time}s")
-                    time.sleep(wait_time)
+                    if not sleep_within_deadline(wait_time):
+                        logger.error("Deadline reached before retry")
+                        break
                     continue
 
                 else:
@@ -1509,7 +1554,13 @@ DESCRIPTION: {sanitized_description[:2000]}...
                     f"Request timeout, attempt {attempt + 1}/{self.max_retries}"
                 )
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                    if not sleep_within_deadline(self.retry_delay):
+                        logger.error("Deadline reached before retry")
+                        break
+
+            except ResilienceTimeoutError as e:
+                logger.error(f"Request not sent: {e}")
+                break
 
             except Exception as e:
                 logger.error(f"Request failed: {str(e)}")
@@ -19,6 +19,7 @@ import time
 from datetime import datetime, time as dt_time
 from typing import Dict, List, Optional
 from modules.database.database_manager import DatabaseManager
+from modules.resilience.timeout_manager import deadline_scope
 from modules.ai_job_description_analysis.tier1_analyzer import Tier1CoreAnalyzer
 from modules.ai_job_description_analysis.tier2_analyzer import Tier2EnhancedAnalyzer
 from modules.ai_job_description_analysis.tier3_analyzer import Tier3StrategicAnalyzer
@@ -262,12 +263,30 @@ class SequentialBatchScheduler:
             logger.info("Outside all tier processing windows")
             return None
 
-        if active_tier == 1:
-            return self.run_tier1_batch()
-        elif active_tier == 2:
-            return self.run_tier2_batch()
-        elif active_tier == 3:
-            return self.run_tier3_batch()
+        # Every Gemini call and retry in the tier shares the window's remaining time
+        now = current_time or datetime.now()
+        with deadline_scope(self.get_window_remaining(active_tier, now), f"tier{active_tier}_window"):
+            if active_tier == 1:
+                return self.run_tier1_batch()
+            elif active_tier == 2:
+                return self.run_tier2_batch()
+            elif active_tier == 3:
+                return self.run_tier3_batch()
+
+    def get_window_remaining(self, tier: int, current_time: datetime) -> float:
+        """
+        Seconds until the tier's processing window closes
+
+        Args:
+            tier: Tier number (1-3)
+            current_time: Time inside the tier's window
+
+        Returns:
+            Seconds remaining in the window
+        """
+        window_end = {1: self.TIER1_END, 2: self.TIER2_END, 3: self.TIER3_END}[tier]
+        end = datetime.combine(current_time.date(), window_end)
+        return max(0.0, (end - current_time.replace(tzinfo=None)).total_seconds())
 
     def run_full_sequential_batch(
         self,
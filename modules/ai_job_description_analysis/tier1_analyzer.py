@@ -17,6 +17,7 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from modules.database.database_manager import DatabaseManager
 from modules.ai_job_description_analysis.ai_analyzer import GeminiJobAnalyzer
+from modules.resilience.timeout_manager import deadline_exceeded, sleep_within_deadline
 from modules.ai_job_description_analysis.prompts.tier1_core_prompt import create_tier1_core_prompt
 
 logger = logging.getLogger(__name__)
@@ -261,6 +262,7 @@ class Tier1CoreAnalyzer:
             'total_jobs': len(job_ids),
             'successful': 0,
             'failed': 0,
+            'deferred': 0,  # Left for the next run once the deadline passed
             'total_tokens': 0,
             'response_times': []
         }
@@ -269,6 +271,10 @@ class Tier1CoreAnalyzer:
             batch = job_ids[i:i + batch_size]
 
             for job_id in batch:
+                if deadline_exceeded():
+                    results['deferred'] += 1
+                    continue
+
                 try:
                     # Get job data from database
                     job_data = self._get_job_data(job_id)
@@ -295,7 +301,10 @@ class Tier1CoreAnalyzer:
 
             # Small delay between batches to respect rate limits
             if i + batch_size < len(job_ids):
-                time.sleep(1)
+                sleep_within_deadline(1)
+
+        if results['deferred']:
+            logger.warning(f"Deadline reached, {results['deferred']} jobs deferred to the next run")
 
         # Calculate statistics
         total_time = time.time() - start_time
@@ -17,6 +17,7 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from modules.database.database_manager import DatabaseManager
 from modules.ai_job_description_analysis.ai_analyzer import GeminiJobAnalyzer
+from modules.resilience.timeout_manager import deadline_exceeded, sleep_within_deadline
 from modules.ai_job_description_analysis.prompts.tier3_strategic_prompt import create_tier3_strategic_prompt
 
 logger = logging.getLogger(__name__)
@@ -222,6 +223,7 @@ class Tier3StrategicAnalyzer:
             'total_jobs': len(job_ids),
             'successful': 0,
             'failed': 0,
+            'deferred': 0,  # Left for the next run once the deadline passed
             'total_tokens': 0,
             'response_times': []
         }
@@ -230,6 +232,10 @@ class Tier3StrategicAnalyzer:
             batch = job_ids[i:i + batch_size]
 
             for job_id in batch:
+                if deadline_exceeded():
+                    results['deferred'] += 1
+                    continue
+
                 try:
                     # Get job data and previous tier results
                     job_data = self._get_job_data(job_id)
@@ -263,7 +269,10 @@ class Tier3StrategicAnalyzer:
 
             # Small delay between batches
             if i + batch_size < len(job_ids):
-                time.sleep(1)
+                sleep_within_deadline(1)
+
+        if results['deferred']:
+            logger.warning(f"Deadline reached, {results['deferred']} jobs deferred to the next run")
 
         # Calculate statistics
         total_time = time.time() - start_time
@@ -11,6 +11,7 @@ Design Principles:
 - Comprehensive metadata tracking
 """
 
+import asyncio
 import os
 import logging
 from typing import Dict, Optional, List, Any
@@ -139,8 +140,9 @@ class ScreenshotManager:
             if additional_metadata:
                 metadata.update(additional_metadata)
 
-            # Store screenshot using storage backend
-            storage_result = self.storage.save(
+            # Store screenshot off the event loop (uploads can take seconds)
+            storage_result = await asyncio.to_thread(
+                self.storage.save,
                 filename=f"{self.screenshot_dir}/{filename}",
                 content=screenshot_bytes,
                 metadata={
@@ -211,8 +213,9 @@ class ScreenshotManager:
                 "page_url": page.url,
             }
 
-            # Store screenshot
-            storage_result = self.storage.save(
+            # Store screenshot off the event loop
+            storage_result = await asyncio.to_thread(
+                self.storage.save,
                 filename=f"{self.screenshot_dir}/{filename}",
                 content=screenshot_bytes,
                 metadata={"content_type": "image/jpeg", "document_type": "field_screenshot", **metadata},
@@ -10,7 +10,9 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from sqlalchemy import text
 from ..database.database_client import DatabaseClient
+from ..database.materialized_view_refresher import notify_table_write
 from .tone_analyzer import ToneAnalyzer
+from .sentence_bank_index import get_sentence_bank_indexes
 
 
 class ContentManager:
@@ -21,6 +23,8 @@ class ContentManager:
     def __init__(self):
         self.db_client = DatabaseClient()
         self.tone_analyzer = ToneAnalyzer()
+        # Approved-bank indexes shared by every job (rebuilt when a bank changes)
+        self.sentence_indexes = get_sentence_bank_indexes()
         self.logger = logging.getLogger(__name__)
 
     def seed_content_library(self):
@@ -190,6 +194,7 @@ class ContentManager:
                     },
                 )
 
+        self.sentence_indexes.invalidate()
         logging.info("Content library seeded with approved sentences")
 
     def select_content_for_job(self, job_data: Dict) -> Dict:
@@ -220,30 +225,9 @@ class ContentManager:
         if job_keywords is None:
             job_keywords = []
 
-        with self.db_client.get_session() as session:
-            # Get all approved resume content
-            result = session.execute(
-                text(
-                    """
-                SELECT * FROM sentence_bank_resume 
-                WHERE stage = 'Approved'
-                """
-                )
-            ).fetchall()
-
-            sentences = [dict(row._mapping) for row in result]
-
-        # Score and select sentences using new algorithm
-        scored_sentences = []
-        for sentence in sentences:
-            score = self._calculate_composite_score(sentence, job_skills, job_keywords)
-            scored_sentences.append((sentence, score))
-
-        # Sort by score and select top sentences
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
-        selected = [sentence for sentence, score in scored_sentences[:6]]  # Top 6 for resume
-
-        return selected
+        # Score all approved resume content against the shared index and select the top 6
+        index = self.sentence_indexes.get("sentence_bank_resume")
+        return index.ranked(job_skills, job_keywords, limit=6)
 
     def _select_cover_letter_content(self, job_data: Dict) -> List[Dict]:
         """
@@ -253,17 +237,7 @@ class ContentManager:
         job_skills = job_data.get("skills_required", [])
         job_keywords = job_data.get("keywords", [])
 
-        with self.db_client.get_session() as session:
-            result = session.execute(
-                text(
-                    """
-                SELECT * FROM sentence_bank_cover_letter 
-                WHERE stage = 'Approved'
-                """
-                )
-            ).fetchall()
-
-            sentences = [dict(row._mapping) for row in result]
+        index = self.sentence_indexes.get("sentence_bank_cover_letter")
 
         # Select sentences by category to ensure complete cover letter
         categories_needed = ["Opening", "Alignment", "Achievement", "Closing"]
@@ -276,11 +250,12 @@ class ContentManager:
         }
 
         for category in categories_needed:
-            category_sentences = [s for s in sentences if s["category"] == category]
-            if category_sentences:
+            category_positions = index.category_positions.get(category)
+            if category_positions:
                 # Find best sentence that doesn't violate variable repetition rules
                 best_sentence = self._select_best_sentence_with_variable_constraints(
-                    category_sentences, job_skills, job_keywords, variables_used
+                    index.ranked(job_skills, job_keywords, positions=category_positions),
+                    job_skills, job_keywords, variables_used, presorted=True
                 )
                 if best_sentence:
                     selected_sentences.append(best_sentence)
@@ -392,7 +367,8 @@ class ContentManager:
 
     def _select_best_sentence_with_variable_constraints(self, category_sentences: List[Dict], 
                                                        job_skills: List[str], job_keywords: List[str], 
-                                                       variables_used: Dict[str, bool]) -> Optional[Dict]:
+                                                       variables_used: Dict[str, bool],
+                                                       presorted: bool = False) -> Optional[Dict]:
         """
         Select best sentence from category that doesn't violate variable repetition constraints
         
@@ -401,18 +377,22 @@ class ContentManager:
             job_skills: Job skills for scoring
             job_keywords: Job keywords for scoring  
             variables_used: Dictionary tracking which variables have been used
+            presorted: category_sentences are already ranked (SentenceBankIndex.ranked)
             
         Returns:
             Best valid sentence or None if no valid sentences available
         """
-        # Score all sentences and sort by composite score
-        scored_sentences = []
-        for sentence in category_sentences:
-            score = self._calculate_composite_score(sentence, job_skills, job_keywords)
-            scored_sentences.append((sentence, score))
-        
-        # Sort by score (highest first)
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
+        if presorted:
+            scored_sentences = [(sentence, None) for sentence in category_sentences]
+        else:
+            # Score all sentences and sort by composite score
+            scored_sentences = []
+            for sentence in category_sentences:
+                score = self._calculate_composite_score(sentence, job_skills, job_keywords)
+                scored_sentences.append((sentence, score))
+            
+            # Sort by score (highest first)
+            scored_sentences.sort(key=lambda x: x[1], reverse=True)
         
         # Find first sentence that doesn't violate variable constraints
         for sentence, score in scored_sentences:
@@ -611,4 +591,5 @@ Portfolio: https://steveglen.com
                 },
             )
 
+        notify_table_write("job_applications")
         return application_id
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Canadian Spelling Converter - Compiled, Shared Conversion Service
+
+Compiles the canadian_spellings dictionary once per dictionary version into a
+case-aware lookup plus one trie-shaped regex, so each text is scanned in a
+single pass and every hit is replaced via dict lookup. The compiled converter
+lives in a process-wide service shared by the copywriting evaluator (Stage 3)
+and the document TemplateEngine; it reloads only when the table's checksum
+changes (checked at most once per CHECK_INTERVAL_SECONDS).
+
+Case handling matches the previous per-entry passes: each American spelling
+is matched exactly, Capitalized, and UPPERCASE (the latter only for words
+longer than two letters), and the replacement uses the same casing. Change
+positions refer to the original text.
+
+Author: Automated Job Application System
+Version: 1.0.0
+"""
+
+import re
+import time
+import logging
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from modules.content.copywriting_evaluator.keyword_matcher import trie_pattern
+
+logger = logging.getLogger(__name__)
+
+SPELLINGS_QUERY = "SELECT american_spelling, canadian_spelling FROM canadian_spellings"
+
+# Cheap change detector: row count plus a checksum of every pair
+SPELLINGS_VERSION_QUERY = (
+    "SELECT COUNT(*) AS total, "
+    "md5(COALESCE(string_agg(american_spelling || '=' || canadian_spelling, '|' "
+    "ORDER BY american_spelling, canadian_spelling), '')) AS checksum "
+    "FROM canadian_spellings"
+)
+
+
+class SpellingConverter:
+    """
+    Compiled American -> Canadian converter for one dictionary version
+
+    Example:
+        >>> converter = SpellingConverter({'color': 'colour'})
+        >>> converter.convert('Color and COLOR and color')[0]
+        'Colour and COLOUR and colour'
+    """
+
+    def __init__(self, conversions: Dict[str, str], version: Optional[str] = None):
+        """
+        Compile the converter
+
+        Args:
+            conversions: American spelling -> Canadian spelling
+            version: Dictionary version the conversions were loaded at
+        """
+        self.conversions = conversions
+        self.version = version
+
+        # spelling variant as it appears in text -> (replacement, match_type)
+        self._lookup: Dict[str, Tuple[str, str]] = {}
+
+        # Longest entries first, exact before capitalized before uppercase:
+        # the precedence the per-entry passes used when variants collide
+        for american, canadian in sorted(conversions.items(), key=lambda item: len(item[0]), reverse=True):
+            self._lookup.setdefault(american, (canadian, 'exact_case'))
+
+            american_capitalized = american.capitalize()
+            if american_capitalized != american:
+                self._lookup.setdefault(american_capitalized, (canadian.capitalize(), 'capitalized'))
+
+            american_upper = american.upper()
+            if american_upper != american and len(american) > 2:  # Avoid single-letter words
+                self._lookup.setdefault(american_upper, (canadian.upper(), 'uppercase'))
+
+        self._regex = re.compile(r'\b(?:' + trie_pattern(self._lookup) + r')\b') if self._lookup else None
+
+    def __len__(self) -> int:
+        return len(self.conversions)
+
+    def convert(self, text: str) -> Tuple[str, List[Dict]]:
+        """
+        Apply Canadian spellings in one pass
+
+        Args:
+            text: Text to convert
+
+        Returns:
+            Tuple of (converted_text, list_of_changes_made)
+        """
+        if not text or self._regex is None:
+            return text, []
+
+        changes_made = []
+
+        def replace(match: re.Match) -> str:
+            original = match.group(0)
+            replacement, match_type = self._lookup[original]
+            changes_made.append({
+                'original': original,
+                'replacement': replacement,
+                'position': match.start(),
+                'match_type': match_type
+            })
+            return replacement
+
+        converted_text = self._regex.sub(replace, text)
+        return converted_text, changes_made
+
+
+class CanadianSpellingService:
+    """
+    Process-wide holder of the compiled SpellingConverter
+
+    Loads canadian_spellings lazily, then polls the table's checksum at most
+    once per check interval and recompiles only when it changed. Database
+    failures keep the last good converter.
+    """
+
+    CHECK_INTERVAL_SECONDS = 300
+
+    def __init__(
+        self,
+        db=None,
+        check_interval_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the service
+
+        Args:
+            db: DatabaseManager-compatible object (created lazily if omitted)
+            check_interval_seconds: Minimum seconds between version checks
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._db = db
+        self.check_interval_seconds = (
+            self.CHECK_INTERVAL_SECONDS if check_interval_seconds is None else check_interval_seconds
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._converter: Optional[SpellingConverter] = None
+        self._last_checked: Optional[float] = None
+        self.loaded_at: Optional[float] = None
+        self.reload_count = 0
+
+    @property
+    def db(self):
+        if self._db is None:
+            from modules.database.database_manager import DatabaseManager
+            self._db = DatabaseManager()
+        return self._db
+
+    @property
+    def current_converter(self) -> Optional[SpellingConverter]:
+        """Last compiled converter, without checking for updates (None before the first load)"""
+        return self._converter
+
+    def get_converter(self) -> SpellingConverter:
+        """
+        Get the current converter, reloading if the dictionary changed
+
+        Returns:
+            Compiled SpellingConverter (empty if nothing could be loaded)
+        """
+        now = self._clock()
+        converter = self._converter
+        if converter is not None and now - self._last_checked < self.check_interval_seconds:
+            return converter
+
+        with self._lock:
+            if self._converter is not None and now - self._last_checked < self.check_interval_seconds:
+                return self._converter
+
+            self._last_checked = now
+            try:
+                version = self._fetch_version()
+                if self._converter is None or version != self._converter.version:
+                    self._load(version)
+            except Exception as e:
+                logger.error(f"Failed to refresh Canadian spellings: {str(e)}")
+                if self._converter is None:
+                    self._converter = SpellingConverter({})
+
+            return self._converter
+
+    def convert(self, text: str) -> Tuple[str, List[Dict]]:
+        """Convert text with the current converter"""
+        return self.get_converter().convert(text)
+
+    def reload(self) -> SpellingConverter:
+        """Force a reload regardless of the stored version"""
+        with self._lock:
+            self._last_checked = self._clock()
+            self._load(self._fetch_version())
+            return self._converter
+
+    def _fetch_version(self) -> str:
+        rows = self.db.execute_query(SPELLINGS_VERSION_QUERY, ())
+        row = rows[0] if rows else {}
+        return f"{row.get('total', 0)}:{row.get('checksum', '')}"
+
+    def _load(self, version: str) -> None:
+        results = self.db.execute_query(SPELLINGS_QUERY, ())
+
+        conversions = {}
+        for row in results:
+            american_spelling = (row.get('american_spelling') or '').strip()
+            canadian_spelling = (row.get('canadian_spelling') or '').strip()
+
+            if american_spelling and canadian_spelling:
+                conversions[american_spelling] = canadian_spelling
+
+        self._converter = SpellingConverter(conversions, version)
+        self.loaded_at = time.time()
+        self.reload_count += 1
+        logger.info(f"Compiled {len(conversions)} Canadian spelling conversions (version {version})")
+
+
+@lru_cache(maxsize=1)
+def get_canadian_spelling_service() -> CanadianSpellingService:
+    """
+    Get the shared Canadian spelling service (lazy singleton)
+
+    Returns:
+        CanadianSpellingService instance
+    """
+    return CanadianSpellingService()
@@ -3,7 +3,8 @@
 Canadian Spelling Processor - Stage 3 Processing
 
 Applies Canadian Press spelling corrections using 183 conversion pairs.
-Processes text locally without LLM calls for efficiency.
+Processes text locally without LLM calls for efficiency. Conversion itself is
+delegated to the shared compiled converter in canadian_spelling_converter.py.
 
 Author: Automated Job Application System
 Version: 1.0.0
@@ -11,14 +12,15 @@ Version: 1.0.0
 
 import os
 import sys
-import re
 import logging
 from typing import Dict, List, Optional, Tuple, Set
 from datetime import datetime
 
-# Database integration
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
-from modules.database.database_manager import DatabaseManager
+from modules.content.copywriting_evaluator.canadian_spelling_converter import (
+    SpellingConverter,
+    get_canadian_spelling_service,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,58 +32,45 @@ class CanadianSpellingProcessor:
     - Applies 183 Canadian Press spelling conversion pairs
     - Word-boundary aware replacements to avoid partial matches
     - Case-sensitive and case-insensitive matching
-    - Database-driven spelling rules with caching
+    - Database-driven spelling rules compiled once per dictionary version
+      and shared process-wide (reloaded only when canadian_spellings changes)
     - Comprehensive change tracking and statistics
     - High-performance local processing (no LLM calls)
     """
     
     def __init__(self):
         """Initialize Canadian spelling processor"""
-        self.db = DatabaseManager()
-        self._cached_spellings: Optional[Dict[str, str]] = None
-        self._cache_updated: Optional[datetime] = None
-        self._cache_duration_minutes = 120  # Cache spellings for 2 hours
+        self.spelling_service = get_canadian_spelling_service()
+
+        # Converter compiled for ad-hoc conversion dicts (not the shared dictionary)
+        self._adhoc_converter: Optional[SpellingConverter] = None
         
         logger.info("Canadian spelling processor initialized")
     
     def _get_spelling_conversions(self) -> Dict[str, str]:
         """
-        Get Canadian spelling conversions from database with caching
+        Get Canadian spelling conversions from the shared spelling service
         
         Returns:
             Dictionary mapping American spellings to Canadian spellings
         """
-        # Check if cache is valid
-        if (self._cached_spellings is not None and 
-            self._cache_updated is not None and
-            (datetime.now() - self._cache_updated).total_seconds() < (self._cache_duration_minutes * 60)):
-            return self._cached_spellings
+        return self.spelling_service.get_converter().conversions
+    
+    def _get_converter(self, conversions: Dict[str, str]) -> SpellingConverter:
+        """
+        Get a compiled converter for a conversion dictionary
         
-        try:
-            # Fetch spelling conversions from database
-            query = "SELECT american_spelling, canadian_spelling FROM canadian_spellings"
-            results = self.db.execute_query(query, ())
-            
-            # Create conversion dictionary
-            conversions = {}
-            for row in results:
-                american_spelling = row[0].strip() if row[0] else ""
-                canadian_spelling = row[1].strip() if row[1] else ""
-                
-                if american_spelling and canadian_spelling:
-                    conversions[american_spelling] = canadian_spelling
-            
-            # Update cache
-            self._cached_spellings = conversions
-            self._cache_updated = datetime.now()
-            
-            logger.info(f"Loaded {len(conversions)} Canadian spelling conversions")
-            return conversions
-            
-        except Exception as e:
-            logger.error(f"Failed to load spelling conversions from database: {str(e)}")
-            # Return empty dict on error to avoid blocking processing
-            return {}
+        The shared dictionary (as returned by _get_spelling_conversions) reuses the
+        service's compiled converter; any other dictionary is compiled once and
+        kept until a different dictionary is passed.
+        """
+        converter = self.spelling_service.current_converter
+        if converter is not None and conversions is converter.conversions:
+            return converter
+        
+        if self._adhoc_converter is None or self._adhoc_converter.conversions is not conversions:
+            self._adhoc_converter = SpellingConverter(conversions)
+        return self._adhoc_converter
     
     def _apply_spelling_conversions(self, text: str, conversions: Dict[str, str]) -> Tuple[str, List[Dict]]:
         """
@@ -97,71 +86,7 @@ class CanadianSpellingProcessor:
         if not text or not conversions:
             return text, []
         
-        converted_text = text
-        changes_made = []
-        
-        # Sort conversions by length (longest first) to handle overlapping patterns
-        sorted_conversions = sorted(conversions.items(), key=lambda x: len(x[0]), reverse=True)
-        
-        for american_spelling, canadian_spelling in sorted_conversions:
-            # Create case-sensitive pattern with word boundaries
-            pattern_exact = r'\b' + re.escape(american_spelling) + r'\b'
-            
-            # Find all matches for tracking
-            matches = list(re.finditer(pattern_exact, converted_text))
-            
-            if matches:
-                # Apply replacement
-                converted_text = re.sub(pattern_exact, canadian_spelling, converted_text)
-                
-                # Track changes
-                for match in matches:
-                    changes_made.append({
-                        'original': american_spelling,
-                        'replacement': canadian_spelling,
-                        'position': match.start(),
-                        'match_type': 'exact_case'
-                    })
-            
-            # Also check for capitalized versions
-            american_capitalized = american_spelling.capitalize()
-            canadian_capitalized = canadian_spelling.capitalize()
-            
-            if american_capitalized != american_spelling:
-                pattern_cap = r'\b' + re.escape(american_capitalized) + r'\b'
-                matches_cap = list(re.finditer(pattern_cap, converted_text))
-                
-                if matches_cap:
-                    converted_text = re.sub(pattern_cap, canadian_capitalized, converted_text)
-                    
-                    for match in matches_cap:
-                        changes_made.append({
-                            'original': american_capitalized,
-                            'replacement': canadian_capitalized,
-                            'position': match.start(),
-                            'match_type': 'capitalized'
-                        })
-            
-            # Check for uppercase versions
-            american_upper = american_spelling.upper()
-            canadian_upper = canadian_spelling.upper()
-            
-            if american_upper != american_spelling and len(american_spelling) > 2:  # Avoid single-letter words
-                pattern_upper = r'\b' + re.escape(american_upper) + r'\b'
-                matches_upper = list(re.finditer(pattern_upper, converted_text))
-                
-                if matches_upper:
-                    converted_text = re.sub(pattern_upper, canadian_upper, converted_text)
-                    
-                    for match in matches_upper:
-                        changes_made.append({
-                            'original': american_upper,
-                            'replacement': canadian_upper,
-                            'position': match.start(),
-                            'match_type': 'uppercase'
-                        })
-        
-        return converted_text, changes_made
+        return self._get_converter(conversions).convert(text)
     
     def _process_sentence(self, sentence: Dict, conversions: Dict[str, str], session_id: str) -> Dict:
         """
@@ -326,9 +251,11 @@ class CanadianSpellingProcessor:
             return {
                 'total_conversions': len(conversions),
                 'conversion_patterns': conversion_types,
-                'cache_status': 'valid' if self._cached_spellings is not None else 'empty',
-                'cache_updated': self._cache_updated.isoformat() if self._cache_updated else None,
-                'cache_duration_minutes': self._cache_duration_minutes,
+                'cache_status': 'valid' if self.spelling_service.loaded_at is not None else 'empty',
+                'cache_updated': (datetime.fromtimestamp(self.spelling_service.loaded_at).isoformat()
+                                  if self.spelling_service.loaded_at else None),
+                'dictionary_version': self.spelling_service.get_converter().version,
+                'version_check_interval_seconds': self.spelling_service.check_interval_seconds,
                 'sample_conversions': dict(list(conversions.items())[:5]) if conversions else {}
             }
             
@@ -349,10 +276,7 @@ class CanadianSpellingProcessor:
             Cache refresh result
         """
         try:
-            self._cached_spellings = None
-            self._cache_updated = None
-            
-            conversions = self._get_spelling_conversions()
+            conversions = self.spelling_service.reload().conversions
             
             return {
                 'success': True,
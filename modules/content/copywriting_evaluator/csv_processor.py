@@ -16,11 +16,12 @@ import logging
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 
 # Database integration
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
 from modules.database.database_manager import DatabaseManager
+from modules.content.copywriting_evaluator.sentence_bulk_loader import SentenceBulkLoader
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +40,8 @@ class CSVProcessor:
     Features:
     - Automatic file detection and validation
     - Schema validation against database structure
-    - Batch processing with transaction safety
-    - Duplicate detection and handling
+    - Streaming chunked COPY ingestion with transaction safety per chunk
+    - Set-based duplicate detection (in-chunk hash set + content hash index)
     - Comprehensive error reporting
     - Support for both sentence bank tables
     """
@@ -48,6 +49,7 @@ class CSVProcessor:
     def __init__(self):
         """Initialize CSV processor"""
         self.db = DatabaseManager()
+        self.bulk_loader = SentenceBulkLoader()
         
         # Define expected CSV schemas for each table type
         self.cover_letter_schema = {
@@ -179,6 +181,30 @@ class CSVProcessor:
             logger.error(f"CSV validation error: {str(e)}")
             return False, f"Validation error: {str(e)}", {}
     
+    def iter_csv_rows(self, csv_file_path: str, file_info: Dict) -> Iterator[Dict]:
+        """
+        Stream parsed rows from a CSV file without loading it into memory
+
+        Args:
+            csv_file_path: Path to CSV file
+            file_info: File information from validation
+
+        Yields:
+            Parsed row dictionaries (invalid rows are logged and skipped)
+        """
+        with open(csv_file_path, 'r', encoding='utf-8-sig') as csvfile:
+            reader = csv.DictReader(csvfile)
+
+            for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+                try:
+                    # Parse and clean row data
+                    parsed_row = self._parse_row_data(row, file_info['target_table'], row_num)
+                    if parsed_row:
+                        yield parsed_row
+                except Exception as e:
+                    logger.error(f"Error parsing row {row_num}: {str(e)}")
+                    # Continue processing other rows
+
     def parse_csv_data(self, csv_file_path: str, file_info: Dict) -> List[Dict]:
         """
         Parse CSV data into standardized dictionaries
@@ -190,22 +216,8 @@ class CSVProcessor:
         Returns:
             List of parsed row dictionaries
         """
-        parsed_rows = []
-        
         try:
-            with open(csv_file_path, 'r', encoding='utf-8-sig') as csvfile:
-                reader = csv.DictReader(csvfile)
-                
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-                    try:
-                        # Parse and clean row data
-                        parsed_row = self._parse_row_data(row, file_info['target_table'], row_num)
-                        if parsed_row:
-                            parsed_rows.append(parsed_row)
-                    except Exception as e:
-                        logger.error(f"Error parsing row {row_num}: {str(e)}")
-                        # Continue processing other rows
-            
+            parsed_rows = list(self.iter_csv_rows(csv_file_path, file_info))
             logger.info(f"Parsed {len(parsed_rows)} valid rows from {csv_file_path}")
             return parsed_rows
             
@@ -293,105 +305,51 @@ class CSVProcessor:
         except (ValueError, TypeError):
             return None
     
-    async def ingest_to_database(self, parsed_data: List[Dict], table_name: str) -> Dict:
+    async def ingest_to_database(self, parsed_data: Iterable[Dict], table_name: str) -> Dict:
         """
         Ingest parsed data into database with duplicate checking
+
+        Rows are streamed through SentenceBulkLoader: each chunk is deduped
+        in memory, COPYed into a staging table and merged with
+        ON CONFLICT DO NOTHING against the content hash index.
         
         Args:
-            parsed_data: List of parsed row dictionaries
+            parsed_data: Parsed row dictionaries (list or streaming iterator)
             table_name: Target database table
             
         Returns:
             Dictionary with ingestion results
         """
-        if not parsed_data:
+        try:
+            load_result = self.bulk_loader.load(parsed_data, table_name)
+        except Exception as e:
+            logger.error(f"Database ingestion failed: {str(e)}")
+            raise CSVProcessingError(f"Database ingestion failed: {str(e)}")
+
+        if not load_result['rows_processed']:
             return {
                 'success': True,
+                'parsed_rows': 0,
                 'inserted_count': 0,
                 'duplicate_count': 0,
                 'error_count': 0,
                 'sentence_ids': [],
                 'message': 'No data to ingest'
             }
-        
-        inserted_ids = []
-        duplicate_count = 0
-        error_count = 0
-        
-        try:
-            for row in parsed_data:
-                try:
-                    # Check for duplicates based on content_text
-                    duplicate_check = """
-                        SELECT id FROM {} WHERE content_text = %s
-                    """.format(table_name)
-                    
-                    existing = self.db.execute_query(duplicate_check, (row['content_text'],))
-                    
-                    if existing:
-                        duplicate_count += 1
-                        logger.debug(f"Duplicate content found, skipping: {row['content_text'][:50]}...")
-                        continue
-                    
-                    # Generate UUID for new record
-                    sentence_id = str(uuid.uuid4())
-                    
-                    # Build insert query based on table
-                    if table_name == 'sentence_bank_cover_letter':
-                        insert_query = """
-                            INSERT INTO sentence_bank_cover_letter (
-                                id, content_text, tone, tone_strength, status, position_label,
-                                matches_job_skill, variable, keyword_filter_status,
-                                truthfulness_status, canadian_spelling_status,
-                                tone_analysis_status, skill_analysis_status, created_at
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """
-                        params = (
-                            sentence_id, row['content_text'], row['tone'], row['tone_strength'],
-                            row['status'], row['position_label'], row['matches_job_skill'],
-                            row['variable'], row['keyword_filter_status'], row['truthfulness_status'],
-                            row['canadian_spelling_status'], row['tone_analysis_status'],
-                            row['skill_analysis_status'], datetime.now()
-                        )
-                    else:  # sentence_bank_resume
-                        insert_query = """
-                            INSERT INTO sentence_bank_resume (
-                                id, content_text, tone, tone_strength, status, body_section,
-                                matches_job_skill, experience_id, keyword_filter_status,
-                                truthfulness_status, canadian_spelling_status,
-                                tone_analysis_status, skill_analysis_status, created_at
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """
-                        params = (
-                            sentence_id, row['content_text'], row['tone'], row['tone_strength'],
-                            row['status'], row['body_section'], row['matches_job_skill'],
-                            row['experience_id'], row['keyword_filter_status'], row['truthfulness_status'],
-                            row['canadian_spelling_status'], row['tone_analysis_status'],
-                            row['skill_analysis_status'], datetime.now()
-                        )
-                    
-                    self.db.execute_query(insert_query, params)
-                    inserted_ids.append(sentence_id)
-                    
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"Error inserting row: {str(e)}")
-            
-            logger.info(f"Database ingestion complete: {len(inserted_ids)} inserted, "
-                       f"{duplicate_count} duplicates, {error_count} errors")
-            
-            return {
-                'success': True,
-                'inserted_count': len(inserted_ids),
-                'duplicate_count': duplicate_count,
-                'error_count': error_count,
-                'sentence_ids': inserted_ids,
-                'message': f"Ingested {len(inserted_ids)} new sentences successfully"
-            }
-            
-        except Exception as e:
-            logger.error(f"Database ingestion failed: {str(e)}")
-            raise CSVProcessingError(f"Database ingestion failed: {str(e)}")
+
+        inserted_count = load_result['inserted_count']
+        logger.info(f"Database ingestion complete: {inserted_count} inserted, "
+                   f"{load_result['duplicate_count']} duplicates, {load_result['error_count']} errors")
+
+        return {
+            'success': True,
+            'parsed_rows': load_result['rows_processed'],
+            'inserted_count': inserted_count,
+            'duplicate_count': load_result['duplicate_count'],
+            'error_count': load_result['error_count'],
+            'sentence_ids': load_result['sentence_ids'],
+            'message': f"Ingested {inserted_count} new sentences successfully"
+        }
     
     async def process_csv_file(self, csv_file_path: str, table_name: str) -> Dict:
         """
@@ -422,9 +380,10 @@ class CSVProcessor:
             logger.info(f"CSV validation passed: {file_info['data_rows']} rows, "
                        f"{file_info['column_count']} columns")
             
-            # Step 2: Parse CSV data
-            parsed_data = self.parse_csv_data(csv_file_path, file_info)
-            if not parsed_data:
+            # Steps 2-3: Stream parsed rows into the database chunk by chunk
+            parsed_rows = self.iter_csv_rows(csv_file_path, file_info)
+            ingestion_result = await self.ingest_to_database(parsed_rows, table_name)
+            if not ingestion_result['parsed_rows']:
                 return {
                     'success': True,
                     'message': 'No valid data rows found in CSV',
@@ -432,16 +391,13 @@ class CSVProcessor:
                     'sentence_ids': []
                 }
             
-            # Step 3: Ingest to database
-            ingestion_result = await self.ingest_to_database(parsed_data, table_name)
-            
             # Combine results
             processing_time = (datetime.now() - processing_start).total_seconds()
             
             result = {
                 'success': ingestion_result['success'],
                 'file_info': file_info,
-                'parsed_rows': len(parsed_data),
+                'parsed_rows': ingestion_result['parsed_rows'],
                 'inserted_count': ingestion_result['inserted_count'],
                 'duplicate_count': ingestion_result['duplicate_count'],
                 'error_count': ingestion_result['error_count'],
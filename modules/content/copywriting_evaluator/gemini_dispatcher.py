@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Gemini Dispatcher - Shared Rate Limiting for Concurrent AI Stages
+
+The AI stage processors (truthfulness, tone, skill) call Gemini through the
+blocking requests client. call_gemini() runs those calls in worker threads so
+the event loop stays free while several batches are in flight, and paces
+every call through one process-wide token bucket so concurrent stages share
+a single request budget.
+
+The limiter reserves slots under a threading lock and sleeps outside it, so
+it works from any event loop (and from plain threads via acquire_blocking).
+
+Configuration (environment):
+    GEMINI_REQUESTS_PER_MINUTE: Sustained request rate (default 60)
+    GEMINI_BURST: Requests allowed back-to-back (default 4)
+
+Author: Automated Job Application System
+Version: 1.0.0
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiRateLimiter:
+    """
+    Token bucket shared by every Gemini caller in the process
+
+    Example:
+        >>> limiter = GeminiRateLimiter(requests_per_minute=60, burst=4)
+        >>> await limiter.acquire()
+    """
+
+    def __init__(self, requests_per_minute: float = 60, burst: int = 4,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the limiter
+
+        Args:
+            requests_per_minute: Sustained request rate
+            burst: Maximum requests issued without waiting
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.burst = max(1, burst)
+        self._rate = requests_per_minute / 60.0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last_refill = clock()
+        self.total_acquired = 0
+        self.total_wait_seconds = 0.0
+
+    def _reserve(self) -> float:
+        """Take one token, going negative if necessary; returns seconds to wait"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+
+            self._tokens -= 1
+            self.total_acquired += 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+            self.total_wait_seconds += wait
+            return wait
+
+    async def acquire(self) -> None:
+        """Wait (without blocking the event loop) until a request may be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self) -> None:
+        """Blocking variant for callers outside an event loop"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def get_stats(self) -> Dict:
+        """Limiter configuration and usage counters"""
+        return {
+            'requests_per_minute': self.requests_per_minute,
+            'burst': self.burst,
+            'total_acquired': self.total_acquired,
+            'total_wait_seconds': round(self.total_wait_seconds, 3)
+        }
+
+
+@lru_cache(maxsize=1)
+def get_gemini_rate_limiter() -> GeminiRateLimiter:
+    """
+    Get the process-wide Gemini rate limiter (lazy singleton)
+
+    Returns:
+        GeminiRateLimiter configured from the environment
+    """
+    requests_per_minute = float(os.environ.get('GEMINI_REQUESTS_PER_MINUTE', '60'))
+    burst = int(os.environ.get('GEMINI_BURST', '4'))
+    logger.info(f"Gemini rate limiter: {requests_per_minute:g} requests/minute, burst {burst}")
+    return GeminiRateLimiter(requests_per_minute=requests_per_minute, burst=burst)
+
+
+async def call_gemini(func: Callable[..., Any], *args,
+                      limiter: Optional[GeminiRateLimiter] = None, **kwargs) -> Any:
+    """
+    Run a blocking Gemini call in a worker thread under the shared rate limit
+
+    Args:
+        func: Blocking callable that issues one Gemini request
+        *args: Positional arguments for func
+        limiter: Rate limiter (defaults to the shared limiter)
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    await (limiter or get_gemini_rate_limiter()).acquire()
+    return await asyncio.to_thread(func, *args, **kwargs)
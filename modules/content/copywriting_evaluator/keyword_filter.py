@@ -12,13 +12,13 @@ Version: 1.0.0
 import os
 import sys
 import logging
-import re
 from typing import Dict, List, Set, Optional
 from datetime import datetime
 
 # Database integration
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
 from modules.database.database_manager import DatabaseManager
+from modules.content.copywriting_evaluator.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,7 @@ class KeywordFilter:
     Features:
     - Case-insensitive keyword matching
     - Word boundary detection to avoid partial matches
+    - Keywords compiled once into a single-pass matcher per cache refresh
     - Database-driven keyword management
     - Comprehensive logging and statistics
     - Batch processing optimization
@@ -40,6 +41,8 @@ class KeywordFilter:
         self._cached_keywords: Optional[Set[str]] = None
         self._cache_updated: Optional[datetime] = None
         self._cache_duration_minutes = 60  # Cache keywords for 1 hour
+        self._matcher: Optional[KeywordMatcher] = None
+        self._matcher_keywords: Optional[Set[str]] = None
         
         logger.info("Keyword filter initialized")
     
@@ -65,9 +68,10 @@ class KeywordFilter:
             # Note: execute_query returns list of dicts, not tuples
             keywords = {row['keyword'].lower().strip() for row in results if row.get('keyword') and row.get('keyword').strip()}
 
-            # Update cache
+            # Update cache and compile the matcher once for this keyword set
             self._cached_keywords = keywords
             self._cache_updated = datetime.now()
+            self._get_matcher(keywords)
 
             logger.info(f"Loaded {len(keywords)} active keywords: {sorted(keywords)}")
             return keywords
@@ -77,6 +81,25 @@ class KeywordFilter:
             # Return empty set on error to avoid blocking processing
             return set()
     
+    def _get_matcher(self, keywords: Set[str]) -> KeywordMatcher:
+        """
+        Get the compiled matcher for a keyword set, compiling it if the set changed
+
+        Args:
+            keywords: Set of keywords (lowercase)
+
+        Returns:
+            KeywordMatcher for the keywords
+        """
+        # The cached keyword set is reused by identity, so this is normally a pointer compare
+        if self._matcher is None or (
+            keywords is not self._matcher_keywords and frozenset(keywords) != self._matcher.keywords
+        ):
+            self._matcher = KeywordMatcher(keywords)
+            logger.debug(f"Compiled keyword matcher for {len(self._matcher)} keywords")
+        self._matcher_keywords = keywords
+        return self._matcher
+
     def _contains_keyword(self, text: str, keywords: Set[str]) -> tuple[bool, List[str]]:
         """
         Check if text contains any of the specified keywords
@@ -92,17 +115,9 @@ class KeywordFilter:
             return False, []
         
         # Convert text to lowercase for case-insensitive matching
-        text_lower = text.lower()
-        found_keywords = []
-        
-        for keyword in keywords:
-            # Use word boundaries to ensure exact word matches
-            # This prevents matching "meticulous" within "unmeticulous" etc.
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            
-            if re.search(pattern, text_lower):
-                found_keywords.append(keyword)
-        
+        # Word boundaries prevent matching "meticulous" within "unmeticulous" etc.
+        found_keywords = self._get_matcher(keywords).find_all(text.lower())
+
         return len(found_keywords) > 0, found_keywords
     
     def process_sentence(self, sentence: Dict, keywords: Set[str], session_id: str) -> Dict:
@@ -194,6 +209,9 @@ class KeywordFilter:
             
             if not keywords:
                 logger.warning("No active keywords found - all sentences will be rejected")
+
+            # Compile once for the whole batch; every sentence is then a single scan
+            self._get_matcher(keywords)
             
             # Process each sentence
             results = []
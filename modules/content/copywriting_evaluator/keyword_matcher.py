@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Keyword Matcher - Compiled Whole-Word Keyword Search
+
+Compiles a keyword set once into a single trie-shaped regex so each sentence
+is scanned in one pass instead of one regex search per keyword. Shared
+prefixes are factored out ('meticulous', 'meticulously' -> meticulous(?:ly)?),
+so the regex engine walks the keyword trie like an automaton at each word
+boundary.
+
+Matching semantics are identical to searching r'\b' + re.escape(keyword) + r'\b'
+for every keyword: the regex reports the longest keyword at each position and
+shorter keywords that are prefixes of it are checked for a word boundary
+explicitly.
+
+Author: Automated Job Application System
+Version: 1.0.0
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+# Trie node key marking the end of a keyword
+_END = ''
+
+
+def _is_word_char(char: str) -> bool:
+    """Match re's \\w for str patterns"""
+    return char.isalnum() or char == '_'
+
+
+def _is_boundary(text: str, position: int) -> bool:
+    """True when re's \\b would match at position in text"""
+    before = position > 0 and _is_word_char(text[position - 1])
+    after = position < len(text) and _is_word_char(text[position])
+    return before != after
+
+
+def _render_trie(node: Dict[str, dict]) -> str:
+    """Render a trie node as a regex; longer continuations are tried first"""
+    branches = [
+        re.escape(char) + _render_trie(child)
+        for char, child in sorted(node.items())
+        if char != _END
+    ]
+    if not branches:
+        return ''
+
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if _END in node:
+        pattern = '(?:' + pattern + ')?'
+    return pattern
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation of words with shared prefixes factored out
+
+    At any position the pattern prefers the longest word, backtracking to
+    shorter ones when whatever follows the group fails to match.
+
+    Args:
+        words: Non-empty strings to match literally
+
+    Returns:
+        Regex source (no surrounding group or anchors)
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+    return _render_trie(trie)
+
+
+class KeywordMatcher:
+    """
+    Compiled whole-word matcher for a fixed set of lowercase keywords
+
+    Example:
+        >>> matcher = KeywordMatcher({'meticulous', 'meticulously'})
+        >>> matcher.find_all('worked meticulously and was meticulous')
+        ['meticulously', 'meticulous']
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile the matcher
+
+        Args:
+            keywords: Keywords to match (already lowercased and stripped)
+        """
+        self.keywords = frozenset(keyword for keyword in keywords if keyword)
+        self._regex: Optional[re.Pattern] = None
+
+        # keyword -> shorter keywords that are its prefixes (longest first)
+        self._prefixes: Dict[str, List[str]] = {}
+
+        if not self.keywords:
+            return
+
+        # Zero-width lookahead so keywords starting inside an earlier match are still found
+        self._regex = re.compile(r'(?=\b(' + trie_pattern(self.keywords) + r')\b)')
+
+        for keyword in self.keywords:
+            prefixes = [keyword[:i] for i in range(len(keyword) - 1, 0, -1) if keyword[:i] in self.keywords]
+            if prefixes:
+                self._prefixes[keyword] = prefixes
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find_all(self, text_lower: str) -> List[str]:
+        """
+        Find every keyword occurring as a whole word
+
+        Args:
+            text_lower: Lowercased text to search
+
+        Returns:
+            Distinct matched keywords in order of first occurrence
+        """
+        if self._regex is None or not text_lower:
+            return []
+
+        found: Dict[str, None] = {}
+        for match in self._regex.finditer(text_lower):
+            keyword = match.group(1)
+            found[keyword] = None
+
+            start = match.start()
+            for prefix in self._prefixes.get(keyword, ()):
+                if _is_boundary(text_lower, start + len(prefix)):
+                    found[prefix] = None
+
+        return list(found)
@@ -53,7 +53,7 @@ class ModeManager:
         
         config = PipelineConfig(
             mode=ProcessingMode.TESTING,
-            batch_size=5,
+            batch_size=50,
             max_consecutive_errors=999999,  # No limits in testing
             immediate_processing=True,
             enable_scheduling=False,
@@ -81,7 +81,7 @@ class ModeManager:
         
         config = PipelineConfig(
             mode=ProcessingMode.PRODUCTION,
-            batch_size=5,
+            batch_size=50,
             max_consecutive_errors=15,
             error_cooldown_hours=23,
             immediate_processing=not enable_scheduler,
@@ -130,6 +130,30 @@ class PerformanceTracker:
         except Exception as e:
             logger.error(f"Failed to log pipeline session: {str(e)}")
     
+    def log_cache_lookup(self, stage_name: str, lookups: int, hits: int,
+                         session_id: Optional[str] = None) -> None:
+        """
+        Log verdict cache lookups for a batch
+        
+        Recorded as api_call_type 'verdict_cache' with batch_size = lookups and
+        sentences_processed = hits; excluded from the API call aggregates.
+        
+        Args:
+            stage_name: Processing stage name
+            lookups: Sentences looked up
+            hits: Sentences served from the cache
+            session_id: Session identifier
+        """
+        self.log_api_call(APIMetrics(
+            stage_name=stage_name,
+            api_call_type="verdict_cache",
+            response_time_ms=None,
+            success=True,
+            batch_size=lookups,
+            sentences_processed=hits,
+            session_id=session_id
+        ))
+    
     async def log_error(self, error_info: Dict) -> None:
         """
         Log error information for debugging
@@ -164,26 +188,32 @@ class PerformanceTracker:
             Dictionary with performance statistics
         """
         try:
+            # verdict_cache rows record cache lookups/hits, not API calls
             query = """
                 SELECT 
-                    COUNT(*) as total_calls,
-                    COUNT(CASE WHEN success = true THEN 1 END) as successful_calls,
+                    COUNT(CASE WHEN api_call_type != 'verdict_cache' THEN 1 END) as total_calls,
+                    COUNT(CASE WHEN success = true AND api_call_type != 'verdict_cache' THEN 1 END) as successful_calls,
                     COUNT(CASE WHEN success = false THEN 1 END) as failed_calls,
                     AVG(response_time_ms) as avg_response_time,
                     MIN(response_time_ms) as min_response_time,
                     MAX(response_time_ms) as max_response_time,
                     SUM(cost_estimate) as total_cost,
-                    SUM(sentences_processed) as total_sentences_processed,
-                    COUNT(DISTINCT model_used) as models_used
+                    SUM(CASE WHEN api_call_type != 'verdict_cache' THEN sentences_processed END) as total_sentences_processed,
+                    COUNT(DISTINCT model_used) as models_used,
+                    SUM(CASE WHEN api_call_type = 'verdict_cache' THEN batch_size END) as cache_lookups,
+                    SUM(CASE WHEN api_call_type = 'verdict_cache' THEN sentences_processed END) as cache_hits
                 FROM performance_metrics 
                 WHERE stage_name = %s 
-                AND processing_date >= NOW() - INTERVAL '%s hours'
+                AND processing_date >= NOW() - (%s * INTERVAL '1 hour')
             """
             
             results = self.db.execute_query(query, (stage_name, hours_back))
             
             if results:
                 row = results[0]
+                # DatabaseManager returns SELECT rows as dictionaries
+                if isinstance(row, dict):
+                    row = list(row.values())
                 return {
                     'stage_name': stage_name,
                     'total_calls': row[0] or 0,
@@ -196,6 +226,9 @@ class PerformanceTracker:
                     'total_cost_estimate': row[6] or 0,
                     'total_sentences_processed': row[7] or 0,
                     'models_used_count': row[8] or 0,
+                    'cache_lookups': row[9] or 0,
+                    'cache_hits': row[10] or 0,
+                    'cache_hit_rate': (row[10] or 0) / max(row[9] or 1, 1) * 100,
                     'hours_back': hours_back
                 }
             
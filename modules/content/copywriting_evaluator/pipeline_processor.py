@@ -14,6 +14,7 @@ import os
 import logging
 import asyncio
 import re
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
@@ -25,6 +26,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
 
 from modules.database.database_manager import DatabaseManager
 from modules.content.copywriting_evaluator.performance_tracker import PerformanceTracker
+from modules.content.copywriting_evaluator.verdict_cache import VerdictCache
 
 logger = logging.getLogger(__name__)
 
@@ -41,11 +43,28 @@ class ProcessingStage(Enum):
     TONE_ANALYSIS = "tone_analysis"
     SKILL_ANALYSIS = "skill_analysis"
 
+# Stages backed by Gemini calls (batched, run concurrently when pipelined)
+AI_STAGES = (ProcessingStage.TRUTHFULNESS, ProcessingStage.TONE_ANALYSIS, ProcessingStage.SKILL_ANALYSIS)
+
+# Statuses that mean a sentence still needs a stage
+STAGE_PENDING_STATUSES = ('pending', 'error', 'testing')
+
+# Queue marker closing a pipelined stage's input
+_END_OF_STREAM = object()
+
 @dataclass
 class PipelineConfig:
     """Configuration for pipeline processing"""
     mode: ProcessingMode = ProcessingMode.TESTING
-    batch_size: int = 5
+    # Sentences handed to an AI stage per call; the analyzers pack each call
+    # into as few Gemini requests as their token budget allows
+    batch_size: int = 50
+    # Stages run as a producer/consumer pipeline; AI stages keep up to
+    # ai_concurrency Gemini batches in flight (shared rate limit applies)
+    pipelined_stages: bool = True
+    ai_concurrency: int = 4
+    # Serve AI stage results for already-evaluated texts from the verdict cache
+    use_verdict_cache: bool = True
     max_consecutive_errors: int = 15
     error_cooldown_hours: int = 23
     retry_attempts: int = 1
@@ -67,6 +86,9 @@ class ProcessingStats:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     stage_stats: Optional[Dict[str, Dict]] = None
+    # Time spent in stage processors vs writing stage results, summed over stages
+    processor_seconds: float = 0.0
+    db_seconds: float = 0.0
     
     def __post_init__(self):
         if self.stage_stats is None:
@@ -85,6 +107,7 @@ class CopywritingEvaluatorPipeline:
         self.config = config if config is not None else PipelineConfig()
         self.db = DatabaseManager()
         self.performance_tracker = PerformanceTracker()
+        self.verdict_cache = VerdictCache(self.db)
         
         # Error tracking - integrate with comprehensive error handler
         self.consecutive_errors = 0
@@ -408,19 +431,25 @@ class CopywritingEvaluatorPipeline:
                 start_index = processing_stages.index(restart_from_stage)
                 processing_stages = processing_stages[start_index:]
             
-            for stage in processing_stages:
-                stage_stats = await self._process_stage(stage, sentences, session_id)
-                if stats.stage_stats is not None:
-                    stats.stage_stats[stage.value] = stage_stats
-                
-                # Update sentence list based on stage results (remove filtered/rejected)
-                if stage == ProcessingStage.KEYWORD_FILTER:
-                    stats.filtered_sentences += stage_stats.get('rejected', 0)
-                    sentences = [s for s in sentences if s['keyword_filter_status'] != 'rejected']
-                
-                # Stop if all sentences rejected or error limit reached
-                if not sentences or self.consecutive_errors >= self.config.max_consecutive_errors:
-                    break
+            if self.config.pipelined_stages and len(processing_stages) > 1:
+                # Batches flow into the next stage as soon as they clear the previous one
+                stage_results, sentences = await self._process_stages_pipelined(
+                    processing_stages, sentences, session_id
+                )
+                for stage in processing_stages:
+                    self._record_stage_stats(stats, stage, stage_results[stage.value])
+            else:
+                for stage in processing_stages:
+                    stage_stats = await self._process_stage(stage, sentences, session_id)
+                    self._record_stage_stats(stats, stage, stage_stats)
+                    
+                    # Update sentence list based on stage results (remove filtered/rejected)
+                    if stage == ProcessingStage.KEYWORD_FILTER:
+                        sentences = [s for s in sentences if s['keyword_filter_status'] != 'rejected']
+                    
+                    # Stop if all sentences rejected or error limit reached
+                    if not sentences or self.consecutive_errors >= self.config.max_consecutive_errors:
+                        break
             
             stats.processed_sentences = len(sentences)
             stats.approved_sentences = len([s for s in sentences if s.get('final_status') == 'approved'])
@@ -441,6 +470,16 @@ class CopywritingEvaluatorPipeline:
         logger.info(f"Pipeline processing complete: {stats.processed_sentences}/{stats.total_sentences} processed")
         return stats
     
+    def _record_stage_stats(self, stats: ProcessingStats, stage: ProcessingStage, stage_stats: Dict) -> None:
+        """Fold one stage's statistics into the session statistics"""
+        if stats.stage_stats is not None:
+            stats.stage_stats[stage.value] = stage_stats
+        stats.processor_seconds += stage_stats.get('processor_seconds', 0.0)
+        stats.db_seconds += stage_stats.get('db_seconds', 0.0)
+        
+        if stage == ProcessingStage.KEYWORD_FILTER:
+            stats.filtered_sentences += stage_stats.get('rejected', 0)
+    
     async def _get_sentences_for_processing(self, table_name: Optional[str], 
                                           sentence_ids: Optional[List[str]], 
                                           restart_from_stage: Optional[ProcessingStage]) -> List[Dict]:
@@ -496,27 +535,46 @@ class CopywritingEvaluatorPipeline:
         
         return all_sentences
     
-    async def _process_stage(self, stage: ProcessingStage, sentences: List[Dict], 
-                           session_id: str) -> Dict:
-        """Process sentences through a specific pipeline stage"""
-        
-        processor = self._get_stage_processor(stage)
-        stage_stats = {
+    def _new_stage_stats(self, stage: ProcessingStage, total_sentences: int) -> Dict:
+        """Empty statistics record for a stage"""
+        return {
             'stage': stage.value,
-            'total_sentences': len(sentences),
+            'total_sentences': total_sentences,
             'processed': 0,
             'approved': 0,
             'rejected': 0,
             'errors': 0,
+            'cache_hits': 0,
+            'processor_seconds': 0.0,
+            'db_seconds': 0.0,
             'start_time': datetime.now()
         }
+    
+    def _finish_stage_stats(self, stage: ProcessingStage, stage_stats: Dict) -> None:
+        stage_stats['end_time'] = datetime.now()
+        stage_stats['duration_seconds'] = (stage_stats['end_time'] - stage_stats['start_time']).total_seconds()
+        
+        logger.info(f"Stage {stage.value} complete: {stage_stats['processed']} processed, "
+                   f"{stage_stats['approved']} approved, {stage_stats['rejected']} rejected "
+                   f"(processor {stage_stats['processor_seconds']:.2f}s, db {stage_stats['db_seconds']:.2f}s)")
+        
+        token_usage = getattr(self._stage_processors.get(stage), 'token_usage', None)
+        if token_usage is not None:
+            stage_stats['token_usage'] = token_usage.snapshot()
+    
+    async def _process_stage(self, stage: ProcessingStage, sentences: List[Dict], 
+                           session_id: str) -> Dict:
+        """Process sentences through a specific pipeline stage"""
+        
+        processor = self._get_stage_processor(stage)
+        stage_stats = self._new_stage_stats(stage, len(sentences))
         
         logger.info(f"Processing {stage.value}: {len(sentences)} sentences")
         
         try:
             # Filter sentences that need processing for this stage
             stage_column = f"{stage.value}_status"
-            sentences_to_process = [s for s in sentences if s.get(stage_column) in ['pending', 'error', 'testing']]
+            sentences_to_process = [s for s in sentences if s.get(stage_column) in STAGE_PENDING_STATUSES]
 
             # DEBUG: Log filtering details
             if len(sentences) > 0:
@@ -532,115 +590,263 @@ class CopywritingEvaluatorPipeline:
                 logger.info(f"No sentences need {stage.value} processing (filtered {len(sentences)} sentences)")
                 return stage_stats
             
-            # Process in batches
-            batch_size = self.config.batch_size if stage in [ProcessingStage.TRUTHFULNESS, 
-                                                           ProcessingStage.TONE_ANALYSIS,
-                                                           ProcessingStage.SKILL_ANALYSIS] else 1
+            # Process in batches (every stage, so DB write-back is one UPDATE per batch)
+            batch_size = self.config.batch_size
+            
+            # id -> sentence for O(1) status propagation
+            sentences_by_id = {sentence['id']: sentence for sentence in sentences}
             
             for i in range(0, len(sentences_to_process), batch_size):
                 batch = sentences_to_process[i:i + batch_size]
                 
-                try:
-                    # Process batch through stage processor
-                    results = await processor.process_batch(batch, session_id)
+                if not await self._process_stage_batch(stage, processor, batch, sentences_by_id,
+                                                       stage_stats, session_id):
+                    break
+        
+        finally:
+            self._finish_stage_stats(stage, stage_stats)
+        
+        return stage_stats
+    
+    async def _process_stage_batch(self, stage: ProcessingStage, processor, batch: List[Dict],
+                                   sentences_by_id: Dict[Any, Dict], stage_stats: Dict,
+                                   session_id: str) -> bool:
+        """
+        Run one batch through a stage processor and persist the results
+        
+        Returns:
+            False when the error limit was reached and the stage should stop
+        """
+        stage_column = f"{stage.value}_status"
+        
+        try:
+            # Process batch through stage processor
+            started = time.perf_counter()
+            if stage in AI_STAGES and self.config.use_verdict_cache:
+                cached = await self.verdict_cache.process_batch(stage.value, processor, batch, session_id)
+                results = cached['results']
+                stage_stats['cache_hits'] += cached['cache_hits']
+                self.performance_tracker.log_cache_lookup(stage.value, len(batch), cached['cache_hits'], session_id)
+            else:
+                results = await processor.process_batch(batch, session_id)
+            stage_stats['processor_seconds'] += time.perf_counter() - started
 
-                    # Update database with results
-                    await self._update_stage_results(stage, results)
+            # Update database with results
+            started = time.perf_counter()
+            await self._update_stage_results(stage, results)
+            stage_stats['db_seconds'] += time.perf_counter() - started
 
-                    # Update in-memory sentence dictionaries with new status
-                    # This is CRITICAL - without this, subsequent stages won't see updated statuses
-                    stage_column = f"{stage.value}_status"
-                    for result in results:
-                        sentence_id = result['id']
-                        # Find matching sentence in the original list and update its status
-                        for sentence in sentences:
-                            if sentence['id'] == sentence_id:
-                                sentence[stage_column] = result['status']
-                                break
+            # Update in-memory sentence dictionaries with new status
+            # This is CRITICAL - without this, subsequent stages won't see updated statuses
+            for result in results:
+                sentence = sentences_by_id.get(result['id'])
+                if sentence is not None:
+                    sentence[stage_column] = result['status']
 
-                    # Update statistics
-                    for result in results:
-                        stage_stats['processed'] += 1
-                        if result.get('status') == 'approved':
-                            stage_stats['approved'] += 1
-                        elif result.get('status') == 'rejected':
-                            stage_stats['rejected'] += 1
+            # Update statistics
+            for result in results:
+                stage_stats['processed'] += 1
+                if result.get('status') == 'approved':
+                    stage_stats['approved'] += 1
+                elif result.get('status') == 'rejected':
+                    stage_stats['rejected'] += 1
 
-                    # Reset consecutive errors on successful batch
-                    if self.config.mode == ProcessingMode.PRODUCTION:
-                        self.consecutive_errors = 0
+            # Reset consecutive errors on successful batch
+            if self.config.mode == ProcessingMode.PRODUCTION:
+                self.consecutive_errors = 0
+        
+        except Exception as e:
+            logger.error(f"Batch processing failed in {stage.value}: {str(e)}")
+            stage_stats['errors'] += 1
+            
+            # Record error using comprehensive error handler
+            self.error_handler.record_error(e, {
+                'session_id': session_id,
+                'stage_name': stage.value,
+                'batch_size': len(batch),
+                'processing_mode': self.config.mode.value
+            })
+            
+            # Update local tracking for compatibility
+            if self.config.mode == ProcessingMode.PRODUCTION:
+                self.consecutive_errors = self.error_handler.consecutive_errors
+                self.last_error_time = self.error_handler.last_error_time
+                self.cooldown_until = self.error_handler.cooldown_until
                 
-                except Exception as e:
-                    logger.error(f"Batch processing failed in {stage.value}: {str(e)}")
-                    stage_stats['errors'] += 1
-                    
-                    # Record error using comprehensive error handler
-                    self.error_handler.record_error(e, {
-                        'session_id': session_id,
-                        'stage_name': stage.value,
-                        'batch_size': len(batch),
-                        'processing_mode': self.config.mode.value
-                    })
-                    
-                    # Update local tracking for compatibility
-                    if self.config.mode == ProcessingMode.PRODUCTION:
-                        self.consecutive_errors = self.error_handler.consecutive_errors
-                        self.last_error_time = self.error_handler.last_error_time
-                        self.cooldown_until = self.error_handler.cooldown_until
-                        
-                        # Check if we hit error limit
-                        if self.error_handler.is_in_cooldown():
-                            logger.error(f"Error limit reached. Cooldown until {self.cooldown_until}")
-                            break
-                    
-                    # Continue processing remaining batches unless in cooldown
-                    continue
+                # Check if we hit error limit
+                if self.error_handler.is_in_cooldown():
+                    logger.error(f"Error limit reached. Cooldown until {self.cooldown_until}")
+                    return False
         
-        finally:
-            stage_stats['end_time'] = datetime.now()
-            stage_stats['duration_seconds'] = (stage_stats['end_time'] - stage_stats['start_time']).total_seconds()
+        # Continue processing remaining batches unless in cooldown
+        return True
+    
+    async def _process_stages_pipelined(self, stages: List[ProcessingStage], sentences: List[Dict],
+                                        session_id: str) -> Tuple[Dict[str, Dict], List[Dict]]:
+        """
+        Run stages concurrently as a chain of queues
         
-        logger.info(f"Stage {stage.value} complete: {stage_stats['processed']} processed, "
-                   f"{stage_stats['approved']} approved, {stage_stats['rejected']} rejected")
+        Each stage consumes sentences from its inbox, processes them in
+        batches and forwards them to the next stage as soon as its batch is
+        written, so later stages start while earlier ones are still running.
+        Progress is persisted per batch through the *_status columns, so an
+        interrupted run resumes with restart_from_stage as before.
         
-        return stage_stats
+        Returns:
+            Tuple of (stage statistics by stage name, sentences that left the last stage)
+        """
+        sentences_by_id = {sentence['id']: sentence for sentence in sentences}
+        queues = [asyncio.Queue() for _ in range(len(stages) + 1)]
+        stage_results = {stage.value: self._new_stage_stats(stage, 0) for stage in stages}
+        
+        logger.info(f"Pipelined processing: {len(sentences)} sentences through {len(stages)} stages "
+                   f"(AI concurrency {self.config.ai_concurrency})")
+        
+        workers = [
+            asyncio.create_task(self._run_pipelined_stage(
+                stage, queues[index], queues[index + 1], sentences_by_id,
+                stage_results[stage.value], session_id
+            ))
+            for index, stage in enumerate(stages)
+        ]
+        
+        for sentence in sentences:
+            queues[0].put_nowait(sentence)
+        queues[0].put_nowait(_END_OF_STREAM)
+        
+        remaining = []
+        while True:
+            item = await queues[-1].get()
+            if item is _END_OF_STREAM:
+                break
+            remaining.append(item)
+        
+        await asyncio.gather(*workers)
+        return stage_results, remaining
     
-    async def _update_stage_results(self, stage: ProcessingStage, results: List[Dict]):
-        """Update database with stage processing results"""
+    async def _run_pipelined_stage(self, stage: ProcessingStage, inbox: asyncio.Queue, outbox: asyncio.Queue,
+                                   sentences_by_id: Dict[Any, Dict], stage_stats: Dict, session_id: str) -> None:
+        """Consume one stage's inbox, keeping up to ai_concurrency batches in flight"""
+        processor = None
+        batch_size = self.config.batch_size
+        slots = asyncio.Semaphore(self.config.ai_concurrency if stage in AI_STAGES else 1)
+        stage_column = f"{stage.value}_status"
+        in_flight = set()
+        pending: List[Dict] = []
+        halted = False
+        
+        def forward(sentence: Dict) -> None:
+            # Keyword filter rejections leave the pipeline
+            if stage == ProcessingStage.KEYWORD_FILTER and sentence.get(stage_column) == 'rejected':
+                return
+            outbox.put_nowait(sentence)
+        
+        async def run_batch(batch: List[Dict]) -> None:
+            nonlocal halted
+            try:
+                if not halted and not await self._process_stage_batch(
+                    stage, processor, batch, sentences_by_id, stage_stats, session_id
+                ):
+                    halted = True
+            finally:
+                slots.release()
+            for sentence in batch:
+                forward(sentence)
+        
+        async def dispatch(batch: List[Dict]) -> None:
+            await slots.acquire()
+            task = asyncio.create_task(run_batch(batch))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
         
-        for result in results:
-            table_name = result['table_name']
-            sentence_id = result['id']
-            status = result['status']
-            
-            # Build update query for stage-specific columns
-            stage_column = f"{stage.value}_status"
-            date_column = f"{stage.value}_date"
-            
-            update_columns = [f"{stage_column} = %s", f"{date_column} = CURRENT_DATE"]
-            params = [status]
-            
-            # Add model info for AI stages
-            if stage in [ProcessingStage.TRUTHFULNESS, ProcessingStage.TONE_ANALYSIS, ProcessingStage.SKILL_ANALYSIS]:
-                model_column = f"{stage.value}_model"
-                update_columns.append(f"{model_column} = %s")
-                params.append(result.get('model_used', 'unknown'))
-            
-            # Add error message if present
-            if result.get('error_message'):
-                error_column = f"{stage.value}_error_message"
-                update_columns.append(f"{error_column} = %s")
-                params.append(result['error_message'])
+        try:
+            processor = self._get_stage_processor(stage)
             
-            params.append(sentence_id)
+            while True:
+                sentence = await inbox.get()
+                if sentence is _END_OF_STREAM:
+                    break
+                
+                stage_stats['total_sentences'] += 1
+                halted = halted or self.consecutive_errors >= self.config.max_consecutive_errors
+                
+                # Already-processed sentences (and everything after the error limit) pass through;
+                # unprocessed ones keep their pending status for the next run
+                if halted or sentence.get(stage_column) not in STAGE_PENDING_STATUSES:
+                    forward(sentence)
+                    continue
+                
+                pending.append(sentence)
+                if len(pending) >= batch_size:
+                    await dispatch(pending)
+                    pending = []
             
-            update_query = f"""
-                UPDATE {table_name}
-                SET {', '.join(update_columns)}
-                WHERE id = %s
-            """
+            if pending:
+                await dispatch(pending)
+            if in_flight:
+                await asyncio.gather(*list(in_flight))
+        
+        finally:
+            outbox.put_nowait(_END_OF_STREAM)
+            self._finish_stage_stats(stage, stage_stats)
+    
+    async def _update_stage_results(self, stage: ProcessingStage, results: List[Dict]):
+        """Update database with stage processing results (one UPDATE per table)"""
+        
+        results_by_table: Dict[str, List[Dict]] = {}
+        for result in results:
+            results_by_table.setdefault(result['table_name'], []).append(result)
+        
+        for table_name, table_results in results_by_table.items():
+            update_query, params = self._build_stage_update(stage, table_name, table_results)
+            self.db.execute_query(update_query, params)
+    
+    def _build_stage_update(self, stage: ProcessingStage, table_name: str,
+                            results: List[Dict]) -> Tuple[str, tuple]:
+        """
+        Build a single UPDATE ... FROM (VALUES ...) for a batch of stage results
+        
+        Args:
+            stage: Stage the results belong to
+            table_name: Table all results belong to
+            results: Stage results with id, status and optional model_used/error_message
             
-            self.db.execute_query(update_query, tuple(params))
+        Returns:
+            Tuple of (query, params)
+        """
+        stage_column = f"{stage.value}_status"
+        date_column = f"{stage.value}_date"
+        error_column = f"{stage.value}_error_message"
+        
+        update_columns = [f"{stage_column} = v.status", f"{date_column} = CURRENT_DATE"]
+        
+        # Add model info for AI stages
+        if stage in [ProcessingStage.TRUTHFULNESS, ProcessingStage.TONE_ANALYSIS, ProcessingStage.SKILL_ANALYSIS]:
+            update_columns.append(f"{stage.value}_model = v.model_used")
+        
+        # Error messages only overwrite the column when present
+        if any(result.get('error_message') for result in results):
+            update_columns.append(f"{error_column} = COALESCE(v.error_message, t.{error_column})")
+        
+        values_rows = []
+        params = []
+        for result in results:
+            values_rows.append("(%s, %s, %s, %s)")
+            params.extend([
+                str(result['id']),
+                result['status'],
+                result.get('model_used', 'unknown'),
+                result.get('error_message') or None
+            ])
+        
+        update_query = f"""
+            UPDATE {table_name} AS t
+            SET {', '.join(update_columns)}
+            FROM (VALUES {', '.join(values_rows)}) AS v(id, status, model_used, error_message)
+            WHERE t.id = CAST(v.id AS uuid)
+        """
+        
+        return update_query, tuple(params)
     
     async def _handle_pipeline_error(self, error: Exception, session_id: str):
         """Handle pipeline-level errors using comprehensive error handler"""
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Prompt Packing - Token-Budgeted Batching and Prefix Reuse for Gemini Stages
+
+The truthfulness, tone and skill analyzers send the same instruction block
+(and, for truthfulness, the whole atomic-truths file) with every request.
+This module lets them:
+
+1. Split each prompt into a static prefix and the per-batch sentence block,
+   so the prefix is sent as systemInstruction or, where the API allows it,
+   through an explicit Gemini context cache (cachedContents)
+2. Pack as many sentences per call as the model's input/output token budget
+   allows (20-50 typically) instead of a fixed batch size
+3. Halve a batch and retry when the response cannot be parsed (usually a
+   truncated JSON body on an oversized batch)
+4. Track prompt/cached/output tokens per sentence for each stage
+
+Author: Automated Job Application System
+Version: 1.0.0
+"""
+
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from modules.content.copywriting_evaluator.gemini_dispatcher import call_gemini
+
+logger = logging.getLogger(__name__)
+
+# Rough chars-per-token ratio for English prose with Gemini's tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text (ceil(len / CHARS_PER_TOKEN))"""
+    return -(-len(text or '') // CHARS_PER_TOKEN)
+
+
+class ResponseParseError(ValueError):
+    """Raised when a Gemini response for a batch cannot be parsed"""
+    pass
+
+
+@dataclass
+class TokenBudget:
+    """
+    Per-stage limits used to pack sentences into one Gemini request
+
+    Attributes:
+        max_output_tokens: generationConfig.maxOutputTokens for the stage
+        output_tokens_per_sentence: Expected JSON output per sentence
+        max_sentences: Hard cap on sentences per request
+        max_input_tokens: Input budget including the static prefix
+        sentence_overhead_tokens: Framing per sentence ("SENTENCE n: (ID: ...)")
+        safety_margin: Fraction of each budget actually used
+    """
+    max_output_tokens: int
+    output_tokens_per_sentence: int
+    max_sentences: int = 50
+    max_input_tokens: int = 100000
+    sentence_overhead_tokens: int = 20
+    safety_margin: float = 0.8
+
+    def pack(self, sentences: List[Dict], prefix_tokens: int = 0) -> List[List[Dict]]:
+        """
+        Greedily split sentences into batches that fit the budget
+
+        Args:
+            sentences: Sentence dictionaries with content_text
+            prefix_tokens: Tokens used by the static prompt prefix
+
+        Returns:
+            List of batches (every sentence appears exactly once, order kept)
+        """
+        output_budget = int(self.max_output_tokens * self.safety_margin)
+        max_by_output = max(1, output_budget // self.output_tokens_per_sentence)
+        max_per_batch = max(1, min(self.max_sentences, max_by_output))
+        input_budget = int(self.max_input_tokens * self.safety_margin) - prefix_tokens
+
+        batches = []
+        current: List[Dict] = []
+        current_tokens = 0
+
+        for sentence in sentences:
+            cost = estimate_tokens(sentence.get('content_text', '')) + self.sentence_overhead_tokens
+            if current and (len(current) >= max_per_batch or current_tokens + cost > input_budget):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(sentence)
+            current_tokens += cost
+
+        if current:
+            batches.append(current)
+        return batches
+
+
+class TokenUsage:
+    """Thread-safe token counters for one stage (from Gemini usageMetadata)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.sentences = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.output_tokens = 0
+        self.split_batches = 0
+
+    def record(self, usage_metadata: Optional[Dict], sentence_count: int) -> None:
+        """Add one response's usage"""
+        usage = usage_metadata or {}
+        with self._lock:
+            self.calls += 1
+            self.sentences += sentence_count
+            self.prompt_tokens += usage.get('promptTokenCount', 0)
+            self.cached_tokens += usage.get('cachedContentTokenCount', 0)
+            self.output_tokens += usage.get('candidatesTokenCount', 0)
+
+    def record_split(self) -> None:
+        with self._lock:
+            self.split_batches += 1
+
+    def snapshot(self) -> Dict:
+        """Counters plus tokens per sentence (cached prefix tokens shown separately)"""
+        with self._lock:
+            sentences = self.sentences or 1
+            return {
+                'calls': self.calls,
+                'sentences': self.sentences,
+                'sentences_per_call': round(self.sentences / self.calls, 1) if self.calls else 0.0,
+                'prompt_tokens': self.prompt_tokens,
+                'cached_tokens': self.cached_tokens,
+                'output_tokens': self.output_tokens,
+                'split_batches': self.split_batches,
+                'tokens_per_sentence': round((self.prompt_tokens + self.output_tokens) / sentences, 1),
+                'uncached_tokens_per_sentence': round(
+                    (self.prompt_tokens - self.cached_tokens + self.output_tokens) / sentences, 1
+                )
+            }
+
+
+class GeminiContextCache:
+    """
+    Explicit Gemini context caches for static prompt prefixes
+
+    One cachedContents entry is created per (model, prefix) and reused until
+    shortly before its TTL expires. Prefixes below the model's minimum
+    cacheable size, or models/keys where creation fails, fall back to sending
+    the prefix as systemInstruction (failures are remembered for one TTL so
+    creation is not retried on every call).
+    """
+
+    def __init__(self, post: Callable, api_base_url: str, api_key: str,
+                 ttl_seconds: int = 3600, min_prefix_tokens: int = 1024,
+                 request_timeout: int = 30, clock: Callable[[], float] = time.time):
+        """
+        Initialize the cache
+
+        Args:
+            post: requests.post-compatible callable
+            api_base_url: Gemini API base (e.g. https://generativelanguage.googleapis.com/v1beta)
+            api_key: Gemini API key
+            ttl_seconds: Lifetime of created caches
+            min_prefix_tokens: Smallest prefix worth caching
+            request_timeout: Timeout for cache creation requests
+            clock: Wall-clock time source (injectable for tests)
+        """
+        self._post = post
+        self.api_base_url = api_base_url.rstrip('/')
+        self.api_key = api_key
+        self.ttl_seconds = ttl_seconds
+        self.min_prefix_tokens = min_prefix_tokens
+        self.request_timeout = request_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (model, prefix digest) -> (cache name or None, expires_at)
+        self._entries: Dict[Tuple[str, str], Tuple[Optional[str], float]] = {}
+        # Keys whose cachedContents POST is in flight; set once the entry is published
+        self._creating: Dict[Tuple[str, str], threading.Event] = {}
+
+    def get(self, model: str, prefix: str) -> Optional[str]:
+        """
+        Get a cachedContents name for the prefix, creating it if needed
+
+        Returns:
+            Cache resource name, or None when the prefix should be sent inline
+        """
+        if estimate_tokens(prefix) < self.min_prefix_tokens:
+            return None
+
+        key = (model, hashlib.sha256(prefix.encode('utf-8')).hexdigest())
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            # Refresh a minute early so in-flight requests never hit an expired cache
+            if entry is not None and now < entry[1] - 60:
+                return entry[0]
+
+            creating = self._creating.get(key)
+            if creating is None:
+                creating = self._creating[key] = threading.Event()
+                owner = True
+            else:
+                owner = False
+                # While another thread refreshes, the old cache is still usable
+                if entry is not None and now < entry[1]:
+                    return entry[0]
+
+        if not owner:
+            # The POST runs outside the lock, so only callers for this key wait on it
+            creating.wait(self.request_timeout)
+            with self._lock:
+                entry = self._entries.get(key)
+                return entry[0] if entry is not None and self._clock() < entry[1] else None
+
+        name = None
+        try:
+            name = self._create(model, prefix)
+        finally:
+            with self._lock:
+                self._entries[key] = (name, now + self.ttl_seconds)
+                del self._creating[key]
+            creating.set()
+        return name
+
+    def _create(self, model: str, prefix: str) -> Optional[str]:
+        try:
+            response = self._post(
+                f"{self.api_base_url}/cachedContents?key={self.api_key}",
+                headers={"Content-Type": "application/json"},
+                json={
+                    "model": f"models/{model}",
+                    "systemInstruction": {"parts": [{"text": prefix}]},
+                    "ttl": f"{self.ttl_seconds}s"
+                },
+                timeout=self.request_timeout
+            )
+            if response.status_code == 200:
+                name = response.json().get('name')
+                logger.info(f"Created Gemini context cache {name} for {model} "
+                           f"(~{estimate_tokens(prefix)} prefix tokens)")
+                return name
+
+            logger.info(f"Gemini context caching unavailable for {model} "
+                       f"(HTTP {response.status_code}); sending prefix inline")
+        except Exception as e:
+            logger.warning(f"Gemini context cache creation failed for {model}: {str(e)}")
+        return None
+
+
+def apply_prompt_prefix(data: Dict, prefix: Optional[str], cached_content: Optional[str]) -> Dict:
+    """
+    Attach the static prefix to a generateContent request body
+
+    Args:
+        data: Request body with contents/generationConfig
+        prefix: Static prompt prefix (None to leave the body unchanged)
+        cached_content: cachedContents name holding the prefix, if any
+
+    Returns:
+        The same body, updated in place
+    """
+    if cached_content:
+        data["cachedContent"] = cached_content
+    elif prefix:
+        data["systemInstruction"] = {"parts": [{"text": prefix}]}
+    return data
+
+
+async def process_packed(sentences: List[Dict], budget: TokenBudget, prefix: str,
+                         run_batch: Callable[[List[Dict], bool], List[Dict]],
+                         usage: Optional[TokenUsage] = None, stage_name: str = 'gemini') -> List[Dict]:
+    """
+    Pack sentences into token-budgeted batches and run them concurrently
+
+    Args:
+        sentences: Sentences to process
+        budget: Stage token budget
+        prefix: Static prompt prefix (counted against the input budget)
+        run_batch: Blocking callable (batch, strict) -> results; with strict=True
+            it raises ResponseParseError instead of returning error results
+        usage: Stage token counters (records halvings)
+        stage_name: Stage name for logging
+
+    Returns:
+        Results for every sentence, in input order
+    """
+    batches = budget.pack(sentences, estimate_tokens(prefix))
+    logger.info(f"{stage_name}: packed {len(sentences)} sentences into {len(batches)} request(s)")
+
+    async def run_with_halving(batch: List[Dict]) -> List[Dict]:
+        splittable = len(batch) > 1
+        try:
+            return await call_gemini(run_batch, batch, splittable)
+        except ResponseParseError as e:
+            middle = len(batch) // 2
+            logger.warning(f"{stage_name}: unparseable response for {len(batch)} sentences ({str(e)}), "
+                          f"retrying as {middle} + {len(batch) - middle}")
+            if usage is not None:
+                usage.record_split()
+            left, right = await asyncio.gather(run_with_halving(batch[:middle]), run_with_halving(batch[middle:]))
+            return left + right
+
+    batch_results = await asyncio.gather(*(run_with_halving(batch) for batch in batches))
+    return [result for results in batch_results for result in results]
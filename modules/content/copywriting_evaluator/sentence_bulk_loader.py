@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Sentence Bulk Loader - Streaming COPY Ingestion for Sentence Banks
+
+Loads parsed CSV rows into sentence_bank_cover_letter / sentence_bank_resume
+in fixed-size chunks instead of one duplicate-check SELECT plus one INSERT
+per row:
+
+1. Rows are consumed from an iterator (the CSV is never fully in memory)
+2. Duplicates inside a chunk are dropped with a hash set of content digests
+3. Each chunk is COPYed into a temp staging table (ON COMMIT DELETE ROWS)
+4. One INSERT ... SELECT ... ON CONFLICT DO NOTHING merges the chunk against
+   the unique md5(content_text) index (database_migrations/005) and returns
+   the staged/inserted counts and new ids from the statement itself
+
+Duplicates across chunks and against existing rows are resolved by the
+unique index, so peak memory is bounded by chunk_size, not file size.
+
+Author: Automated Job Application System
+Version: 1.0.0
+"""
+
+import io
+import hashlib
+import logging
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Columns loaded per table (id and created_at come from the table defaults)
+COMMON_COLUMNS = (
+    'content_text', 'tone', 'tone_strength', 'status', 'matches_job_skill',
+    'keyword_filter_status', 'truthfulness_status', 'canadian_spelling_status',
+    'tone_analysis_status', 'skill_analysis_status'
+)
+
+TABLE_COLUMNS = {
+    'sentence_bank_cover_letter': COMMON_COLUMNS + ('position_label', 'variable'),
+    'sentence_bank_resume': COMMON_COLUMNS + ('body_section', 'experience_id'),
+}
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# SQLSTATE raised when ON CONFLICT names columns without a unique index
+# (psycopg2.errorcodes.INVALID_COLUMN_REFERENCE)
+INVALID_COLUMN_REFERENCE = '42P10'
+
+# Merge one staged chunk; counts and ids come back from the same statement
+MERGE_SQL = """
+    WITH staged AS (
+        SELECT {columns} FROM {staging}
+    ), inserted AS (
+        INSERT INTO {table} ({columns})
+        SELECT {columns} FROM staged
+        {conflict_clause}
+        RETURNING id
+    )
+    SELECT
+        (SELECT count(*) FROM staged) AS staged_count,
+        (SELECT count(*) FROM inserted) AS inserted_count,
+        ARRAY(SELECT id::text FROM inserted) AS inserted_ids
+"""
+
+# Uses the unique index from migration 005
+CONFLICT_ON_CONTENT_HASH = "ON CONFLICT ((md5(content_text))) DO NOTHING"
+
+# Fallback when the unique index has not been created yet (not race-free)
+CONFLICT_ANTI_JOIN = (
+    "WHERE NOT EXISTS (SELECT 1 FROM {table} existing "
+    "WHERE existing.content_text = staged.content_text)"
+)
+
+
+def _copy_value(value) -> str:
+    """Encode a value for COPY ... FROM STDIN (text format)"""
+    if value is None:
+        return '\\N'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+class SentenceBulkLoader:
+    """
+    Chunked COPY + merge loader for the sentence bank tables
+
+    Example:
+        >>> loader = SentenceBulkLoader(chunk_size=5000)
+        >>> result = loader.load(processor.iter_csv_rows(path, file_info), 'sentence_bank_resume')
+        >>> result['inserted_count'], result['duplicate_count']
+    """
+
+    def __init__(self, connection_factory: Optional[Callable] = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the loader
+
+        Args:
+            connection_factory: Callable returning a psycopg2 connection
+                (defaults to the environment-aware database config)
+            chunk_size: Rows per COPY/merge round trip
+        """
+        self._connection_factory = connection_factory or self._default_connection
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def _default_connection():
+        """Open a psycopg2 connection using the environment-aware database config"""
+        import psycopg2
+        from modules.database.database_config import get_database_config
+
+        return psycopg2.connect(get_database_config().get_connection_url())
+
+    def load(self, rows: Iterable[Dict], table_name: str) -> Dict:
+        """
+        Stream rows into a sentence bank table
+
+        Args:
+            rows: Parsed row dictionaries (any iterable; consumed once)
+            table_name: 'sentence_bank_cover_letter' or 'sentence_bank_resume'
+
+        Returns:
+            Dictionary with rows_processed, inserted_count, duplicate_count,
+            error_count, chunk_count and sentence_ids
+        """
+        if table_name not in TABLE_COLUMNS:
+            raise ValueError(f"Unknown table name: {table_name}")
+
+        columns = TABLE_COLUMNS[table_name]
+        staging = f"{table_name}_staging"
+        result = {
+            'rows_processed': 0,
+            'inserted_count': 0,
+            'duplicate_count': 0,
+            'error_count': 0,
+            'chunk_count': 0,
+            'sentence_ids': []
+        }
+
+        conn = self._connection_factory()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+                    f"(LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+                )
+            conn.commit()
+
+            conflict_clause = CONFLICT_ON_CONTENT_HASH
+            iterator = iter(rows)
+
+            while True:
+                chunk = list(islice(iterator, self.chunk_size))
+                if not chunk:
+                    break
+
+                result['rows_processed'] += len(chunk)
+                result['chunk_count'] += 1
+
+                unique_rows = self._dedupe_chunk(chunk)
+                result['duplicate_count'] += len(chunk) - len(unique_rows)
+
+                try:
+                    staged, inserted_ids = self._merge_chunk(
+                        conn, unique_rows, table_name, staging, columns, conflict_clause
+                    )
+                except Exception as e:
+                    conn.rollback()
+                    if conflict_clause is CONFLICT_ON_CONTENT_HASH and self._is_missing_index_error(e):
+                        logger.warning(
+                            f"No unique md5(content_text) index on {table_name} "
+                            f"(run database_migrations/005_sentence_bank_content_hash.sql); "
+                            f"falling back to anti-join dedupe"
+                        )
+                        conflict_clause = CONFLICT_ANTI_JOIN.format(table=table_name)
+                        try:
+                            staged, inserted_ids = self._merge_chunk(
+                                conn, unique_rows, table_name, staging, columns, conflict_clause
+                            )
+                        except Exception as retry_error:
+                            conn.rollback()
+                            self._record_chunk_error(result, unique_rows, retry_error)
+                            continue
+                    else:
+                        self._record_chunk_error(result, unique_rows, e)
+                        continue
+
+                result['inserted_count'] += len(inserted_ids)
+                result['duplicate_count'] += staged - len(inserted_ids)
+                result['sentence_ids'].extend(inserted_ids)
+
+                logger.debug(f"Chunk {result['chunk_count']}: {staged} staged, {len(inserted_ids)} inserted")
+
+        finally:
+            conn.close()
+
+        logger.info(
+            f"Bulk load into {table_name} complete: {result['inserted_count']} inserted, "
+            f"{result['duplicate_count']} duplicates, {result['error_count']} errors "
+            f"({result['rows_processed']} rows in {result['chunk_count']} chunks)"
+        )
+        return result
+
+    @staticmethod
+    def _dedupe_chunk(chunk: List[Dict]) -> List[Dict]:
+        """Drop rows whose content repeats an earlier row in the same chunk"""
+        seen = set()
+        unique_rows = []
+        for row in chunk:
+            digest = hashlib.md5(row['content_text'].encode('utf-8')).digest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+            unique_rows.append(row)
+        return unique_rows
+
+    def _merge_chunk(self, conn, rows: List[Dict], table_name: str, staging: str,
+                     columns: tuple, conflict_clause: str) -> tuple:
+        """COPY rows into staging and merge them; returns (staged_count, inserted_ids)"""
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write('\t'.join(_copy_value(row.get(column)) for column in columns))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        column_list = ', '.join(columns)
+        with conn.cursor() as cursor:
+            cursor.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN", buffer)
+            cursor.execute(MERGE_SQL.format(
+                columns=column_list,
+                staging=staging,
+                table=table_name,
+                conflict_clause=conflict_clause
+            ))
+            staged_count, _, inserted_ids = cursor.fetchone()
+
+        # Commit empties the staging table (ON COMMIT DELETE ROWS)
+        conn.commit()
+        return staged_count, list(inserted_ids or [])
+
+    @staticmethod
+    def _is_missing_index_error(error: Exception) -> bool:
+        return getattr(error, 'pgcode', None) == INVALID_COLUMN_REFERENCE
+
+    @staticmethod
+    def _record_chunk_error(result: Dict, rows: List[Dict], error: Exception) -> None:
+        result['error_count'] += len(rows)
+        logger.error(f"Bulk load chunk of {len(rows)} rows failed: {str(error)}")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Verdict Cache - Content-Addressed Store for AI Stage Results
+
+Seed-sentence variation runs produce many identical or near-identical
+sentences, and each of them used to go through every Gemini stage. The
+verdict cache stores the result of a truthfulness, tone or skill evaluation
+keyed by:
+
+    (normalized text hash, stage, prompt version, model)
+
+and is consulted before a batch is sent to the stage processor. Hits are
+applied without an API call; repeated texts within one batch are sent once.
+
+The prompt version is a hash of the processor's static prompt prefix, so
+editing a prompt (or, for truthfulness, the atomic truths) starts a fresh
+cache automatically. Only approved/rejected verdicts are stored; errors are
+always retried.
+
+Table: copywriting_verdict_cache (database_migrations/006_copywriting_verdict_cache.sql)
+
+Author: Automated Job Application System
+Version: 1.0.0
+"""
+
+import re
+import json
+import hashlib
+import logging
+import unicodedata
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Verdict statuses worth reusing (errors are retried)
+CACHEABLE_STATUSES = ('approved', 'rejected')
+
+# Per-sentence / per-run fields that are not part of the verdict
+_UNCACHED_FIELDS = ('id', 'table_name', 'error_message', 'analysis_timestamp', 'evaluation_timestamp')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """Normalize sentence text for hashing (Unicode NFKC, case-folded, collapsed whitespace)"""
+    normalized = unicodedata.normalize('NFKC', text or '')
+    return _WHITESPACE_RE.sub(' ', normalized).strip().casefold()
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 hex digest of the normalized sentence text"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def prompt_version(processor: Any) -> str:
+    """
+    Version identifier for a stage processor's prompt
+
+    Uses the static prompt prefix when the processor has one, so any prompt
+    change invalidates previously cached verdicts.
+    """
+    prefix = getattr(processor, 'prompt_prefix', None)
+    if isinstance(prefix, str) and prefix:
+        return hashlib.sha256(prefix.encode('utf-8')).hexdigest()[:16]
+    return type(processor).__name__
+
+
+class VerdictCache:
+    """
+    Stage result cache backed by the copywriting_verdict_cache table
+
+    Cache failures never stop processing: lookups that fail count as misses
+    and failed stores are logged and skipped.
+    """
+
+    def __init__(self, db):
+        """
+        Initialize verdict cache
+
+        Args:
+            db: DatabaseManager (or compatible object with execute_query)
+        """
+        self.db = db
+        self.stats = {'lookups': 0, 'hits': 0, 'batch_duplicates': 0, 'stored': 0}
+
+    def lookup(self, stage_name: str, version: str, model: str, hashes: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch cached verdicts for a set of text hashes
+
+        Returns:
+            Dictionary of text hash -> verdict
+        """
+        if not hashes:
+            return {}
+
+        placeholders = ', '.join(['%s'] * len(hashes))
+        key_params = (stage_name, version, model)
+
+        try:
+            rows = self.db.execute_query(f"""
+                SELECT text_hash, verdict
+                FROM copywriting_verdict_cache
+                WHERE stage_name = %s AND prompt_version = %s AND model = %s
+                AND text_hash IN ({placeholders})
+            """, key_params + tuple(hashes))
+        except Exception as e:
+            logger.warning(f"Verdict cache lookup failed for {stage_name}: {str(e)}")
+            return {}
+
+        verdicts = {}
+        for row in rows or []:
+            verdict = row['verdict']
+            verdicts[row['text_hash']] = json.loads(verdict) if isinstance(verdict, str) else verdict
+
+        if verdicts:
+            hit_placeholders = ', '.join(['%s'] * len(verdicts))
+            try:
+                self.db.execute_query(f"""
+                    UPDATE copywriting_verdict_cache
+                    SET hit_count = hit_count + 1, last_hit_at = NOW()
+                    WHERE stage_name = %s AND prompt_version = %s AND model = %s
+                    AND text_hash IN ({hit_placeholders})
+                """, key_params + tuple(verdicts))
+            except Exception as e:
+                logger.debug(f"Verdict cache hit count update failed: {str(e)}")
+
+        return verdicts
+
+    def store(self, stage_name: str, version: str, model: str, verdicts: Dict[str, Dict]) -> None:
+        """
+        Store verdicts (text hash -> stage result) in one upsert
+
+        Results with non-cacheable statuses are skipped.
+        """
+        rows = [
+            (digest, {k: v for k, v in result.items() if k not in _UNCACHED_FIELDS})
+            for digest, result in verdicts.items()
+            if result.get('status') in CACHEABLE_STATUSES
+        ]
+        if not rows:
+            return
+
+        values_rows = []
+        params = []
+        for digest, verdict in rows:
+            values_rows.append("(%s, %s, %s, %s, CAST(%s AS jsonb))")
+            params.extend([digest, stage_name, version, model, json.dumps(verdict, default=str)])
+
+        try:
+            self.db.execute_query(f"""
+                INSERT INTO copywriting_verdict_cache (text_hash, stage_name, prompt_version, model, verdict)
+                VALUES {', '.join(values_rows)}
+                ON CONFLICT (text_hash, stage_name, prompt_version, model)
+                DO UPDATE SET verdict = EXCLUDED.verdict, created_at = NOW()
+            """, tuple(params))
+            self.stats['stored'] += len(rows)
+        except Exception as e:
+            logger.warning(f"Verdict cache store failed for {stage_name}: {str(e)}")
+
+    async def process_batch(self, stage_name: str, processor: Any, sentences: List[Dict],
+                            session_id: str) -> Dict[str, Any]:
+        """
+        Run a batch through a stage processor, serving cached verdicts first
+
+        Args:
+            stage_name: Pipeline stage name
+            processor: Stage processor with async process_batch and primary_model
+            sentences: Sentences to evaluate
+            session_id: Session identifier for tracking
+
+        Returns:
+            Dictionary with results (one per sentence, like processor.process_batch),
+            cache_hits and batch_duplicates
+        """
+        version = prompt_version(processor)
+        model = str(getattr(processor, 'primary_model', 'unknown'))
+        hash_by_id = {sentence['id']: text_hash(sentence.get('content_text', '')) for sentence in sentences}
+
+        cached = self.lookup(stage_name, version, model, list(set(hash_by_id.values())))
+
+        results = []
+        to_process = []
+        duplicates = []
+        first_by_hash = {}
+        for sentence in sentences:
+            digest = hash_by_id[sentence['id']]
+            if digest in cached:
+                results.append(self._apply(cached[digest], sentence))
+            elif digest in first_by_hash:
+                duplicates.append(sentence)
+            else:
+                first_by_hash[digest] = sentence
+                to_process.append(sentence)
+
+        cache_hits = len(results)
+        if to_process:
+            fresh = await processor.process_batch(to_process, session_id)
+            results.extend(fresh)
+
+            fresh_by_hash = {hash_by_id[r['id']]: r for r in fresh if r.get('id') in hash_by_id}
+            self.store(stage_name, version, model, fresh_by_hash)
+
+            for sentence in duplicates:
+                result = fresh_by_hash.get(hash_by_id[sentence['id']])
+                if result is not None:
+                    results.append(self._apply(result, sentence))
+
+        self.stats['lookups'] += len(sentences)
+        self.stats['hits'] += cache_hits
+        self.stats['batch_duplicates'] += len(duplicates)
+
+        if cache_hits or duplicates:
+            logger.info(f"Verdict cache {stage_name}: {cache_hits} hits, {len(duplicates)} in-batch duplicates, "
+                       f"{len(to_process)} sent to processor")
+
+        return {'results': results, 'cache_hits': cache_hits, 'batch_duplicates': len(duplicates)}
+
+    @staticmethod
+    def _apply(verdict: Dict, sentence: Dict) -> Dict:
+        """Build a stage result for a sentence from a cached (or sibling) verdict"""
+        result = {k: v for k, v in verdict.items() if k not in _UNCACHED_FIELDS}
+        result.update({'id': sentence.get('id'), 'table_name': sentence.get('table_name')})
+        if verdict.get('error_message'):
+            result['error_message'] = verdict['error_message']
+        return result
+
+    def get_stats(self) -> Dict:
+        """Cache counters for this process"""
+        return dict(self.stats, hit_rate=round(self.stats['hits'] / max(self.stats['lookups'], 1) * 100, 1))
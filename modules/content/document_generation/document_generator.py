@@ -13,6 +13,7 @@ Description: Handles Word document generation using template system. Loads .docx
 
 import os
 import logging
+import shutil
 import uuid
 from datetime import datetime, timedelta
 
@@ -31,9 +32,12 @@ except ImportError as e:
             raise ImportError("python-docx not available - document generation disabled")
 
 
-from modules.storage import get_storage_backend
+from modules.storage import get_content_store, get_storage_backend
 from .template_engine import TemplateEngine
 
+# Chunk size for streaming generated documents to storage
+STORAGE_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 class DocumentGenerator:
     """
@@ -73,6 +77,13 @@ class DocumentGenerator:
             logging.error(f"Failed to initialize storage backend: {str(e)}")
             self.storage_client = None
 
+        # Content-addressed store for deduplicating repeated documents (optional)
+        try:
+            self.content_store = get_content_store()
+        except Exception as e:
+            logging.error(f"Failed to initialize content store: {str(e)}")
+            self.content_store = None
+
         # Initialize CSV content mapper for dynamic content mapping
         from modules.content.document_generation.csv_content_mapper import CSVContentMapper
 
@@ -175,7 +186,7 @@ class DocumentGenerator:
             generated_path = result["output_path"]
 
             # Upload to object storage if available
-            file_info = self.upload_to_storage(generated_path)
+            file_info = self.upload_to_storage(generated_path, application_id=application_id)
 
             # Update result with storage information
             result.update(
@@ -270,30 +281,48 @@ class DocumentGenerator:
             "revision": 1,
         }
 
-    def upload_to_storage(self, file_path):
+    def upload_to_storage(self, file_path, application_id=None):
         """
         Upload generated document to storage backend
 
+        With the content store enabled, documents generated for an application
+        are stored once per unique content: a repeat of an earlier document
+        is linked to the existing copy instead of being written and uploaded
+        again.
+
         Args:
             file_path (str): Path to the generated document
+            application_id (str, optional): Application that references the document
 
         Returns:
             dict: Storage information including path, filename, and storage type
         """
         filename = os.path.basename(file_path)
 
-        if self.storage_client:
+        if self.content_store and application_id:
             try:
-                # Read file content
-                with open(file_path, "rb") as file:
-                    file_content = file.read()
-
-                # Save to storage backend using new abstraction layer
-                storage_result = self.storage_client.save(
-                    filename=filename,
-                    content=file_content,
-                    metadata={"document_type": "generated"}
+                storage_result = self.content_store.put(
+                    file_path, filename, application_id,
+                    metadata={"document_type": "generated"},
+                    replace_source=True,
+                )
+                logging.info(
+                    f"Document stored by content: {filename} "
+                    f"({'deduplicated' if storage_result['deduplicated'] else 'new'})"
                 )
+                return storage_result
+
+            except Exception as e:
+                logging.error(f"Failed to store document in content store: {str(e)}")
+
+        if self.storage_client:
+            try:
+                # Stream file content to the storage backend in chunks
+                with open(file_path, "rb") as file, self.storage_client.open_write(
+                    filename, metadata={"document_type": "generated"}
+                ) as writer:
+                    shutil.copyfileobj(file, writer, STORAGE_COPY_CHUNK_SIZE)
+                storage_result = writer.result
 
                 logging.info(f"Document uploaded to storage: {filename} ({storage_result['storage_type']})")
 
@@ -331,3 +360,14 @@ class DocumentGenerator:
                             logging.info(f"Cleaned up old file: {filename}")
         except Exception as e:
             logging.error(f"Error during cleanup: {str(e)}")
+
+        # Release expired document references; only unreferenced blobs are deleted
+        if self.content_store:
+            try:
+                gc_result = self.content_store.gc(max_age_hours=max_age_hours)
+                logging.info(
+                    f"Content store GC: {gc_result['deleted_blobs']} blobs deleted, "
+                    f"{gc_result['freed_bytes']} bytes freed"
+                )
+            except Exception as e:
+                logging.error(f"Error during content store GC: {str(e)}")
@@ -14,6 +14,7 @@ Version: 1.0.0
 
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from .typography_constants import (
     SMART_QUOTE_RULES,
@@ -24,6 +25,11 @@ from .typography_constants import (
     SPECIAL_CHARACTER_RULES,
     count_smart_typography,
 )
+from .typography_pipeline import (
+    TYPOGRAPHY_CACHE_SIZE,
+    compile_typography_steps,
+    apply_typography_steps,
+)
 from .authenticity_config import (
     ENABLE_SMART_QUOTES,
     ENABLE_SMART_DASHES,
@@ -35,6 +41,12 @@ from .authenticity_config import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=TYPOGRAPHY_CACHE_SIZE)
+def _cached_typography_counts(text: str) -> Tuple[Tuple[str, int], ...]:
+    """count_smart_typography() memoized for repeated paragraph texts"""
+    return tuple(count_smart_typography(text).items())
+
+
 class SmartTypography:
     """
     Applies professional typography transformations to text
@@ -227,6 +239,10 @@ class SmartTypography:
         4. Non-breaking spaces
         5. Special characters
 
+        The enabled rules run as one compiled table (see typography_pipeline),
+        with results memoized for repeated texts; output is the same as
+        calling the individual apply_* methods in the order above.
+
         Args:
             text: Input text
 
@@ -246,26 +262,19 @@ class SmartTypography:
             return text, {}
 
         original_text = text
-        result = text
 
         # Apply transformations in order
-        if self.enable_smart_quotes:
-            result = self.apply_smart_quotes(result)
-
-        if self.enable_smart_dashes:
-            result = self.apply_smart_dashes(result)
-
-        if self.enable_smart_ellipsis:
-            result = self.apply_smart_ellipsis(result)
-
-        if self.enable_non_breaking_spaces:
-            result = self.apply_non_breaking_spaces(result)
-
-        if self.enable_special_characters:
-            result = self.apply_special_characters(result)
+        steps = compile_typography_steps(
+            bool(self.enable_smart_quotes),
+            bool(self.enable_smart_dashes),
+            bool(self.enable_smart_ellipsis),
+            bool(self.enable_non_breaking_spaces),
+            bool(self.enable_special_characters),
+        )
+        result = apply_typography_steps(steps, text)
 
         # Calculate transformation statistics
-        stats = count_smart_typography(result)
+        stats = dict(_cached_typography_counts(result))
         stats['original_length'] = len(original_text)
         stats['enhanced_length'] = len(result)
         stats['transformations_applied'] = sum([
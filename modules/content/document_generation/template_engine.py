@@ -17,6 +17,7 @@ import os
 import re
 import json
 import logging
+import uuid
 from datetime import datetime
 from docx import Document
 from docx.shared import Inches
@@ -255,7 +256,7 @@ class TemplateEngine:
 
             # Determine output path if not provided
             if output_path is None:
-                output_path = self.generate_output_path(template_path, data)
+                output_path = self.generate_output_path(template_path, data, application_id)
 
             # Save the document
             doc.save(output_path)
@@ -526,21 +527,13 @@ class TemplateEngine:
             str: Text with Canadian spellings
         """
         try:
-            # Import Canadian spelling processor
-            import sys
-
-            sys.path.append(".")
-            from modules.content.copywriting_evaluator.canadian_spelling_processor import (
-                CanadianSpellingProcessor,
+            # Shared compiled converter: loaded once per process, reloaded
+            # only when the canadian_spellings table changes
+            from modules.content.copywriting_evaluator.canadian_spelling_converter import (
+                get_canadian_spelling_service,
             )
 
-            processor = CanadianSpellingProcessor()
-
-            # Apply spelling conversions
-            conversions = processor._get_spelling_conversions()
-            converted_text, changes = processor._apply_spelling_conversions(
-                text, conversions
-            )
+            converted_text, changes = get_canadian_spelling_service().convert(text)
 
             if changes:
                 self.logger.info(
@@ -774,13 +767,18 @@ class TemplateEngine:
             doc.core_properties.version = data.get("version", "1.0")
             doc.core_properties.revision = data.get("revision", 1)
 
-    def generate_output_path(self, template_path, data):
+    def generate_output_path(self, template_path, data, application_id=None):
         """
         Generate an output path for the document based on template and data
 
+        The filename carries the application ID (when known) and a random
+        suffix, so documents rendered concurrently in the same second never
+        overwrite each other.
+
         Args:
             template_path (str): Path to the template file
             data (dict): Data dictionary
+            application_id (str, optional): Application the document is rendered for
 
         Returns:
             str: Generated output path
@@ -799,8 +797,13 @@ class TemplateEngine:
         # Create timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        # Unique per render: application ID plus a random suffix
+        unique_part = uuid.uuid4().hex[:8]
+        if application_id:
+            unique_part = f"{application_id}_{unique_part}"
+
         # Generate filename
-        filename = f"{template_name}{name_part}_{timestamp}.docx"
+        filename = f"{template_name}{name_part}_{timestamp}_{unique_part}.docx"
 
         # Use storage directory
         storage_dir = os.path.join(os.getcwd(), "storage")
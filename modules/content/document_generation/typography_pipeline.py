@@ -0,0 +1,172 @@
+"""
+Compiled Typography Pipeline
+
+SmartTypography.apply_all used to run every rule in typography_constants as
+its own regex pass (six quote rules, four dash rules, sixteen title rules,
+...) over every paragraph. This module compiles the enabled rules into one
+ordered transformation table:
+
+- Smart quotes: a single scanner pass that decides each quote's direction
+  from its neighbours, with a small state machine reproducing the
+  non-overlapping match semantics of the contraction rule
+- Remaining rules: precompiled regexes in their original order, each gated
+  by a literal the rule cannot match without (no '-' means no dash rule
+  runs, no '/' means no fraction rule runs, ...)
+- Title rules: merged into one alternation (titles never overlap, so one
+  pass is equivalent to one pass per title)
+
+Output is identical to applying the individual rules in sequence; results
+for repeated paragraphs are memoized in a bounded LRU.
+
+Author: Automated Job Application System
+Version: 1.0.0
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+from .typography_constants import (
+    LEFT_DOUBLE_QUOTE,
+    RIGHT_DOUBLE_QUOTE,
+    LEFT_SINGLE_QUOTE,
+    RIGHT_SINGLE_QUOTE,
+    SMART_DASH_RULES,
+    SMART_ELLIPSIS_REPLACEMENT,
+    NON_BREAKING_SPACE,
+    NON_BREAKING_SPACE_RULES,
+    SPECIAL_CHARACTERS,
+    SPECIAL_CHARACTER_RULES,
+    TITLES,
+)
+
+# Paragraph results kept per process (boilerplate repeats across documents)
+TYPOGRAPHY_CACHE_SIZE = 4096
+
+# A step is (trigger, transform): transform runs only if trigger is in the text
+# (None = always run)
+Step = Tuple[Optional[str], Callable[[str], str]]
+
+# Characters that open a quote before it / close it after it (see SMART_QUOTE_RULES)
+_QUOTE_OPENERS = frozenset('([{<')
+_QUOTE_CLOSERS = frozenset('.,!?:;)]}>')
+_ASCII_LETTERS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+# Literal each special character rule needs in order to match
+_SPECIAL_CHARACTER_TRIGGERS = {
+    r' degrees\b': 'degrees',
+    r'\bdegrees\b': 'degrees',
+    r'\b(\d+)\s*x\s*(\d+)\b': 'x',
+    r'\(TM\)': '(TM)',
+    r'\(tm\)': '(tm)',
+    r'\(R\)': '(R)',
+    r'\(r\)': '(r)',
+    r'\(C\)': '(C)',
+    r'\(c\)': '(c)',
+}
+
+_TITLE_RULE = re.compile(r'\b(' + '|'.join(re.escape(title) for title in TITLES) + r')\.\s+')
+_TITLE_REPLACEMENT = r'\1.' + NON_BREAKING_SPACE
+
+
+def _opens_quote(char: str) -> bool:
+    return char.isspace() or char in _QUOTE_OPENERS
+
+
+def _closes_quote(char: str) -> bool:
+    return char.isspace() or char in _QUOTE_CLOSERS
+
+
+def convert_quotes(text: str) -> str:
+    """
+    Straight to curly quotes in one pass (same result as SMART_QUOTE_RULES)
+
+    Direction comes from the neighbouring characters:
+        "  after start/whitespace/opening bracket -> left, else before
+           end/whitespace/closing punctuation -> right
+        '  after start/whitespace/opening bracket -> left; between letters
+           -> apostrophe (a match consumes both letters, so in "a'b'c" only
+           the first quote converts); after a letter or before closing
+           punctuation/end -> right
+    Quotes matching none of these stay straight.
+    """
+    if '"' not in text and "'" not in text:
+        return text
+
+    chars = list(text)
+    last = len(text) - 1
+    # First position not consumed by a previous letter'letter match
+    contraction_free = 0
+
+    for i, char in enumerate(text):
+        if char != '"' and char != "'":
+            continue
+
+        opens = i == 0 or _opens_quote(text[i - 1])
+        closes = i == last or _closes_quote(text[i + 1])
+
+        if char == '"':
+            if opens:
+                chars[i] = LEFT_DOUBLE_QUOTE
+            elif closes:
+                chars[i] = RIGHT_DOUBLE_QUOTE
+            continue
+
+        if opens:
+            chars[i] = LEFT_SINGLE_QUOTE
+        elif text[i - 1] in _ASCII_LETTERS and i < last and text[i + 1] in _ASCII_LETTERS \
+                and i - 1 >= contraction_free:
+            chars[i] = RIGHT_SINGLE_QUOTE
+            contraction_free = i + 2
+        elif closes:
+            chars[i] = RIGHT_SINGLE_QUOTE
+
+    return ''.join(chars)
+
+
+def _regex_step(trigger: Optional[str], pattern, replacement: str) -> Step:
+    return (trigger, lambda text: pattern.sub(replacement, text))
+
+
+@lru_cache(maxsize=32)
+def compile_typography_steps(smart_quotes: bool, smart_dashes: bool, smart_ellipsis: bool,
+                             non_breaking_spaces: bool, special_characters: bool) -> Tuple[Step, ...]:
+    """
+    Ordered transformation table for a combination of enabled features
+
+    Returns:
+        Tuple of (trigger, transform) steps
+    """
+    steps = []
+
+    if smart_quotes:
+        steps.append((None, convert_quotes))
+
+    if smart_dashes:
+        steps.extend(_regex_step('-', pattern, replacement) for pattern, replacement in SMART_DASH_RULES)
+
+    if smart_ellipsis:
+        steps.append(('...', lambda text: text.replace('...', SMART_ELLIPSIS_REPLACEMENT)))
+
+    if non_breaking_spaces:
+        steps.append(_regex_step('.', _TITLE_RULE, _TITLE_REPLACEMENT))
+        # Initials, units, percent (the title rules come first in the constants)
+        for pattern, replacement in NON_BREAKING_SPACE_RULES[len(TITLES):]:
+            trigger = '%' if pattern.pattern.endswith('%') else ('.' if r'\.' in pattern.pattern else None)
+            steps.append(_regex_step(trigger, pattern, replacement))
+
+    if special_characters:
+        for source, (pattern, replacement) in zip(SPECIAL_CHARACTERS, SPECIAL_CHARACTER_RULES):
+            trigger = _SPECIAL_CHARACTER_TRIGGERS.get(source, '/' if '/' in source else None)
+            steps.append(_regex_step(trigger, pattern, replacement))
+
+    return tuple(steps)
+
+
+@lru_cache(maxsize=TYPOGRAPHY_CACHE_SIZE)
+def apply_typography_steps(steps: Tuple[Step, ...], text: str) -> str:
+    """Run a compiled step table over text (memoized per steps/text)"""
+    for trigger, transform in steps:
+        if trigger is None or trigger in text:
+            text = transform(text)
+    return text
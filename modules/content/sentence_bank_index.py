@@ -0,0 +1,225 @@
+"""
+Sentence Bank Index
+In-memory index of the approved sentence banks for content selection
+
+ContentManager used to load every approved sentence for each job, lowercase
+its tags and substring-test each ATS keyword against every sentence. The
+index is built once per approved-bank snapshot and shared by every job in an
+application batch:
+
+- tag postings: lowercased tag -> sentence positions
+- keyword postings: lowercased keyword -> positions whose variable-free text
+  contains it (built on first use, then reused by later jobs)
+- pre-stripped, lowercased, variable-free text per sentence
+- category -> positions for the cover letter sections
+
+Scoring all sentences for a job is then a walk over the postings of the
+job's skills and keywords instead of a pass over every sentence. Scores are
+identical to ContentManager._calculate_composite_score.
+
+The cache re-reads a bank only when its signature (row count plus a hash of
+the approved rows) changes, checked at most every check_interval seconds.
+"""
+
+import re
+import time
+import logging
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SENTENCE_BANK_TABLES = ("sentence_bank_resume", "sentence_bank_cover_letter")
+
+# Composite score weights (see ContentManager._calculate_composite_score)
+SKILL_WEIGHT = 0.7
+KEYWORD_WEIGHT = 0.3
+
+_VARIABLE_PATTERN = re.compile(r"\{(job_title|company_name)\}")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def strip_variables(text: str) -> str:
+    """Remove {job_title}/{company_name} placeholders and collapse whitespace"""
+    return _WHITESPACE_PATTERN.sub(" ", _VARIABLE_PATTERN.sub("", text)).strip()
+
+
+class SentenceBankIndex:
+    """
+    Immutable index over one snapshot of an approved sentence bank
+    """
+
+    def __init__(self, sentences: List[Dict], signature: Any = None):
+        self.sentences = sentences
+        self.signature = signature
+        self.tag_postings: Dict[str, List[int]] = {}
+        self.category_positions: Dict[Any, List[int]] = {}
+        self.stripped_texts: List[Optional[str]] = []
+        self._keyword_postings: Dict[str, Tuple[int, ...]] = {}
+        self._lock = threading.Lock()
+
+        for position, sentence in enumerate(sentences):
+            for tag in set(tag.lower() for tag in sentence.get("tags") or []):
+                self.tag_postings.setdefault(tag, []).append(position)
+
+            self.category_positions.setdefault(sentence.get("category"), []).append(position)
+
+            # None marks sentences without text (they never match keywords)
+            text = (sentence.get("text") or "").lower()
+            self.stripped_texts.append(strip_variables(text) if text else None)
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def keyword_positions(self, keyword: str) -> Tuple[int, ...]:
+        """Positions whose variable-free text contains the keyword (memoized)"""
+        keyword = keyword.lower()
+        positions = self._keyword_postings.get(keyword)
+        if positions is None:
+            positions = tuple(
+                position
+                for position, text in enumerate(self.stripped_texts)
+                if text is not None and keyword in text
+            )
+            with self._lock:
+                self._keyword_postings[keyword] = positions
+        return positions
+
+    def score_all(self, job_skills: List[str], job_keywords: List[str]) -> List[float]:
+        """
+        Composite score of every sentence for a job
+
+        Returns:
+            Scores by sentence position
+        """
+        skill_matches: Counter = Counter()
+        for skill in set(skill.lower() for skill in job_skills):
+            skill_matches.update(self.tag_postings.get(skill, ()))
+
+        keyword_matches: Counter = Counter()
+        for keyword in job_keywords:
+            keyword_matches.update(self.keyword_positions(keyword))
+
+        scores = [0.0] * len(self.sentences)
+        skill_total = len(job_skills)
+        keyword_total = len(job_keywords)
+        for position in set(skill_matches) | set(keyword_matches):
+            skill_score = skill_matches[position] / skill_total if skill_total else 0.0
+            keyword_score = keyword_matches[position] / keyword_total if keyword_total else 0.0
+            scores[position] = min(skill_score, 1.0) * SKILL_WEIGHT + min(keyword_score, 1.0) * KEYWORD_WEIGHT
+        return scores
+
+    def ranked(self, job_skills: List[str], job_keywords: List[str],
+               positions: Optional[List[int]] = None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Sentences ordered by composite score (highest first, bank order on ties)
+
+        Args:
+            job_skills: Job skill names
+            job_keywords: Job ATS keywords
+            positions: Restrict to these sentence positions (e.g. one category)
+            limit: Maximum sentences to return
+
+        Returns:
+            Copies of the sentence dictionaries
+        """
+        scores = self.score_all(job_skills, job_keywords)
+        if positions is None:
+            positions = range(len(self.sentences))
+        ordered = sorted(positions, key=lambda position: scores[position], reverse=True)
+        if limit is not None:
+            ordered = ordered[:limit]
+        return [dict(self.sentences[position]) for position in ordered]
+
+
+class SentenceBankIndexCache:
+    """
+    Shared SentenceBankIndex per table, rebuilt when the approved bank changes
+    """
+
+    def __init__(self, fetch_rows: Callable[[str], List[Dict]], fetch_signature: Callable[[str], Any],
+                 check_interval: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache
+
+        Args:
+            fetch_rows: Returns the approved sentences of a table
+            fetch_signature: Returns a value that changes whenever the approved rows change
+            check_interval: Seconds between signature checks
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._fetch_rows = fetch_rows
+        self._fetch_signature = fetch_signature
+        self.check_interval = check_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, SentenceBankIndex] = {}
+        self._checked_at: Dict[str, float] = {}
+        self.rebuild_count = 0
+
+    def get(self, table: str) -> SentenceBankIndex:
+        """Current index for a sentence bank table"""
+        if table not in SENTENCE_BANK_TABLES:
+            raise ValueError(f"Unknown sentence bank table: {table}")
+
+        with self._lock:
+            index = self._indexes.get(table)
+            now = self._clock()
+            checked_at = self._checked_at.get(table)
+            if index is not None and checked_at is not None and now - checked_at < self.check_interval:
+                return index
+
+            signature = self._fetch_signature(table)
+            self._checked_at[table] = now
+            if index is not None and index.signature == signature:
+                return index
+
+            started = time.perf_counter()
+            index = SentenceBankIndex(self._fetch_rows(table), signature)
+            self._indexes[table] = index
+            self.rebuild_count += 1
+            logger.info(f"Built sentence bank index for {table}: {len(index)} sentences, "
+                        f"{len(index.tag_postings)} tags in {time.perf_counter() - started:.3f}s")
+            return index
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        """Force the next get() to re-check the signature (all tables by default)"""
+        with self._lock:
+            for name in [table] if table else list(self._checked_at):
+                self._checked_at.pop(name, None)
+
+
+@lru_cache(maxsize=1)
+def get_sentence_bank_indexes() -> SentenceBankIndexCache:
+    """
+    Get the process-wide sentence bank index cache (lazy singleton)
+
+    Returns:
+        SentenceBankIndexCache reading the approved banks through DatabaseClient
+    """
+    from sqlalchemy import text
+    from ..database.database_client import DatabaseClient
+
+    db_client = DatabaseClient()
+
+    def fetch_rows(table: str) -> List[Dict]:
+        with db_client.get_session() as session:
+            result = session.execute(text(f"SELECT * FROM {table} WHERE stage = 'Approved'")).fetchall()
+            return [dict(row._mapping) for row in result]
+
+    def fetch_signature(table: str) -> Tuple:
+        with db_client.get_session() as session:
+            row = session.execute(
+                text(
+                    f"""
+                SELECT COUNT(*), md5(string_agg(md5(CAST(t AS text)), '' ORDER BY t.id))
+                FROM {table} t
+                WHERE t.stage = 'Approved'
+                """
+                )
+            ).fetchone()
+            return tuple(row)
+
+    return SentenceBankIndexCache(fetch_rows, fetch_signature)
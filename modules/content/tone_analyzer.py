@@ -4,6 +4,11 @@ Implements the tone coherence scoring algorithms from building_sentences.md
 
 This module uses numpy for mathematical calculations in tone analysis.
 Numpy is loaded on-demand to avoid unnecessary startup overhead.
+
+Tone distances are held as a matrix indexed by tone code, so document
+analysis and sequence optimization run as array operations: tone jumps for
+a whole document in one gather, and the section-by-section candidate
+optimizer as a dynamic program over candidate-to-candidate jump matrices.
 """
 
 import json
@@ -59,6 +64,13 @@ def _get_numpy_module():
 # Initialize numpy module (with lazy loading)
 np = None
 
+# Tone categories in matrix order; unknown tones use the extra last row/column
+TONES = ["Confident", "Warm", "Analytical", "Insightful", "Storytelling", "Curious", "Bold", "Quirky"]
+DEFAULT_TONE_DISTANCE = 0.5
+
+# Exact tone ordering (Held-Karp) up to this many tones; greedy beyond
+MAX_EXACT_SEQUENCE_TONES = 10
+
 
 def _ensure_numpy_loaded():
     """Ensure numpy is loaded when needed"""
@@ -118,10 +130,59 @@ class ToneAnalyzer:
         self.tone_distances = symmetric_distances
 
         # Same tone = 0 distance
-        tones = ["Confident", "Warm", "Analytical", "Insightful", "Storytelling", "Curious", "Bold", "Quirky"]
-        for tone in tones:
+        for tone in TONES:
             self.tone_distances[(tone, tone)] = 0.0
 
+        self.tone_codes = {tone: code for code, tone in enumerate(TONES)}
+        self.max_tone_distance = max(self.tone_distances.values())
+        self._distance_matrix = None
+
+    def get_distance_matrix(self):
+        """
+        Tone distance matrix (numpy array, built once)
+
+        Rows/columns follow TONES plus one final row/column for unknown tones,
+        matching get_tone_distance() for every pair.
+        """
+        if self._distance_matrix is None:
+            np = _ensure_numpy_loaded()
+            size = len(TONES) + 1
+            matrix = np.full((size, size), DEFAULT_TONE_DISTANCE)
+            for (tone1, tone2), distance in self.tone_distances.items():
+                matrix[self.tone_codes[tone1], self.tone_codes[tone2]] = distance
+            self._distance_matrix = matrix
+        return self._distance_matrix
+
+    def _tone_code(self, tone: str) -> int:
+        """Matrix index of a tone (unknown tones share the last index)"""
+        return self.tone_codes.get(tone, len(TONES))
+
+    def _sequence_arrays(self, sentences: List[Dict]):
+        """Tone codes and strengths of a sentence sequence as numpy arrays"""
+        np = _ensure_numpy_loaded()
+        codes = np.fromiter((self._tone_code(s["tone"]) for s in sentences), dtype=np.intp, count=len(sentences))
+        strengths = np.fromiter((s["tone_strength"] for s in sentences), dtype=float, count=len(sentences))
+        return codes, strengths
+
+    def calculate_tone_jump_scores(self, sentences: List[Dict]) -> List[float]:
+        """
+        Tone jump score for every consecutive pair of a sentence sequence
+
+        Same values as calculate_tone_jump_score() pair by pair, computed in
+        one pass over the distance matrix.
+        """
+        np = _ensure_numpy_loaded()
+        if len(sentences) < 2:
+            return []
+        if not hasattr(np, "ndarray"):
+            # Mock numpy interface: fall back to pairwise scoring
+            return [self.calculate_tone_jump_score(a, b) for a, b in zip(sentences, sentences[1:])]
+
+        codes, strengths = self._sequence_arrays(sentences)
+        matrix = self.get_distance_matrix()
+        jumps = matrix[codes[:-1], codes[1:]] * ((strengths[:-1] + strengths[1:]) / 2)
+        return jumps.tolist()
+
     def get_tone_distance(self, tone1: str, tone2: str) -> float:
         """Get distance between two tones"""
         return self.tone_distances.get((tone1, tone2), 0.5)  # Default moderate distance
@@ -160,18 +221,14 @@ class ToneAnalyzer:
                 "average_tone_jump": 0.0,
             }
 
-        tone_jump_scores = []
-
         # Calculate tone jump between each consecutive pair
-        for i in range(len(sentences) - 1):
-            tjs = self.calculate_tone_jump_score(sentences[i], sentences[i + 1])
-            tone_jump_scores.append(tjs)
+        tone_jump_scores = self.calculate_tone_jump_scores(sentences)
 
         # Total Tone Travel (TTT) = sum of all tone jumps
         total_tone_travel = sum(tone_jump_scores)
 
         # Calculate maximum possible tone travel for normalization
-        max_possible_distance = max(self.tone_distances.values())
+        max_possible_distance = self.max_tone_distance
         max_strength = 1.0
         max_possible_jump = max_possible_distance * max_strength
         max_possible_ttt = max_possible_jump * (len(sentences) - 1)
@@ -251,11 +308,16 @@ class ToneAnalyzer:
     def get_optimal_tone_sequence(self, target_tones: List[str]) -> List[str]:
         """
         Find optimal ordering of tones to minimize tone travel
-        Simple greedy algorithm - can be improved with dynamic programming
+        Starts with the first tone; exact dynamic programming (Held-Karp) up to
+        MAX_EXACT_SEQUENCE_TONES tones, greedy nearest-tone beyond that
         """
         if len(target_tones) <= 1:
             return target_tones
 
+        np = _ensure_numpy_loaded()
+        if len(target_tones) <= MAX_EXACT_SEQUENCE_TONES and hasattr(np, "ndarray"):
+            return self._exact_tone_sequence(target_tones)
+
         remaining_tones = target_tones.copy()
         sequence = [remaining_tones.pop(0)]  # Start with first tone
 
@@ -268,6 +330,102 @@ class ToneAnalyzer:
 
         return sequence
 
+    def _exact_tone_sequence(self, target_tones: List[str]) -> List[str]:
+        """Minimum-travel ordering of all tones starting at target_tones[0] (Held-Karp)"""
+        np = _ensure_numpy_loaded()
+        n = len(target_tones)
+        codes = np.array([self._tone_code(tone) for tone in target_tones], dtype=np.intp)
+        distances = self.get_distance_matrix()[codes[:, None], codes[None, :]]
+
+        # cost[mask, last]: minimum travel visiting mask (always includes tone 0), ending at last
+        full = 1 << n
+        cost = np.full((full, n), np.inf)
+        parent = np.full((full, n), -1, dtype=np.intp)
+        cost[1, 0] = 0.0
+
+        for mask in range(1, full, 2):
+            row = cost[mask]
+            if not np.isfinite(row).any():
+                continue
+            # Best predecessor for every possible next tone in one step
+            candidates = row[:, None] + distances
+            best_last = candidates.argmin(axis=0)
+            best_cost = candidates[best_last, np.arange(n)]
+            for nxt in range(1, n):
+                bit = 1 << nxt
+                if mask & bit:
+                    continue
+                if best_cost[nxt] < cost[mask | bit, nxt]:
+                    cost[mask | bit, nxt] = best_cost[nxt]
+                    parent[mask | bit, nxt] = best_last[nxt]
+
+        last = int(cost[full - 1].argmin())
+        mask = full - 1
+        order = []
+        while last != -1:
+            order.append(last)
+            last, mask = int(parent[mask, last]), mask & ~(1 << last)
+        return [target_tones[i] for i in reversed(order)]
+
+    def select_coherent_sequence(
+        self, sections: List[List[Dict]], relevance_key: Optional[str] = None, coherence_weight: float = 1.0
+    ) -> Dict:
+        """
+        Pick one candidate sentence per document section for the best coherence
+
+        Dynamic programming over sections: for every candidate of section k the
+        best path ending there is found from the candidate-to-candidate tone
+        jump matrix of sections k-1 and k, so hundreds of candidates per section
+        cost a few matrix operations.
+
+        Objective: maximize sum(relevance) - coherence_weight * total_tone_travel
+        (pure tone-travel minimization when relevance_key is None).
+
+        Args:
+            sections: Candidate sentence dicts ('tone', 'tone_strength') per section, in document order
+            relevance_key: Optional sentence key holding a relevance score to trade off against travel
+            coherence_weight: Weight of tone travel against relevance
+
+        Returns:
+            Dict with selected sentences, objective and the analyze_document_tone() metrics
+        """
+        np = _ensure_numpy_loaded()
+        sections = [candidates for candidates in sections if candidates]
+        if not sections:
+            return {"sentences": [], "objective": 0.0, "analysis": self.analyze_document_tone([])}
+
+        matrix = self.get_distance_matrix()
+
+        def relevance(candidates):
+            if relevance_key is None:
+                return np.zeros(len(candidates))
+            return np.array([float(c.get(relevance_key) or 0.0) for c in candidates])
+
+        prev_codes, prev_strengths = self._sequence_arrays(sections[0])
+        score = relevance(sections[0])
+        back_pointers = []
+
+        for candidates in sections[1:]:
+            codes, strengths = self._sequence_arrays(candidates)
+            # jumps[i, j]: tone jump from previous candidate i to candidate j
+            jumps = matrix[prev_codes[:, None], codes[None, :]] * ((prev_strengths[:, None] + strengths[None, :]) / 2)
+            totals = score[:, None] - coherence_weight * jumps
+            best_prev = totals.argmax(axis=0)
+            score = totals[best_prev, np.arange(len(candidates))] + relevance(candidates)
+            back_pointers.append(best_prev)
+            prev_codes, prev_strengths = codes, strengths
+
+        choice = int(score.argmax())
+        objective = float(score[choice])
+        picks = [choice]
+        for best_prev in reversed(back_pointers):
+            choice = int(best_prev[choice])
+            picks.append(choice)
+        picks.reverse()
+
+        selected = [candidates[pick] for candidates, pick in zip(sections, picks)]
+        return {"sentences": selected, "objective": objective, "analysis": self.analyze_document_tone(selected)}
+
     def suggest_tone_improvements(self, analysis: Dict, target_coherence: float = 0.8) -> List[Dict]:
         """
         Suggest improvements to achieve target coherence score
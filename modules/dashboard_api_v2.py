@@ -17,6 +17,7 @@ from datetime import datetime, timedelta
 from functools import wraps
 from sqlalchemy import text
 from modules.database.lazy_instances import get_database_client
+from modules.database.materialized_view_refresher import get_mv_refresher
 
 # Create blueprint
 dashboard_api_v2 = Blueprint("dashboard_api_v2", __name__)
@@ -484,6 +485,46 @@ def get_pipeline_status():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@dashboard_api_v2.route("/api/v2/dashboard/materialized-views", methods=["GET"])
+@require_dashboard_auth
+def get_materialized_view_status():
+    """
+    Get refresh statistics for dashboard materialized views
+
+    Returns per-view staleness, refresh durations and lock contention counts
+    """
+    try:
+        return jsonify({"success": True, "views": get_mv_refresher().get_stats()})
+    except Exception as e:
+        logger.error(f"Error in materialized view status: {e}", exc_info=True)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@dashboard_api_v2.route("/api/v2/dashboard/materialized-views/refresh", methods=["POST"])
+@require_dashboard_auth
+def refresh_materialized_views():
+    """
+    Refresh dashboard materialized views immediately
+
+    Request body (optional):
+    - view: name of a single view to refresh (default: all registered views)
+    """
+    try:
+        refresher = get_mv_refresher()
+        view_name = (request.get_json(silent=True) or {}).get("view")
+        stats = refresher.get_stats()
+
+        if view_name and view_name not in stats:
+            return jsonify({"success": False, "error": f"Unknown materialized view: {view_name}"}), 400
+
+        results = [refresher.refresh_view(name) for name in ([view_name] if view_name else stats)]
+        return jsonify({"success": all(r["status"] != "failed" for r in results), "results": results})
+
+    except Exception as e:
+        logger.error(f"Error refreshing materialized views: {e}", exc_info=True)
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 # Keep backward compatibility with v1 endpoints (deprecated)
 @dashboard_api_v2.route("/api/dashboard/stats", methods=["GET"])
 @require_dashboard_auth
@@ -0,0 +1,416 @@
+"""
+Module: materialized_view_refresher.py
+Purpose: Debounced, lock-coordinated refresh of dashboard materialized views
+Created: 2026-10-18
+Modified: 2026-10-18
+Dependencies: psycopg2, database_config, threading
+Related: database_migrations/002_dashboard_materialized_views.sql, dashboard_api_v2.py,
+         modules/workflow/application_orchestrator.py
+Description: Keeps materialized views such as application_summary_mv fresh without
+             manual refreshes. Writers call notify_table_write() after committing;
+             the refresher coalesces bursts of writes (debounce), bounds how long a
+             view may stay stale (max_staleness), and runs REFRESH MATERIALIZED VIEW
+             CONCURRENTLY under a PostgreSQL advisory lock so only one gunicorn
+             worker refreshes a view at a time. Refresh duration and staleness are
+             recorded per view and exposed through get_stats().
+
+Usage:
+    from modules.database.materialized_view_refresher import notify_table_write
+    notify_table_write("job_applications")  # after the INSERT/UPDATE is committed
+"""
+
+import logging
+import os
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+import psycopg2
+
+logger = logging.getLogger(__name__)
+
+# Namespace for advisory lock keys so they cannot collide with other pg_advisory_lock users
+ADVISORY_LOCK_NAMESPACE = 0x4D56  # "MV"
+
+
+@dataclass
+class MaterializedViewSpec:
+    """
+    Refresh policy for a single materialized view.
+
+    Attributes:
+        name: Materialized view name
+        source_tables: Tables whose writes make the view stale
+        debounce_seconds: Quiet period after the last write before refreshing
+        max_staleness: Upper bound (seconds) between the first unrefreshed write
+                       and the refresh, even if writes keep arriving
+        concurrently: Use REFRESH ... CONCURRENTLY (requires a unique index)
+    """
+
+    name: str
+    source_tables: Tuple[str, ...] = ()
+    debounce_seconds: float = 5.0
+    max_staleness: float = 300.0
+    concurrently: bool = True
+
+    @property
+    def lock_key(self) -> int:
+        """Stable advisory lock key derived from the view name"""
+        return zlib.crc32(self.name.encode("utf-8")) & 0x7FFFFFFF
+
+
+@dataclass
+class ViewRefreshState:
+    """Runtime bookkeeping for a registered view"""
+
+    first_dirty_at: Optional[float] = None
+    last_dirty_at: Optional[float] = None
+    last_refreshed_at: Optional[float] = None
+    last_duration: Optional[float] = None
+    last_staleness: Optional[float] = None
+    last_error: Optional[str] = None
+    refresh_count: int = 0
+    skipped_locked: int = 0
+    failure_count: int = 0
+    consecutive_failures: int = 0
+    retry_at: Optional[float] = None
+    pending_writes: int = 0
+    durations: List[float] = field(default_factory=list)
+
+
+# Views defined in database_migrations/002_dashboard_materialized_views.sql
+DEFAULT_VIEWS = [
+    MaterializedViewSpec(
+        name="application_summary_mv",
+        source_tables=("job_applications", "jobs", "companies"),
+        debounce_seconds=float(os.environ.get("MV_REFRESH_DEBOUNCE_SECONDS", "5")),
+        max_staleness=float(os.environ.get("MV_REFRESH_MAX_STALENESS_SECONDS", "300")),
+    ),
+]
+
+
+class MaterializedViewRefresher:
+    """
+    Background coordinator for materialized view refreshes.
+
+    Writes mark views dirty; a single daemon thread per process refreshes each
+    dirty view once it has been quiet for debounce_seconds or has been stale for
+    max_staleness seconds. A non-blocking advisory lock ensures that when several
+    processes want the same refresh, one does it and the others back off and
+    retry on their next tick.
+    """
+
+    # Keep this many recent durations per view for averages
+    DURATION_HISTORY = 50
+
+    # Exponential backoff (seconds) after consecutive refresh failures
+    FAILURE_BACKOFF_BASE = 5.0
+    FAILURE_BACKOFF_MAX = 600.0
+
+    def __init__(
+        self,
+        views: Optional[List[MaterializedViewSpec]] = None,
+        connection_factory: Optional[Callable] = None,
+        clock: Callable[[], float] = time.monotonic,
+        poll_interval: float = 1.0,
+    ):
+        """
+        Initialize refresher.
+
+        Args:
+            views: View specs to manage (defaults to DEFAULT_VIEWS)
+            connection_factory: Callable returning a new DB-API connection
+            clock: Monotonic time source (injectable for tests)
+            poll_interval: Upper bound on the background thread's sleep
+        """
+        self._views: Dict[str, MaterializedViewSpec] = {}
+        self._states: Dict[str, ViewRefreshState] = {}
+        self._table_index: Dict[str, List[str]] = {}
+        self._connection_factory = connection_factory or self._default_connection
+        self._clock = clock
+        self._poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        for spec in views if views is not None else DEFAULT_VIEWS:
+            self.register_view(spec)
+
+    @staticmethod
+    def _default_connection():
+        """Open a psycopg2 connection using the environment-aware database config"""
+        from .database_config import get_database_config
+
+        return psycopg2.connect(get_database_config().get_connection_url())
+
+    @contextmanager
+    def _connection(self):
+        conn = self._connection_factory()
+        try:
+            conn.autocommit = True
+            yield conn
+        finally:
+            conn.close()
+
+    def register_view(self, spec: MaterializedViewSpec) -> None:
+        """Register (or replace) a view and index it by its source tables"""
+        with self._lock:
+            self._views[spec.name] = spec
+            self._states.setdefault(spec.name, ViewRefreshState())
+            for table_views in self._table_index.values():
+                if spec.name in table_views:
+                    table_views.remove(spec.name)
+            for table in spec.source_tables:
+                self._table_index.setdefault(table, []).append(spec.name)
+
+    def set_max_staleness(self, view_name: str, max_staleness: float) -> None:
+        """Adjust the staleness bound for a registered view"""
+        with self._lock:
+            self._views[view_name].max_staleness = max_staleness
+        self._wakeup.set()
+
+    def notify_table_write(self, table: str) -> None:
+        """Mark every view that depends on table as dirty"""
+        for view_name in self._table_index.get(table, ()):
+            self.mark_dirty(view_name)
+
+    def mark_dirty(self, view_name: str) -> None:
+        """Record a write affecting view_name and ensure the worker thread is running"""
+        if view_name not in self._views:
+            logger.debug(f"Ignoring dirty mark for unregistered view {view_name}")
+            return
+
+        now = self._clock()
+        with self._lock:
+            state = self._states[view_name]
+            if state.first_dirty_at is None:
+                state.first_dirty_at = now
+            state.last_dirty_at = now
+            state.pending_writes += 1
+
+        self._ensure_worker()
+        self._wakeup.set()
+
+    def _due_at(self, spec: MaterializedViewSpec, state: ViewRefreshState) -> Optional[float]:
+        """Monotonic time at which a dirty view should be refreshed (None if clean)"""
+        if state.first_dirty_at is None:
+            return None
+        due_at = min(state.last_dirty_at + spec.debounce_seconds, state.first_dirty_at + spec.max_staleness)
+        if state.retry_at is not None:
+            # A failing refresh waits out its backoff instead of retrying every tick
+            due_at = max(due_at, state.retry_at)
+        return due_at
+
+    def run_pending(self) -> float:
+        """
+        Refresh every view whose debounce or staleness deadline has passed.
+
+        Returns:
+            Seconds until the next view becomes due (poll_interval if none are dirty)
+        """
+        now = self._clock()
+        due_views = []
+        next_due = None
+
+        with self._lock:
+            for name, spec in self._views.items():
+                due_at = self._due_at(spec, self._states[name])
+                if due_at is None:
+                    continue
+                if due_at <= now:
+                    due_views.append(name)
+                elif next_due is None or due_at < next_due:
+                    next_due = due_at
+
+        for name in due_views:
+            self.refresh_view(name)
+
+        if next_due is None:
+            return self._poll_interval
+        return max(0.0, min(self._poll_interval, next_due - self._clock()))
+
+    def refresh_view(self, view_name: str) -> Dict:
+        """
+        Refresh a view now if no other process holds its advisory lock.
+
+        Returns:
+            Dict describing the outcome (refreshed, skipped or failed)
+        """
+        spec = self._views[view_name]
+        state = self._states[view_name]
+
+        with self._lock:
+            dirty_since = state.first_dirty_at
+            writes_seen = state.pending_writes
+
+        try:
+            with self._connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT pg_try_advisory_lock(%s, %s)", (ADVISORY_LOCK_NAMESPACE, spec.lock_key))
+                    if not cursor.fetchone()[0]:
+                        with self._lock:
+                            state.skipped_locked += 1
+                        logger.debug(f"Refresh of {view_name} already running in another process")
+                        return {"view": view_name, "status": "skipped", "reason": "locked"}
+
+                    try:
+                        started = time.perf_counter()
+                        self._execute_refresh(cursor, spec)
+                        duration = time.perf_counter() - started
+                    finally:
+                        cursor.execute(
+                            "SELECT pg_advisory_unlock(%s, %s)", (ADVISORY_LOCK_NAMESPACE, spec.lock_key)
+                        )
+
+        except Exception as e:
+            with self._lock:
+                state.failure_count += 1
+                state.consecutive_failures += 1
+                state.last_error = str(e)
+                backoff = min(
+                    self.FAILURE_BACKOFF_MAX,
+                    self.FAILURE_BACKOFF_BASE * 2 ** (state.consecutive_failures - 1),
+                )
+                state.retry_at = self._clock() + backoff
+            logger.error(f"Failed to refresh materialized view {view_name} (retrying in {backoff:.0f}s): {e}")
+            return {"view": view_name, "status": "failed", "error": str(e), "retry_in": backoff}
+
+        finished = self._clock()
+        staleness = finished - dirty_since if dirty_since is not None else None
+
+        with self._lock:
+            state.last_refreshed_at = finished
+            state.last_duration = duration
+            state.last_staleness = staleness
+            state.last_error = None
+            state.consecutive_failures = 0
+            state.retry_at = None
+            state.refresh_count += 1
+            state.durations.append(duration)
+            del state.durations[: -self.DURATION_HISTORY]
+
+            # Writes that arrived while refreshing stay dirty for the next round
+            if state.pending_writes == writes_seen:
+                state.first_dirty_at = None
+                state.last_dirty_at = None
+                state.pending_writes = 0
+            else:
+                state.pending_writes -= writes_seen
+                state.first_dirty_at = state.last_dirty_at
+
+        logger.info(
+            f"Refreshed {view_name} in {duration * 1000:.1f}ms "
+            f"(staleness: {staleness:.1f}s, writes coalesced: {writes_seen})"
+            if staleness is not None
+            else f"Refreshed {view_name} in {duration * 1000:.1f}ms"
+        )
+        return {"view": view_name, "status": "refreshed", "duration": duration, "staleness": staleness}
+
+    @staticmethod
+    def _execute_refresh(cursor, spec: MaterializedViewSpec) -> None:
+        """Run REFRESH, falling back to a blocking refresh if CONCURRENTLY is unsupported"""
+        if spec.concurrently:
+            try:
+                cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {spec.name}")
+                return
+            except psycopg2.errors.ObjectNotInPrerequisiteState as e:
+                # CONCURRENTLY requires a unique index (or a populated view)
+                logger.warning(f"Concurrent refresh unavailable for {spec.name}, using blocking refresh: {e}")
+                spec.concurrently = False
+        cursor.execute(f"REFRESH MATERIALIZED VIEW {spec.name}")
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._worker_loop, name="mv-refresher", daemon=True)
+            self._thread.start()
+
+    def _worker_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                wait = self.run_pending()
+            except Exception as e:
+                logger.error(f"Materialized view refresher loop error: {e}")
+                wait = self._poll_interval
+            self._wakeup.wait(wait)
+            self._wakeup.clear()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread (pending refreshes are not flushed)"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-view refresh statistics suitable for JSON responses"""
+        now = self._clock()
+        wall_now = time.time()
+        stats = {}
+
+        with self._lock:
+            for name, spec in self._views.items():
+                state = self._states[name]
+                durations = state.durations
+                stats[name] = {
+                    "dirty": state.first_dirty_at is not None,
+                    "current_staleness_seconds": (
+                        round(now - state.first_dirty_at, 3) if state.first_dirty_at is not None else 0.0
+                    ),
+                    "pending_writes": state.pending_writes,
+                    "max_staleness_seconds": spec.max_staleness,
+                    "debounce_seconds": spec.debounce_seconds,
+                    "last_refreshed_at": (
+                        datetime.fromtimestamp(wall_now - (now - state.last_refreshed_at)).isoformat()
+                        if state.last_refreshed_at is not None
+                        else None
+                    ),
+                    "last_refresh_duration_ms": (
+                        round(state.last_duration * 1000, 2) if state.last_duration is not None else None
+                    ),
+                    "avg_refresh_duration_ms": (
+                        round(sum(durations) / len(durations) * 1000, 2) if durations else None
+                    ),
+                    "last_staleness_seconds": (
+                        round(state.last_staleness, 3) if state.last_staleness is not None else None
+                    ),
+                    "refresh_count": state.refresh_count,
+                    "skipped_locked": state.skipped_locked,
+                    "failure_count": state.failure_count,
+                    "consecutive_failures": state.consecutive_failures,
+                    "retry_in_seconds": (
+                        round(max(0.0, state.retry_at - now), 3) if state.retry_at is not None else None
+                    ),
+                    "last_error": state.last_error,
+                }
+        return stats
+
+
+@lru_cache(maxsize=1)
+def get_mv_refresher() -> MaterializedViewRefresher:
+    """Process-wide refresher singleton (lazy, no connection until first refresh)"""
+    return MaterializedViewRefresher()
+
+
+def notify_table_write(table: str) -> None:
+    """
+    Signal that table was written so dependent materialized views get refreshed.
+
+    Never raises: view freshness must not break the write path.
+    """
+    try:
+        get_mv_refresher().notify_table_write(table)
+    except Exception as e:
+        logger.warning(f"Could not schedule materialized view refresh for {table}: {e}")
@@ -8,6 +8,8 @@ raw_job_scrapes -> cleaned_job_scrapes -> pre_analyzed_jobs -> ai analysis -> an
 Key Features:
 - Uses centralized DatabaseClient for connection pooling and management
 - Separate deduplication methods for pre_analyzed_jobs and analyzed_jobs
+- Set-based cleaned -> pre_analyzed transfer (one bulk insert per batch, consumed
+  cleaned scrapes marked via cleaned_job_scrapes.pre_analyzed_at)
 - Audit trail tracking per job
 - No primary keys passed through LLM prompts
 - Clear separation of concerns between pre-analysis and post-analysis data
@@ -21,11 +23,34 @@ import logging
 import hashlib
 from typing import Dict, List, Optional
 from datetime import datetime
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from modules.database.lazy_instances import get_database_client
 
 logger = logging.getLogger(__name__)
 
+# cleaned_job_scrapes columns carried into pre_analyzed_jobs
+CLEANED_TRANSFER_COLUMNS = (
+    "cleaned_job_id", "job_title", "company_name", "location_city",
+    "location_province", "location_country", "work_arrangement",
+    "salary_min", "salary_max", "salary_currency", "salary_period",
+    "job_description", "requirements", "benefits", "industry",
+    "job_type", "experience_level", "posting_date", "application_deadline",
+    "external_job_id", "source_website", "application_url",
+    "application_email", "confidence_score",
+)
+
+PRE_ANALYZED_INSERT_COLUMNS = (
+    "cleaned_scrape_id", "company_id", "job_title", "company_name",
+    "location_city", "location_province", "location_country", "work_arrangement",
+    "salary_min", "salary_max", "salary_currency", "salary_period",
+    "job_description", "requirements", "benefits", "industry",
+    "job_type", "experience_level", "posting_date", "application_deadline",
+    "external_job_id", "source_website", "application_url", "application_email",
+    "confidence_score", "duplicates_count", "deduplication_key",
+    "is_active", "queued_for_analysis",
+)
+
 
 class WorkflowManager:
     """
@@ -57,10 +82,13 @@ class WorkflowManager:
         """
         Transfer jobs from cleaned_job_scrapes to pre_analyzed_jobs.
 
-        This method:
-        - Consolidates multiple cleaned scrapes into single pre_analyzed_jobs
-        - Performs deduplication specific to pre_analyzed_jobs table
-        - Maintains audit trail of source cleaned scrapes
+        This method works on the whole batch at once:
+        - Selects unconsumed cleaned scrapes (pre_analyzed_at IS NULL, an indexed scan)
+        - Computes deduplication keys for the batch and drops in-batch repeats
+        - Resolves all companies with one lookup plus one bulk insert of new ones
+        - Inserts with ON CONFLICT (deduplication_key) DO NOTHING RETURNING
+        - Marks every selected cleaned scrape consumed, duplicates included,
+          so they are not selected again
         - Does not pass primary keys to external systems
 
         Args:
@@ -73,30 +101,17 @@ class WorkflowManager:
 
         try:
             with self.db_client.get_session() as session:
-                # Get unprocessed cleaned job scrapes
-                query = """
-                    SELECT cleaned_job_id, job_title, company_name, location_city,
-                           location_province, location_country, work_arrangement,
-                           salary_min, salary_max, salary_currency, salary_period,
-                           job_description, requirements, benefits, industry,
-                           job_type, experience_level, posting_date, application_deadline,
-                           external_job_id, source_website, application_url,
-                           application_email, confidence_score
+                # Get unconsumed cleaned job scrapes
+                query = f"""
+                    SELECT {', '.join(CLEANED_TRANSFER_COLUMNS)}
                     FROM cleaned_job_scrapes
-                    WHERE cleaned_job_id NOT IN (
-                        SELECT cleaned_scrape_id
-                        FROM pre_analyzed_jobs
-                        WHERE cleaned_scrape_id IS NOT NULL
-                    )
+                    WHERE pre_analyzed_at IS NULL
                     ORDER BY cleaned_timestamp DESC
                     LIMIT :batch_size
                 """
 
-                result = session.execute(
-                    self.db_client.engine.text(query),
-                    {"batch_size": batch_size}
-                )
-                cleaned_jobs = result.fetchall()
+                result = session.execute(text(query), {"batch_size": batch_size})
+                cleaned_jobs = [dict(row._mapping) for row in result.fetchall()]
 
                 if not cleaned_jobs:
                     return {
@@ -108,35 +123,25 @@ class WorkflowManager:
 
                 logger.info(f"Found {len(cleaned_jobs)} cleaned job scrapes to process")
 
-                transferred = 0
-                duplicates_found = 0
-
+                # One candidate per deduplication key (first, i.e. most recent, wins)
+                candidates = {}
                 for job in cleaned_jobs:
-                    # Create deduplication key for pre_analyzed_jobs
                     dedup_key = self._create_pre_analyzed_dedup_key(
-                        job_title=job[1], company_name=job[2], location_city=job[3], location_province=job[4]
+                        job_title=job["job_title"],
+                        company_name=job["company_name"],
+                        location_city=job["location_city"],
+                        location_province=job["location_province"],
                     )
+                    candidates.setdefault(dedup_key, job)
 
-                    # Check if this job already exists in pre_analyzed_jobs
-                    if self._check_pre_analyzed_duplicate(session, dedup_key):
-                        duplicates_found += 1
-                        logger.debug(f"Duplicate found for: {job[1]} at {job[2]}")
-                        continue
+                company_ids = self._resolve_company_ids(
+                    session, [job["company_name"] for job in candidates.values()]
+                )
+                inserted = self._insert_pre_analyzed_jobs(session, candidates, company_ids)
+                self._mark_cleaned_consumed(session, [job["cleaned_job_id"] for job in cleaned_jobs])
 
-                    # Resolve or create company
-                    company_id = self._resolve_company_id(session, job[2])
-
-                    # Insert into pre_analyzed_jobs
-                    try:
-                        self._insert_pre_analyzed_job(session, job, company_id, dedup_key)
-                        transferred += 1
-                    except IntegrityError as e:
-                        if "duplicate key" in str(e).lower():
-                            logger.warning(f"Duplicate key constraint violation: {job[1]} at {job[2]}")
-                            duplicates_found += 1
-                            session.rollback()
-                            continue
-                        raise
+                transferred = len(inserted)
+                duplicates_found = len(cleaned_jobs) - transferred
 
                 # Commit happens automatically via context manager
                 logger.info(
@@ -461,101 +466,101 @@ class WorkflowManager:
         dedup_string = f"{title_norm}|{company_norm}|{industry_norm}"
         return hashlib.sha256(dedup_string.encode("utf-8")).hexdigest()[:32]
 
-    def _check_pre_analyzed_duplicate(self, session, dedup_key: str) -> bool:
-        """Check if job already exists in pre_analyzed_jobs."""
-        query = "SELECT 1 FROM pre_analyzed_jobs WHERE deduplication_key = :dedup_key"
-        result = session.execute(self.db_client.engine.text(query), {"dedup_key": dedup_key})
-        return result.fetchone() is not None
-
     def _check_analyzed_duplicate(self, session, dedup_key: str) -> bool:
         """Check if job already exists in analyzed_jobs."""
         query = "SELECT 1 FROM analyzed_jobs WHERE deduplication_key = :dedup_key"
         result = session.execute(self.db_client.engine.text(query), {"dedup_key": dedup_key})
         return result.fetchone() is not None
 
-    def _resolve_company_id(self, session, company_name: str) -> Optional[str]:
-        """Resolve company name to company_id, create if not exists."""
-        if not company_name:
-            return None
+    def _resolve_company_ids(self, session, company_names: List[Optional[str]]) -> Dict[str, str]:
+        """
+        Resolve company names to company_ids, creating missing companies.
 
-        # Check if company exists
-        query = "SELECT id FROM companies WHERE LOWER(name) = LOWER(:company_name)"
-        result = session.execute(self.db_client.engine.text(query), {"company_name": company_name})
-        row = result.fetchone()
+        Returns:
+            Dict of lowercased company name -> company_id
+        """
+        names = {}
+        for company_name in company_names:
+            if company_name:
+                names.setdefault(company_name.lower(), company_name)
+        if not names:
+            return {}
+
+        # Existing companies (case-insensitive match)
+        query = "SELECT id, name FROM companies WHERE LOWER(name) = ANY(CAST(:names AS text[]))"
+        result = session.execute(text(query), {"names": list(names)})
+        company_ids = {}
+        for row in result.fetchall():
+            company_ids.setdefault(row[1].lower(), str(row[0]))
+
+        # Create the rest in one insert
+        missing = [name for key, name in names.items() if key not in company_ids]
+        if missing:
+            insert_query = """
+                INSERT INTO companies (name, created_at)
+                SELECT name, CURRENT_TIMESTAMP
+                FROM unnest(CAST(:names AS text[])) AS new_companies(name)
+                RETURNING id, name
+            """
+            result = session.execute(text(insert_query), {"names": missing})
+            for row in result.fetchall():
+                company_ids[row[1].lower()] = str(row[0])
+
+        return company_ids
+
+    def _insert_pre_analyzed_jobs(
+        self, session, jobs_by_key: Dict[str, Dict], company_ids: Dict[str, str]
+    ) -> List[str]:
+        """
+        Insert jobs into pre_analyzed_jobs in one statement, skipping existing deduplication keys.
 
-        if row:
-            return str(row[0])
+        Args:
+            jobs_by_key: Deduplication key -> cleaned job row (same structure as cleaned_job_scrapes)
+            company_ids: Lowercased company name -> company_id
 
-        # Create new company
-        insert_query = """
-            INSERT INTO companies (name, created_at)
-            VALUES (:company_name, CURRENT_TIMESTAMP)
-            RETURNING id
+        Returns:
+            cleaned_scrape_ids of the inserted rows
         """
-        result = session.execute(
-            self.db_client.engine.text(insert_query),
-            {"company_name": company_name}
-        )
-        return str(result.fetchone()[0])
+        if not jobs_by_key:
+            return []
 
-    def _insert_pre_analyzed_job(self, session, job_data: tuple, company_id: Optional[str], dedup_key: str):
-        """Insert job into pre_analyzed_jobs table (same structure as cleaned_job_scrapes)."""
-        query = """
-            INSERT INTO pre_analyzed_jobs (
-                cleaned_scrape_id, company_id, job_title, company_name,
-                location_city, location_province, location_country, work_arrangement,
-                salary_min, salary_max, salary_currency, salary_period,
-                job_description, requirements, benefits, industry,
-                job_type, experience_level, posting_date, application_deadline,
-                external_job_id, source_website, application_url, application_email,
-                confidence_score, duplicates_count, deduplication_key,
-                is_active, queued_for_analysis, created_at
-            ) VALUES (
-                :cleaned_job_id, :company_id, :job_title, :company_name,
-                :location_city, :location_province, :location_country, :work_arrangement,
-                :salary_min, :salary_max, :salary_currency, :salary_period,
-                :job_description, :requirements, :benefits, :industry,
-                :job_type, :experience_level, :posting_date, :application_deadline,
-                :external_job_id, :source_website, :application_url, :application_email,
-                :confidence_score, :duplicates_count, :deduplication_key,
-                :is_active, :queued_for_analysis, CURRENT_TIMESTAMP
+        values_rows = []
+        params = {}
+        for i, (dedup_key, job) in enumerate(jobs_by_key.items()):
+            values_rows.append(
+                "(" + ", ".join(f":{column}_{i}" for column in PRE_ANALYZED_INSERT_COLUMNS) + ", CURRENT_TIMESTAMP)"
+            )
+            row = {column: job.get(column) for column in CLEANED_TRANSFER_COLUMNS}
+            row.update(
+                {
+                    "cleaned_scrape_id": job["cleaned_job_id"],
+                    "company_id": company_ids.get((job["company_name"] or "").lower()),
+                    "salary_currency": job.get("salary_currency") or "CAD",
+                    "duplicates_count": 1,
+                    "deduplication_key": dedup_key,
+                    "is_active": True,
+                    "queued_for_analysis": False,
+                }
             )
+            params.update({f"{column}_{i}": row[column] for column in PRE_ANALYZED_INSERT_COLUMNS})
+
+        query = f"""
+            INSERT INTO pre_analyzed_jobs ({', '.join(PRE_ANALYZED_INSERT_COLUMNS)}, created_at)
+            VALUES {', '.join(values_rows)}
+            ON CONFLICT (deduplication_key) DO NOTHING
+            RETURNING cleaned_scrape_id
         """
+        result = session.execute(text(query), params)
+        return [str(row[0]) for row in result.fetchall()]
 
-        session.execute(
-            self.db_client.engine.text(query),
-            {
-                "cleaned_job_id": job_data[0],
-                "company_id": company_id,
-                "job_title": job_data[1],
-                "company_name": job_data[2],
-                "location_city": job_data[3],
-                "location_province": job_data[4],
-                "location_country": job_data[5],
-                "work_arrangement": job_data[6],
-                "salary_min": job_data[7],
-                "salary_max": job_data[8],
-                "salary_currency": job_data[9] or "CAD",
-                "salary_period": job_data[10],
-                "job_description": job_data[11] if len(job_data) > 11 else None,
-                "requirements": job_data[12] if len(job_data) > 12 else None,
-                "benefits": job_data[13] if len(job_data) > 13 else None,
-                "industry": job_data[14] if len(job_data) > 14 else None,
-                "job_type": job_data[15] if len(job_data) > 15 else None,
-                "experience_level": job_data[16] if len(job_data) > 16 else None,
-                "posting_date": job_data[17] if len(job_data) > 17 else None,
-                "application_deadline": job_data[18] if len(job_data) > 18 else None,
-                "external_job_id": job_data[19] if len(job_data) > 19 else None,
-                "source_website": job_data[20] if len(job_data) > 20 else None,
-                "application_url": job_data[21] if len(job_data) > 21 else None,
-                "application_email": job_data[22] if len(job_data) > 22 else None,
-                "confidence_score": job_data[23] if len(job_data) > 23 else None,
-                "duplicates_count": 1,
-                "deduplication_key": dedup_key,
-                "is_active": True,
-                "queued_for_analysis": False,
-            }
-        )
+    def _mark_cleaned_consumed(self, session, cleaned_job_ids: List) -> None:
+        """Mark cleaned scrapes as consumed by the pre_analyzed_jobs transfer."""
+        query = """
+            UPDATE cleaned_job_scrapes
+            SET pre_analyzed_at = CURRENT_TIMESTAMP
+            WHERE cleaned_job_id = ANY(CAST(:cleaned_job_ids AS uuid[]))
+        """
+        session.execute(text(query), {"cleaned_job_ids": [str(job_id) for job_id in cleaned_job_ids]})
 
     def _insert_analyzed_job(self, session, pre_analyzed_data: tuple, ai_result: Dict, dedup_key: str):
         """Insert job into analyzed_jobs table with AI analysis results."""
@@ -73,6 +73,12 @@ class DisabledEmailSender:
             "mock_mode": True,
         }
 
+    def send(
+        self, to_email: str, subject: str, body: str, attachments: Optional[List[Dict]] = None
+    ) -> Dict[str, Any]:
+        """Mock bulk send (same interface as GmailBulkSender.send)"""
+        return self.send_job_application_email_enhanced(to_email, subject, body, attachments)
+
     def send_test_email(self, to_email: str = None) -> Dict[str, Any]:
         """Mock test email sending"""
         to_email = to_email or "test@example.com"
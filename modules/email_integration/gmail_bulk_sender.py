@@ -0,0 +1,454 @@
+"""
+Gmail Bulk Sending for Automated Job Application System
+
+Bulk-send path for GmailSender:
+- StreamingMimeBuilder writes the MIME message into a spooled temporary file,
+  encoding attachments in fixed-size chunks instead of building the whole
+  tree in memory
+- AttachmentCache keeps the base64 body of each generated document, keyed by
+  path, size and modification time, so retries and resends do not re-read or
+  re-encode it
+- GmailApiSession reuses one keep-alive HTTP session and posts the raw
+  message/rfc822 bytes to Gmail's upload endpoint (resumable upload for large
+  messages), so the message is not base64-encoded a second time for JSON
+- ApplicationStatusBatch writes send outcomes back to job_applications in
+  batches (used by GmailBulkSender and the application pipeline's status stage)
+- GmailBulkSender queues sends through the shared session and attachment cache
+"""
+
+import base64
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import IO, Callable, Dict, List, Optional, Tuple
+
+import email.mime.base
+import email.mime.multipart
+import email.mime.text
+
+logger = logging.getLogger(__name__)
+
+# Raw bytes per base64 chunk (multiple of 57 so every chunk encodes to whole 76-char lines)
+ENCODE_CHUNK_BYTES = 57 * 1024
+
+# Messages up to this size stay in memory while being built
+SPOOL_MAX_BYTES = 2 * 1024 * 1024
+
+# Messages larger than this use the resumable upload protocol
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+GMAIL_UPLOAD_URL = "https://gmail.googleapis.com/upload/gmail/v1/users/me/messages/send"
+
+
+class AttachmentCache:
+    """
+    LRU cache of base64-encoded attachment bodies
+
+    Entries are keyed by (path, size, mtime), so a regenerated document is
+    read again while an unchanged one is reused across sends and retries.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_encoded(self, file_path: str) -> bytes:
+        """Base64 body (76-character lines) of a file"""
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return encoded
+
+        chunks = []
+        with open(file_path, "rb") as f:
+            while True:
+                chunk = f.read(ENCODE_CHUNK_BYTES)
+                if not chunk:
+                    break
+                chunks.append(base64.encodebytes(chunk))
+        encoded = b"".join(chunks)
+
+        with self._lock:
+            self.misses += 1
+            if len(encoded) <= self.max_bytes and key not in self._entries:
+                self._entries[key] = encoded
+                self._size += len(encoded)
+                while self._size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= len(evicted)
+        return encoded
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._size, "hits": self.hits, "misses": self.misses}
+
+
+class StreamingMimeBuilder:
+    """Builds multipart/mixed messages into a spooled temporary file"""
+
+    def __init__(self, attachment_cache: Optional[AttachmentCache] = None):
+        self.attachment_cache = attachment_cache or AttachmentCache()
+
+    def build(
+        self, to_email: str, subject: str, body: str, attachments: Optional[List[Dict]] = None
+    ) -> Tuple[IO[bytes], int]:
+        """
+        Build an RFC 2822 message
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject line
+            body: Email body content
+            attachments: List of attachment dictionaries with 'path' and 'filename'
+
+        Returns:
+            Tuple of (file positioned at the start, size in bytes)
+        """
+        boundary = f"==============={uuid.uuid4().hex}=="
+        msg = email.mime.multipart.MIMEMultipart(boundary=boundary)
+        msg["To"] = to_email
+        msg["Subject"] = subject
+        msg.attach(email.mime.text.MIMEText(body, "plain"))
+
+        # Headers and body part come from the email package; the closing
+        # delimiter is written after the attachments
+        head = msg.as_bytes()
+        closing = f"--{boundary}--\n".encode("ascii")
+        head = head[: -len(closing)]
+
+        out = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        out.write(head)
+
+        for attachment in attachments or []:
+            file_path = attachment.get("path")
+            filename = attachment.get("filename")
+
+            if not file_path or not filename:
+                logger.warning(f"Invalid attachment: {attachment}")
+                continue
+
+            if not os.path.exists(file_path):
+                logger.warning(f"Attachment file not found: {file_path}")
+                continue
+
+            try:
+                encoded = self.attachment_cache.get_encoded(file_path)
+            except OSError as e:
+                logger.error(f"Failed to attach file {file_path}: {e}")
+                continue
+
+            part = email.mime.base.MIMEBase("application", "octet-stream")
+            part["Content-Transfer-Encoding"] = "base64"
+            part.add_header("Content-Disposition", "attachment", filename=filename)
+            part.set_payload("")
+
+            out.write(f"--{boundary}\n".encode("ascii"))
+            out.write(part.as_bytes())
+            out.write(encoded)
+            out.write(b"\n")
+
+        out.write(closing)
+        size = out.tell()
+        out.seek(0)
+        return out, size
+
+
+class GmailApiSession:
+    """
+    Keep-alive HTTP session for the Gmail upload endpoint
+
+    Messages are sent as message/rfc822 bytes: a single media upload for
+    normal messages, the resumable protocol above RESUMABLE_UPLOAD_THRESHOLD.
+    """
+
+    def __init__(self, oauth_manager, session=None, timeout: float = 60.0):
+        """
+        Args:
+            oauth_manager: GmailOAuthManager (token source and refresh)
+            session: requests.Session to reuse (created on first use if omitted)
+            timeout: Per-request timeout in seconds
+        """
+        self.oauth_manager = oauth_manager
+        self.timeout = timeout
+        self._session = session
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                self._session = requests.Session()
+                self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            return self._session
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def send_message(self, message: IO[bytes], size: int, access_token: str) -> Dict:
+        """
+        Send a raw RFC 2822 message
+
+        Returns:
+            Send result status (same shape as GmailSender._send_via_gmail_api)
+        """
+        try:
+            response = self._upload(message, size, access_token)
+
+            if response.status_code == 401:
+                # Token expired - try to refresh
+                logger.warning("Access token expired, attempting refresh")
+                refresh_result = self.oauth_manager.refresh_access_token()
+                if refresh_result["status"] != "success":
+                    return {
+                        "status": "error",
+                        "message": "Access token expired and refresh failed. Re-authentication required.",
+                    }
+                message.seek(0)
+                response = self._upload(message, size, refresh_result["tokens"]["access_token"])
+
+            if response.status_code == 200:
+                response_data = response.json()
+                message_id = response_data.get("id", "unknown")
+
+                logger.info(f"Email sent successfully: {message_id}")
+
+                return {
+                    "status": "success",
+                    "message": "Email sent successfully",
+                    "gmail_message_id": message_id,
+                    "thread_id": response_data.get("threadId"),
+                    "label_ids": response_data.get("labelIds", []),
+                }
+
+            logger.error(f"Gmail API error: {response.status_code} - {response.text}")
+            return {
+                "status": "error",
+                "message": f"Gmail API error: {response.status_code}",
+                "details": response.text,
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to send via Gmail API: {e}")
+            return {"status": "error", "message": f"API request failed: {str(e)}"}
+
+    def _upload(self, message: IO[bytes], size: int, access_token: str):
+        authorization = {"Authorization": f"Bearer {access_token}"}
+
+        if size <= RESUMABLE_UPLOAD_THRESHOLD:
+            return self.session.post(
+                f"{GMAIL_UPLOAD_URL}?uploadType=media",
+                headers={**authorization, "Content-Type": "message/rfc822", "Content-Length": str(size)},
+                data=message,
+                timeout=self.timeout,
+            )
+
+        # Resumable upload: open an upload session, then send the bytes to it
+        start = self.session.post(
+            f"{GMAIL_UPLOAD_URL}?uploadType=resumable",
+            headers={
+                **authorization,
+                "X-Upload-Content-Type": "message/rfc822",
+                "X-Upload-Content-Length": str(size),
+            },
+            json={},
+            timeout=self.timeout,
+        )
+        if start.status_code != 200 or not start.headers.get("Location"):
+            return start
+
+        return self.session.put(
+            start.headers["Location"],
+            headers={**authorization, "Content-Type": "message/rfc822", "Content-Length": str(size)},
+            data=message,
+            timeout=self.timeout,
+        )
+
+
+def write_application_statuses(updates: List[Dict]) -> None:
+    """
+    Write send outcomes to job_applications in one statement
+
+    Args:
+        updates: Dicts with application_id, status, email_sent_to and note
+    """
+    from modules.database.lazy_instances import get_database_manager
+    from modules.database.materialized_view_refresher import notify_table_write
+
+    values_rows = []
+    params = []
+    for update in updates:
+        values_rows.append("(%s, %s, %s, %s)")
+        params.extend([update["application_id"], update["status"], update["email_sent_to"], update["note"]])
+
+    get_database_manager().execute_query(
+        f"""
+        UPDATE job_applications AS ja
+        SET application_status = v.status,
+            email_sent_to = v.email_sent_to,
+            notes = COALESCE(ja.notes, '') || v.note
+        FROM (VALUES {', '.join(values_rows)}) AS v(id, status, email_sent_to, note)
+        WHERE ja.id = CAST(v.id AS uuid)
+        """,
+        tuple(params),
+    )
+    notify_table_write("job_applications")
+
+
+class ApplicationStatusBatch:
+    """
+    Buffer of application send outcomes, written batch_size rows at a time
+
+    Thread-safe; call flush() once the last outcome has been recorded.
+    """
+
+    def __init__(self, writer: Callable[[List[Dict]], None] = write_application_statuses, batch_size: int = 25):
+        self.writer = writer
+        self.batch_size = batch_size
+        self._pending: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def record(self, application_id: str, to_email: str, result: Dict) -> None:
+        """Buffer the outcome of one send (a GmailBulkSender.send result)"""
+        sent = result.get("status") == "success"
+        note = (
+            f" | Email sent: {datetime.now().isoformat()} ({result.get('gmail_message_id')})"
+            if sent
+            else f" | Email failed: {result.get('message', 'Unknown error')}"
+        )
+        with self._lock:
+            self._pending.append(
+                {
+                    "application_id": application_id,
+                    "status": "sent" if sent else "send_failed",
+                    "email_sent_to": to_email,
+                    "note": note,
+                }
+            )
+        self._write(force=False)
+
+    def flush(self) -> None:
+        """Write every buffered outcome"""
+        self._write(force=True)
+
+    def _write(self, force: bool) -> None:
+        with self._lock:
+            if not self._pending or (not force and len(self._pending) < self.batch_size):
+                return
+            batch, self._pending = self._pending, []
+
+        for start in range(0, len(batch), self.batch_size):
+            chunk = batch[start:start + self.batch_size]
+            try:
+                self.writer(chunk)
+            except Exception as e:
+                logger.error(f"Failed to write {len(chunk)} application statuses: {e}")
+
+
+class GmailBulkSender:
+    """
+    Send queue for bulk application emails
+
+    Queued sends share one keep-alive Gmail session and the attachment cache;
+    the resulting application statuses are written back to job_applications
+    status_batch_size rows at a time (see ApplicationStatusBatch).
+    """
+
+    def __init__(
+        self,
+        oauth_manager,
+        api_session: Optional[GmailApiSession] = None,
+        mime_builder: Optional[StreamingMimeBuilder] = None,
+        status_writer: Callable[[List[Dict]], None] = write_application_statuses,
+        status_batch_size: int = 25,
+    ):
+        self.oauth_manager = oauth_manager
+        self.api_session = api_session or GmailApiSession(oauth_manager)
+        self.mime_builder = mime_builder or StreamingMimeBuilder()
+        self.statuses = ApplicationStatusBatch(status_writer, status_batch_size)
+        self._queue: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def enqueue(
+        self,
+        application_id: str,
+        to_email: str,
+        subject: str,
+        body: str,
+        attachments: Optional[List[Dict]] = None,
+    ) -> None:
+        """Queue an application email (sent on flush)"""
+        with self._lock:
+            self._queue.append(
+                {
+                    "application_id": application_id,
+                    "to_email": to_email,
+                    "subject": subject,
+                    "body": body,
+                    "attachments": attachments or [],
+                }
+            )
+
+    def flush(self) -> Dict:
+        """
+        Send every queued email and write their statuses
+
+        Returns:
+            Summary with per-application results
+        """
+        with self._lock:
+            queued, self._queue = self._queue, []
+
+        results = {}
+        for item in queued:
+            result = self.send(item["to_email"], item["subject"], item["body"], item["attachments"])
+            results[item["application_id"]] = result
+            self.statuses.record(item["application_id"], item["to_email"], result)
+
+        self.statuses.flush()
+
+        sent = sum(1 for result in results.values() if result.get("status") == "success")
+        return {
+            "sent": sent,
+            "failed": len(results) - sent,
+            "results": results,
+            "attachment_cache": self.mime_builder.attachment_cache.get_stats(),
+        }
+
+    def send(self, to_email: str, subject: str, body: str, attachments: Optional[List[Dict]] = None) -> Dict:
+        """Send one email immediately through the shared session"""
+        access_token = self.oauth_manager.get_valid_token()
+        if not access_token:
+            return {"status": "error", "message": "No valid access token available. OAuth authentication required."}
+
+        try:
+            message, size = self.mime_builder.build(to_email, subject, body, attachments)
+        except Exception as e:
+            logger.error(f"Failed to create email message: {e}")
+            return {"status": "error", "message": "Failed to create email message"}
+
+        with message:
+            return self.api_session.send_message(message, size, access_token)
+
+    def close(self) -> None:
+        """Flush pending status writes and release the HTTP session"""
+        self.statuses.flush()
+        self.api_session.close()
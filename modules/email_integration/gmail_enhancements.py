@@ -6,13 +6,14 @@ Based on production testing results and identified improvement areas
 
 import os
 import re
-import time
 import json
 import logging
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 import mimetypes
 
+from modules.resilience.timeout_manager import sleep_within_deadline
+
 logger = logging.getLogger(__name__)
 
 
@@ -256,7 +257,9 @@ class RetryManager:
                 if attempt < max_retries - 1:
                     delay = initial_delay * (backoff_factor**attempt)
                     logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
+                    if not sleep_within_deadline(delay):
+                        logger.warning("Workflow deadline reached, not retrying")
+                        return {"success": False, "attempts": attempt + 1, "final_error": str(e)}
 
         # All attempts failed
         return {
@@ -1,6 +1,7 @@
 """
 Gmail OAuth Integration for Automated Job Application System
 Handles OAuth 2.0 authentication and email sending via Gmail API
+(bulk sends: see gmail_bulk_sender.py)
 """
 
 import logging
@@ -9,6 +10,8 @@ import json
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+from .gmail_bulk_sender import GmailApiSession, GmailBulkSender
+
 logger = logging.getLogger(__name__)
 
 
@@ -299,6 +302,8 @@ class GmailSender:
     def __init__(self, oauth_manager: GmailOAuthManager):
         self.oauth_manager = oauth_manager
         self.gmail_api_url = "https://gmail.googleapis.com/gmail/v1/users/me/messages/send"
+        # Keep-alive HTTP session shared by every send from this sender
+        self.api_session = GmailApiSession(oauth_manager)
 
     def send_job_application_email(
         self, to_email: str, subject: str, body: str, attachments: Optional[List[Dict]] = None
@@ -422,15 +427,13 @@ class GmailSender:
             if not self.oauth_manager._ensure_requests_loaded():
                 return {"status": "error", "message": "requests module not available for API calls"}
 
-            import requests
-
             # Prepare API request
             headers = {"Authorization": f"Bearer {access_token}", "Content-Type": "application/json"}
 
             payload = {"raw": raw_message}
 
-            # Send request to Gmail API
-            response = requests.post(self.gmail_api_url, headers=headers, json=payload, timeout=30)
+            # Send request to Gmail API (reusing the keep-alive connection)
+            response = self.api_session.session.post(self.gmail_api_url, headers=headers, json=payload, timeout=30)
 
             if response.status_code == 200:
                 response_data = response.json()
@@ -519,3 +522,10 @@ def get_gmail_sender(oauth_manager: Optional[GmailOAuthManager] = None) -> Gmail
     if oauth_manager is None:
         oauth_manager = get_gmail_oauth_manager()
     return GmailSender(oauth_manager)
+
+
+def get_gmail_bulk_sender(oauth_manager: Optional[GmailOAuthManager] = None) -> GmailBulkSender:
+    """Get Gmail bulk sender (send queue with batched status writes)"""
+    if oauth_manager is None:
+        oauth_manager = get_gmail_oauth_manager()
+    return GmailBulkSender(oauth_manager)
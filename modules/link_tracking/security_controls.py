@@ -9,7 +9,9 @@ Date: July 28, 2025
 """
 
 import re
+import math
 import time
+import threading
 import hashlib
 import secrets
 from typing import Dict, List, Optional, Any, Tuple
@@ -19,8 +21,27 @@ from functools import wraps
 from flask import request, jsonify, g
 import ipaddress
 
+from modules.security.limiter_engine import SlidingWindowCounterLimiter, get_shared_limiter_store
+
 logger = logging.getLogger(__name__)
 
+# One limiter per (limit, window) pair; the state lives in the shared store
+_window_limiters: Dict[Tuple[int, int], SlidingWindowCounterLimiter] = {}
+_window_limiters_lock = threading.Lock()
+
+
+def _get_window_limiter(limit: int, window: int) -> SlidingWindowCounterLimiter:
+    limiter = _window_limiters.get((limit, window))
+    if limiter is None:
+        with _window_limiters_lock:
+            limiter = _window_limiters.setdefault(
+                (limit, window),
+                SlidingWindowCounterLimiter(
+                    limit, window, store=get_shared_limiter_store(), namespace=f"link_tracking:{limit}:{window}"
+                ),
+            )
+    return limiter
+
 
 class SecurityControls:
     """
@@ -28,7 +49,6 @@ class SecurityControls:
     """
 
     def __init__(self):
-        self.rate_limit_storage = {}  # In production, use Redis
         self.blocked_ips = set()
         self.allowed_domains = {
             "linkedin.com",
@@ -297,6 +317,9 @@ class SecurityControls:
         """
         Check if request is within rate limits.
 
+        Uses a sliding window counter in the shared limiter store, so counts
+        survive across SecurityControls instances and worker processes.
+
         Args:
             key: Rate limiting key (IP, API key, etc.)
             limit: Maximum requests allowed
@@ -305,34 +328,21 @@ class SecurityControls:
         Returns:
             Tuple of (is_allowed, rate_limit_info)
         """
+        result = _get_window_limiter(limit, window).check(key)
         current_time = time.time()
 
-        # Clean old entries
-        if key in self.rate_limit_storage:
-            self.rate_limit_storage[key] = [
-                timestamp for timestamp in self.rate_limit_storage[key] if current_time - timestamp < window
-            ]
-        else:
-            self.rate_limit_storage[key] = []
-
-        # Check current count
-        current_count = len(self.rate_limit_storage[key])
-
         rate_limit_info = {
             "limit": limit,
-            "remaining": max(0, limit - current_count),
-            "reset_time": current_time + window,
+            "remaining": result.remaining,
+            "reset_time": current_time + (result.retry_after if not result.allowed else window),
             "window": window,
+            "retry_after": int(math.ceil(result.retry_after)),
         }
 
-        if current_count >= limit:
+        if not result.allowed:
             logger.warning(f"Rate limit exceeded for key: {key}")
             return False, rate_limit_info
 
-        # Add current request
-        self.rate_limit_storage[key].append(current_time)
-        rate_limit_info["remaining"] -= 1
-
         return True, rate_limit_info
 
     def get_client_ip(self, request) -> str:
@@ -475,13 +485,13 @@ def rate_limit(limit: int = 100, window: int = 3600):
                         "error": "Rate limit exceeded",
                         "limit": rate_info["limit"],
                         "window": rate_info["window"],
-                        "retry_after": rate_info["window"],
+                        "retry_after": rate_info["retry_after"],
                     }
                 )
                 response.headers["X-RateLimit-Limit"] = str(rate_info["limit"])
                 response.headers["X-RateLimit-Remaining"] = "0"
                 response.headers["X-RateLimit-Reset"] = str(int(rate_info["reset_time"]))
-                response.headers["Retry-After"] = str(rate_info["window"])
+                response.headers["Retry-After"] = str(rate_info["retry_after"])
 
                 return response, 429
 
@@ -6,9 +6,10 @@ Provides structured logging, request correlation, performance metrics, debugging
 PII scrubbing, rate limiting, and configuration validation.
 """
 
-from .logging_config import configure_logging, get_logger, shutdown_logging
+from .logging_config import configure_logging, get_logger, shutdown_logging, get_logging_stats
 from .context import RequestContext, get_request_context, set_request_context
 from .metrics import MetricsCollector, track_performance
+from .timeseries import TimeSeriesStore
 from .middleware import ObservabilityMiddleware
 from .monitoring_api import monitoring_api
 from .pii_scrubber import PIIScrubber, PIIScrubbingFilter, scrub_pii
@@ -20,6 +21,7 @@ __all__ = [
     'configure_logging',
     'get_logger',
     'shutdown_logging',
+    'get_logging_stats',
 
     # Context
     'RequestContext',
@@ -29,6 +31,7 @@ __all__ = [
     # Metrics
     'MetricsCollector',
     'track_performance',
+    'TimeSeriesStore',
 
     # Middleware & API
     'ObservabilityMiddleware',
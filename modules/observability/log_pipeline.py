@@ -0,0 +1,305 @@
+"""
+Asynchronous Log Pipeline with Backpressure
+
+The request thread only snapshots the record and enqueues it; filtering (PII
+scrubbing), message formatting, JSON serialization and I/O all happen on the
+listener thread.
+
+Components:
+- BoundedQueueHandler: non-blocking enqueue onto a bounded queue with a
+  configurable overflow policy and per-level drop counters
+- BatchingQueueListener: drains the queue in batches and writes each batch to
+  stream/file handlers with a single write() and flush()
+
+Overflow policies:
+- drop_debug_first (default): DEBUG records are shed once the queue passes the
+  shed watermark; when full, records below ERROR are dropped and ERROR+ wait
+  briefly for space
+- drop_newest: when full, the incoming record is dropped regardless of level
+- block: the caller waits for space (never drops)
+
+Dropped records are counted per level and, when multi-process metrics are
+enabled, exported as log_records_dropped_total{level}.
+
+Example:
+    >>> log_queue = Queue(maxsize=10000)
+    >>> root.addHandler(BoundedQueueHandler(log_queue))
+    >>> listener = BatchingQueueListener(log_queue, console_handler, file_handler)
+    >>> listener.start()
+"""
+
+import copy
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from .context import get_request_context
+
+OVERFLOW_POLICIES = ('drop_debug_first', 'drop_newest', 'block')
+
+# Marks records whose request context was not captured at enqueue time
+_NOT_CAPTURED = object()
+
+
+def record_request_context(record: logging.LogRecord):
+    """
+    Request context for a log record.
+
+    Records that went through BoundedQueueHandler carry the context captured
+    on the request thread (the listener thread has none of its own); direct
+    handlers fall back to the live context.
+    """
+    context = getattr(record, '_request_context', _NOT_CAPTURED)
+    if context is _NOT_CAPTURED:
+        return get_request_context()
+    return context
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that never blocks the caller on a full queue (unless the
+    'block' policy is chosen) and counts what it had to drop.
+
+    Unlike the stdlib QueueHandler, prepare() does not format the message:
+    args and exc_info stay on the record so formatting happens on the
+    listener thread. The record is shallow-copied so other handlers on the
+    same logger are unaffected.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        overflow_policy: str = 'drop_debug_first',
+        shed_watermark: float = 0.8,
+        block_timeout: float = 0.05
+    ):
+        """
+        Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue shared with the listener
+            overflow_policy: One of OVERFLOW_POLICIES
+            shed_watermark: Queue fill ratio above which DEBUG records are shed
+            block_timeout: Seconds an ERROR+ record waits for space when full
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow_policy}', expected one of {OVERFLOW_POLICIES}")
+
+        super().__init__(log_queue)
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.capacity = log_queue.maxsize
+        self.shed_depth = int(self.capacity * shed_watermark) if self.capacity > 0 else 0
+
+        self._drop_lock = threading.Lock()
+        self.dropped: Counter = Counter()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if (
+                self.shed_depth
+                and record.levelno <= logging.DEBUG
+                and self.overflow_policy == 'drop_debug_first'
+                and self.queue.qsize() >= self.shed_depth
+            ):
+                self._record_drop(record)
+                return
+
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record._request_context = get_request_context()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if self.overflow_policy == 'block':
+            self.queue.put(record)
+            return
+
+        if self.overflow_policy == 'drop_debug_first' and record.levelno >= logging.ERROR:
+            try:
+                self.queue.put(record, timeout=self.block_timeout)
+                return
+            except queue.Full:
+                pass
+
+        self._record_drop(record)
+
+    def _record_drop(self, record: logging.LogRecord) -> None:
+        with self._drop_lock:
+            self.dropped[record.levelname] += 1
+
+        # Imported lazily: multiprocess metrics are optional and logging is
+        # configured before the rest of the observability module is used
+        from .multiprocess_metrics import get_multiprocess_metrics
+        shared_metrics = get_multiprocess_metrics()
+        if shared_metrics:
+            shared_metrics.inc_counter('log_records_dropped_total', {'level': record.levelname})
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and drop counters"""
+        with self._drop_lock:
+            dropped = dict(self.dropped)
+
+        return {
+            'overflow_policy': self.overflow_policy,
+            'queue_depth': self.queue.qsize(),
+            'queue_capacity': self.capacity,
+            'dropped': dropped,
+            'dropped_total': sum(dropped.values())
+        }
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that drains up to batch_size records at a time.
+
+    Stream and file handlers receive the whole batch as one write() and one
+    flush() instead of a flush per record; other handlers get handle() per
+    record. Rotating file handlers roll over at batch boundaries.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler,
+                 respect_handler_level: bool = True, batch_size: int = 256):
+        """
+        Initialize the listener.
+
+        Args:
+            log_queue: Queue fed by BoundedQueueHandler
+            handlers: Handlers that perform the actual output
+            respect_handler_level: Skip records below each handler's level
+            batch_size: Maximum records drained per batch
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.batch_size = batch_size
+
+        self._stats_lock = threading.Lock()
+        self.batches_written = 0
+        self.records_written = 0
+        self.max_batch = 0
+        self.last_write_ms = 0.0
+
+    def _monitor(self) -> None:
+        log_queue = self.queue
+        has_task_done = hasattr(log_queue, 'task_done')
+        stopping = False
+
+        while not stopping:
+            record = self.dequeue(True)
+            if record is self._sentinel:
+                if has_task_done:
+                    log_queue.task_done()
+                break
+
+            batch = [record]
+            while len(batch) < self.batch_size:
+                try:
+                    record = log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is self._sentinel:
+                    stopping = True
+                    break
+                batch.append(record)
+
+            self.handle_batch(batch)
+
+            if has_task_done:
+                for _ in range(len(batch) + (1 if stopping else 0)):
+                    log_queue.task_done()
+
+    def handle_batch(self, records: List[logging.LogRecord]) -> None:
+        """Write a batch of records to every handler"""
+        start = time.perf_counter()
+
+        for handler in self.handlers:
+            if isinstance(handler, logging.StreamHandler):
+                self._write_batch(handler, records)
+                continue
+
+            for record in records:
+                if self.respect_handler_level and record.levelno < handler.level:
+                    continue
+                handler.handle(record)
+
+        with self._stats_lock:
+            self.batches_written += 1
+            self.records_written += len(records)
+            self.max_batch = max(self.max_batch, len(records))
+            self.last_write_ms = (time.perf_counter() - start) * 1000
+
+    def _write_batch(self, handler: logging.StreamHandler, records: List[logging.LogRecord]) -> None:
+        lines = []
+        for record in records:
+            if self.respect_handler_level and record.levelno < handler.level:
+                continue
+            if not handler.filter(record):
+                continue
+            try:
+                lines.append(handler.format(record) + handler.terminator)
+            except Exception:
+                handler.handleError(record)
+
+        if not lines:
+            return
+
+        payload = ''.join(lines)
+        handler.acquire()
+        try:
+            if isinstance(handler, logging.FileHandler) and handler.stream is None:
+                handler.stream = handler._open()
+
+            if isinstance(handler, logging.handlers.RotatingFileHandler) and handler.maxBytes > 0:
+                position = handler.stream.tell()
+                if position > 0 and position + len(payload) >= handler.maxBytes:
+                    handler.doRollover()
+
+            handler.stream.write(payload)
+            handler.flush()
+        except Exception:
+            handler.handleError(records[-1])
+        finally:
+            handler.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batch throughput counters"""
+        with self._stats_lock:
+            return {
+                'batch_size': self.batch_size,
+                'batches_written': self.batches_written,
+                'records_written': self.records_written,
+                'max_batch': self.max_batch,
+                'avg_batch': round(self.records_written / self.batches_written, 2) if self.batches_written else 0.0,
+                'last_write_ms': round(self.last_write_ms, 3)
+            }
+
+
+def get_pipeline_stats(handler: Optional[BoundedQueueHandler],
+                       listener: Optional[BatchingQueueListener]) -> Dict[str, Any]:
+    """
+    Combined pipeline statistics.
+
+    Returns:
+        {'async': False} when async logging is off, otherwise queue depth,
+        drop counters and batch counters
+    """
+    if handler is None or listener is None:
+        return {'async': False}
+
+    stats = {'async': True}
+    stats.update(handler.get_stats())
+    stats.update(listener.get_stats())
+    return stats
@@ -5,7 +5,8 @@ Provides structured logging with consistent formatting, log levels, and output h
 across all application modules. Supports both development and production environments.
 
 Features:
-- Async logging with QueueHandler for non-blocking I/O
+- Async logging with a bounded queue, overflow policy and batched writes
+  (see log_pipeline.py); formatting and I/O run off the request thread
 - Rotating file handlers for automatic log rotation
 - JSON structured logging for production
 - Human-readable colored output for development
@@ -26,8 +27,20 @@ from typing import Optional, Dict, Any
 from queue import Queue
 from pythonjsonlogger import jsonlogger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import PII scrubber
 from .pii_scrubber import PIIScrubbingFilter, PIIScrubber
+from .log_pipeline import BoundedQueueHandler, BatchingQueueListener, get_pipeline_stats, record_request_context
+
+
+def _orjson_default(obj: Any) -> str:
+    """Fallback for objects orjson cannot serialize natively (matches JsonEncoder's str())"""
+    return str(obj)
 
 
 class StructuredFormatter(jsonlogger.JsonFormatter):
@@ -41,6 +54,9 @@ class StructuredFormatter(jsonlogger.JsonFormatter):
     - Message
     - Request context (if available)
     - Exception info (if present)
+
+    Serializes with orjson when it is installed, falling back to the
+    standard json encoder for anything orjson rejects.
     """
 
     def add_fields(self, log_record: Dict[str, Any], record: logging.LogRecord, message_dict: Dict[str, Any]) -> None:
@@ -54,8 +70,9 @@ class StructuredFormatter(jsonlogger.JsonFormatter):
         """
         super(StructuredFormatter, self).add_fields(log_record, record, message_dict)
 
-        # Add timestamp in ISO format
-        log_record['timestamp'] = datetime.utcnow().isoformat() + 'Z'
+        # Add timestamp in ISO format (creation time, not format time, since
+        # async records are formatted later on the listener thread)
+        log_record['timestamp'] = datetime.utcfromtimestamp(record.created).isoformat() + 'Z'
 
         # Add log level
         log_record['level'] = record.levelname
@@ -71,8 +88,7 @@ class StructuredFormatter(jsonlogger.JsonFormatter):
         }
 
         # Add request context if available (from RequestContext)
-        from .context import get_request_context
-        context = get_request_context()
+        context = record_request_context(record)
         if context:
             log_record['request'] = {
                 'correlation_id': context.correlation_id,
@@ -90,6 +106,27 @@ class StructuredFormatter(jsonlogger.JsonFormatter):
                 'traceback': self.formatException(record.exc_info) if record.exc_info else None
             }
 
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        """
+        Serialize the log record, using orjson when available.
+
+        Args:
+            log_record: Dictionary built by add_fields
+
+        Returns:
+            JSON string
+        """
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(
+                    log_record,
+                    default=_orjson_default,
+                    option=orjson.OPT_NON_STR_KEYS
+                ).decode('utf-8')
+            except TypeError:
+                pass
+        return super(StructuredFormatter, self).jsonify_log_record(log_record)
+
 
 class HumanReadableFormatter(logging.Formatter):
     """
@@ -129,8 +166,7 @@ class HumanReadableFormatter(logging.Formatter):
         message = f"{color}{record.levelname:8}{reset} {timestamp} [{record.name}] {record.getMessage()}"
 
         # Add request context if available
-        from .context import get_request_context
-        context = get_request_context()
+        context = record_request_context(record)
         if context:
             message += f" | correlation_id={context.correlation_id} path={context.path}"
 
@@ -143,6 +179,7 @@ class HumanReadableFormatter(logging.Formatter):
 
 # Global queue listener for async logging
 _queue_listener = None
+_queue_handler = None
 _log_queue = None
 
 
@@ -157,7 +194,9 @@ def configure_logging(
     backup_count: int = 5,
     enable_async_logging: bool = True,
     enable_pii_scrubbing: bool = True,
-    queue_size: int = 10000
+    queue_size: int = 10000,
+    overflow_policy: str = 'drop_debug_first',
+    batch_size: int = 256
 ) -> None:
     """
     Configure application-wide logging settings with rotating file handlers.
@@ -174,6 +213,9 @@ def configure_logging(
         enable_async_logging: Use async logging with QueueHandler (default: True)
         enable_pii_scrubbing: Enable PII scrubbing filter (default: True)
         queue_size: Maximum queue size for async logging (default: 10000)
+        overflow_policy: What to do when the queue fills - 'drop_debug_first',
+            'drop_newest' or 'block' (default: 'drop_debug_first')
+        batch_size: Maximum records written per batch by the listener (default: 256)
 
     Example:
         >>> # Development setup
@@ -190,7 +232,7 @@ def configure_logging(
         ...     enable_pii_scrubbing=True
         ... )
     """
-    global _queue_listener, _log_queue
+    global _queue_listener, _queue_handler, _log_queue
     # Convert level string to logging constant
     log_level = getattr(logging, level.upper(), logging.INFO)
 
@@ -198,8 +240,9 @@ def configure_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
-    # Remove existing handlers
+    # Remove existing handlers (stopping a listener left by a previous call)
     root_logger.handlers.clear()
+    shutdown_logging()
 
     # Choose formatter
     if format_type == 'json':
@@ -281,23 +324,26 @@ def configure_logging(
         # Create queue with max size to prevent memory issues
         _log_queue = Queue(maxsize=queue_size)
 
-        # Create QueueHandler for root logger
-        queue_handler = logging.handlers.QueueHandler(_log_queue)
-        queue_handler.setLevel(log_level)
-        root_logger.addHandler(queue_handler)
+        # Create QueueHandler for root logger; it only snapshots the record
+        # and never blocks on a full queue unless overflow_policy='block'
+        _queue_handler = BoundedQueueHandler(_log_queue, overflow_policy=overflow_policy)
+        _queue_handler.setLevel(log_level)
+        root_logger.addHandler(_queue_handler)
 
         # Create QueueListener with actual handlers
-        # QueueListener runs in separate thread and does I/O
-        _queue_listener = logging.handlers.QueueListener(
+        # The listener thread filters, formats and writes records in batches
+        _queue_listener = BatchingQueueListener(
             _log_queue,
             *handlers_list,
-            respect_handler_level=True
+            respect_handler_level=True,
+            batch_size=batch_size
         )
 
         # Start the listener
         _queue_listener.start()
 
-        # Register shutdown handler
+        # Register shutdown handler (once, even if logging is reconfigured)
+        atexit.unregister(shutdown_logging)
         atexit.register(shutdown_logging)
 
     else:
@@ -327,6 +373,22 @@ def configure_logging(
     )
 
 
+def get_logging_stats() -> Dict[str, Any]:
+    """
+    Get async log pipeline statistics for this process.
+
+    Returns:
+        Dictionary with queue depth/capacity, dropped record counts per level,
+        and batch write counters ({'async': False} when async logging is off)
+
+    Example:
+        >>> stats = get_logging_stats()
+        >>> stats['queue_depth'], stats['dropped_total']
+        (0, 0)
+    """
+    return get_pipeline_stats(_queue_handler, _queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
@@ -357,13 +419,14 @@ def shutdown_logging():
     Example:
         >>> shutdown_logging()  # Manually shutdown (usually automatic via atexit)
     """
-    global _queue_listener, _log_queue
+    global _queue_listener, _queue_handler, _log_queue
 
     if _queue_listener is not None:
         try:
             # Stop the listener (waits for queue to empty)
             _queue_listener.stop()
             _queue_listener = None
+            _queue_handler = None
             _log_queue = None
         except Exception as e:
             # Use print since logging may not work during shutdown
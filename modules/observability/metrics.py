@@ -14,25 +14,12 @@ from dataclasses import dataclass, field
 from threading import Lock
 
 from .logging_config import get_logger
+from .timeseries import TimeSeriesStore
+from .multiprocess_metrics import get_multiprocess_metrics
 
 logger = get_logger(__name__)
 
 
-@dataclass
-class MetricPoint:
-    """
-    Individual metric data point.
-
-    Attributes:
-        timestamp: When the metric was recorded
-        value: Metric value
-        labels: Additional labels/tags for filtering
-    """
-    timestamp: datetime
-    value: float
-    labels: Dict[str, str] = field(default_factory=dict)
-
-
 @dataclass
 class RequestMetrics:
     """
@@ -66,12 +53,13 @@ class MetricsCollector:
     Provides aggregation and querying capabilities.
     """
 
-    def __init__(self, retention_hours: int = 24):
+    def __init__(self, retention_hours: int = 24, series_capacity: int = 1024):
         """
         Initialize metrics collector.
 
         Args:
             retention_hours: How long to retain metrics (default: 24 hours)
+            series_capacity: Raw points kept per metric/label series (default: 1024)
         """
         self.retention_hours = retention_hours
         self._lock = Lock()
@@ -79,8 +67,11 @@ class MetricsCollector:
         # Request metrics by path
         self._request_metrics: Dict[str, RequestMetrics] = defaultdict(RequestMetrics)
 
-        # Time-series metrics
-        self._metrics: Dict[str, List[MetricPoint]] = defaultdict(list)
+        # Time-series metrics (fixed memory: per-minute buckets + per-series ring buffers)
+        self._metrics = TimeSeriesStore(
+            retention_minutes=retention_hours * 60,
+            series_capacity=series_capacity
+        )
 
         # Error tracking
         self._errors: List[Dict[str, Any]] = []
@@ -118,12 +109,10 @@ class MetricsCollector:
                 metrics.total_errors += 1
 
             # Record time-series point
-            self._metrics['request_duration_ms'].append(
-                MetricPoint(
-                    timestamp=datetime.utcnow(),
-                    value=duration_ms,
-                    labels={'method': method, 'path': path, 'status': str(status_code)}
-                )
+            self._metrics.record(
+                'request_duration_ms',
+                duration_ms,
+                {'method': method, 'path': path, 'status': str(status_code)}
             )
 
     def record_error(
@@ -170,13 +159,7 @@ class MetricsCollector:
             >>> metrics.record_custom_metric('ai_tokens_used', 5000, {'model': 'gemini'})
         """
         with self._lock:
-            self._metrics[name].append(
-                MetricPoint(
-                    timestamp=datetime.utcnow(),
-                    value=value,
-                    labels=labels or {}
-                )
-            )
+            self._metrics.record(name, value, labels)
 
     def get_request_metrics(self, path: Optional[str] = None) -> Dict[str, RequestMetrics]:
         """
@@ -202,25 +185,11 @@ class MetricsCollector:
             minutes: Time window in minutes
 
         Returns:
-            Dictionary with summary statistics
+            Dictionary with summary statistics, including p50/p95/p99
+            estimates (within 1%) when the window has data
         """
-        cutoff = datetime.utcnow() - timedelta(minutes=minutes)
-
         with self._lock:
-            points = [p for p in self._metrics.get(name, []) if p.timestamp >= cutoff]
-
-            if not points:
-                return {'count': 0, 'avg': 0, 'min': 0, 'max': 0, 'sum': 0}
-
-            values = [p.value for p in points]
-            return {
-                'count': len(values),
-                'avg': sum(values) / len(values),
-                'min': min(values),
-                'max': max(values),
-                'sum': sum(values),
-                'latest': values[-1] if values else 0
-            }
+            return self._metrics.summary(name, minutes)
 
     def get_error_summary(self, minutes: int = 60) -> Dict[str, Any]:
         """
@@ -253,15 +222,14 @@ class MetricsCollector:
 
     def cleanup_old_metrics(self) -> None:
         """
-        Remove metrics older than retention period.
+        Remove errors older than retention period.
+
+        Time-series metrics live in fixed-size ring buffers that overwrite
+        expired minutes in place, so they need no cleanup.
         """
         cutoff = datetime.utcnow() - timedelta(hours=self.retention_hours)
 
         with self._lock:
-            # Clean time-series metrics
-            for name in self._metrics:
-                self._metrics[name] = [p for p in self._metrics[name] if p.timestamp >= cutoff]
-
             # Clean errors
             self._errors = [e for e in self._errors if e['timestamp'] >= cutoff]
 
@@ -274,6 +242,14 @@ class MetricsCollector:
         Returns:
             Dictionary containing all metrics
         """
+        with self._lock:
+            custom_metrics = {
+                name: self._metrics.summary(name)
+                for name in self._metrics.names()
+            }
+
+        error_summary = self.get_error_summary()
+
         with self._lock:
             return {
                 'timestamp': datetime.utcnow().isoformat(),
@@ -289,11 +265,8 @@ class MetricsCollector:
                     }
                     for path, m in self._request_metrics.items()
                 },
-                'custom_metrics': {
-                    name: self.get_metric_summary(name)
-                    for name in self._metrics.keys()
-                },
-                'errors': self.get_error_summary()
+                'custom_metrics': custom_metrics,
+                'errors': error_summary
             }
 
 
@@ -301,6 +274,9 @@ def track_performance(metric_name: str = None):
     """
     Decorator for tracking function performance.
 
+    Durations are logged and, in multi-process mode (METRICS_MULTIPROC_DIR),
+    recorded into the function_duration_ms histogram shared across workers.
+
     Args:
         metric_name: Custom metric name (defaults to function name)
 
@@ -325,6 +301,12 @@ def track_performance(metric_name: str = None):
                     extra={'function': name, 'duration_ms': duration_ms}
                 )
 
+                shared_metrics = get_multiprocess_metrics()
+                if shared_metrics:
+                    shared_metrics.observe_histogram(
+                        'function_duration_ms', duration_ms, {'function': name, 'outcome': 'success'}
+                    )
+
                 return result
 
             except Exception as e:
@@ -334,6 +316,12 @@ def track_performance(metric_name: str = None):
                     exc_info=e,
                     extra={'function': name, 'duration_ms': duration_ms}
                 )
+
+                shared_metrics = get_multiprocess_metrics()
+                if shared_metrics:
+                    shared_metrics.observe_histogram(
+                        'function_duration_ms', duration_ms, {'function': name, 'outcome': 'error'}
+                    )
                 raise
 
         return wrapper
@@ -13,6 +13,7 @@ from werkzeug.wrappers import Response
 from .context import RequestContext, set_request_context, clear_request_context, get_request_context
 from .logging_config import get_logger
 from .metrics import MetricsCollector
+from .multiprocess_metrics import get_multiprocess_metrics
 
 logger = get_logger(__name__)
 
@@ -25,6 +26,7 @@ class ObservabilityMiddleware:
     - Automatic request context creation with correlation IDs
     - Request/response logging
     - Performance metrics collection
+    - Cross-worker Prometheus counters/histograms (when METRICS_MULTIPROC_DIR is set)
     - Error tracking
 
     Usage:
@@ -55,6 +57,7 @@ class ObservabilityMiddleware:
         self.log_request_body = log_request_body
         self.log_response_body = log_response_body
         self.exclude_paths = exclude_paths or ['/health', '/metrics', '/favicon.ico']
+        self.multiprocess_metrics = get_multiprocess_metrics()
 
         # Register request handlers
         app.before_request(self._before_request)
@@ -159,16 +162,38 @@ class ObservabilityMiddleware:
 
             getattr(logger, log_level)(log_msg, extra=log_data)
 
-        # Record metrics
+        # Record metrics (labelled by route so unique paths cannot grow the series set)
+        route = self._route_label()
         self.metrics.record_request(
             method=request.method,
-            path=request.path,
+            path=route,
             status_code=response.status_code,
             duration_ms=duration_ms
         )
 
+        if self.multiprocess_metrics:
+            self.multiprocess_metrics.inc_counter(
+                'http_requests_total',
+                {'method': request.method, 'route': route, 'status': str(response.status_code)}
+            )
+            self.multiprocess_metrics.observe_histogram(
+                'http_request_duration_ms',
+                duration_ms,
+                {'method': request.method, 'route': route}
+            )
+
         return response
 
+    @staticmethod
+    def _route_label() -> str:
+        """
+        Route template for metric labels (e.g. /api/jobs/<job_id>).
+
+        Using the URL rule instead of the raw path keeps label cardinality
+        bounded by the number of registered routes.
+        """
+        return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
     def _teardown_request(self, exception=None):
         """
         Teardown request handler - logs errors and clears context.
@@ -200,6 +225,12 @@ class ObservabilityMiddleware:
                     error_type=type(exception).__name__
                 )
 
+            if self.multiprocess_metrics:
+                self.multiprocess_metrics.inc_counter(
+                    'http_request_errors_total',
+                    {'route': self._route_label(), 'error_type': type(exception).__name__}
+                )
+
         # Clear request context
         clear_request_context()
 
@@ -19,7 +19,7 @@ from datetime import datetime, timedelta
 from flask import Blueprint, request, jsonify, current_app
 from functools import wraps
 
-from .logging_config import get_logger
+from .logging_config import get_logger, get_logging_stats
 from .debug_tools import LogAnalyzer, HealthChecker
 from .metrics import MetricsCollector
 from .rate_limiter import rate_limit
@@ -331,7 +331,8 @@ def get_metrics():
                 for path, m in request_metrics.items()
             },
             'custom_metrics': custom_metrics,
-            'errors': error_summary
+            'errors': error_summary,
+            'logging': get_logging_stats()
         })
 
     except Exception as e:
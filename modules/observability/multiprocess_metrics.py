@@ -0,0 +1,351 @@
+"""
+Multi-Process Metrics with Prometheus Text Exposition
+
+Each gunicorn worker has its own MetricsCollector, so in-process metrics only
+describe whichever worker served the request. This module lets every process
+write counters and histograms into its own memory-mapped file in a shared
+directory; the /metrics endpoint sums all
+files into one Prometheus text exposition.
+
+Design (modelled on prometheus_client's multiprocess mode):
+- One mmap'd file per process: a single writer per file, so the hot path
+  is an uncontended in-process lock, a dict lookup and struct.pack_into.
+  Threads share the file, so short-lived threads leave no files or
+  mappings behind
+- Entries are appended as [key length][JSON key][padding][float64 value];
+  the used-bytes header is written last so readers see a consistent prefix
+- Counters from exited workers stay in the directory, so totals survive
+  gunicorn's max_requests worker recycling; the directory is wiped when the
+  master starts (see gunicorn_config.on_starting)
+
+Configuration:
+    METRICS_MULTIPROC_DIR: Shared directory for metric files (enables the mode)
+
+Example:
+    >>> metrics = get_multiprocess_metrics()
+    >>> metrics.inc_counter('jobs_scraped_total', {'source': 'indeed'}, 150)
+    >>> metrics.observe_histogram('ai_call_duration_ms', 812.0, {'model': 'gemini'})
+    >>> print(metrics.render())
+"""
+
+import glob
+import json
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MULTIPROC_DIR_ENV = 'METRICS_MULTIPROC_DIR'
+
+# Millisecond buckets covering fast endpoints through slow AI calls
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+# HELP lines for metrics recorded by the observability module
+METRIC_HELP = {
+    'http_requests_total': 'Total HTTP requests by method, route and status',
+    'http_request_errors_total': 'HTTP requests that raised an unhandled exception',
+    'http_request_duration_ms': 'HTTP request duration in milliseconds',
+    'function_duration_ms': 'Duration of @track_performance functions in milliseconds',
+    'log_records_dropped_total': 'Log records dropped by the async log queue overflow policy',
+}
+
+_HEADER = struct.Struct('<II')  # used bytes, reserved
+_KEY_LENGTH = struct.Struct('<I')
+_VALUE = struct.Struct('<d')
+_INITIAL_SIZE = 64 * 1024
+
+
+class MmapedValues:
+    """
+    Append-only key -> float64 table in a memory-mapped file.
+
+    Not thread-safe: callers must serialize writes to an instance.
+    """
+
+    def __init__(self, path: str, initial_size: int = _INITIAL_SIZE):
+        self.path = path
+        self._file = open(path, 'a+b')
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._file.truncate(initial_size)
+        self._capacity = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), self._capacity)
+        self._offsets: Dict[str, int] = {}
+
+        self._used = _HEADER.unpack_from(self._map, 0)[0]
+        if self._used == 0:
+            self._used = _HEADER.size
+            _HEADER.pack_into(self._map, 0, self._used, 0)
+        else:
+            for key, _, offset in _iter_entries(self._map, self._used):
+                self._offsets[key] = offset
+
+    def offset(self, key: str) -> int:
+        """Offset of the value slot for key, appending a zeroed entry if new"""
+        offset = self._offsets.get(key)
+        if offset is None:
+            offset = self._append(key)
+        return offset
+
+    def _append(self, key: str) -> int:
+        encoded = key.encode('utf-8')
+        padding = (8 - (_KEY_LENGTH.size + len(encoded)) % 8) % 8
+        entry_size = _KEY_LENGTH.size + len(encoded) + padding + _VALUE.size
+
+        while self._used + entry_size > self._capacity:
+            self._grow()
+
+        start = self._used
+        _KEY_LENGTH.pack_into(self._map, start, len(encoded))
+        self._map[start + _KEY_LENGTH.size:start + _KEY_LENGTH.size + len(encoded)] = encoded
+        value_offset = start + _KEY_LENGTH.size + len(encoded) + padding
+        _VALUE.pack_into(self._map, value_offset, 0.0)
+
+        # Publish the entry only after it is fully written
+        self._used += entry_size
+        _HEADER.pack_into(self._map, 0, self._used, 0)
+        self._offsets[key] = value_offset
+        return value_offset
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        self._map.close()
+        self._file.truncate(self._capacity)
+        self._map = mmap.mmap(self._file.fileno(), self._capacity)
+
+    def add(self, offset: int, amount: float) -> None:
+        """Add amount to the value at offset"""
+        _VALUE.pack_into(self._map, offset, _VALUE.unpack_from(self._map, offset)[0] + amount)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+def _iter_entries(buffer, used: int) -> Iterator[Tuple[str, float, int]]:
+    """Yield (key, value, value_offset) for every entry below used"""
+    position = _HEADER.size
+    while position < used:
+        key_length = _KEY_LENGTH.unpack_from(buffer, position)[0]
+        key_start = position + _KEY_LENGTH.size
+        key = bytes(buffer[key_start:key_start + key_length]).decode('utf-8')
+        padding = (8 - (_KEY_LENGTH.size + key_length) % 8) % 8
+        value_offset = key_start + key_length + padding
+        yield key, _VALUE.unpack_from(buffer, value_offset)[0], value_offset
+        position = value_offset + _VALUE.size
+
+
+def read_metric_file(path: str) -> Iterator[Tuple[str, float]]:
+    """Yield (key, value) pairs from a metric file without locking it"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        return
+    used = min(_HEADER.unpack_from(data, 0)[0], len(data))
+    for key, value, _ in _iter_entries(data, used):
+        yield key, value
+
+
+class MultiprocessMetrics:
+    """
+    Lock-free counter and histogram recording shared across processes.
+
+    Each process lazily opens its own file in the shared directory, so
+    recording never contends with other processes; threads within a process
+    serialize on a lock held only for the struct update. render()
+    aggregates every file in the directory.
+    """
+
+    def __init__(self, directory: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        """
+        Initialize multi-process metrics.
+
+        Args:
+            directory: Shared directory for per-process metric files
+            buckets: Default histogram upper bounds
+        """
+        self.directory = directory
+        self.buckets = tuple(sorted(buckets))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._values: Optional[MmapedValues] = None
+        self._offsets: Dict[tuple, object] = {}
+
+        # A forked child must not keep writing into its parent's files
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+        self._values = None
+        self._offsets = {}
+
+    def _file(self) -> MmapedValues:
+        """This process's values file, opened on first use (caller holds _lock)"""
+        if self._values is None:
+            self._values = MmapedValues(os.path.join(self.directory, f'metrics_{os.getpid()}.db'))
+        return self._values
+
+    def inc_counter(self, name: str, labels: Optional[Dict[str, str]] = None, amount: float = 1.0) -> None:
+        """Increment a counter"""
+        cache_key = ('c', name, tuple(labels.items()) if labels else ())
+        with self._lock:
+            values = self._file()
+            offset = self._offsets.get(cache_key)
+            if offset is None:
+                offset = self._offsets[cache_key] = values.offset(_encode_key(name, 'counter', labels, ''))
+            values.add(offset, amount)
+
+    def observe_histogram(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[Dict[str, str]] = None,
+        buckets: Optional[Tuple[float, ...]] = None
+    ) -> None:
+        """Record an observation into a cumulative-bucket histogram"""
+        bounds = buckets or self.buckets
+        cache_key = ('h', name, tuple(labels.items()) if labels else (), bounds)
+        with self._lock:
+            values = self._file()
+            offsets = self._offsets.get(cache_key)
+            if offsets is None:
+                bucket_offsets = [
+                    values.offset(_encode_key(name, 'histogram', labels, 'bucket', bound))
+                    for bound in bounds + (float('inf'),)
+                ]
+                offsets = self._offsets[cache_key] = (
+                    bucket_offsets,
+                    values.offset(_encode_key(name, 'histogram', labels, 'sum')),
+                    values.offset(_encode_key(name, 'histogram', labels, 'count')),
+                )
+
+            bucket_offsets, sum_offset, count_offset = offsets
+            values.add(bucket_offsets[bisect_left(bounds, value)], 1.0)
+            values.add(sum_offset, value)
+            values.add(count_offset, 1.0)
+
+    def collect(self) -> Dict[str, float]:
+        """Sum values for every key across all metric files in the directory"""
+        totals: Dict[str, float] = defaultdict(float)
+        for path in glob.glob(os.path.join(self.directory, 'metrics_*.db')):
+            try:
+                for key, value in read_metric_file(path):
+                    totals[key] += value
+            except (OSError, ValueError, UnicodeDecodeError):
+                # A file being created or grown may be briefly unreadable
+                continue
+        return totals
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4) of all workers' metrics"""
+        return render_exposition(self.collect())
+
+    def close(self) -> None:
+        """Close this process's metric file"""
+        with self._lock:
+            if self._values is not None:
+                self._values.close()
+                self._values = None
+            self._offsets = {}
+
+
+def _encode_key(name: str, metric_type: str, labels: Optional[Dict[str, str]], suffix: str,
+                bound: Optional[float] = None) -> str:
+    label_items = sorted((str(k), str(v)) for k, v in (labels or {}).items())
+    return json.dumps([name, metric_type, label_items, suffix, bound], separators=(',', ':'))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _format_labels(label_items: List[Tuple[str, str]]) -> str:
+    if not label_items:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape_label_value(v)}"' for k, v in label_items) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def render_exposition(totals: Dict[str, float]) -> str:
+    """
+    Render aggregated key totals as Prometheus text exposition.
+
+    Histogram buckets are stored per-bucket and made cumulative here.
+    """
+    families: Dict[str, Dict] = {}
+    for key, value in totals.items():
+        name, metric_type, label_items, suffix, bound = json.loads(key)
+        family = families.setdefault(name, {'type': metric_type, 'series': {}})
+        label_key = tuple(tuple(item) for item in label_items)
+        series = family['series'].setdefault(label_key, {'buckets': {}, 'sum': 0.0, 'count': 0.0, 'value': 0.0})
+        if suffix == 'bucket':
+            series['buckets'][bound] = series['buckets'].get(bound, 0.0) + value
+        elif suffix in ('sum', 'count'):
+            series[suffix] += value
+        else:
+            series['value'] += value
+
+    lines = []
+    for name in sorted(families):
+        family = families[name]
+        if name in METRIC_HELP:
+            lines.append(f'# HELP {name} {METRIC_HELP[name]}')
+        lines.append(f'# TYPE {name} {family["type"]}')
+
+        for label_key in sorted(family['series']):
+            series = family['series'][label_key]
+            label_items = list(label_key)
+            if family['type'] == 'histogram':
+                cumulative = 0.0
+                for bound in sorted(series['buckets']):
+                    cumulative += series['buckets'][bound]
+                    bucket_labels = label_items + [('le', _format_value(float(bound)))]
+                    lines.append(f'{name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}')
+                lines.append(f'{name}_sum{_format_labels(label_items)} {_format_value(series["sum"])}')
+                lines.append(f'{name}_count{_format_labels(label_items)} {_format_value(series["count"])}')
+            else:
+                lines.append(f'{name}{_format_labels(label_items)} {_format_value(series["value"])}')
+
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+_instance: Optional[MultiprocessMetrics] = None
+_instance_lock = threading.Lock()
+
+
+def get_multiprocess_metrics() -> Optional[MultiprocessMetrics]:
+    """
+    Shared MultiprocessMetrics for this process.
+
+    Returns:
+        Instance writing to METRICS_MULTIPROC_DIR, or None if the mode is disabled
+    """
+    global _instance
+    if _instance is None:
+        directory = os.environ.get(MULTIPROC_DIR_ENV)
+        if not directory:
+            return None
+        with _instance_lock:
+            if _instance is None:
+                _instance = MultiprocessMetrics(directory)
+    return _instance
+
+
+def clear_multiprocess_directory(directory: str) -> None:
+    """Remove stale metric files (call from the master before workers start)"""
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, 'metrics_*.db')):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,46 +1,25 @@
 """
 Rate Limiting for Monitoring API
 
-Implements token bucket algorithm for rate limiting to protect monitoring
+Implements token bucket rate limiting (as GCRA) to protect monitoring
 endpoints from abuse and ensure fair resource allocation.
 
 Features:
-- Token bucket algorithm for smooth rate limiting
+- Token bucket semantics with O(1) state per key (GCRA)
 - Per-API-key tracking
 - Configurable limits and time windows
-- Automatic cleanup of expired buckets
-- Thread-safe implementation
+- Bounded key table: idle keys expire, least recently used keys are evicted
+- Thread-safe implementation; optionally shared across worker processes
 - Returns standard HTTP 429 with Retry-After header
 """
 
+import math
 import time
-import threading
 from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
-from datetime import datetime, timedelta
 from functools import wraps
 from flask import request, jsonify, current_app
 
-
-@dataclass
-class TokenBucket:
-    """
-    Token bucket for rate limiting.
-
-    Implements the token bucket algorithm where tokens are added at a constant
-    rate and removed when requests are made. When the bucket is empty, requests
-    are rate limited.
-
-    Attributes:
-        capacity: Maximum number of tokens (burst size)
-        tokens: Current number of tokens available
-        refill_rate: Tokens added per second
-        last_refill: Last time tokens were added
-    """
-    capacity: int
-    tokens: float
-    refill_rate: float
-    last_refill: float
+from modules.security.limiter_engine import GCRALimiter, MemoryLimiterStore, get_shared_limiter_store
 
 
 class RateLimiter:
@@ -48,7 +27,9 @@ class RateLimiter:
     Rate limiter using token bucket algorithm.
 
     Tracks rate limits per API key and automatically refills tokens over time.
-    Thread-safe for concurrent request handling.
+    Each key is stored as a single theoretical arrival time (see
+    modules.security.limiter_engine.GCRALimiter), so checks are O(1) and a
+    key whose bucket has refilled completely is dropped.
 
     Example:
         >>> limiter = RateLimiter(requests_per_minute=60)
@@ -61,7 +42,9 @@ class RateLimiter:
         self,
         requests_per_minute: int = 60,
         burst_size: Optional[int] = None,
-        cleanup_interval_minutes: int = 60
+        cleanup_interval_minutes: int = 60,
+        store=None,
+        namespace: str = "monitoring"
     ):
         """
         Initialize rate limiter.
@@ -69,86 +52,26 @@ class RateLimiter:
         Args:
             requests_per_minute: Maximum requests allowed per minute per API key
             burst_size: Maximum burst size (defaults to requests_per_minute)
-            cleanup_interval_minutes: How often to clean up expired buckets
+            cleanup_interval_minutes: Kept for compatibility; idle keys now expire
+                as soon as their bucket is full again
+            store: Limiter state store (defaults to a private in-memory store);
+                pass get_shared_limiter_store() to share limits across workers
+            namespace: Key prefix within a shared store
         """
         self.requests_per_minute = requests_per_minute
         self.capacity = burst_size or requests_per_minute
         self.refill_rate = requests_per_minute / 60.0  # Tokens per second
-
-        # Dictionary to store token buckets per API key
-        self.buckets: Dict[str, TokenBucket] = {}
-
-        # Lock for thread-safe access
-        self.lock = threading.Lock()
-
-        # Track last cleanup time
-        self.last_cleanup = time.time()
         self.cleanup_interval = cleanup_interval_minutes * 60  # Convert to seconds
 
-    def _get_or_create_bucket(self, key: str) -> TokenBucket:
-        """
-        Get existing bucket or create a new one for the given key.
-
-        Args:
-            key: API key or identifier
-
-        Returns:
-            TokenBucket for this key
-        """
-        current_time = time.time()
-
-        if key not in self.buckets:
-            # Create new bucket with full capacity
-            self.buckets[key] = TokenBucket(
-                capacity=self.capacity,
-                tokens=self.capacity,
-                refill_rate=self.refill_rate,
-                last_refill=current_time
-            )
-
-        return self.buckets[key]
-
-    def _refill_bucket(self, bucket: TokenBucket) -> None:
-        """
-        Refill tokens in the bucket based on elapsed time.
-
-        Args:
-            bucket: Token bucket to refill
-        """
-        current_time = time.time()
-        time_elapsed = current_time - bucket.last_refill
-
-        # Calculate tokens to add
-        tokens_to_add = time_elapsed * bucket.refill_rate
-
-        # Update bucket
-        bucket.tokens = min(bucket.capacity, bucket.tokens + tokens_to_add)
-        bucket.last_refill = current_time
-
-    def _cleanup_old_buckets(self) -> None:
-        """
-        Remove buckets that haven't been used recently to prevent memory leaks.
-
-        Only runs periodically based on cleanup_interval.
-        """
-        current_time = time.time()
-
-        # Only cleanup periodically
-        if current_time - self.last_cleanup < self.cleanup_interval:
-            return
-
-        # Remove buckets that haven't been accessed in 2x cleanup interval
-        expiry_threshold = current_time - (self.cleanup_interval * 2)
-
-        keys_to_remove = [
-            key for key, bucket in self.buckets.items()
-            if bucket.last_refill < expiry_threshold
-        ]
-
-        for key in keys_to_remove:
-            del self.buckets[key]
-
-        self.last_cleanup = current_time
+        self.store = store if store is not None else MemoryLimiterStore()
+        self._limiter = GCRALimiter(
+            rate=requests_per_minute,
+            period=60.0,
+            burst=self.capacity,
+            store=self.store,
+            namespace=namespace,
+            clock=time.time
+        )
 
     def is_allowed(self, key: str, tokens: int = 1) -> Tuple[bool, Optional[int]]:
         """
@@ -168,25 +91,10 @@ class RateLimiter:
             >>> if not allowed:
             ...     print(f"Wait {retry_after} seconds")
         """
-        with self.lock:
-            # Periodic cleanup
-            self._cleanup_old_buckets()
-
-            # Get or create bucket for this key
-            bucket = self._get_or_create_bucket(key)
-
-            # Refill tokens
-            self._refill_bucket(bucket)
-
-            # Check if we have enough tokens
-            if bucket.tokens >= tokens:
-                bucket.tokens -= tokens
-                return True, None
-            else:
-                # Calculate retry-after time
-                tokens_needed = tokens - bucket.tokens
-                retry_after = int(tokens_needed / bucket.refill_rate) + 1
-                return False, retry_after
+        result = self._limiter.check(key, tokens)
+        if result.allowed:
+            return True, None
+        return False, max(1, math.ceil(result.retry_after))
 
     def get_stats(self, key: str) -> Optional[Dict[str, any]]:
         """
@@ -202,20 +110,17 @@ class RateLimiter:
             >>> stats = limiter.get_stats('api_key_123')
             >>> print(f"Remaining: {stats['remaining']}/{stats['capacity']}")
         """
-        with self.lock:
-            if key not in self.buckets:
-                return None
-
-            bucket = self._get_or_create_bucket(key)
-            self._refill_bucket(bucket)
-
-            return {
-                'capacity': bucket.capacity,
-                'remaining': int(bucket.tokens),
-                'refill_rate_per_second': bucket.refill_rate,
-                'requests_per_minute': self.requests_per_minute,
-                'next_refill_in': 1.0 / bucket.refill_rate if bucket.refill_rate > 0 else 0
-            }
+        if self.store.get(self._limiter._key(key), time.time()) is None:
+            return None
+
+        result = self._limiter.peek(key)
+        return {
+            'capacity': self.capacity,
+            'remaining': result.remaining,
+            'refill_rate_per_second': self.refill_rate,
+            'requests_per_minute': self.requests_per_minute,
+            'next_refill_in': 1.0 / self.refill_rate if self.refill_rate > 0 else 0
+        }
 
     def reset(self, key: Optional[str] = None) -> None:
         """
@@ -228,11 +133,7 @@ class RateLimiter:
             >>> limiter.reset('api_key_123')  # Reset specific key
             >>> limiter.reset()  # Reset all keys
         """
-        with self.lock:
-            if key is None:
-                self.buckets.clear()
-            elif key in self.buckets:
-                del self.buckets[key]
+        self._limiter.reset(key)
 
 
 # Global rate limiter instance
@@ -260,6 +161,9 @@ def init_rate_limiter(
     """
     Initialize rate limiter and attach to Flask app.
 
+    The limiter uses the shared limiter store, so all worker processes on the
+    host enforce one limit per API key.
+
     Args:
         app: Flask application instance (optional)
         requests_per_minute: Maximum requests per minute
@@ -272,7 +176,11 @@ def init_rate_limiter(
         >>> app = Flask(__name__)
         >>> limiter = init_rate_limiter(app, requests_per_minute=120)
     """
-    limiter = RateLimiter(requests_per_minute=requests_per_minute, burst_size=burst_size)
+    limiter = RateLimiter(
+        requests_per_minute=requests_per_minute,
+        burst_size=burst_size,
+        store=get_shared_limiter_store()
+    )
     if app is not None:
         app.rate_limiter = limiter
     return limiter
@@ -0,0 +1,351 @@
+"""
+Compact Time-Series Storage for Metrics
+
+Fixed-memory storage backing MetricsCollector. Replaces per-point dataclass
+objects with typed arrays so a worker's metric footprint no longer grows
+with request volume.
+
+Components:
+- LabelInterner: maps label dicts to small integer ids (one copy per label set)
+- LogHistogram: mergeable log-bucketed histogram with bounded relative error
+  (DDSketch/HDR style) for p50/p95/p99
+- SeriesRingBuffer: fixed-capacity array('d') ring of raw (timestamp, value) points
+- MinuteBucketRing: pre-aggregated per-minute count/sum/min/max/histogram slots
+- TimeSeriesStore: per-metric minute buckets plus per-series raw ring buffers
+
+Recording is O(1); summaries are O(buckets in window).
+"""
+
+import math
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class LabelInterner:
+    """
+    Interns label sets so each distinct combination is stored once.
+
+    Example:
+        >>> interner = LabelInterner()
+        >>> interner.intern({'method': 'GET'}) == interner.intern({'method': 'GET'})
+        True
+    """
+
+    def __init__(self):
+        self._ids: Dict[LabelKey, int] = {}
+        self._labels: List[Dict[str, str]] = []
+
+    def intern(self, labels: Optional[Dict[str, str]]) -> int:
+        """Return the id for labels, assigning a new one on first sight"""
+        key = tuple(sorted(labels.items())) if labels else ()
+        label_id = self._ids.get(key)
+        if label_id is None:
+            label_id = len(self._labels)
+            self._ids[key] = label_id
+            self._labels.append(dict(key))
+        return label_id
+
+    def lookup(self, labels: Optional[Dict[str, str]]) -> Optional[int]:
+        """Return the id for labels if already interned, without assigning one"""
+        return self._ids.get(tuple(sorted(labels.items())) if labels else ())
+
+    def labels(self, label_id: int) -> Dict[str, str]:
+        """Return the label dict for an interned id"""
+        return self._labels[label_id]
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+
+class LogHistogram:
+    """
+    Mergeable histogram with logarithmic buckets.
+
+    Bucket i covers (gamma^(i-1), gamma^i], where gamma = (1 + a) / (1 - a) for
+    relative accuracy a. Two histograms with the same accuracy merge by adding
+    counts, so per-minute histograms combine into window percentiles exactly
+    as if all values had been recorded into one.
+
+    Attributes:
+        relative_accuracy: Maximum relative error of reported quantiles
+        counts: Bucket index -> count for positive values
+        zero_count: Count of values <= min_value
+    """
+
+    __slots__ = ('relative_accuracy', 'min_value', '_gamma', '_log_gamma', 'counts', 'zero_count')
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9):
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.counts: Dict[int, int] = {}
+        self.zero_count = 0
+
+    def record(self, value: float) -> None:
+        """Add a value to the histogram"""
+        if value <= self.min_value:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.counts[index] = self.counts.get(index, 0) + 1
+
+    def merge(self, other: 'LogHistogram') -> None:
+        """Add other's counts into this histogram (accuracies must match)"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge histograms with different accuracy")
+        self.zero_count += other.zero_count
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + sum(self.counts.values())
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 <= q <= 1).
+
+        Returns:
+            Value within relative_accuracy of the true quantile (0.0 if empty)
+        """
+        total = self.count
+        if total == 0:
+            return 0.0
+
+        rank = q * (total - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if rank < seen:
+                # Midpoint of the bucket in relative terms
+                return 2 * self._gamma ** index / (self._gamma + 1)
+        return 2 * self._gamma ** max(self.counts) / (self._gamma + 1)
+
+
+class SeriesRingBuffer:
+    """
+    Fixed-capacity ring of raw (timestamp, value) points.
+
+    Backed by two array('d') so each point costs 16 bytes regardless of
+    how many are recorded; the oldest points are overwritten.
+    """
+
+    __slots__ = ('capacity', 'timestamps', 'values', '_next', '_size')
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.values = array('d', bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Record a point, overwriting the oldest when full"""
+        self.timestamps[self._next] = timestamp
+        self.values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """Most recent (timestamp, value) or None if empty"""
+        if self._size == 0:
+            return None
+        index = (self._next - 1) % self.capacity
+        return self.timestamps[index], self.values[index]
+
+    def points(self, since: float = 0.0) -> Iterable[Tuple[float, float]]:
+        """Yield points in recording order with timestamp >= since"""
+        start = (self._next - self._size) % self.capacity
+        for offset in range(self._size):
+            index = (start + offset) % self.capacity
+            timestamp = self.timestamps[index]
+            if timestamp >= since:
+                yield timestamp, self.values[index]
+
+
+class MinuteBucketRing:
+    """
+    Ring of pre-aggregated per-minute buckets covering the retention window.
+
+    Each slot holds the minute it represents; a slot whose minute has rolled
+    past the window is reset on its next write, so expiry needs no sweeps.
+    """
+
+    __slots__ = ('capacity', 'relative_accuracy', 'minutes', 'counts', 'sums', 'mins', 'maxes', 'histograms')
+
+    def __init__(self, capacity: int, relative_accuracy: float = 0.01):
+        self.capacity = capacity
+        self.relative_accuracy = relative_accuracy
+        self.minutes = array('q', [-1]) * capacity
+        self.counts = array('q', bytes(8 * capacity))
+        self.sums = array('d', bytes(8 * capacity))
+        self.mins = array('d', bytes(8 * capacity))
+        self.maxes = array('d', bytes(8 * capacity))
+        self.histograms: List[Optional[LogHistogram]] = [None] * capacity
+
+    def record(self, timestamp: float, value: float) -> None:
+        """Add value to the bucket for timestamp's minute"""
+        minute = int(timestamp // 60)
+        slot = minute % self.capacity
+
+        if self.minutes[slot] != minute:
+            self.minutes[slot] = minute
+            self.counts[slot] = 0
+            self.sums[slot] = 0.0
+            self.mins[slot] = value
+            self.maxes[slot] = value
+            self.histograms[slot] = LogHistogram(self.relative_accuracy)
+
+        self.counts[slot] += 1
+        self.sums[slot] += value
+        if value < self.mins[slot]:
+            self.mins[slot] = value
+        if value > self.maxes[slot]:
+            self.maxes[slot] = value
+        self.histograms[slot].record(value)
+
+    def summarize(self, since: float, now: float) -> Dict[str, float]:
+        """Aggregate all buckets whose minute falls in [since, now]"""
+        first_minute = int(since // 60)
+        last_minute = int(now // 60)
+
+        count = 0
+        total = 0.0
+        low = math.inf
+        high = -math.inf
+        merged = LogHistogram(self.relative_accuracy)
+
+        first_minute = max(first_minute, last_minute - self.capacity + 1)
+        for minute in range(first_minute, last_minute + 1):
+            slot = minute % self.capacity
+            if self.minutes[slot] != minute or self.counts[slot] == 0:
+                continue
+            count += self.counts[slot]
+            total += self.sums[slot]
+            low = min(low, self.mins[slot])
+            high = max(high, self.maxes[slot])
+            merged.merge(self.histograms[slot])
+
+        if count == 0:
+            return {'count': 0, 'avg': 0, 'min': 0, 'max': 0, 'sum': 0}
+
+        return {
+            'count': count,
+            'avg': total / count,
+            'min': low,
+            'max': high,
+            'sum': total,
+            'p50': merged.quantile(0.50),
+            'p95': merged.quantile(0.95),
+            'p99': merged.quantile(0.99),
+        }
+
+
+class TimeSeriesStore:
+    """
+    Bounded store of named metrics.
+
+    Each metric name gets a MinuteBucketRing (all label sets combined) used
+    for summaries, and each (name, label set) pair gets a SeriesRingBuffer of
+    recent raw points. Not thread-safe; callers hold their own lock.
+
+    Example:
+        >>> store = TimeSeriesStore(retention_minutes=60)
+        >>> store.record('request_duration_ms', 12.5, {'path': '/health'})
+        >>> store.summary('request_duration_ms', minutes=5)['count']
+        1
+    """
+
+    def __init__(
+        self,
+        retention_minutes: int = 24 * 60,
+        series_capacity: int = 1024,
+        max_series: int = 2000,
+        relative_accuracy: float = 0.01,
+        clock=time.time,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            retention_minutes: Number of per-minute buckets kept per metric
+            series_capacity: Raw points kept per (metric, label set) series
+            max_series: Cap on raw series; beyond it only minute buckets are updated
+            relative_accuracy: Histogram quantile accuracy
+            clock: Wall-clock time source in seconds
+        """
+        self.retention_minutes = retention_minutes
+        self.series_capacity = series_capacity
+        self.max_series = max_series
+        self.relative_accuracy = relative_accuracy
+        self._clock = clock
+        self.labels = LabelInterner()
+        self._buckets: Dict[str, MinuteBucketRing] = {}
+        self._series: Dict[Tuple[str, int], SeriesRingBuffer] = {}
+        self._latest: Dict[str, float] = {}
+        self.dropped_series_points = 0
+
+    def record(self, name: str, value: float, labels: Optional[Dict[str, str]] = None,
+               timestamp: Optional[float] = None) -> None:
+        """Record a value for metric name (O(1))"""
+        if timestamp is None:
+            timestamp = self._clock()
+
+        buckets = self._buckets.get(name)
+        if buckets is None:
+            buckets = self._buckets[name] = MinuteBucketRing(self.retention_minutes, self.relative_accuracy)
+        buckets.record(timestamp, value)
+
+        label_id = self.labels.lookup(labels)
+        series = self._series.get((name, label_id)) if label_id is not None else None
+        if series is None:
+            # Check the cap before interning so unseen label sets cannot grow memory either
+            if len(self._series) >= self.max_series:
+                self.dropped_series_points += 1
+                self._latest[name] = value
+                return
+            label_id = self.labels.intern(labels)
+            series = self._series[(name, label_id)] = SeriesRingBuffer(self.series_capacity)
+        series.append(timestamp, value)
+
+        self._latest[name] = value
+
+    def names(self) -> List[str]:
+        """Names of all recorded metrics"""
+        return list(self._buckets)
+
+    def summary(self, name: str, minutes: int = 60) -> Dict[str, float]:
+        """
+        Summary statistics for a metric over the last minutes.
+
+        Returns:
+            Dict with count, avg, min, max, sum, latest and p50/p95/p99
+        """
+        buckets = self._buckets.get(name)
+        if buckets is None:
+            return {'count': 0, 'avg': 0, 'min': 0, 'max': 0, 'sum': 0}
+
+        now = self._clock()
+        result = buckets.summarize(now - minutes * 60, now)
+        if result['count']:
+            result['latest'] = self._latest.get(name, 0)
+        return result
+
+    def series(self, name: str) -> List[Tuple[Dict[str, str], SeriesRingBuffer]]:
+        """All (labels, ring buffer) pairs recorded for metric name"""
+        return [
+            (self.labels.labels(label_id), buffer)
+            for (series_name, label_id), buffer in self._series.items()
+            if series_name == name
+        ]
@@ -3,24 +3,33 @@
 Module: circuit_breaker_manager.py
 Purpose: Circuit breaker pattern to prevent cascading failures
 Created: 2024-08-28
-Modified: 2025-10-21
+Modified: 2026-10-18
 Dependencies: threading, datetime, typing, enum, dataclasses, functools
-Related: failure_recovery.py, retry_strategy_manager.py, timeout_manager.py
+Related: failure_recovery.py, retry_strategy_manager.py, timeout_manager.py,
+         shared_circuit_state.py
 Description: Implements circuit breaker pattern with three states (CLOSED, OPEN,
              HALF_OPEN). Automatic state transitions based on failure thresholds,
              per-service configuration, manual control, state monitoring, metrics,
              and graceful degradation support. Protects services from cascading
-             failures by opening circuit when service fails repeatedly.
+             failures by opening circuit when service fails repeatedly. With
+             CIRCUIT_BREAKER_STATE_DIR set, breaker state is shared by every
+             process on the host.
 """
 
 import logging
 import threading
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any
 from enum import Enum
 from dataclasses import dataclass, field
 import functools
 
+from .shared_circuit_state import (
+    STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN,
+    SharedCircuitState, SharedCircuitStateStore, SharedStateSnapshot, get_shared_state_store
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +95,9 @@ class CircuitBreakerConfig:
     # Manual override
     manual_override: Optional[CircuitState] = None  # Force specific state
 
+    # Shared state (when the manager has a shared store)
+    shared_refresh_interval: float = 0.25  # Seconds between reads of other processes' state
+
 
 @dataclass
 class CircuitBreakerMetrics:
@@ -103,20 +115,45 @@ class CircuitBreakerMetrics:
     circuit_closes: int = 0  # Number of times circuit closed
 
 
+class _SuccessTally:
+    """
+    Per-thread count of successes recorded on the lock-free CLOSED path
+
+    Each thread only writes its own tally, so increments need no lock;
+    readers sum all tallies under the breaker lock.
+    """
+    __slots__ = ("count", "run", "epoch", "last_success")
+
+    def __init__(self):
+        self.count = 0
+        self.run = 0  # Successes since the breaker's success epoch changed
+        self.epoch = 0
+        self.last_success = 0.0
+
+
 class CircuitBreaker:
     """
     Individual circuit breaker instance for a service
 
     Tracks service health and manages state transitions automatically.
+
+    In the CLOSED state call() takes no lock: successes go to per-thread
+    tallies and only failures take the slow, locked path. With a shared
+    state record (see shared_circuit_state.py) state changes are published
+    to every process on the host and re-read every shared_refresh_interval
+    seconds.
     """
 
-    def __init__(self, service_name: str, config: Optional[CircuitBreakerConfig] = None):
+    def __init__(self, service_name: str, config: Optional[CircuitBreakerConfig] = None,
+                 shared_state: Optional[SharedCircuitState] = None):
         """
         Initialize circuit breaker for a service
 
         Args:
             service_name: Unique identifier for the service
             config: Circuit breaker configuration (uses defaults if not provided)
+            shared_state: Shared state record for this service (state is per
+                process when not provided)
         """
         self.service_name = service_name
         self.config = config or CircuitBreakerConfig()
@@ -124,6 +161,16 @@ class CircuitBreaker:
         self.metrics = CircuitBreakerMetrics()
         self._lock = threading.RLock()  # Thread-safe state management
 
+        self._local = threading.local()
+        self._tallies: List[_SuccessTally] = []
+        self._success_epoch = 0
+
+        self._shared = shared_state
+        self._next_sync = 0.0
+        self._applied_change = 0.0
+        self._published_calls = 0
+        self._published_failures = 0
+
         logger.info(f"Circuit breaker initialized for '{service_name}' in CLOSED state")
 
     def call(self, func: Callable, *args, **kwargs) -> Any:
@@ -141,6 +188,22 @@ class CircuitBreaker:
             CircuitBreakerError: If circuit is open
             Exception: Original exception from function if circuit allows call
         """
+        if self._shared is not None and time.monotonic() >= self._next_sync:
+            self._sync_shared()
+
+        # Fast path: CLOSED without override takes no lock on success
+        if self.state is CircuitState.CLOSED and not self.config.manual_override:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._on_failure(e)
+                raise
+            if self.metrics.consecutive_failures:
+                self._on_success()
+            else:
+                self._record_fast_success()
+            return result
+
         with self._lock:
             # Check if manual override is set
             if self.config.manual_override:
@@ -152,8 +215,8 @@ class CircuitBreaker:
         # State-specific behavior
         if current_state == CircuitState.OPEN:
             # Check if enough time has passed to try half-open
-            if self._should_attempt_reset():
-                self._transition_to_half_open()
+            if self._should_attempt_reset() and self._claim_half_open():
+                self._transition_to_half_open(publish=False)
             else:
                 # Circuit still open, reject call
                 raise CircuitBreakerError(
@@ -179,6 +242,33 @@ class CircuitBreaker:
             self._on_failure(e)
             raise
 
+    def _record_fast_success(self):
+        """Count a CLOSED-state success in this thread's tally"""
+        tally = getattr(self._local, "tally", None)
+        if tally is None:
+            tally = _SuccessTally()
+            with self._lock:
+                self._tallies.append(tally)
+            self._local.tally = tally
+
+        if tally.epoch != self._success_epoch:
+            tally.epoch = self._success_epoch
+            tally.run = 0
+        tally.count += 1
+        tally.run += 1
+        tally.last_success = time.time()
+
+    def _fast_successes(self) -> int:
+        return sum(tally.count for tally in self._tallies)
+
+    def _total_calls(self) -> int:
+        return self.metrics.total_calls + self._fast_successes()
+
+    def _reset_success_run(self):
+        """Restart consecutive success counting (tallies catch up lazily)"""
+        self._success_epoch += 1
+        self.metrics.consecutive_successes = 0
+
     def _on_success(self):
         """Handle successful function execution"""
         with self._lock:
@@ -201,7 +291,7 @@ class CircuitBreaker:
             self.metrics.total_calls += 1
             self.metrics.failed_calls += 1
             self.metrics.consecutive_failures += 1
-            self.metrics.consecutive_successes = 0
+            self._reset_success_run()
             self.metrics.last_failure_time = datetime.now()
 
             logger.warning(
@@ -209,6 +299,8 @@ class CircuitBreaker:
                 f"(consecutive: {self.metrics.consecutive_failures})"
             )
 
+            shared_window = self._publish_calls() if self._shared is not None else None
+
             if self.state == CircuitState.HALF_OPEN:
                 # Any failure in half-open state reopens the circuit
                 logger.warning(f"Failure in half-open state for '{self.service_name}', reopening")
@@ -216,7 +308,7 @@ class CircuitBreaker:
 
             elif self.state == CircuitState.CLOSED:
                 # Check if we should open the circuit
-                if self._should_open():
+                if self._should_open() or self._shared_window_exceeded(shared_window):
                     self._transition_to_open()
 
     def _should_open(self) -> bool:
@@ -226,13 +318,20 @@ class CircuitBreaker:
             return True
 
         # Check failure rate threshold (only after minimum calls)
-        if self.metrics.total_calls >= self.config.minimum_calls_for_rate:
-            failure_rate = self.metrics.failed_calls / self.metrics.total_calls
+        total_calls = self._total_calls()
+        if total_calls >= self.config.minimum_calls_for_rate:
+            failure_rate = self.metrics.failed_calls / total_calls
             if failure_rate >= self.config.failure_rate_threshold:
                 return True
 
         return False
 
+    def _shared_window_exceeded(self, window: Optional[SharedStateSnapshot]) -> bool:
+        """Check the failure rate across all processes in the current window"""
+        if window is None or window.window_calls < self.config.minimum_calls_for_rate:
+            return False
+        return window.window_failures / window.window_calls >= self.config.failure_rate_threshold
+
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to try half-open state"""
         if not self.metrics.last_failure_time:
@@ -241,12 +340,97 @@ class CircuitBreaker:
         time_since_open = (datetime.now() - self.metrics.state_change_time).total_seconds()
         return time_since_open >= self.config.timeout_duration
 
+    # ------------------------------------------------------------------
+    # Shared state
+    # ------------------------------------------------------------------
+
+    def _publish_calls(self) -> SharedStateSnapshot:
+        """Add calls and failures since the last publish to the shared window"""
+        total_calls = self._total_calls()
+        calls = total_calls - self._published_calls
+        failures = self.metrics.failed_calls - self._published_failures
+        self._published_calls = total_calls
+        self._published_failures = self.metrics.failed_calls
+        return self._shared.record_calls(max(0, calls), max(0, failures), self.config.window_duration)
+
+    def _publish_state(self, state: int, open_until: float = 0.0, reset_window: bool = False):
+        if self._shared is None:
+            return
+        try:
+            snapshot = self._shared.publish(state, open_until, reset_window)
+            self._applied_change = snapshot.changed_at
+        except OSError as e:
+            logger.error(f"Failed to publish circuit state for '{self.service_name}': {e}")
+
+    def _sync_shared(self):
+        """Adopt state changes published by other processes"""
+        with self._lock:
+            self._next_sync = time.monotonic() + self.config.shared_refresh_interval
+            try:
+                if self._total_calls() > self._published_calls:
+                    snapshot = self._publish_calls()
+                else:
+                    snapshot = self._shared.read()
+            except OSError as e:
+                logger.error(f"Failed to read shared circuit state for '{self.service_name}': {e}")
+                return
+
+            if snapshot.changed_at <= self._applied_change:
+                return
+            self._applied_change = snapshot.changed_at
+
+            if ((snapshot.state == STATE_OPEN and self.state != CircuitState.OPEN)
+                    or (snapshot.state == STATE_HALF_OPEN and self.state == CircuitState.CLOSED)):
+                # Another process tripped the breaker (or is probing recovery)
+                self.state = CircuitState.OPEN
+                self.metrics.state_change_time = datetime.fromtimestamp(snapshot.changed_at)
+                if snapshot.last_failure_at:
+                    self.metrics.last_failure_time = datetime.fromtimestamp(snapshot.last_failure_at)
+                logger.warning(f"Circuit breaker OPEN for '{self.service_name}' (opened by another process)")
+
+            elif snapshot.state == STATE_CLOSED and self.state != CircuitState.CLOSED:
+                self.state = CircuitState.CLOSED
+                self.metrics.state_change_time = datetime.fromtimestamp(snapshot.changed_at)
+                self.metrics.consecutive_failures = 0
+                self.metrics.half_open_calls = 0
+                logger.info(f"Circuit breaker CLOSED for '{self.service_name}' (recovered in another process)")
+
+    def _claim_half_open(self) -> bool:
+        """
+        Claim the recovery probe so only one process tests the service
+
+        Returns:
+            True if this process may go HALF_OPEN
+        """
+        if self._shared is None:
+            return True
+
+        now = time.time()
+        claimed = []
+
+        def claim(current: SharedStateSnapshot) -> Optional[SharedStateSnapshot]:
+            if current.state == STATE_CLOSED or now >= current.open_until:
+                claimed.append(True)
+                return current._replace(state=STATE_HALF_OPEN, changed_at=now,
+                                        open_until=now + self.config.half_open_timeout)
+            return None
+
+        try:
+            snapshot = self._shared.update(claim)
+        except OSError as e:
+            logger.error(f"Failed to claim recovery probe for '{self.service_name}': {e}")
+            return True
+        if claimed:
+            self._applied_change = snapshot.changed_at
+        return bool(claimed)
+
     def _transition_to_open(self):
         """Transition circuit to OPEN state"""
         with self._lock:
             self.state = CircuitState.OPEN
             self.metrics.state_change_time = datetime.now()
             self.metrics.circuit_opens += 1
+            self._publish_state(STATE_OPEN, time.time() + self.config.timeout_duration)
 
             logger.warning(
                 f"Circuit breaker OPENED for '{self.service_name}' "
@@ -254,13 +438,15 @@ class CircuitBreaker:
                 f"failure_rate: {self._get_failure_rate():.2%})"
             )
 
-    def _transition_to_half_open(self):
+    def _transition_to_half_open(self, publish: bool = True):
         """Transition circuit to HALF_OPEN state"""
         with self._lock:
             self.state = CircuitState.HALF_OPEN
             self.metrics.state_change_time = datetime.now()
             self.metrics.half_open_calls = 0
-            self.metrics.consecutive_successes = 0
+            self._reset_success_run()
+            if publish:
+                self._publish_state(STATE_HALF_OPEN, time.time() + self.config.half_open_timeout)
 
             logger.info(f"Circuit breaker HALF_OPEN for '{self.service_name}', testing recovery")
 
@@ -272,6 +458,7 @@ class CircuitBreaker:
             self.metrics.consecutive_failures = 0
             self.metrics.half_open_calls = 0
             self.metrics.circuit_closes += 1
+            self._publish_state(STATE_CLOSED, reset_window=True)
 
             logger.info(
                 f"Circuit breaker CLOSED for '{self.service_name}', service recovered "
@@ -280,9 +467,10 @@ class CircuitBreaker:
 
     def _get_failure_rate(self) -> float:
         """Calculate current failure rate"""
-        if self.metrics.total_calls == 0:
+        total_calls = self._total_calls()
+        if total_calls == 0:
             return 0.0
-        return self.metrics.failed_calls / self.metrics.total_calls
+        return self.metrics.failed_calls / total_calls
 
     def get_state(self) -> CircuitState:
         """Get current circuit state"""
@@ -292,22 +480,34 @@ class CircuitBreaker:
     def get_metrics(self) -> Dict[str, Any]:
         """Get circuit breaker metrics"""
         with self._lock:
+            fast_successes = self._fast_successes()
+            consecutive_successes = self.metrics.consecutive_successes + sum(
+                tally.run for tally in self._tallies if tally.epoch == self._success_epoch
+            )
+            last_success_time = self.metrics.last_success_time
+            fast_last_success = max((tally.last_success for tally in self._tallies), default=0.0)
+            if fast_last_success and (
+                last_success_time is None or fast_last_success > last_success_time.timestamp()
+            ):
+                last_success_time = datetime.fromtimestamp(fast_last_success)
+
             return {
                 "service_name": self.service_name,
                 "state": self.state.value,
-                "total_calls": self.metrics.total_calls,
-                "successful_calls": self.metrics.successful_calls,
+                "total_calls": self.metrics.total_calls + fast_successes,
+                "successful_calls": self.metrics.successful_calls + fast_successes,
                 "failed_calls": self.metrics.failed_calls,
                 "consecutive_failures": self.metrics.consecutive_failures,
-                "consecutive_successes": self.metrics.consecutive_successes,
+                "consecutive_successes": consecutive_successes,
                 "failure_rate": self._get_failure_rate(),
                 "last_failure": self.metrics.last_failure_time.isoformat()
                 if self.metrics.last_failure_time else None,
-                "last_success": self.metrics.last_success_time.isoformat()
-                if self.metrics.last_success_time else None,
+                "last_success": last_success_time.isoformat()
+                if last_success_time else None,
                 "circuit_opens": self.metrics.circuit_opens,
                 "circuit_closes": self.metrics.circuit_closes,
                 "state_change_time": self.metrics.state_change_time.isoformat(),
+                "shared_state": self._shared is not None,
             }
 
     def reset(self):
@@ -315,6 +515,12 @@ class CircuitBreaker:
         with self._lock:
             self.state = CircuitState.CLOSED
             self.metrics = CircuitBreakerMetrics()
+            self._local = threading.local()
+            self._tallies = []
+            self._success_epoch += 1
+            self._published_calls = 0
+            self._published_failures = 0
+            self._publish_state(STATE_CLOSED, reset_window=True)
             logger.info(f"Circuit breaker manually reset for '{self.service_name}'")
 
     def force_open(self):
@@ -337,12 +543,22 @@ class CircuitBreakerManager:
     Provides centralized circuit breaker creation, monitoring, and control.
     """
 
-    def __init__(self):
-        """Initialize circuit breaker manager"""
+    def __init__(self, shared_store: Optional[SharedCircuitStateStore] = None):
+        """
+        Initialize circuit breaker manager
+
+        Args:
+            shared_store: Store for state shared across processes (defaults to
+                CIRCUIT_BREAKER_STATE_DIR; per-process state when unset)
+        """
         self._breakers: Dict[str, CircuitBreaker] = {}
         self._configs: Dict[str, CircuitBreakerConfig] = {}
         self._lock = threading.RLock()
-        logger.info("Circuit Breaker Manager initialized")
+        self._shared_store = shared_store or get_shared_state_store()
+        logger.info(
+            "Circuit Breaker Manager initialized"
+            + (f" (shared state in {self._shared_store.directory})" if self._shared_store else "")
+        )
 
     def get_or_create_breaker(self, service_name: str,
                               config: Optional[CircuitBreakerConfig] = None) -> CircuitBreaker:
@@ -359,7 +575,13 @@ class CircuitBreakerManager:
         with self._lock:
             if service_name not in self._breakers:
                 breaker_config = config or self._configs.get(service_name) or CircuitBreakerConfig()
-                self._breakers[service_name] = CircuitBreaker(service_name, breaker_config)
+                shared_state = None
+                if self._shared_store is not None:
+                    try:
+                        shared_state = self._shared_store.state_for(service_name)
+                    except OSError as e:
+                        logger.error(f"Shared circuit state unavailable for '{service_name}': {e}")
+                self._breakers[service_name] = CircuitBreaker(service_name, breaker_config, shared_state)
                 logger.info(f"Created new circuit breaker for '{service_name}'")
 
             return self._breakers[service_name]
@@ -472,8 +694,6 @@ def configure_circuit_breaker(service_name: str, **kwargs):
 
 # Example usage
 if __name__ == "__main__":
-    import time
-
     print("Circuit Breaker Manager Test")
     print("=" * 60)
 
@@ -12,18 +12,95 @@ Features:
 - Workflow state integrity checks
 - Automatic data correction where possible
 - Comprehensive consistency reporting
+
+Each check is a single set-based query returning only the keys of violating
+rows. Checks run concurrently on connections from a pool shared by every
+validator in the process and, after the first
+run, only look at rows written since the previous run's watermark (the
+oldest transaction still running when it started, compared against each
+row's xmin), so no application table needs an updated_at column. A full
+scan still runs every FULL_SCAN_INTERVAL to catch violations caused by
+deletes and other rows that were not touched.
+
+Configuration:
+    CONSISTENCY_VALIDATION_WORKERS: Concurrent checks / shared pool connections (default: 4)
 """
 
 import logging
 import json
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from contextlib import contextmanager
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 import os
 
+# Incremental runs fall back to a full scan when the last one is older than this
+FULL_SCAN_INTERVAL = timedelta(hours=24)
+
+# Maximum keys per correction statement
+CORRECTION_BATCH_SIZE = 5000
+
+# Connections per database shared by all validators in the process
+POOL_MAX_CONNECTIONS = int(os.environ.get("CONSISTENCY_VALIDATION_WORKERS", "4"))
+
+
+class _SharedConnectionPool:
+    """
+    Process-wide connection pool for one database
+
+    Opens a single connection up front and more only as checks need them.
+    getconn() waits for a free connection instead of raising PoolError, so
+    validators running at the same time share POOL_MAX_CONNECTIONS.
+    """
+
+    def __init__(self, db_url: str, max_connections: int):
+        self._pool = ThreadedConnectionPool(1, max_connections, db_url)
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def getconn(self):
+        self._slots.acquire()
+        try:
+            return self._pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn):
+        try:
+            self._pool.putconn(conn)
+        finally:
+            self._slots.release()
+
+    def closeall(self):
+        self._pool.closeall()
+
+
+_pools: Dict[str, _SharedConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_shared_pool(db_url: str) -> _SharedConnectionPool:
+    """Shared pool for db_url, created on first use"""
+    with _pools_lock:
+        pool = _pools.get(db_url)
+        if pool is None:
+            pool = _pools[db_url] = _SharedConnectionPool(db_url, POOL_MAX_CONNECTIONS)
+        return pool
+
+
+def close_connection_pools():
+    """Close every shared validator connection (process shutdown)"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
+
 
 class ConsistencyIssue:
     """Represents a data consistency issue"""
@@ -57,6 +134,222 @@ class ConsistencyIssue:
         }
 
 
+@dataclass(frozen=True)
+class ConsistencyCheck:
+    """
+    One set-based consistency check
+
+    query selects a single ``key`` column and may use two placeholders:
+    ``{changed[alias]}`` (rows of alias written since the last run) and
+    ``{crossed[alias]}`` (rows of alias whose created_at passed
+    age_threshold since the last run). Both become TRUE on a full scan.
+    correction_sql takes ``{keys}`` and is applied in bulk.
+    """
+
+    issue_type: str
+    severity: str
+    description: str  # Formatted with {count}
+    query: str
+    correctable: bool = False
+    correction_action: Optional[str] = None
+    correction_sql: Optional[str] = None
+    age_threshold: Optional[str] = None  # PostgreSQL interval used by {crossed[...]}
+    report_failure: bool = True  # Failing check adds a critical validation_error issue
+
+
+CONSISTENCY_CHECKS: List[ConsistencyCheck] = [
+    # Job application consistency
+    ConsistencyCheck(
+        issue_type="orphaned_job_applications",
+        severity="critical",
+        description="Found {count} job applications referencing non-existent jobs",
+        query="""
+            SELECT ja.id AS key
+            FROM job_applications ja
+            WHERE NOT EXISTS (SELECT 1 FROM jobs j WHERE j.id = ja.job_id)
+            AND {changed[ja]}
+        """,
+        correctable=True,
+        correction_action="Delete orphaned job application records",
+        correction_sql="DELETE FROM job_applications WHERE id IN ({keys})",
+    ),
+    ConsistencyCheck(
+        issue_type="missing_job_applications",
+        severity="warning",
+        description="Found {count} eligible jobs without application records",
+        query="""
+            SELECT j.id AS key
+            FROM jobs j
+            WHERE j.eligibility_flag = TRUE
+            AND j.analysis_completed = TRUE
+            AND j.created_at < NOW() - INTERVAL '1 hour'
+            AND NOT EXISTS (SELECT 1 FROM job_applications ja WHERE ja.job_id = j.id)
+            AND ({changed[j]} OR {crossed[j]})
+        """,
+        correctable=True,
+        correction_action="Create missing job application records",
+        correction_sql="""
+            INSERT INTO job_applications (id, job_id, application_status, created_at)
+            SELECT gen_random_uuid(), j.id, 'pending', NOW() FROM jobs j WHERE j.id IN ({keys})
+            ON CONFLICT DO NOTHING
+        """,
+        age_threshold="1 hour",
+    ),
+    ConsistencyCheck(
+        issue_type="duplicate_job_applications",
+        severity="warning",
+        description="Found {count} jobs with multiple application records",
+        query="""
+            SELECT job_id AS key
+            FROM job_applications
+            WHERE job_id IN (SELECT ja.job_id FROM job_applications ja WHERE {changed[ja]})
+            GROUP BY job_id
+            HAVING COUNT(*) > 1
+        """,
+        correctable=True,
+        correction_action="Merge or remove duplicate application records",
+    ),
+    # Company relationships
+    ConsistencyCheck(
+        issue_type="invalid_company_references",
+        severity="critical",
+        description="Found {count} jobs with invalid company references",
+        query="""
+            SELECT j.id AS key
+            FROM jobs j
+            WHERE j.company_id IS NOT NULL
+            AND NOT EXISTS (SELECT 1 FROM companies c WHERE c.id = j.company_id)
+            AND {changed[j]}
+        """,
+        correctable=True,
+        correction_action="Create missing company records or clear invalid references",
+    ),
+    ConsistencyCheck(
+        issue_type="unused_companies",
+        severity="info",
+        description="Found {count} companies with no associated jobs",
+        query="""
+            SELECT c.id AS key
+            FROM companies c
+            WHERE c.created_at < NOW() - INTERVAL '7 days'
+            AND NOT EXISTS (SELECT 1 FROM jobs j WHERE j.company_id = c.id)
+            AND ({changed[c]} OR {crossed[c]})
+        """,
+        correctable=True,
+        correction_action="Archive or remove unused company records",
+        age_threshold="7 days",
+    ),
+    # Workflow state integrity
+    ConsistencyCheck(
+        issue_type="inconsistent_analysis_state",
+        severity="warning",
+        description="Found {count} jobs with eligibility set but analysis not completed",
+        query="""
+            SELECT j.id AS key
+            FROM jobs j
+            WHERE j.analysis_completed = FALSE
+            AND j.eligibility_flag IS NOT NULL
+            AND {changed[j]}
+        """,
+        correctable=True,
+        correction_action="Reset eligibility flag for incomplete analysis",
+        correction_sql="UPDATE jobs SET eligibility_flag = NULL WHERE id IN ({keys})",
+    ),
+    ConsistencyCheck(
+        issue_type="stalled_workflows",
+        severity="warning",
+        description="Found {count} jobs with stalled analysis (>24h)",
+        query="""
+            SELECT j.id AS key
+            FROM jobs j
+            WHERE j.analysis_completed = FALSE
+            AND j.created_at < NOW() - INTERVAL '24 hours'
+            AND ({changed[j]} OR {crossed[j]})
+        """,
+        correctable=True,
+        correction_action="Re-queue jobs for analysis or mark as failed",
+        age_threshold="24 hours",
+    ),
+    # Document tracking
+    ConsistencyCheck(
+        issue_type="missing_document_tracking",
+        severity="warning",
+        description="Found {count} sent applications without document tracking",
+        query="""
+            SELECT ja.id AS key
+            FROM job_applications ja
+            WHERE ja.application_status = 'sent'
+            AND NOT EXISTS (
+                SELECT 1 FROM document_job dj WHERE dj.webhook_data->>'application_id' = ja.id::text
+            )
+            AND {changed[ja]}
+        """,
+        correction_action="Document tracking cannot be retroactively created",
+        report_failure=False,
+    ),
+    # Email tracking
+    ConsistencyCheck(
+        issue_type="missing_email_tracking",
+        severity="warning",
+        description="Found {count} applications marked as sent without email timestamp",
+        query="""
+            SELECT ja.id AS key
+            FROM job_applications ja
+            WHERE ja.application_status = 'sent'
+            AND ja.email_sent_at IS NULL
+            AND {changed[ja]}
+        """,
+        correctable=True,
+        correction_action="Update email_sent_at timestamp or correct application status",
+        report_failure=False,
+    ),
+    # AI analysis completeness
+    ConsistencyCheck(
+        issue_type="missing_analysis_data",
+        severity="critical",
+        description="Found {count} jobs marked as analyzed but missing analysis data",
+        query="""
+            SELECT j.id AS key
+            FROM jobs j
+            WHERE j.analysis_completed = TRUE
+            AND NOT EXISTS (SELECT 1 FROM analyzed_jobs aj WHERE aj.job_id = j.id)
+            AND {changed[j]}
+        """,
+        correctable=True,
+        correction_action="Reset analysis_completed flag to trigger re-analysis",
+        correction_sql="UPDATE jobs SET analysis_completed = FALSE WHERE id IN ({keys})",
+        report_failure=False,
+    ),
+    # Preference matching is handled by fallback defaults, so there is no check for it
+    # Temporal consistency
+    ConsistencyCheck(
+        issue_type="temporal_inconsistency",
+        severity="warning",
+        description="Found {count} applications created before their associated jobs",
+        query="""
+            SELECT ja.id AS key
+            FROM job_applications ja
+            JOIN jobs j ON ja.job_id = j.id
+            WHERE ja.created_at < j.created_at
+            AND ({changed[ja]} OR {changed[j]})
+        """,
+        correctable=True,
+        correction_action="Correct timestamps to maintain proper temporal ordering",
+        report_failure=False,
+    ),
+]
+
+
+class _RowFilter:
+    """Per-alias SQL predicate for ConsistencyCheck.query placeholders"""
+
+    def __init__(self, template: Optional[str]):
+        self.template = template
+
+    def __getitem__(self, alias: str) -> str:
+        return "TRUE" if self.template is None else self.template.format(alias=alias)
+
+
 class DataConsistencyValidator:
     """
     Comprehensive data consistency validation and correction system
@@ -65,10 +358,17 @@ class DataConsistencyValidator:
     automatic correction capabilities where possible.
     """
 
-    def __init__(self):
-        """Initialize the data consistency validator"""
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the data consistency validator
+
+        Args:
+            max_workers: Checks run concurrently (default: CONSISTENCY_VALIDATION_WORKERS or 4)
+        """
         self.db_url = os.environ.get("DATABASE_URL")
         self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers or POOL_MAX_CONNECTIONS
+        self.checks = list(CONSISTENCY_CHECKS)
 
         # Initialize validation tracking
         self._initialize_validation_tables()
@@ -112,14 +412,29 @@ class DataConsistencyValidator:
                 """
                 )
 
+                # Create validation_runs table (watermarks for incremental runs)
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS validation_runs (
+                        validation_run_id UUID PRIMARY KEY,
+                        watermark_txid BIGINT NOT NULL,
+                        full_scan BOOLEAN NOT NULL,
+                        total_issues INTEGER,
+                        started_at TIMESTAMP DEFAULT NOW(),
+                        completed_at TIMESTAMP
+                    )
+                """
+                )
+
                 conn.commit()
 
     @contextmanager
     def get_db_connection(self):
-        """Get database connection with proper error handling"""
+        """Get pooled database connection with proper error handling"""
+        pool = _get_shared_pool(self.db_url)
         conn = None
         try:
-            conn = psycopg2.connect(self.db_url)
+            conn = pool.getconn()
             conn.autocommit = False
             yield conn
         except psycopg2.Error as e:
@@ -129,14 +444,20 @@ class DataConsistencyValidator:
             raise
         finally:
             if conn:
-                conn.close()
+                # The pool rolls back any open transaction and discards broken connections
+                pool.putconn(conn)
 
-    def validate_complete_workflow(self, workflow_id: Optional[str] = None) -> Dict[str, Any]:
+    def validate_complete_workflow(self, workflow_id: Optional[str] = None, full_scan: bool = False) -> Dict[str, Any]:
         """
         Perform comprehensive workflow consistency validation
 
+        Incremental by default: only rows written since the last completed
+        run are checked, with a full scan when there is no previous run or
+        the last full scan is older than FULL_SCAN_INTERVAL.
+
         Args:
             workflow_id: Optional specific workflow to validate
+            full_scan: Check every row regardless of the watermark
 
         Returns:
             Dict: Comprehensive validation results
@@ -144,41 +465,41 @@ class DataConsistencyValidator:
         validation_run_id = str(uuid.uuid4())
         start_time = datetime.now()
 
-        self.logger.info(f"Starting comprehensive consistency validation (run: {validation_run_id})")
+        previous_run = self._start_validation_run(validation_run_id, full_scan)
+        full_scan = previous_run is None
+
+        self.logger.info(
+            f"Starting {'full' if full_scan else 'incremental'} consistency validation (run: {validation_run_id})"
+        )
 
-        issues = []
-        corrections_applied = []
+        # Run all validation checks concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="consistency-check") as executor:
+            check_results = list(executor.map(lambda check: self._run_check(check, previous_run), self.checks))
 
-        # Run all validation checks
-        issues.extend(self._validate_job_application_consistency())
-        issues.extend(self._validate_company_relationships())
-        issues.extend(self._validate_workflow_state_integrity())
-        issues.extend(self._validate_document_tracking())
-        issues.extend(self._validate_email_tracking())
-        issues.extend(self._validate_ai_analysis_completeness())
-        issues.extend(self._validate_preference_matching())
-        issues.extend(self._validate_temporal_consistency())
+        issues = [issue for issue, _ in check_results if issue is not None]
+        checks_failed = sum(1 for _, failed in check_results if failed)
 
         # Apply automatic corrections where possible
-        for issue in issues:
-            if issue.correctable:
-                try:
-                    correction_result = self._apply_correction(issue, validation_run_id)
-                    if correction_result:
-                        corrections_applied.append(correction_result)
-                        issue.correctable = False  # Mark as corrected
-                except Exception as e:
-                    self.logger.error(f"Failed to apply correction for {issue.issue_type}: {e}")
+        corrections_applied = self._apply_corrections([issue for issue in issues if issue.correctable], validation_run_id)
+        for issue, correction in zip([issue for issue in issues if issue.correctable], corrections_applied):
+            if correction["success"]:
+                issue.correctable = False  # Mark as corrected
 
         # Log validation results
         self._log_validation_results(validation_run_id, issues, corrections_applied)
 
+        # A failed check leaves the watermark where it was so its rows are checked again
+        if not checks_failed:
+            self._complete_validation_run(validation_run_id, len(issues))
+
         validation_time = (datetime.now() - start_time).total_seconds()
 
         # Compile results
         results = {
             "validation_run_id": validation_run_id,
             "validation_time": validation_time,
+            "full_scan": full_scan,
+            "checked_since": previous_run["started_at"].isoformat() if previous_run else None,
             "total_issues": len(issues),
             "critical_issues": len([i for i in issues if i.severity == "critical"]),
             "warning_issues": len([i for i in issues if i.severity == "warning"]),
@@ -192,481 +513,229 @@ class DataConsistencyValidator:
 
         self.logger.info(
             f"Consistency validation completed: {results['overall_status']} "
-            f"({len(issues)} issues, {len(corrections_applied)} corrections)"
+            f"({len(issues)} issues, {len(corrections_applied)} corrections, {validation_time:.1f}s)"
         )
 
         return results
 
-    def _validate_job_application_consistency(self) -> List[ConsistencyIssue]:
-        """Validate job application data consistency"""
-        issues = []
-
-        try:
-            with self.get_db_connection() as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-
-                    # Check for orphaned job applications
-                    cursor.execute(
-                        """
-                        SELECT ja.id, ja.job_id
-                        FROM job_applications ja
-                        LEFT JOIN jobs j ON ja.job_id = j.id
-                        WHERE j.id IS NULL
-                    """
-                    )
-
-                    orphaned_applications = cursor.fetchall()
-                    if orphaned_applications:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="orphaned_job_applications",
-                                severity="critical",
-                                description=f"Found {len(orphaned_applications)} job applications referencing non-existent jobs",
-                                affected_records=[str(row["id"]) for row in orphaned_applications],
-                                correctable=True,
-                                correction_action="Delete orphaned job application records",
-                            )
-                        )
+    def _start_validation_run(self, validation_run_id: str, full_scan: bool) -> Optional[Dict[str, Any]]:
+        """
+        Record a new run and its watermark
 
-                    # Check for jobs without applications that should have them
-                    cursor.execute(
-                        """
-                        SELECT j.id, j.job_title, j.eligibility_flag
-                        FROM jobs j
-                        LEFT JOIN job_applications ja ON j.id = ja.job_id
-                        WHERE j.eligibility_flag = TRUE 
-                        AND j.analysis_completed = TRUE
-                        AND ja.id IS NULL
-                        AND j.created_at < NOW() - INTERVAL '1 hour'
+        Returns:
+            Watermark of the last completed run (watermark_txid, its 32-bit
+            watermark_xid, started_at) for an incremental run, or None when
+            this run must be a full scan
+        """
+        with self.get_db_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(
                     """
-                    )
+                    SELECT watermark_txid, started_at,
+                           COALESCE(
+                               (SELECT MAX(started_at) FROM validation_runs
+                                WHERE full_scan AND completed_at IS NOT NULL) < NOW() - %s,
+                               TRUE
+                           ) AS full_scan_due
+                    FROM validation_runs
+                    WHERE completed_at IS NOT NULL
+                    ORDER BY started_at DESC
+                    LIMIT 1
+                """,
+                    (FULL_SCAN_INTERVAL,),
+                )
+                previous_run = cursor.fetchone()
 
-                    missing_applications = cursor.fetchall()
-                    if missing_applications:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="missing_job_applications",
-                                severity="warning",
-                                description=f"Found {len(missing_applications)} eligible jobs without application records",
-                                affected_records=[str(row["id"]) for row in missing_applications],
-                                correctable=True,
-                                correction_action="Create missing job application records",
-                            )
-                        )
+                if full_scan or previous_run is None or previous_run["full_scan_due"]:
+                    previous_run = None
 
-                    # Check for duplicate applications
-                    cursor.execute(
-                        """
-                        SELECT job_id, COUNT(*) as app_count
-                        FROM job_applications
-                        GROUP BY job_id
-                        HAVING COUNT(*) > 1
+                # Rows written by transactions at or after the oldest one still running
+                # are the ones the next run has to look at
+                cursor.execute(
                     """
-                    )
-
-                    duplicate_applications = cursor.fetchall()
-                    if duplicate_applications:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="duplicate_job_applications",
-                                severity="warning",
-                                description=f"Found {len(duplicate_applications)} jobs with multiple application records",
-                                affected_records=[str(row["job_id"]) for row in duplicate_applications],
-                                correctable=True,
-                                correction_action="Merge or remove duplicate application records",
-                            )
-                        )
-
-        except Exception as e:
-            self.logger.error(f"Error validating job application consistency: {e}")
-            issues.append(
-                ConsistencyIssue(
-                    issue_type="validation_error",
-                    severity="critical",
-                    description=f"Job application validation failed: {str(e)}",
-                    affected_records=[],
-                    correctable=False,
+                    INSERT INTO validation_runs (validation_run_id, watermark_txid, full_scan)
+                    VALUES (%s, txid_snapshot_xmin(txid_current_snapshot()), %s)
+                """,
+                    (validation_run_id, previous_run is None),
                 )
-            )
+                conn.commit()
 
-        return issues
+        if previous_run is None:
+            return None
 
-    def _validate_company_relationships(self) -> List[ConsistencyIssue]:
-        """Validate company relationship consistency"""
-        issues = []
+        # xmin is a 32-bit xid; the checks compare ages against the watermark in that form
+        previous_run = dict(previous_run)
+        previous_run["watermark_xid"] = str(previous_run["watermark_txid"] % 2**32)
+        return previous_run
 
+    def _complete_validation_run(self, validation_run_id: str, total_issues: int):
+        """Mark a run complete, making its watermark the next run's starting point"""
         try:
             with self.get_db_connection() as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-
-                    # Check for jobs with invalid company references
-                    cursor.execute(
-                        """
-                        SELECT j.id, j.company_id, j.job_title
-                        FROM jobs j
-                        LEFT JOIN companies c ON j.company_id = c.id
-                        WHERE j.company_id IS NOT NULL AND c.id IS NULL
-                    """
-                    )
-
-                    invalid_company_refs = cursor.fetchall()
-                    if invalid_company_refs:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="invalid_company_references",
-                                severity="critical",
-                                description=f"Found {len(invalid_company_refs)} jobs with invalid company references",
-                                affected_records=[str(row["id"]) for row in invalid_company_refs],
-                                correctable=True,
-                                correction_action="Create missing company records or clear invalid references",
-                            )
-                        )
-
-                    # Check for unused companies
+                with conn.cursor() as cursor:
                     cursor.execute(
-                        """
-                        SELECT c.id, c.name
-                        FROM companies c
-                        LEFT JOIN jobs j ON c.id = j.company_id
-                        WHERE j.id IS NULL
-                        AND c.created_at < NOW() - INTERVAL '7 days'
-                    """
+                        "UPDATE validation_runs SET completed_at = NOW(), total_issues = %s WHERE validation_run_id = %s",
+                        (total_issues, validation_run_id),
                     )
-
-                    unused_companies = cursor.fetchall()
-                    if unused_companies:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="unused_companies",
-                                severity="info",
-                                description=f"Found {len(unused_companies)} companies with no associated jobs",
-                                affected_records=[str(row["id"]) for row in unused_companies],
-                                correctable=True,
-                                correction_action="Archive or remove unused company records",
-                            )
-                        )
-
+                    conn.commit()
         except Exception as e:
-            self.logger.error(f"Error validating company relationships: {e}")
-            issues.append(
-                ConsistencyIssue(
-                    issue_type="validation_error",
-                    severity="critical",
-                    description=f"Company relationship validation failed: {str(e)}",
-                    affected_records=[],
-                    correctable=False,
-                )
-            )
+            self.logger.error(f"Failed to complete validation run {validation_run_id}: {e}")
+
+    def _build_check_query(self, check: ConsistencyCheck, previous_run: Optional[Dict[str, Any]]) -> str:
+        """Fill a check's row filters for a full scan (previous_run None) or incremental run"""
+        if previous_run is None:
+            return check.query.format(changed=_RowFilter(None), crossed=_RowFilter(None))
+
+        # age() counts transactions since an xid (frozen rows are maximally old). Both
+        # ages share one reference point, so this selects rows written at or after the
+        # watermark without txid_current(), which would assign an xid to a read-only query
+        changed = _RowFilter("age({alias}.xmin) <= age(%(watermark_xid)s::xid)")
+        crossed = _RowFilter(
+            "{alias}.created_at >= %(since)s - INTERVAL '" + (check.age_threshold or "0 seconds") + "'"
+        )
+        return check.query.format(changed=changed, crossed=crossed)
 
-        return issues
+    def _run_check(
+        self, check: ConsistencyCheck, previous_run: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[ConsistencyIssue], bool]:
+        """
+        Run one check on its own pooled connection
 
-    def _validate_workflow_state_integrity(self) -> List[ConsistencyIssue]:
-        """Validate workflow state consistency"""
-        issues = []
+        Returns:
+            (issue or None, whether the check failed)
+        """
+        query = self._build_check_query(check, previous_run)
+        params = {}
+        if previous_run is not None:
+            params = {"watermark_xid": previous_run["watermark_xid"], "since": previous_run["started_at"]}
 
         try:
             with self.get_db_connection() as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-
-                    # Check for inconsistent analysis states
-                    cursor.execute(
-                        """
-                        SELECT j.id, j.analysis_completed, j.eligibility_flag
-                        FROM jobs j
-                        WHERE j.analysis_completed = FALSE 
-                        AND j.eligibility_flag IS NOT NULL
-                    """
-                    )
-
-                    inconsistent_analysis = cursor.fetchall()
-                    if inconsistent_analysis:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="inconsistent_analysis_state",
-                                severity="warning",
-                                description=f"Found {len(inconsistent_analysis)} jobs with eligibility set but analysis not completed",
-                                affected_records=[str(row["id"]) for row in inconsistent_analysis],
-                                correctable=True,
-                                correction_action="Reset eligibility flag for incomplete analysis",
-                            )
-                        )
-
-                    # Check for stalled workflows
-                    cursor.execute(
-                        """
-                        SELECT j.id, j.created_at, j.analysis_completed
-                        FROM jobs j
-                        WHERE j.analysis_completed = FALSE
-                        AND j.created_at < NOW() - INTERVAL '24 hours'
-                    """
-                    )
-
-                    stalled_workflows = cursor.fetchall()
-                    if stalled_workflows:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="stalled_workflows",
-                                severity="warning",
-                                description=f"Found {len(stalled_workflows)} jobs with stalled analysis (>24h)",
-                                affected_records=[str(row["id"]) for row in stalled_workflows],
-                                correctable=True,
-                                correction_action="Re-queue jobs for analysis or mark as failed",
-                            )
-                        )
-
+                with conn.cursor() as cursor:
+                    cursor.execute(query, params)
+                    keys = [str(row[0]) for row in cursor.fetchall()]
         except Exception as e:
-            self.logger.error(f"Error validating workflow state: {e}")
-            issues.append(
+            self.logger.error(f"Error running consistency check {check.issue_type}: {e}")
+            if not check.report_failure:
+                return None, True
+            return (
                 ConsistencyIssue(
                     issue_type="validation_error",
                     severity="critical",
-                    description=f"Workflow state validation failed: {str(e)}",
+                    description=f"{check.issue_type} validation failed: {str(e)}",
                     affected_records=[],
                     correctable=False,
-                )
+                ),
+                True,
             )
 
-        return issues
-
-    def _validate_document_tracking(self) -> List[ConsistencyIssue]:
-        """Validate document generation tracking"""
-        issues = []
-
-        try:
-            with self.get_db_connection() as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-
-                    # Check for applications without document tracking
-                    cursor.execute(
-                        """
-                        SELECT ja.id, ja.application_status
-                        FROM job_applications ja
-                        LEFT JOIN document_job dj ON ja.id::text = dj.webhook_data->>'application_id'
-                        WHERE ja.application_status = 'sent'
-                        AND dj.id IS NULL
-                    """
-                    )
-
-                    missing_document_tracking = cursor.fetchall()
-                    if missing_document_tracking:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="missing_document_tracking",
-                                severity="warning",
-                                description=f"Found {len(missing_document_tracking)} sent applications without document tracking",
-                                affected_records=[str(row["id"]) for row in missing_document_tracking],
-                                correctable=False,
-                                correction_action="Document tracking cannot be retroactively created",
-                            )
-                        )
-
-        except Exception as e:
-            self.logger.error(f"Error validating document tracking: {e}")
-
-        return issues
-
-    def _validate_email_tracking(self) -> List[ConsistencyIssue]:
-        """Validate email tracking consistency"""
-        issues = []
-
-        try:
-            with self.get_db_connection() as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-
-                    # Check for sent applications without email tracking
-                    cursor.execute(
-                        """
-                        SELECT ja.id, ja.email_sent_at
-                        FROM job_applications ja
-                        WHERE ja.application_status = 'sent'
-                        AND ja.email_sent_at IS NULL
-                    """
-                    )
-
-                    missing_email_tracking = cursor.fetchall()
-                    if missing_email_tracking:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="missing_email_tracking",
-                                severity="warning",
-                                description=f"Found {len(missing_email_tracking)} applications marked as sent without email timestamp",
-                                affected_records=[str(row["id"]) for row in missing_email_tracking],
-                                correctable=True,
-                                correction_action="Update email_sent_at timestamp or correct application status",
-                            )
-                        )
-
-        except Exception as e:
-            self.logger.error(f"Error validating email tracking: {e}")
-
-        return issues
-
-    def _validate_ai_analysis_completeness(self) -> List[ConsistencyIssue]:
-        """Validate AI analysis completeness"""
-        issues = []
-
-        try:
-            with self.get_db_connection() as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-
-                    # Check for jobs marked as analyzed but missing analysis data
-                    cursor.execute(
-                        """
-                        SELECT j.id, j.job_title
-                        FROM jobs j
-                        LEFT JOIN analyzed_jobs aj ON j.id = aj.job_id
-                        WHERE j.analysis_completed = TRUE
-                        AND aj.id IS NULL
-                    """
-                    )
-
-                    missing_analysis_data = cursor.fetchall()
-                    if missing_analysis_data:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="missing_analysis_data",
-                                severity="critical",
-                                description=f"Found {len(missing_analysis_data)} jobs marked as analyzed but missing analysis data",
-                                affected_records=[str(row["id"]) for row in missing_analysis_data],
-                                correctable=True,
-                                correction_action="Reset analysis_completed flag to trigger re-analysis",
-                            )
-                        )
-
-        except Exception as e:
-            self.logger.error(f"Error validating AI analysis: {e}")
-
-        return issues
-
-    def _validate_preference_matching(self) -> List[ConsistencyIssue]:
-        """Validate preference matching consistency"""
-        issues = []
-
-        # This would validate user preference matching logic
-        # For now, returning empty list as preferences are handled by fallback defaults
-
-        return issues
-
-    def _validate_temporal_consistency(self) -> List[ConsistencyIssue]:
-        """Validate temporal consistency (timestamps, ordering)"""
-        issues = []
-
-        try:
-            with self.get_db_connection() as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-
-                    # Check for applications created before jobs
-                    cursor.execute(
-                        """
-                        SELECT ja.id, ja.created_at as app_created, j.created_at as job_created
-                        FROM job_applications ja
-                        JOIN jobs j ON ja.job_id = j.id
-                        WHERE ja.created_at < j.created_at
-                    """
-                    )
-
-                    temporal_inconsistencies = cursor.fetchall()
-                    if temporal_inconsistencies:
-                        issues.append(
-                            ConsistencyIssue(
-                                issue_type="temporal_inconsistency",
-                                severity="warning",
-                                description=f"Found {len(temporal_inconsistencies)} applications created before their associated jobs",
-                                affected_records=[str(row["id"]) for row in temporal_inconsistencies],
-                                correctable=True,
-                                correction_action="Correct timestamps to maintain proper temporal ordering",
-                            )
-                        )
-
-        except Exception as e:
-            self.logger.error(f"Error validating temporal consistency: {e}")
-
-        return issues
+        if not keys:
+            return None, False
+
+        return (
+            ConsistencyIssue(
+                issue_type=check.issue_type,
+                severity=check.severity,
+                description=check.description.format(count=len(keys)),
+                affected_records=keys,
+                correctable=check.correctable,
+                correction_action=check.correction_action,
+            ),
+            False,
+        )
 
-    def _apply_correction(self, issue: ConsistencyIssue, validation_run_id: str) -> Optional[Dict[str, Any]]:
+    def _apply_corrections(self, issues: List[ConsistencyIssue], validation_run_id: str) -> List[Dict[str, Any]]:
         """
-        Apply automatic correction for correctable issues
+        Apply automatic corrections in bulk
+
+        All corrections share one transaction; each runs in a savepoint so one
+        failing correction does not undo the others. Keys are applied
+        CORRECTION_BATCH_SIZE at a time per statement.
 
         Args:
-            issue: ConsistencyIssue to correct
+            issues: Correctable issues
             validation_run_id: Validation run identifier
 
         Returns:
-            Dict: Correction result information
+            List: Correction result per issue, in order
         """
-        if not issue.correctable:
-            return None
+        if not issues:
+            return []
+
+        correction_sql_by_type = {check.issue_type: check.correction_sql for check in self.checks}
+        results = []
 
         try:
             with self.get_db_connection() as conn:
                 with conn.cursor() as cursor:
-
-                    correction_sql = None
-
-                    if issue.issue_type == "orphaned_job_applications":
-                        # Delete orphaned job applications
-                        placeholders = ",".join(["%s"] * len(issue.affected_records))
-                        correction_sql = f"DELETE FROM job_applications WHERE id IN ({placeholders})"
-                        cursor.execute(correction_sql, issue.affected_records)
-
-                    elif issue.issue_type == "missing_job_applications":
-                        # Create missing job application records
-                        for job_id in issue.affected_records:
-                            cursor.execute(
-                                """
-                                INSERT INTO job_applications (id, job_id, application_status, created_at)
-                                VALUES (gen_random_uuid(), %s, 'pending', NOW())
-                                ON CONFLICT DO NOTHING
-                            """,
-                                (job_id,),
+                    for issue in issues:
+                        correction_sql = correction_sql_by_type.get(issue.issue_type)
+                        records_affected = len(issue.affected_records)
+
+                        cursor.execute("SAVEPOINT correction")
+                        try:
+                            if correction_sql:
+                                records_affected = 0
+                                for start in range(0, len(issue.affected_records), CORRECTION_BATCH_SIZE):
+                                    batch = issue.affected_records[start:start + CORRECTION_BATCH_SIZE]
+                                    cursor.execute(correction_sql.format(keys=",".join(["%s"] * len(batch))), batch)
+                                    records_affected += max(cursor.rowcount, 0)
+                                correction_sql = " ".join(correction_sql.split())
+                            cursor.execute("RELEASE SAVEPOINT correction")
+                        except psycopg2.Error as e:
+                            cursor.execute("ROLLBACK TO SAVEPOINT correction")
+                            self.logger.error(f"Failed to apply correction for {issue.issue_type}: {e}")
+                            results.append(
+                                {"correction_type": issue.issue_type, "records_affected": 0, "error": str(e), "success": False}
                             )
-                        correction_sql = "INSERT job_applications for eligible jobs"
-
-                    elif issue.issue_type == "inconsistent_analysis_state":
-                        # Reset eligibility flags for incomplete analysis
-                        placeholders = ",".join(["%s"] * len(issue.affected_records))
-                        correction_sql = f"UPDATE jobs SET eligibility_flag = NULL WHERE id IN ({placeholders})"
-                        cursor.execute(correction_sql, issue.affected_records)
-
-                    elif issue.issue_type == "missing_analysis_data":
-                        # Reset analysis_completed flag
-                        placeholders = ",".join(["%s"] * len(issue.affected_records))
-                        correction_sql = f"UPDATE jobs SET analysis_completed = FALSE WHERE id IN ({placeholders})"
-                        cursor.execute(correction_sql, issue.affected_records)
+                            continue
+
+                        results.append(
+                            {
+                                "correction_type": issue.issue_type,
+                                "records_affected": records_affected,
+                                "correction_sql": correction_sql,
+                                "success": True,
+                            }
+                        )
 
-                    # Log the correction
-                    cursor.execute(
-                        """
-                        INSERT INTO data_corrections (
-                            validation_run_id, correction_type, affected_table, 
-                            affected_records, correction_sql
-                        ) VALUES (%s, %s, %s, %s, %s)
-                    """,
-                        (
-                            validation_run_id,
-                            issue.issue_type,
-                            self._get_affected_table(issue.issue_type),
-                            json.dumps(issue.affected_records),
-                            correction_sql,
-                        ),
-                    )
+                    # Log the corrections
+                    applied = [(issue, result) for issue, result in zip(issues, results) if result["success"]]
+                    if applied:
+                        execute_values(
+                            cursor,
+                            """
+                            INSERT INTO data_corrections (
+                                validation_run_id, correction_type, affected_table,
+                                affected_records, correction_sql
+                            ) VALUES %s
+                        """,
+                            [
+                                (
+                                    validation_run_id,
+                                    issue.issue_type,
+                                    self._get_affected_table(issue.issue_type),
+                                    json.dumps(issue.affected_records),
+                                    result["correction_sql"],
+                                )
+                                for issue, result in applied
+                            ],
+                        )
 
                     conn.commit()
 
-                    self.logger.info(
-                        f"Applied correction for {issue.issue_type}: {len(issue.affected_records)} records"
-                    )
+            for issue, result in zip(issues, results):
+                if result["success"]:
+                    self.logger.info(f"Applied correction for {issue.issue_type}: {result['records_affected']} records")
 
-                    return {
-                        "correction_type": issue.issue_type,
-                        "records_affected": len(issue.affected_records),
-                        "correction_sql": correction_sql,
-                        "success": True,
-                    }
+            return results
 
         except Exception as e:
-            self.logger.error(f"Failed to apply correction for {issue.issue_type}: {e}")
-            return {"correction_type": issue.issue_type, "records_affected": 0, "error": str(e), "success": False}
+            self.logger.error(f"Failed to apply corrections: {e}")
+            return [
+                {"correction_type": issue.issue_type, "records_affected": 0, "error": str(e), "success": False}
+                for issue in issues
+            ]
 
     def _get_affected_table(self, issue_type: str) -> str:
         """Determine primary affected table for issue type"""
@@ -687,18 +756,22 @@ class DataConsistencyValidator:
         self, validation_run_id: str, issues: List[ConsistencyIssue], corrections: List[Dict[str, Any]]
     ):
         """Log validation results to database"""
+        if not issues:
+            return
+
         try:
             with self.get_db_connection() as conn:
                 with conn.cursor() as cursor:
 
-                    for issue in issues:
-                        cursor.execute(
-                            """
-                            INSERT INTO consistency_validation_logs (
-                                validation_run_id, issue_type, severity, description,
-                                affected_record_count, correctable, correction_applied
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        """,
+                    execute_values(
+                        cursor,
+                        """
+                        INSERT INTO consistency_validation_logs (
+                            validation_run_id, issue_type, severity, description,
+                            affected_record_count, correctable, correction_applied
+                        ) VALUES %s
+                    """,
+                        [
                             (
                                 validation_run_id,
                                 issue.issue_type,
@@ -707,8 +780,10 @@ class DataConsistencyValidator:
                                 len(issue.affected_records),
                                 issue.correctable,
                                 not issue.correctable,  # If not correctable, no correction applied
-                            ),
-                        )
+                            )
+                            for issue in issues
+                        ],
+                    )
 
                     conn.commit()
 
@@ -480,7 +480,8 @@ class FailureRecoveryManager:
         Returns:
             str: Checkpoint ID
         """
-        checkpoint_id = f"{workflow_id}_{stage}_{int(time.time())}"
+        # Millisecond timestamp plus a random suffix: several checkpoints per stage per second are normal
+        checkpoint_id = f"{workflow_id}_{stage}_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}"
 
         try:
             with self.get_db_connection() as conn:
@@ -21,6 +21,8 @@ from typing import Dict, List, Optional, Callable, Any
 from enum import Enum
 from dataclasses import dataclass
 
+from .timeout_manager import remaining_time
+
 
 class CircuitState(Enum):
     """Circuit breaker states"""
@@ -368,6 +370,16 @@ class RetryStrategyManager:
 
                 # Calculate delay and wait
                 delay = strategy.get_delay(attempt)
+
+                # Never retry past the workflow deadline
+                remaining = remaining_time()
+                if remaining is not None and remaining <= delay:
+                    self.logger.error(
+                        f"Operation {operation_name} failed (attempt {attempt}), "
+                        f"{remaining:.1f}s left on deadline - not retrying: {e}"
+                    )
+                    break
+
                 strategy.metrics.total_delay_time += delay
 
                 self.logger.warning(
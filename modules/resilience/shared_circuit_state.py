@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Module: shared_circuit_state.py
+Purpose: Circuit breaker state shared by every process on the host
+Created: 2026-10-18
+Dependencies: mmap, fcntl, struct
+Related: circuit_breaker_manager.py, modules/observability/multiprocess_metrics.py
+Description: Publishes each service's breaker state (state, open-until, failure
+             window) in a small memory-mapped file, so once any gunicorn worker
+             or scheduler process trips a breaker all of them short-circuit
+             instead of each paying the outage's timeouts. Writers serialise
+             with flock; readers never lock and use a sequence counter
+             (seqlock) to retry torn reads.
+
+Configuration:
+    CIRCUIT_BREAKER_STATE_DIR: Shared directory for state files (enables sharing;
+                               set by gunicorn_config.py)
+"""
+
+import fcntl
+import mmap
+import os
+import re
+import struct
+import time
+from typing import Callable, NamedTuple, Optional
+
+STATE_DIR_ENV = "CIRCUIT_BREAKER_STATE_DIR"
+STATE_FILE_SUFFIX = ".breaker"
+
+# Shared state codes (CircuitState values are strings; the file stores integers)
+STATE_CLOSED = 0
+STATE_OPEN = 1
+STATE_HALF_OPEN = 2
+
+# seq, state, reserved, changed_at, open_until, window_start, window_calls,
+# window_failures, last_failure_at
+_RECORD = struct.Struct("<QIIdddQQd")
+_FIELDS = struct.Struct("<IIdddQQd")
+_MAX_READ_ATTEMPTS = 100
+
+
+class SharedStateSnapshot(NamedTuple):
+    """One consistent read of a service's shared breaker state"""
+
+    state: int
+    changed_at: float  # Epoch seconds of the last state change
+    open_until: float  # OPEN: when a probe may start; HALF_OPEN: probe lease expiry
+    window_start: float
+    window_calls: int
+    window_failures: int
+    last_failure_at: float
+
+
+class SharedCircuitState:
+    """
+    Memory-mapped state record for one service
+
+    Reads are lock-free; update() runs a read-modify-write under an
+    exclusive flock so concurrent processes never lose an update.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._file = os.fdopen(fd, "r+b")
+        if os.fstat(fd).st_size < _RECORD.size:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size < _RECORD.size:
+                    os.ftruncate(fd, _RECORD.size)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(fd, _RECORD.size)
+
+    def read(self) -> SharedStateSnapshot:
+        """Current state; retries while a writer is mid-update"""
+        for _ in range(_MAX_READ_ATTEMPTS):
+            seq = struct.unpack_from("<Q", self._map, 0)[0]
+            if seq % 2:
+                continue
+            fields = _FIELDS.unpack_from(self._map, 8)
+            # Re-read seq after copying the fields: a writer that started meanwhile changed it
+            if struct.unpack_from("<Q", self._map, 0)[0] == seq:
+                return SharedStateSnapshot(fields[0], *fields[2:])
+        # A writer died mid-update; take the lock and read under it
+        return self.update(lambda snapshot: snapshot)
+
+    def update(self, fn: Callable[[SharedStateSnapshot], Optional[SharedStateSnapshot]]) -> SharedStateSnapshot:
+        """
+        Atomically transform the state
+
+        Args:
+            fn: Receives the current snapshot, returns the new one (or None to
+                leave it unchanged)
+
+        Returns:
+            The snapshot now stored
+        """
+        fd = self._file.fileno()
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            record = _RECORD.unpack_from(self._map, 0)
+            current = SharedStateSnapshot(record[1], *record[3:])
+            new = fn(current)
+            if new is None or new == current:
+                return current
+            seq = record[0] + (1 if record[0] % 2 == 0 else 0)
+            struct.pack_into("<Q", self._map, 0, seq)  # Odd: write in progress
+            _FIELDS.pack_into(self._map, 8, new.state, 0, *new[1:])
+            struct.pack_into("<Q", self._map, 0, seq + 1)
+            return new
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def publish(self, state: int, open_until: float = 0.0, reset_window: bool = False) -> SharedStateSnapshot:
+        """Record a state change made by this process"""
+        now = time.time()
+
+        def apply(current: SharedStateSnapshot) -> SharedStateSnapshot:
+            if reset_window:
+                current = current._replace(window_start=now, window_calls=0, window_failures=0)
+            return current._replace(state=state, changed_at=now, open_until=open_until)
+
+        return self.update(apply)
+
+    def record_calls(self, calls: int, failures: int, window_duration: float) -> SharedStateSnapshot:
+        """Add this process's calls and failures to the shared failure window"""
+        now = time.time()
+
+        def apply(current: SharedStateSnapshot) -> SharedStateSnapshot:
+            if now - current.window_start >= window_duration:
+                current = current._replace(window_start=now, window_calls=0, window_failures=0)
+            current = current._replace(
+                window_calls=current.window_calls + calls,
+                window_failures=current.window_failures + failures,
+            )
+            if failures:
+                current = current._replace(last_failure_at=now)
+            return current
+
+        return self.update(apply)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+class SharedCircuitStateStore:
+    """Directory of per-service state files"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def state_for(self, service_name: str) -> SharedCircuitState:
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", service_name) or "_default"
+        return SharedCircuitState(os.path.join(self.directory, safe_name + STATE_FILE_SUFFIX))
+
+
+def get_shared_state_store() -> Optional[SharedCircuitStateStore]:
+    """
+    Store named by CIRCUIT_BREAKER_STATE_DIR
+
+    Returns:
+        SharedCircuitStateStore, or None when the variable is unset (breakers
+        then keep their state per process)
+    """
+    directory = os.getenv(STATE_DIR_ENV)
+    return SharedCircuitStateStore(directory) if directory else None
+
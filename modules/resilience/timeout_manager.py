@@ -2,11 +2,18 @@
 Timeout Manager - Configurable timeout management for operations
 
 Provides centralized timeout configuration and enforcement across
-different operation types in the job application system.
+different operation types in the job application system, plus
+per-workflow deadlines carried in a context variable (so every call and
+retry inside a workflow shares one budget) and hedged requests for
+external APIs with long tail latency.
 """
 
+import contextvars
+import threading
 import time
 import signal
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Dict, Optional, Callable, Any
 from enum import Enum
 from contextlib import contextmanager
@@ -428,3 +435,274 @@ def get_timeout_stats() -> Dict[str, Any]:
         Dictionary with timeout statistics including total count and per-operation counts
     """
     return dict(_timeout_stats)
+
+
+# ---------------------------------------------------------------------------
+# Deadline propagation
+# ---------------------------------------------------------------------------
+
+class Deadline:
+    """Absolute point (monotonic clock) by which a workflow must finish"""
+
+    def __init__(self, name: str, budget: float):
+        self.name = name
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """Seconds left (0 once expired)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def __repr__(self) -> str:
+        return f"Deadline({self.name!r}, remaining={self.remaining():.1f}s)"
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "resilience_deadline", default=None
+)
+
+
+@contextmanager
+def deadline_scope(seconds: float, name: str = "workflow"):
+    """
+    Run a block under a deadline
+
+    Nested scopes can only shorten the budget: the effective deadline is
+    the earlier of the enclosing one and ``seconds`` from now. Threads
+    started with contextvars.copy_context().run inherit the deadline.
+
+    Args:
+        seconds: Budget for the block
+        name: Name reported when the deadline is exceeded
+
+    Example:
+        with deadline_scope(1800, "nightly_analysis"):
+            analyzer.analyze_jobs_batch(jobs)
+    """
+    deadline = Deadline(name, seconds)
+    parent = _current_deadline.get()
+    if parent is not None and parent.expires_at <= deadline.expires_at:
+        deadline = parent
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def get_current_deadline() -> Optional[Deadline]:
+    """Deadline of the current context, or None when unbounded"""
+    return _current_deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left on the current deadline, or None when unbounded"""
+    deadline = _current_deadline.get()
+    return deadline.remaining() if deadline is not None else None
+
+
+def deadline_exceeded() -> bool:
+    """True once the current deadline has passed (False when unbounded)"""
+    deadline = _current_deadline.get()
+    return deadline is not None and deadline.expired()
+
+
+def check_deadline(operation_name: str = "operation"):
+    """
+    Raise if the current deadline has passed
+
+    Raises:
+        ResilienceTimeoutError: If the deadline is exhausted
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None and deadline.expired():
+        _timeout_stats["total_timeouts"] += 1
+        _timeout_stats["operations"][operation_name] = _timeout_stats["operations"].get(operation_name, 0) + 1
+        raise ResilienceTimeoutError(
+            operation_name=operation_name,
+            timeout_seconds=deadline.budget,
+            message=f"Deadline '{deadline.name}' exceeded",
+            context={"deadline": deadline.name},
+        )
+
+
+def bounded_timeout(timeout: float, operation_name: str = "operation") -> float:
+    """
+    Per-call timeout capped by the remaining deadline
+
+    Args:
+        timeout: Timeout the call would use on its own
+        operation_name: Name reported if no budget is left
+
+    Returns:
+        min(timeout, remaining budget)
+
+    Raises:
+        ResilienceTimeoutError: If the deadline is already exhausted
+    """
+    check_deadline(operation_name)
+    remaining = remaining_time()
+    return timeout if remaining is None else min(timeout, remaining)
+
+
+def sleep_within_deadline(seconds: float) -> bool:
+    """
+    Sleep unless doing so would run past the current deadline
+
+    Returns:
+        True after sleeping; False (without sleeping) if the remaining
+        budget cannot cover the sleep, so the caller should stop retrying
+    """
+    remaining = remaining_time()
+    if remaining is not None and remaining <= seconds:
+        return False
+    time.sleep(seconds)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Hedged requests
+# ---------------------------------------------------------------------------
+
+class LatencyTracker:
+    """Recent latencies of one operation, for deriving the hedge delay"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Latency at the given fraction (0.95 = p95), None until min_samples are recorded"""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+HEDGE_MAX_WORKERS = 16
+
+_latency_trackers: Dict[str, LatencyTracker] = {}
+_hedge_stats = {"calls": 0, "hedged": 0, "hedge_wins": 0}
+_hedge_lock = threading.Lock()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_latency_tracker(operation_name: str) -> LatencyTracker:
+    """Shared tracker for an operation name"""
+    with _hedge_lock:
+        if operation_name not in _latency_trackers:
+            _latency_trackers[operation_name] = LatencyTracker()
+        return _latency_trackers[operation_name]
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    with _hedge_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="hedged-request")
+        return _hedge_executor
+
+
+def hedged_call(
+    primary: Callable[[], Any],
+    hedge: Callable[[], Any],
+    operation_name: str,
+    hedge_delay: Optional[float] = None,
+    percentile: float = 0.95,
+    accept: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    """
+    Run primary, and hedge too if primary is slower than usual
+
+    The hedge starts once primary has run longer than the operation's
+    recent p95 latency (or hedge_delay), or straight away if primary fails
+    or returns an unacceptable result first. Whichever acceptable result
+    arrives first is returned; the slower attempt finishes in the
+    background and its result is discarded. Until enough latencies are
+    recorded primary runs alone, so hedging adds roughly 5% extra requests.
+
+    Args:
+        primary: Preferred attempt
+        hedge: Backup attempt (e.g. the same request to a fallback model)
+        operation_name: Latency tracking key
+        hedge_delay: Fixed delay before hedging (overrides the percentile)
+        percentile: Latency fraction that triggers the hedge
+        accept: Predicate for usable results (default: any return value)
+
+    Returns:
+        First accepted result; otherwise primary's result, or the hedge's
+        if primary raised
+
+    Raises:
+        The primary's exception if neither attempt returns a result
+    """
+    tracker = get_latency_tracker(operation_name)
+    delay = hedge_delay if hedge_delay is not None else tracker.percentile(percentile)
+    accept = accept or (lambda result: True)
+
+    with _hedge_lock:
+        _hedge_stats["calls"] += 1
+
+    if delay is None:
+        start = time.monotonic()
+        result = primary()
+        tracker.record(time.monotonic() - start)
+        return result
+
+    remaining = remaining_time()
+    if remaining is not None:
+        delay = min(delay, remaining)
+
+    executor = _get_hedge_executor()
+
+    start = time.monotonic()
+
+    def record_latency(done):
+        if done.exception() is None:
+            tracker.record(time.monotonic() - start)
+
+    # Only primary's latency is tracked: the hedge (e.g. another model) has its own profile
+    primary_future = executor.submit(contextvars.copy_context().run, primary)
+    primary_future.add_done_callback(record_latency)
+    done, _ = wait([primary_future], timeout=delay)
+    if done and primary_future.exception() is None and accept(primary_future.result()):
+        return primary_future.result()
+
+    with _hedge_lock:
+        _hedge_stats["hedged"] += 1
+    hedge_future = executor.submit(contextvars.copy_context().run, hedge)
+
+    pending = {primary_future, hedge_future}
+    while pending:
+        done, pending = wait(pending, timeout=remaining_time(), return_when=FIRST_COMPLETED)
+        if not done:
+            check_deadline(operation_name)
+        for future in done:
+            if future.exception() is None and accept(future.result()):
+                if future is hedge_future:
+                    with _hedge_lock:
+                        _hedge_stats["hedge_wins"] += 1
+                return future.result()
+
+    for future in (primary_future, hedge_future):
+        if future.exception() is None:
+            return future.result()
+    raise primary_future.exception()
+
+
+def get_hedge_stats() -> Dict[str, int]:
+    """Hedged call counters: calls, hedged (backup fired) and hedge_wins"""
+    with _hedge_lock:
+        return dict(_hedge_stats)
@@ -2,7 +2,7 @@
 Module: job_scraper_apify.py
 Purpose: Apify platform integration for Indeed job scraping (EDUCATIONAL ONLY)
 Created: 2024-08-20
-Modified: 2025-10-21
+Modified: 2026-10-18
 Dependencies: apify_client, requests, database_manager, scrape_pipeline, security_manager
 Related: scraper_api.py, scrape_pipeline.py, intelligent_scraper.py
 Description: Handles job scraping using Apify's misceres/indeed-scraper actor with
@@ -22,6 +22,7 @@ from apify_client import ApifyClient
 from modules.database.database_manager import DatabaseManager
 from .scrape_pipeline import ScrapeDataPipeline
 from modules.security.security_manager import SecurityManager
+from modules.resilience.timeout_manager import remaining_time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -155,6 +156,11 @@ class ApifyJobScraper:
         start_time = time.time()
         max_wait_seconds = max_wait_minutes * 60
 
+        # Never wait past the enclosing workflow deadline
+        remaining = remaining_time()
+        if remaining is not None and remaining < max_wait_seconds:
+            max_wait_seconds = remaining
+
         while time.time() - start_time < max_wait_seconds:
             status = self.get_run_status(run_id)
 
@@ -166,12 +172,13 @@ class ApifyJobScraper:
                 return False
             elif status["status"] in ["RUNNING", "READY"]:
                 logger.info(f"Scraping run {run_id} still running...")
-                time.sleep(30)  # Check every 30 seconds
+                # Check every 30 seconds, with a final check at the deadline
+                time.sleep(max(0.0, min(30, max_wait_seconds - (time.time() - start_time))))
             else:
                 logger.warning(f"Unexpected status for run {run_id}: {status['status']}")
-                time.sleep(30)
+                time.sleep(max(0.0, min(30, max_wait_seconds - (time.time() - start_time))))
 
-        logger.error(f"Scraping run {run_id} timed out after {max_wait_minutes} minutes")
+        logger.error(f"Scraping run {run_id} timed out after {(time.time() - start_time) / 60:.1f} minutes")
         return False
 
     def get_scraped_data(self, run_id: str) -> List[Dict]:
@@ -0,0 +1,452 @@
+"""
+Rate Limiter Engine
+
+Shared engine behind the application's rate limiters: the monitoring API
+limiter (modules/observability/rate_limiter.py), link tracking
+(modules/link_tracking/security_controls.py) and Flask-Limiter
+(modules/security/rate_limit_manager.py through limiter_storage.py).
+
+Algorithms (O(1) time and state per key):
+- GCRA: token bucket equivalent stored as a single theoretical arrival time
+- Sliding window counter: current and previous window counts, weighted by
+  how far the current window has progressed
+
+State stores:
+- MemoryLimiterStore: per-process, lock-striped shards with LRU eviction and
+  TTL expiry, so the key table stays bounded
+- SQLiteLimiterStore: a WAL-mode SQLite file on the host, so every gunicorn
+  worker enforces the same limits
+
+Usage:
+    from modules.security.limiter_engine import GCRALimiter, get_shared_limiter_store
+
+    limiter = GCRALimiter(rate=60, period=60, burst=10,
+                          store=get_shared_limiter_store(), namespace='monitoring')
+    result = limiter.check('api_key_123')
+    if not result.allowed:
+        print(f"Retry after {result.retry_after:.1f}s")
+
+Configuration:
+    RATE_LIMIT_SHARED_STORE: 'sqlite' (default) or 'memory'
+    RATE_LIMIT_DB_PATH: SQLite file (default: <tmpdir>/merlin_rate_limits.sqlite3)
+    RATE_LIMIT_MAX_KEYS: Maximum keys kept per store (default: 100000)
+"""
+
+import logging
+import math
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_KEYS = 100_000
+DEFAULT_SHARDS = 16
+
+# SQLite stores prune expired and least recently used keys every N updates
+SQLITE_PRUNE_INTERVAL = 1000
+
+# A state update: fn(state or None, now) -> (new_state, expires_at, result)
+StateUpdate = Callable[[Optional[Tuple[float, ...]], float], Tuple[Tuple[float, ...], float, object]]
+
+
+class LimitResult(NamedTuple):
+    """Outcome of a rate limit check"""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # Seconds until the request would be allowed (0 when allowed)
+    reset_after: float  # Seconds until the key is back to its full allowance
+
+
+# ============================================================================
+# STATE STORES
+# ============================================================================
+
+
+class MemoryLimiterStore:
+    """
+    Bounded in-process state table
+
+    Keys are spread over lock-striped shards so concurrent checks on
+    different keys rarely contend; each shard is an LRU (OrderedDict) capped
+    at its share of max_keys, and expired entries read as absent.
+    """
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS, shards: int = DEFAULT_SHARDS):
+        self.max_keys = max_keys
+        self._shard_capacity = max(1, math.ceil(max_keys / shards))
+        self._shards = [(threading.Lock(), OrderedDict()) for _ in range(shards)]
+        self.evictions = 0
+
+    def _shard(self, key: str):
+        return self._shards[hash(key) % len(self._shards)]
+
+    def update(self, key: str, fn: StateUpdate, now: float):
+        """Atomically read, transform and write a key's state; returns fn's result"""
+        lock, table = self._shard(key)
+        with lock:
+            entry = table.get(key)
+            state = entry[0] if entry and entry[1] > now else None
+            new_state, expires_at, result = fn(state, now)
+            table[key] = (new_state, expires_at)
+            table.move_to_end(key)
+            if len(table) > self._shard_capacity:
+                table.popitem(last=False)
+                self.evictions += 1
+            return result
+
+    def get(self, key: str, now: float) -> Optional[Tuple[float, ...]]:
+        lock, table = self._shard(key)
+        with lock:
+            entry = table.get(key)
+            if entry and entry[1] > now:
+                return entry[0]
+            return None
+
+    def get_expiry(self, key: str, now: float) -> Optional[float]:
+        lock, table = self._shard(key)
+        with lock:
+            entry = table.get(key)
+            return entry[1] if entry and entry[1] > now else None
+
+    def delete(self, key: str) -> None:
+        lock, table = self._shard(key)
+        with lock:
+            table.pop(key, None)
+
+    def clear(self, prefix: str = "") -> int:
+        """Remove all keys (or those starting with prefix); returns the count"""
+        removed = 0
+        for lock, table in self._shards:
+            with lock:
+                doomed = [key for key in table if key.startswith(prefix)]
+                for key in doomed:
+                    del table[key]
+                removed += len(doomed)
+        return removed
+
+    def keys(self) -> List[str]:
+        keys = []
+        for lock, table in self._shards:
+            with lock:
+                keys.extend(table)
+        return keys
+
+    def __len__(self) -> int:
+        return sum(len(table) for _, table in self._shards)
+
+
+class SQLiteLimiterStore:
+    """
+    Host-wide state table in a WAL-mode SQLite file
+
+    Every process opening the same file shares limits. Each update is one
+    short BEGIN IMMEDIATE transaction (read, compute, upsert); expired keys
+    and keys beyond max_keys (least recently used first) are pruned
+    periodically.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_keys: int = DEFAULT_MAX_KEYS,
+                 busy_timeout_ms: int = 5000):
+        self.path = path or default_limiter_db_path()
+        self.max_keys = max_keys
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._updates = 0
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS limiter_state (
+                key TEXT PRIMARY KEY,
+                s0 REAL, s1 REAL, s2 REAL,
+                expires_at REAL NOT NULL,
+                touched_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_limiter_state_expires ON limiter_state (expires_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_limiter_state_touched ON limiter_state (touched_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+        return conn
+
+    def update(self, key: str, fn: StateUpdate, now: float):
+        """Atomically read, transform and write a key's state; returns fn's result"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT s0, s1, s2 FROM limiter_state WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            state = tuple(value for value in row if value is not None) if row else None
+            new_state, expires_at, result = fn(state, now)
+            padded = (tuple(new_state) + (None, None, None))[:3]
+            conn.execute(
+                "INSERT OR REPLACE INTO limiter_state (key, s0, s1, s2, expires_at, touched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, *padded, expires_at, now),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._updates += 1
+        if self._updates % SQLITE_PRUNE_INTERVAL == 0:
+            self.prune(now)
+        return result
+
+    def get(self, key: str, now: float) -> Optional[Tuple[float, ...]]:
+        row = self._connection().execute(
+            "SELECT s0, s1, s2 FROM limiter_state WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        return tuple(value for value in row if value is not None) if row else None
+
+    def get_expiry(self, key: str, now: float) -> Optional[float]:
+        row = self._connection().execute(
+            "SELECT expires_at FROM limiter_state WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        return row[0] if row else None
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM limiter_state WHERE key = ?", (key,))
+
+    def clear(self, prefix: str = "") -> int:
+        """Remove all keys (or those starting with prefix); returns the count"""
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        cursor = self._connection().execute(
+            "DELETE FROM limiter_state WHERE key LIKE ? ESCAPE '\\'", (escaped + "%",)
+        )
+        return cursor.rowcount
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete expired keys and the least recently used keys beyond max_keys"""
+        now = time.time() if now is None else now
+        conn = self._connection()
+        removed = conn.execute("DELETE FROM limiter_state WHERE expires_at <= ?", (now,)).rowcount
+        excess = conn.execute("SELECT COUNT(*) FROM limiter_state").fetchone()[0] - self.max_keys
+        if excess > 0:
+            removed += conn.execute(
+                "DELETE FROM limiter_state WHERE key IN "
+                "(SELECT key FROM limiter_state ORDER BY touched_at LIMIT ?)",
+                (excess,),
+            ).rowcount
+        return removed
+
+    def keys(self) -> List[str]:
+        return [row[0] for row in self._connection().execute("SELECT key FROM limiter_state")]
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM limiter_state").fetchone()[0]
+
+
+def default_limiter_db_path() -> str:
+    return os.getenv(
+        "RATE_LIMIT_DB_PATH", os.path.join(tempfile.gettempdir(), "merlin_rate_limits.sqlite3")
+    )
+
+
+_shared_store = None
+_shared_store_lock = threading.Lock()
+
+
+def get_shared_limiter_store():
+    """
+    Get the process-wide limiter store (host-wide when SQLite-backed)
+
+    Returns:
+        SQLiteLimiterStore, or MemoryLimiterStore when RATE_LIMIT_SHARED_STORE=memory
+        or the SQLite file cannot be opened
+    """
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            max_keys = int(os.getenv("RATE_LIMIT_MAX_KEYS", DEFAULT_MAX_KEYS))
+            if os.getenv("RATE_LIMIT_SHARED_STORE", "sqlite").lower() == "memory":
+                _shared_store = MemoryLimiterStore(max_keys=max_keys)
+            else:
+                try:
+                    _shared_store = SQLiteLimiterStore(max_keys=max_keys)
+                    logger.info(f"Rate limits shared through {_shared_store.path}")
+                except sqlite3.Error as e:
+                    logger.error(f"Shared rate limit store unavailable, limits are per process: {e}")
+                    _shared_store = MemoryLimiterStore(max_keys=max_keys)
+        return _shared_store
+
+
+# ============================================================================
+# ALGORITHMS
+# ============================================================================
+
+
+class GCRALimiter:
+    """
+    Generic cell rate algorithm
+
+    Equivalent to a token bucket holding `burst` tokens refilled at
+    rate/period per second, but the only state is the theoretical arrival
+    time (TAT) of the next request.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0, burst: Optional[int] = None,
+                 store=None, namespace: str = "gcra", clock: Callable[[], float] = time.time):
+        """
+        Args:
+            rate: Requests allowed per period
+            period: Period in seconds
+            burst: Requests allowed at once (defaults to rate)
+            store: State store (defaults to a private MemoryLimiterStore)
+            namespace: Key prefix separating this limiter's keys in a shared store
+            clock: Time source (seconds)
+        """
+        self.rate = rate
+        self.period = period
+        self.burst = int(burst or rate)
+        self.emission_interval = period / rate
+        self.burst_tolerance = self.emission_interval * self.burst
+        self.store = store if store is not None else MemoryLimiterStore()
+        self.namespace = namespace
+        self.clock = clock
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def check(self, key: str, cost: int = 1) -> LimitResult:
+        """Consume `cost` requests for key if allowed"""
+        interval = self.emission_interval
+        tolerance = self.burst_tolerance
+
+        def apply(state, now):
+            tat = max(state[0], now) if state else now
+            new_tat = tat + cost * interval
+            allow_at = new_tat - tolerance
+            if allow_at <= now:
+                remaining = int((now + tolerance - new_tat) / interval + 1e-9)
+                return (new_tat,), new_tat, LimitResult(True, self.burst, remaining, 0.0, new_tat - now)
+            remaining = int((now + tolerance - tat) / interval + 1e-9)
+            return (tat,), tat, LimitResult(False, self.burst, max(0, remaining), allow_at - now, tat - now)
+
+        return self.store.update(self._key(key), apply, self.clock())
+
+    def peek(self, key: str) -> LimitResult:
+        """Current allowance for key without consuming anything"""
+        now = self.clock()
+        state = self.store.get(self._key(key), now)
+        tat = max(state[0], now) if state else now
+        remaining = int((now + self.burst_tolerance - tat) / self.emission_interval + 1e-9)
+        retry_after = max(0.0, tat + self.emission_interval - self.burst_tolerance - now)
+        return LimitResult(remaining > 0, self.burst, remaining, retry_after, tat - now)
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Reset one key, or every key of this limiter"""
+        if key is None:
+            self.store.clear(f"{self.namespace}:")
+        else:
+            self.store.delete(self._key(key))
+
+
+class SlidingWindowCounterLimiter:
+    """
+    Sliding window counter
+
+    Keeps the request counts of the current and previous fixed windows and
+    estimates the count over the last `window` seconds as
+    previous * (1 - elapsed fraction of current window) + current.
+    """
+
+    def __init__(self, limit: int, window: float, store=None, namespace: str = "swc",
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            limit: Requests allowed per window
+            window: Window length in seconds
+            store: State store (defaults to a private MemoryLimiterStore)
+            namespace: Key prefix separating this limiter's keys in a shared store
+            clock: Time source (seconds)
+        """
+        self.limit = limit
+        self.window = window
+        self.store = store if store is not None else MemoryLimiterStore()
+        self.namespace = namespace
+        self.clock = clock
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _counts(self, state, now: float) -> Tuple[float, float, float]:
+        """(window_start, previous_count, current_count) rolled forward to now"""
+        window_start = now - (now % self.window)
+        if not state:
+            return window_start, 0.0, 0.0
+        stored_start, previous, current = state
+        if stored_start == window_start:
+            return window_start, previous, current
+        if stored_start == window_start - self.window:
+            return window_start, current, 0.0
+        return window_start, 0.0, 0.0
+
+    def _retry_after(self, window_start: float, previous: float, current: float,
+                     cost: int, now: float) -> float:
+        """Seconds until previous * weight + current + cost fits the limit"""
+        if current + cost <= self.limit and previous > 0:
+            weight = (self.limit - current - cost) / previous
+            return max(0.0, window_start + self.window * (1 - weight) - now)
+        # Wait for the current window to become the previous one, then for it to decay
+        weight = (self.limit - cost) / current if current else 1.0
+        return max(0.0, window_start + self.window * (2 - max(0.0, weight)) - now)
+
+    def check(self, key: str, cost: int = 1) -> LimitResult:
+        """Count `cost` requests for key if allowed"""
+        def apply(state, now):
+            window_start, previous, current = self._counts(state, now)
+            weight = 1 - (now - window_start) / self.window
+            estimated = previous * weight + current
+            expires_at = window_start + 2 * self.window
+            reset_after = expires_at - now
+
+            if estimated + cost <= self.limit:
+                current += cost
+                remaining = int(self.limit - estimated - cost)
+                return (window_start, previous, current), expires_at, LimitResult(
+                    True, self.limit, remaining, 0.0, reset_after)
+
+            retry_after = self._retry_after(window_start, previous, current, cost, now)
+            return (window_start, previous, current), expires_at, LimitResult(
+                False, self.limit, 0, retry_after, reset_after)
+
+        return self.store.update(self._key(key), apply, self.clock())
+
+    def peek(self, key: str) -> LimitResult:
+        """Current allowance for key without counting a request"""
+        now = self.clock()
+        window_start, previous, current = self._counts(self.store.get(self._key(key), now), now)
+        estimated = previous * (1 - (now - window_start) / self.window) + current
+        remaining = max(0, int(self.limit - estimated))
+        retry_after = 0.0 if remaining else self._retry_after(window_start, previous, current, 1, now)
+        return LimitResult(remaining > 0, self.limit, remaining, retry_after,
+                           window_start + 2 * self.window - now)
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Reset one key, or every key of this limiter"""
+        if key is None:
+            self.store.clear(f"{self.namespace}:")
+        else:
+            self.store.delete(self._key(key))
@@ -0,0 +1,90 @@
+"""
+Flask-Limiter Storage over the Rate Limiter Engine
+
+Registers limits storage schemes backed by modules.security.limiter_engine:
+
+    merlin+sqlite://   Shared SQLite store (all workers on the host share counters)
+    merlin+memory://   Bounded per-process store
+
+Importing this module registers the schemes (limits' StorageRegistry picks up
+every Storage subclass), so rate_limit_manager imports it before creating the
+Limiter. Counters are fixed windows, one row per key, pruned by the
+monitor's cleanup loop.
+"""
+
+import time
+from typing import List, Optional
+
+from limits.storage import Storage
+
+from modules.security.limiter_engine import (
+    DEFAULT_MAX_KEYS,
+    MemoryLimiterStore,
+    get_shared_limiter_store,
+)
+
+KEY_PREFIX = "flask_limiter:"
+
+
+class EngineStorage(Storage):
+    """limits storage keeping fixed-window counters in a limiter engine store"""
+
+    STORAGE_SCHEME = ["merlin+sqlite", "merlin+memory"]
+
+    def __init__(self, uri: Optional[str] = None, wrap_exceptions: bool = False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        if uri and uri.startswith("merlin+memory"):
+            self.engine_store = MemoryLimiterStore(max_keys=int(options.get("max_keys", DEFAULT_MAX_KEYS)))
+        else:
+            self.engine_store = get_shared_limiter_store()
+
+    @property
+    def base_exceptions(self):
+        import sqlite3
+
+        return sqlite3.Error
+
+    def incr(self, key: str, expiry: int, elastic_expiry: bool = False, amount: int = 1) -> int:
+        def apply(state, now):
+            if state:
+                count, expires_at = state
+                count += amount
+            else:
+                count, expires_at = amount, now + expiry
+            if elastic_expiry:
+                expires_at = now + expiry
+            return (count, expires_at), expires_at, int(count)
+
+        return self.engine_store.update(KEY_PREFIX + key, apply, time.time())
+
+    def get(self, key: str) -> int:
+        state = self.engine_store.get(KEY_PREFIX + key, time.time())
+        return int(state[0]) if state else 0
+
+    def get_expiry(self, key: str) -> int:
+        now = time.time()
+        expires_at = self.engine_store.get_expiry(KEY_PREFIX + key, now)
+        return int(expires_at if expires_at is not None else now)
+
+    def check(self) -> bool:
+        try:
+            len(self.engine_store)
+            return True
+        except Exception:
+            return False
+
+    def reset(self) -> Optional[int]:
+        return self.engine_store.clear(KEY_PREFIX)
+
+    def clear(self, key: str) -> None:
+        self.engine_store.delete(KEY_PREFIX + key)
+
+    def keys(self) -> List[str]:
+        """Rate limit keys currently stored (used by rate_limit_monitor)"""
+        return [key[len(KEY_PREFIX):] for key in self.engine_store.keys() if key.startswith(KEY_PREFIX)]
+
+    def prune(self) -> int:
+        """Drop expired keys and keys beyond the store's bound"""
+        if hasattr(self.engine_store, "prune"):
+            return self.engine_store.prune()
+        return 0
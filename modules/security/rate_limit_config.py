@@ -54,7 +54,7 @@ ALERT_THRESHOLD_MB = 40  # Alert when usage exceeds this
 CRITICAL_THRESHOLD_MB = 45  # Critical alert threshold
 
 # Storage configuration
-STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")  # Default to in-memory
+STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "merlin+sqlite://")  # Shared by all workers on the host
 STORAGE_OPTIONS = {
     "memory": {
         "per_method": False,  # Don't differentiate GET vs POST in same endpoint
@@ -297,6 +297,23 @@ validate_configuration()
 # ============================================================================
 
 
+def get_storage_type(uri: str) -> str:
+    """
+    Describe a rate limit storage URI.
+
+    Args:
+        uri: Flask-Limiter storage URI
+
+    Returns:
+        Storage type name
+    """
+    if uri.startswith("merlin+sqlite"):
+        return "shared-sqlite"
+    if "memory://" in uri:
+        return "in-memory"
+    return "redis"
+
+
 def get_configuration_summary() -> Dict[str, Any]:
     """
     Get human-readable configuration summary.
@@ -307,7 +324,7 @@ def get_configuration_summary() -> Dict[str, Any]:
     return {
         "storage": {
             "uri": STORAGE_URI,
-            "type": "in-memory" if "memory://" in STORAGE_URI else "redis",
+            "type": get_storage_type(STORAGE_URI),
             "max_memory_mb": MAX_MEMORY_MB,
         },
         "rate_limits": {
@@ -1,7 +1,8 @@
 """
 Rate Limit Manager for Job Application System
 
-Centralized rate limiting using Flask-Limiter with in-memory storage.
+Centralized rate limiting using Flask-Limiter with storage shared across workers
+(see modules/security/limiter_storage.py).
 Provides decorators, key functions, error handlers, and monitoring integration.
 
 Version: 1.0.0
@@ -18,6 +19,7 @@ from flask_limiter.util import get_remote_address
 
 from modules.security import rate_limit_config as config
 from modules.security import rate_limit_monitor as monitor
+from modules.security import limiter_storage  # noqa: F401 - registers merlin+sqlite:// and merlin+memory://
 
 logger = logging.getLogger(__name__)
 
@@ -244,7 +246,7 @@ def init_rate_limiter(app: Flask) -> Limiter:
     Initialize Flask-Limiter with application.
 
     Configures:
-    - In-memory storage (or Redis if configured)
+    - Shared SQLite storage (or in-memory/Redis if configured)
     - Custom key function (per-user + per-IP)
     - Error handlers
     - Default rate limits
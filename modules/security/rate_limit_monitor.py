@@ -155,6 +155,8 @@ def get_key_distribution(storage) -> Dict[str, int]:
             keys = list(storage.storage.keys())
         elif hasattr(storage, "_data"):
             keys = list(storage._data.keys())
+        elif hasattr(storage, "keys"):
+            keys = list(storage.keys())
 
         # Categorize keys
         for key in keys:
@@ -280,8 +282,10 @@ def cleanup_expired_keys(storage) -> int:
         keys_before = get_active_key_count(storage)
 
         # Flask-Limiter in-memory storage doesn't have explicit cleanup
-        # Keys expire automatically when checked
-        # This function mainly tracks stats
+        # Keys expire automatically when checked; engine-backed storage
+        # (limiter_storage.EngineStorage) prunes expired and excess keys
+        if hasattr(storage, "prune"):
+            storage.prune()
 
         keys_after = get_active_key_count(storage)
         keys_removed = max(0, keys_before - keys_after)
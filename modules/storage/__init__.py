@@ -24,6 +24,10 @@ Quick Start:
     # Retrieve a file
     content = storage.get('my_document.docx')
 
+    # Stream large files instead of holding them in memory
+    with storage.open_write('my_document.docx') as writer:
+        shutil.copyfileobj(source, writer)
+
     # Check if file exists
     if storage.exists('my_document.docx'):
         print("File exists!")
@@ -38,6 +42,10 @@ Configuration:
     STORAGE_BACKEND=local
     LOCAL_STORAGE_PATH=/path/to/storage
 
+    # Save locally, replicate to Google Drive in the background
+    STORAGE_BACKEND=google_drive
+    STORAGE_WRITE_BEHIND=true
+
     # Future: Use AWS S3
     STORAGE_BACKEND=s3
     S3_BUCKET_NAME=my-bucket
@@ -47,13 +55,18 @@ Configuration:
 Module Structure:
 - storage_backend.py: Abstract base class defining storage interface
 - local_storage.py: Local filesystem storage implementation
+- write_behind_storage.py: Local-first storage with background replication
+- content_store.py: Content-addressed, deduplicating document store
 - storage_factory.py: Factory function for creating storage instances
 - __init__.py: Module exports and documentation
 """
 
-from .storage_backend import StorageBackend
+from .storage_backend import StorageBackend, StorageWriter
 from .local_storage import LocalStorageBackend
+from .write_behind_storage import WriteBehindStorageBackend
+from .content_store import ContentAddressedStore, content_digest
 from .storage_factory import (
+    get_content_store,
     get_storage_backend,
     reset_storage_instance,
     validate_storage_configuration,
@@ -70,9 +83,14 @@ except ImportError:
 __all__ = [
     # Abstract base class
     "StorageBackend",
+    "StorageWriter",
     # Implementations
     "LocalStorageBackend",
+    "WriteBehindStorageBackend",
+    "ContentAddressedStore",
+    "content_digest",
     # Factory functions
+    "get_content_store",
     "get_storage_backend",
     "reset_storage_instance",
     "validate_storage_configuration",
@@ -0,0 +1,460 @@
+"""
+Content-Addressed Document Store
+
+This module stores generated documents once per unique content. Blobs are
+keyed by SHA-256, each application's filename is an alias (hard link) to its
+blob, and blobs are reference counted by application so garbage collection
+only ever deletes content no application still uses.
+
+Features:
+- One physical copy per unique document, uploaded under its digest
+- Per-application filenames as hard links, with symlink/copy fallbacks
+- Reference counting by application ID with age- and record-based release
+- GC that deletes only unreferenced blobs, locally and in the remote backend
+- Digest ignores .docx timestamps, so regenerated identical documents match
+
+Directory Structure:
+    /storage/content_store/
+        manifest.json                      blob and reference index
+        /blobs/ab/ab12...ef.docx           one file per unique document
+        /documents/resume_app1.docx        hard link to its blob
+
+Usage Example:
+    from modules.storage.content_store import ContentAddressedStore
+
+    store = ContentAddressedStore()
+    result = store.put('/tmp/resume.docx', 'resume_app1.docx', application_id='app1')
+    print(result['deduplicated'], result['file_path'])
+
+    store.release('app1')      # application no longer needs its documents
+    store.gc()                 # delete blobs with no references
+
+Note:
+    Every manifest change holds an exclusive flock on manifest.lock and
+    re-reads manifest.json first, so gunicorn workers and the nightly
+    workflow can share a store directory without losing each other's
+    references.
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .storage_backend import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per chunk when hashing and copying
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Office document parts whose timestamps change on every generation
+_VOLATILE_CORE_PROPERTIES = re.compile(
+    rb"<(dcterms:created|dcterms:modified|cp:lastPrinted)\b[^>]*>[^<]*</\1>"
+)
+
+
+def content_digest(path: str) -> str:
+    """
+    SHA-256 of a document's content
+
+    For .docx (and other Office Open XML) files the digest covers every
+    package part in name order, with the created/modified/printed timestamps
+    removed from docProps/core.xml; zip entry dates are not part of the
+    digest. Two generations of the same document therefore share a digest.
+    Other files are hashed byte for byte.
+
+    Args:
+        path (str): File to hash
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as package:
+            for name in sorted(package.namelist()):
+                digest.update(name.encode("utf-8") + b"\x00")
+                data = package.read(name)
+                if name == "docProps/core.xml":
+                    data = _VOLATILE_CORE_PROPERTIES.sub(b"", data)
+                digest.update(hashlib.sha256(data).digest())
+        return digest.hexdigest()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContentAddressedStore:
+    """
+    Deduplicating document store with per-application references
+
+    Attributes:
+        base_path (Path): Root directory of the store
+        backend (StorageBackend): Optional backend that receives one copy of each blob
+    """
+
+    def __init__(self, base_path: Optional[str] = None, backend: Optional[StorageBackend] = None):
+        """
+        Initialize the store, creating its directories
+
+        Args:
+            base_path (str, optional): Root directory.
+                Defaults to './storage/content_store'
+            backend (StorageBackend, optional): Remote backend for blob uploads
+        """
+        if base_path is None:
+            base_path = os.path.join(os.getcwd(), "storage", "content_store")
+
+        self.base_path = Path(base_path).resolve()
+        self.blob_dir = self.base_path / "blobs"
+        self.alias_dir = self.base_path / "documents"
+        self.manifest_path = self.base_path / "manifest.json"
+        self.lock_path = self.base_path / "manifest.lock"
+        self.backend = backend
+
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.alias_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._manifest = self._load_manifest()
+
+        logger.info(
+            f"Content store initialized at {self.base_path} "
+            f"({len(self._manifest['blobs'])} blobs)"
+        )
+
+    def put(self, source_path: str, filename: str, application_id: str,
+            metadata: Optional[dict] = None, replace_source: bool = False) -> dict:
+        """
+        Store a document for an application
+
+        The blob is written (and uploaded to the backend) only if its content
+        is new; the filename becomes an alias of the blob and the application
+        gains a reference to it. Re-putting a filename moves its reference to
+        the new content. The upload runs outside the manifest lock; its
+        SHA-256 name makes a repeated upload of the same blob harmless.
+
+        Args:
+            source_path (str): Generated document on disk
+            filename (str): Per-application filename (no directories)
+            application_id (str): Application that references the document
+            metadata (dict, optional): Passed to the backend on upload
+            replace_source (bool): Replace source_path with a link to the blob,
+                so the original path stays valid without a second copy
+
+        Returns:
+            dict: Storage information (file_path of the alias, sha256,
+                deduplicated, blob_path and the backend result of the blob)
+
+        Raises:
+            ValueError: If filename is invalid
+            FileNotFoundError: If source_path does not exist
+        """
+        self._validate_filename(filename)
+        sha256 = content_digest(source_path)
+        extension = Path(filename).suffix.lower()
+
+        with self._locked_manifest():
+            blob = self._manifest["blobs"].get(sha256)
+            deduplicated = blob is not None and self._blob_path(sha256, blob["ext"]).exists()
+
+            if not deduplicated:
+                blob = self._write_blob(source_path, sha256, extension)
+                self._manifest["blobs"][sha256] = blob
+
+            blob_path = self._blob_path(sha256, blob["ext"])
+            alias_path = self.alias_dir / filename
+            self._link_alias(blob_path, alias_path)
+            if replace_source:
+                self._link_alias(blob_path, Path(source_path))
+
+            refs = self._manifest["refs"].setdefault(application_id, {})
+            refs[filename] = {"sha256": sha256, "created_at": datetime.now().isoformat()}
+            self._save_manifest()
+            remote = blob.get("remote")
+
+        if self.backend is not None and remote is None:
+            remote = self._upload_blob(sha256, blob["ext"], metadata)
+            if remote is not None:
+                self._record_upload(sha256, remote)
+
+        logger.info(
+            f"Stored {filename} for application {application_id} "
+            f"({'deduplicated' if deduplicated else 'new blob'} {sha256[:12]})"
+        )
+
+        return {
+            "file_path": str(alias_path),
+            "filename": filename,
+            "storage_type": "content_addressed",
+            "file_size": blob["size"],
+            "timestamp": datetime.now().isoformat(),
+            "local_path": str(alias_path),
+            "sha256": sha256,
+            "deduplicated": deduplicated,
+            "blob_path": str(blob_path),
+            "remote": remote,
+        }
+
+    def get_path(self, filename: str) -> Optional[str]:
+        """Path of a stored document by its per-application filename"""
+        self._validate_filename(filename)
+        path = self.alias_dir / filename
+        return str(path) if path.exists() else None
+
+    def release(self, application_id: str) -> int:
+        """
+        Drop an application's references and aliases
+
+        Blobs are kept until gc() finds them unreferenced.
+
+        Args:
+            application_id (str): Application whose documents are no longer needed
+
+        Returns:
+            int: Number of references released
+        """
+        with self._locked_manifest():
+            refs = self._manifest["refs"].pop(application_id, {})
+            for filename in refs:
+                self._remove_alias(filename)
+            if refs:
+                self._save_manifest()
+        return len(refs)
+
+    def gc(self, active_application_ids: Optional[Iterable[str]] = None,
+           max_age_hours: Optional[float] = None,
+           listed_at: Optional[datetime] = None) -> dict:
+        """
+        Delete blobs that no application references
+
+        Args:
+            active_application_ids (iterable, optional): Application records that
+                still exist; references held by any other application are
+                released first
+            max_age_hours (float, optional): Release references older than this
+            listed_at (datetime, optional): When active_application_ids was read;
+                references created later are kept, since their application may
+                not have been in the list yet
+
+        Returns:
+            dict: released_references, deleted_blobs, freed_bytes, remaining_blobs
+        """
+        with self._locked_manifest():
+            released = 0
+            cutoff = datetime.now() - timedelta(hours=max_age_hours) if max_age_hours is not None else None
+            active = set(active_application_ids) if active_application_ids is not None else None
+
+            for application_id in list(self._manifest["refs"]):
+                refs = self._manifest["refs"][application_id]
+                if active is not None and application_id not in active:
+                    expired = [name for name, ref in refs.items()
+                               if listed_at is None or datetime.fromisoformat(ref["created_at"]) < listed_at]
+                elif cutoff is not None:
+                    expired = [name for name, ref in refs.items()
+                               if datetime.fromisoformat(ref["created_at"]) < cutoff]
+                else:
+                    expired = []
+
+                for filename in expired:
+                    del refs[filename]
+                    self._remove_alias(filename)
+                released += len(expired)
+                if not refs:
+                    del self._manifest["refs"][application_id]
+
+            referenced = {
+                ref["sha256"] for refs in self._manifest["refs"].values() for ref in refs.values()
+            }
+            unreferenced = [sha for sha in self._manifest["blobs"] if sha not in referenced]
+
+            freed = 0
+            remote_names = []
+            for sha256 in unreferenced:
+                blob = self._manifest["blobs"].pop(sha256)
+                try:
+                    self._blob_path(sha256, blob["ext"]).unlink()
+                except FileNotFoundError:
+                    pass
+                freed += blob["size"]
+                if blob.get("remote"):
+                    remote_names.append(self._remote_name(sha256, blob["ext"]))
+
+            if remote_names and self.backend is not None:
+                try:
+                    self.backend.delete_many(remote_names)
+                except Exception as e:
+                    logger.error(f"Failed to delete {len(remote_names)} blobs from {self.backend.backend_name}: {e}")
+
+            self._save_manifest()
+            remaining = len(self._manifest["blobs"])
+
+        return {
+            "released_references": released,
+            "deleted_blobs": len(unreferenced),
+            "freed_bytes": freed,
+            "remaining_blobs": remaining,
+        }
+
+    def get_stats(self) -> dict:
+        """
+        Get deduplication statistics
+
+        Returns:
+            dict: blobs, references, physical_bytes (stored once),
+                logical_bytes (as if every reference were a copy), saved_bytes
+        """
+        with self._locked_manifest():
+            blobs = self._manifest["blobs"]
+            refs = [ref["sha256"] for refs in self._manifest["refs"].values() for ref in refs.values()]
+            physical = sum(blob["size"] for blob in blobs.values())
+            logical = sum(blobs[sha]["size"] for sha in refs if sha in blobs)
+            return {
+                "blobs": len(blobs),
+                "references": len(refs),
+                "physical_bytes": physical,
+                "logical_bytes": logical,
+                "saved_bytes": max(0, logical - physical),
+            }
+
+    def _write_blob(self, source_path: str, sha256: str, extension: str) -> dict:
+        """Copy a new blob into place atomically"""
+        blob_path = self._blob_path(sha256, extension)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(source_path, "rb") as source, tempfile.NamedTemporaryFile(
+            dir=blob_path.parent, suffix=".partial", delete=False
+        ) as partial:
+            shutil.copyfileobj(source, partial, HASH_CHUNK_SIZE)
+        os.replace(partial.name, blob_path)
+
+        return {
+            "ext": extension,
+            "size": blob_path.stat().st_size,
+            "created_at": datetime.now().isoformat(),
+            "remote": None,
+        }
+
+    def _upload_blob(self, sha256: str, extension: str, metadata: Optional[dict]) -> Optional[dict]:
+        """Upload a blob to the backend; returns the backend result, or None on failure"""
+        try:
+            with open(self._blob_path(sha256, extension), "rb") as source, self.backend.open_write(
+                self._remote_name(sha256, extension), metadata
+            ) as writer:
+                shutil.copyfileobj(source, writer, HASH_CHUNK_SIZE)
+            return writer.result
+        except Exception as e:
+            # The local blob is authoritative; the upload is retried on the next put
+            logger.error(f"Failed to upload blob {sha256[:12]} to {self.backend.backend_name}: {e}")
+            return None
+
+    def _record_upload(self, sha256: str, remote: dict) -> None:
+        """Record a finished upload in the manifest"""
+        with self._locked_manifest():
+            blob = self._manifest["blobs"].get(sha256)
+            if blob is None:
+                # Collected while uploading; the same name is overwritten if the content returns
+                logger.warning(f"Blob {sha256[:12]} was collected during its upload")
+                return
+            if not blob.get("remote"):
+                blob["remote"] = remote
+                self._save_manifest()
+
+    def _link_alias(self, blob_path: Path, alias_path: Path) -> None:
+        """Point a per-application filename at a blob (hard link, symlink, or copy)"""
+        partial = alias_path.with_name(f".{alias_path.name}.partial")
+        try:
+            partial.unlink()
+        except FileNotFoundError:
+            pass
+
+        try:
+            os.link(blob_path, partial)
+        except OSError:
+            try:
+                os.symlink(blob_path, partial)
+            except OSError:
+                shutil.copyfile(blob_path, partial)
+        os.replace(partial, alias_path)
+
+    def _remove_alias(self, filename: str) -> None:
+        """Remove an alias unless another application still references the filename"""
+        if any(filename in refs for refs in self._manifest["refs"].values()):
+            return
+        try:
+            (self.alias_dir / filename).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _blob_path(self, sha256: str, extension: str) -> Path:
+        return self.blob_dir / sha256[:2] / f"{sha256}{extension}"
+
+    @staticmethod
+    def _remote_name(sha256: str, extension: str) -> str:
+        return f"blob_{sha256}{extension}"
+
+    @staticmethod
+    def _validate_filename(filename: str) -> None:
+        if not filename or ".." in filename or "/" in filename or "\\" in filename or "\x00" in filename:
+            raise ValueError(f"Invalid filename '{filename}'")
+
+    @contextmanager
+    def _locked_manifest(self):
+        """
+        Hold the manifest exclusively across threads and processes
+
+        The manifest is re-read after the flock is taken, so changes saved by
+        other processes are never overwritten and gc() sees their references.
+        """
+        with self._lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+
+            with open(self.lock_path, "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    self._manifest = self._load_manifest()
+                    self._lock_depth = 1
+                    try:
+                        yield
+                    finally:
+                        self._lock_depth = 0
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _load_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {"blobs": {}, "refs": {}}
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        manifest.setdefault("blobs", {})
+        manifest.setdefault("refs", {})
+        return manifest
+
+    def _save_manifest(self) -> None:
+        """Write the manifest atomically (caller holds _locked_manifest)"""
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.base_path, suffix=".partial", delete=False, encoding="utf-8"
+        ) as partial:
+            json.dump(self._manifest, partial)
+        os.replace(partial.name, self.manifest_path)
@@ -11,6 +11,11 @@ Features:
 - Version-tagged filenames (merlin_v4.1_document.docx)
 - Private file permissions (owner-only access)
 - Google Drive file ID and link tracking
+- Resumable, chunked uploads with progress callbacks (streamed, never fully buffered)
+- Metadata cache: folder IDs and a name -> file ID index built from a fully
+  paginated listing, kept fresh through the Drive changes API (or a relist
+  after FILE_INDEX_TTL_SECONDS), so exists/get/delete/list need no lookup query
+- Batched deletes through the Drive batch endpoint
 - Automatic fallback to local storage on errors
 
 Prerequisites:
@@ -32,9 +37,13 @@ Usage Example:
 
 import os
 import io
+import fnmatch
 import logging
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import BinaryIO, Callable, Optional, List, Dict
 from datetime import datetime
 
 # Google API imports
@@ -50,13 +59,23 @@ try:
 except ImportError:
     GOOGLE_APIS_AVAILABLE = False
 
-from .storage_backend import StorageBackend
+from .storage_backend import SPOOL_MAX_BYTES, StorageBackend, StorageWriter
 
 logger = logging.getLogger(__name__)
 
 # OAuth 2.0 scopes - only access files created by this app
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+# Resumable upload chunk size (Drive requires a multiple of 256 KB)
+UPLOAD_CHUNK_SIZE = 4 * 256 * 1024
+
+# Seconds the file index is trusted before it is synced with the changes API
+FILE_INDEX_TTL_SECONDS = 30
+
+# Files per listing page (Drive maximum) and requests per batch call (Drive limit)
+LIST_PAGE_SIZE = 1000
+BATCH_MAX_REQUESTS = 100
+
 
 class GoogleDriveStorageBackend(StorageBackend):
     """
@@ -72,6 +91,7 @@ class GoogleDriveStorageBackend(StorageBackend):
         token_path (Path): Path to stored OAuth token
         service: Google Drive API service instance
         folder_cache (dict): Cache of folder IDs to avoid repeated searches
+        index_ttl (float): Seconds the name -> file ID index is trusted before a sync
     """
 
     def __init__(self,
@@ -130,9 +150,15 @@ class GoogleDriveStorageBackend(StorageBackend):
                          './storage/google_drive_token.json')
             )
 
-        # Initialize service and folder cache
+        # Initialize service and metadata caches
         self.service = None
         self.folder_cache: Dict[str, str] = {}
+        self.index_ttl = FILE_INDEX_TTL_SECONDS
+        self._version_folder_id: Optional[str] = None
+        self._file_index: Dict[str, str] = {}
+        self._index_expires_at: Optional[float] = None
+        self._changes_token: Optional[str] = None
+        self._index_lock = threading.RLock()
 
         # Authenticate and build service
         self._authenticate()
@@ -293,6 +319,9 @@ class GoogleDriveStorageBackend(StorageBackend):
         Returns:
             str: Version folder ID
         """
+        if self._version_folder_id:
+            return self._version_folder_id
+
         # Create root folder
         root_folder_id = self._get_or_create_folder("Merlin Documents")
 
@@ -303,8 +332,134 @@ class GoogleDriveStorageBackend(StorageBackend):
             root_folder_id
         )
 
+        self._version_folder_id = version_folder_id
         return version_folder_id
 
+    def _list_folder(self, folder_id: str) -> Dict[str, str]:
+        """
+        List every file in a folder, following nextPageToken
+
+        Args:
+            folder_id (str): Folder to list
+
+        Returns:
+            Dict[str, str]: Drive filename -> file ID
+        """
+        files = {}
+        page_token = None
+        while True:
+            results = self.service.files().list(
+                q=f"'{folder_id}' in parents and trashed=false",
+                spaces='drive',
+                fields='nextPageToken, files(id, name)',
+                pageSize=LIST_PAGE_SIZE,
+                pageToken=page_token
+            ).execute()
+
+            for item in results.get('files', []):
+                files.setdefault(item['name'], item['id'])
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                return files
+
+    def _refresh_file_index(self, force: bool = False) -> None:
+        """
+        Make sure the name -> file ID index is current
+
+        Within index_ttl the index is used as is. After that, changes since the
+        last sync are applied from the Drive changes API (one request when
+        nothing changed); the folder is listed in full on first use, when
+        forced, or when the changes feed is unavailable.
+
+        Args:
+            force (bool): Relist the folder regardless of TTL
+        """
+        with self._index_lock:
+            now = time.monotonic()
+            if not force and self._index_expires_at is not None and now < self._index_expires_at:
+                return
+
+            if not force and self._index_expires_at is not None and self._changes_token:
+                try:
+                    self._apply_changes()
+                    self._index_expires_at = now + self.index_ttl
+                    return
+                except HttpError as e:
+                    logger.warning(f"Drive changes sync failed, relisting folder: {e}")
+
+            folder_id = self._ensure_version_folder()
+
+            # Take the changes token before listing so no change is missed
+            try:
+                self._changes_token = self.service.changes().getStartPageToken().execute().get('startPageToken')
+            except HttpError as e:
+                logger.warning(f"Drive changes API unavailable, using TTL refresh only: {e}")
+                self._changes_token = None
+
+            self._file_index = self._list_folder(folder_id)
+            self._index_expires_at = now + self.index_ttl
+            logger.debug(f"Indexed {len(self._file_index)} files in Google Drive version folder")
+
+    def _apply_changes(self) -> None:
+        """Apply changes since the stored changes token to the file index"""
+        folder_id = self._ensure_version_folder()
+        page_token = self._changes_token
+
+        while page_token:
+            results = self.service.changes().list(
+                pageToken=page_token,
+                spaces='drive',
+                fields='nextPageToken, newStartPageToken, changes(fileId, removed, file(name, parents, trashed))',
+                pageSize=LIST_PAGE_SIZE
+            ).execute()
+
+            for change in results.get('changes', []):
+                file_id = change.get('fileId')
+                # Renames and moves: drop the old entry for this ID first
+                for name in [name for name, indexed_id in self._file_index.items() if indexed_id == file_id]:
+                    del self._file_index[name]
+
+                file = change.get('file') or {}
+                if (not change.get('removed') and not file.get('trashed')
+                        and folder_id in file.get('parents', [])):
+                    self._file_index[file['name']] = file_id
+
+            if results.get('newStartPageToken'):
+                self._changes_token = results['newStartPageToken']
+                return
+            page_token = results.get('nextPageToken')
+
+    def invalidate_cache(self) -> None:
+        """Drop cached metadata; the next operation relists the version folder"""
+        with self._index_lock:
+            self._file_index = {}
+            self._index_expires_at = None
+            self._changes_token = None
+
+    def _lookup_file_id(self, filename: str) -> Optional[str]:
+        """
+        Resolve a filename to its Drive file ID from the index
+
+        Args:
+            filename (str): Original filename, or a file ID (no extension)
+
+        Returns:
+            str: File ID, or None if the file does not exist
+        """
+        # Google Drive IDs don't have extensions
+        if '.' not in filename:
+            return filename
+
+        self._refresh_file_index()
+        with self._index_lock:
+            return self._file_index.get(self._format_filename(filename))
+
+    def _forget_file(self, filename: str) -> None:
+        """Remove a filename from the index (after delete or a 404)"""
+        with self._index_lock:
+            self._file_index.pop(self._format_filename(filename), None)
+
     def _format_filename(self, filename: str) -> str:
         """
         Format filename with application version prefix
@@ -340,120 +495,205 @@ class GoogleDriveStorageBackend(StorageBackend):
         self.validate_filename(filename)
 
         try:
-            # Ensure folder structure exists
-            folder_id = self._ensure_version_folder()
+            # Upload in resumable chunks to the version folder
+            return self._upload_stream(filename, io.BytesIO(content), len(content))
 
-            # Format filename with version
-            formatted_filename = self._format_filename(filename)
+        except HttpError as e:
+            logger.error(f"Google Drive upload failed: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error during upload: {e}")
+            raise
 
-            # Prepare file metadata
-            file_metadata = {
-                'name': formatted_filename,
-                'parents': [folder_id]
-            }
+    def _upload_stream(self, filename: str, stream: BinaryIO, size: int,
+                       progress_callback: Optional[Callable[[int, int], None]] = None) -> dict:
+        """
+        Upload a stream to the version folder as a resumable, chunked upload
 
-            # Create media upload
-            media = MediaIoBaseUpload(
-                io.BytesIO(content),
-                mimetype='application/octet-stream',
-                resumable=True
-            )
+        Each chunk is a separate request, so memory stays at one chunk and an
+        interrupted chunk is retried (num_retries) without restarting the file.
 
-            # Upload file
-            file = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, name, webViewLink, createdTime, size'
-            ).execute()
+        Args:
+            filename (str): Original filename (version prefix is added)
+            stream (BinaryIO): Seekable stream positioned at the start of the content
+            size (int): Content size in bytes (reported if Drive omits it)
+            progress_callback (callable, optional): Called with (bytes_uploaded, total_bytes)
 
-            file_id = file['id']
-            web_link = file['webViewLink']
-            file_size = int(file.get('size', len(content)))
+        Returns:
+            dict: Storage information (same keys as save())
+        """
+        folder_id = self._ensure_version_folder()
+        formatted_filename = self._format_filename(filename)
+
+        file_metadata = {
+            'name': formatted_filename,
+            'parents': [folder_id]
+        }
+
+        media = MediaIoBaseUpload(
+            stream,
+            mimetype='application/octet-stream',
+            chunksize=UPLOAD_CHUNK_SIZE,
+            resumable=True
+        )
 
-            logger.info(
-                f"Uploaded to Google Drive: {formatted_filename} "
-                f"(ID: {file_id}, Size: {file_size} bytes)"
-            )
+        request = self.service.files().create(
+            body=file_metadata,
+            media_body=media,
+            fields='id, name, webViewLink, createdTime, size'
+        )
 
-            return {
-                'file_path': file_id,  # Use file ID as path
-                'filename': formatted_filename,
-                'storage_type': 'google_drive',
-                'file_size': file_size,
-                'timestamp': datetime.now().isoformat(),
-                'google_drive_file_id': file_id,
-                'google_drive_link': web_link,
-                'folder_path': f"/Merlin Documents/v{self.app_version}/"
-            }
+        file = None
+        while file is None:
+            status, file = request.next_chunk(num_retries=3)
+            if status and progress_callback:
+                progress_callback(status.resumable_progress, status.total_size or size)
+        if progress_callback:
+            progress_callback(size, size)
 
-        except HttpError as e:
-            logger.error(f"Google Drive upload failed: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error during upload: {e}")
-            raise
+        file_id = file['id']
+        web_link = file['webViewLink']
+        file_size = int(file.get('size', size))
 
-    def get(self, filename: str) -> bytes:
+        with self._index_lock:
+            self._file_index[formatted_filename] = file_id
+
+        logger.info(
+            f"Uploaded to Google Drive: {formatted_filename} "
+            f"(ID: {file_id}, Size: {file_size} bytes)"
+        )
+
+        return {
+            'file_path': file_id,  # Use file ID as path
+            'filename': formatted_filename,
+            'storage_type': 'google_drive',
+            'file_size': file_size,
+            'timestamp': datetime.now().isoformat(),
+            'google_drive_file_id': file_id,
+            'google_drive_link': web_link,
+            'folder_path': f"/Merlin Documents/v{self.app_version}/"
+        }
+
+    def open_write(self, filename: str, metadata: Optional[dict] = None,
+                   progress_callback: Optional[Callable[[int, int], None]] = None) -> StorageWriter:
         """
-        Retrieve file from Google Drive
+        Open a file for streaming writes
+
+        Bytes are spooled (in memory up to SPOOL_MAX_BYTES, then to a
+        temporary file) and uploaded in resumable chunks when the writer is
+        closed, so large documents are never held in memory whole.
 
         Args:
-            filename (str): Name of file to retrieve (can be file ID or filename)
+            filename (str): Name of file to save
+            metadata (dict, optional): Additional metadata
+            progress_callback (callable, optional): Called with (bytes_uploaded, total_bytes)
 
         Returns:
-            bytes: File content
+            StorageWriter: Writable file-like object; ``result`` matches save()
+
+        Raises:
+            ValueError: If filename is invalid
+        """
+        self.validate_filename(filename)
+
+        def commit(stream: BinaryIO, size: int) -> dict:
+            try:
+                stream.seek(0)
+                return self._upload_stream(filename, stream, size, progress_callback)
+            except HttpError as e:
+                logger.error(f"Google Drive upload failed: {e}")
+                raise
+            finally:
+                stream.close()
+
+        return StorageWriter(tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES), commit)
+
+    def open_read(self, filename: str) -> BinaryIO:
+        """
+        Open a file for streaming reads
+
+        The file is downloaded in chunks into a spooled temporary file, which
+        is returned positioned at the start.
+
+        Args:
+            filename (str): Name of file to read (can be file ID or filename)
+
+        Returns:
+            BinaryIO: Readable file-like object (close it when done)
 
         Raises:
             FileNotFoundError: If file not found
             HttpError: If download fails
         """
-        # Validate filename
         self.validate_filename(filename)
 
+        buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
         try:
-            # Check if filename is actually a file ID (Google Drive IDs don't have extensions)
-            if '.' not in filename:
-                file_id = filename
-            else:
-                # Search for file by name
-                formatted_filename = self._format_filename(filename)
-                folder_id = self._ensure_version_folder()
-
-                query = (
-                    f"name='{formatted_filename}' and '{folder_id}' in parents "
-                    f"and trashed=false"
-                )
+            self._download_to(filename, buffer)
+        except BaseException:
+            buffer.close()
+            raise
+        buffer.seek(0)
+        return buffer
 
-                results = self.service.files().list(
-                    q=query,
-                    spaces='drive',
-                    fields='files(id, name)'
-                ).execute()
+    def _download_to(self, filename: str, destination: BinaryIO) -> None:
+        """
+        Download a file into a writable stream in chunks
 
-                items = results.get('files', [])
-                if not items:
-                    raise FileNotFoundError(f"File not found: {filename}")
+        Args:
+            filename (str): File ID or original filename
+            destination (BinaryIO): Stream receiving the content
 
-                file_id = items[0]['id']
+        Raises:
+            FileNotFoundError: If file not found
+            HttpError: If download fails
+        """
+        try:
+            file_id = self._lookup_file_id(filename)
+            if not file_id:
+                raise FileNotFoundError(f"File not found: {filename}")
 
-            # Download file content
             request = self.service.files().get_media(fileId=file_id)
-            file_content = io.BytesIO()
-            downloader = MediaIoBaseDownload(file_content, request)
+            downloader = MediaIoBaseDownload(destination, request)
 
             done = False
             while not done:
                 status, done = downloader.next_chunk()
 
-            content = file_content.getvalue()
-            logger.info(f"Downloaded from Google Drive: {filename} ({len(content)} bytes)")
-            return content
-
         except HttpError as e:
             if e.resp.status == 404:
+                self._forget_file(filename)
                 raise FileNotFoundError(f"File not found: {filename}")
             logger.error(f"Google Drive download failed: {e}")
             raise
+
+    def get(self, filename: str) -> bytes:
+        """
+        Retrieve file from Google Drive
+
+        Args:
+            filename (str): Name of file to retrieve (can be file ID or filename)
+
+        Returns:
+            bytes: File content
+
+        Raises:
+            FileNotFoundError: If file not found
+            HttpError: If download fails
+        """
+        # Validate filename
+        self.validate_filename(filename)
+
+        try:
+            file_content = io.BytesIO()
+            self._download_to(filename, file_content)
+
+            content = file_content.getvalue()
+            logger.info(f"Downloaded from Google Drive: {filename} ({len(content)} bytes)")
+            return content
+
+        except (FileNotFoundError, HttpError):
+            raise
         except Exception as e:
             logger.error(f"Unexpected error during download: {e}")
             raise
@@ -475,41 +715,87 @@ class GoogleDriveStorageBackend(StorageBackend):
         self.validate_filename(filename)
 
         try:
-            # Search for file
-            formatted_filename = self._format_filename(filename)
-            folder_id = self._ensure_version_folder()
-
-            query = (
-                f"name='{formatted_filename}' and '{folder_id}' in parents "
-                f"and trashed=false"
-            )
-
-            results = self.service.files().list(
-                q=query,
-                spaces='drive',
-                fields='files(id, name)'
-            ).execute()
-
-            items = results.get('files', [])
-            if not items:
+            file_id = self._lookup_file_id(filename)
+            if not file_id:
                 logger.info(f"File not found for deletion: {filename}")
                 return False
 
-            file_id = items[0]['id']
-
             # Delete file
             self.service.files().delete(fileId=file_id).execute()
-            logger.info(f"Deleted from Google Drive: {formatted_filename}")
+            self._forget_file(filename)
+            logger.info(f"Deleted from Google Drive: {self._format_filename(filename)}")
             return True
 
         except HttpError as e:
+            if e.resp.status == 404:
+                self._forget_file(filename)
+                logger.info(f"File not found for deletion: {filename}")
+                return False
             logger.error(f"Google Drive delete failed: {e}")
             raise
 
+    def delete_many(self, filenames: List[str]) -> Dict[str, bool]:
+        """
+        Delete several files through the Drive batch endpoint
+
+        Up to BATCH_MAX_REQUESTS deletes share one HTTP request.
+
+        Args:
+            filenames (List[str]): Names of files to delete
+
+        Returns:
+            Dict[str, bool]: Filename -> True if deleted, False if not found
+
+        Raises:
+            ValueError: If any filename is invalid
+            HttpError: If a delete fails for a reason other than not found
+        """
+        for filename in filenames:
+            self.validate_filename(filename)
+
+        results = {}
+        to_delete = []
+        for filename in filenames:
+            file_id = self._lookup_file_id(filename)
+            if file_id:
+                to_delete.append((filename, file_id))
+            else:
+                results[filename] = False
+
+        errors = []
+
+        def on_response(request_id, response, exception):
+            if exception is None:
+                results[request_id] = True
+            elif isinstance(exception, HttpError) and exception.resp.status == 404:
+                results[request_id] = False
+            else:
+                results[request_id] = False
+                errors.append(exception)
+                return
+            self._forget_file(request_id)
+
+        for start in range(0, len(to_delete), BATCH_MAX_REQUESTS):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for filename, file_id in to_delete[start:start + BATCH_MAX_REQUESTS]:
+                batch.add(self.service.files().delete(fileId=file_id), request_id=filename)
+            batch.execute()
+
+        deleted = sum(results.values())
+        logger.info(f"Deleted {deleted} of {len(filenames)} files from Google Drive in batches")
+
+        if errors:
+            logger.error(f"Google Drive batch delete failed for {len(errors)} files: {errors[0]}")
+            raise errors[0]
+        return results
+
     def exists(self, filename: str) -> bool:
         """
         Check if file exists in Google Drive
 
+        Answered from the file index; no request is made while the index is
+        fresh.
+
         Args:
             filename (str): Name of file to check
 
@@ -520,21 +806,7 @@ class GoogleDriveStorageBackend(StorageBackend):
         self.validate_filename(filename)
 
         try:
-            formatted_filename = self._format_filename(filename)
-            folder_id = self._ensure_version_folder()
-
-            query = (
-                f"name='{formatted_filename}' and '{folder_id}' in parents "
-                f"and trashed=false"
-            )
-
-            results = self.service.files().list(
-                q=query,
-                spaces='drive',
-                fields='files(id)'
-            ).execute()
-
-            exists = len(results.get('files', [])) > 0
+            exists = self._lookup_file_id(filename) is not None
             logger.debug(f"File existence check for {filename}: {exists}")
             return exists
 
@@ -546,47 +818,33 @@ class GoogleDriveStorageBackend(StorageBackend):
         """
         List files in Google Drive version folder
 
+        Built from the fully paginated file index, so large folders are not
+        truncated.
+
         Args:
             prefix (str, optional): Filter by filename prefix
-            pattern (str, optional): Glob pattern (converted to contains search)
+            pattern (str, optional): Glob pattern to match (e.g., '*.docx')
 
         Returns:
             List[str]: List of original filenames (version prefix removed)
         """
         try:
-            folder_id = self._ensure_version_folder()
-
-            # Build query
-            query = f"'{folder_id}' in parents and trashed=false"
-
-            # Add prefix filter
-            if prefix:
-                formatted_prefix = self._format_filename(prefix)
-                query += f" and name contains '{formatted_prefix}'"
-
-            # Add pattern filter (convert glob * to contains)
-            if pattern:
-                # Simple conversion: *.docx -> contains '.docx'
-                if pattern.startswith('*'):
-                    search_term = pattern[1:]  # Remove leading *
-                    query += f" and name contains '{search_term}'"
-
-            results = self.service.files().list(
-                q=query,
-                spaces='drive',
-                fields='files(name)',
-                pageSize=100
-            ).execute()
-
-            items = results.get('files', [])
+            self._refresh_file_index()
+            with self._index_lock:
+                names = list(self._file_index)
 
             # Remove version prefix from filenames
             version_prefix = f"merlin_v{self.app_version}_"
             filenames = [
-                item['name'].replace(version_prefix, '', 1)
-                for item in items
+                name[len(version_prefix):] if name.startswith(version_prefix) else name
+                for name in names
             ]
 
+            if prefix:
+                filenames = [f for f in filenames if f.startswith(prefix)]
+            if pattern:
+                filenames = [f for f in filenames if fnmatch.fnmatch(f, pattern)]
+
             logger.info(f"Listed {len(filenames)} files from Google Drive")
             return sorted(filenames)
 
@@ -29,18 +29,26 @@ Usage Example:
 
     # Retrieve document
     content = storage.get('resume_2025.docx')
+
+    # Stream a document in (written atomically on close)
+    with storage.open_write('resume_2025.docx') as writer:
+        shutil.copyfileobj(source, writer)
 """
 
 import os
 import logging
 import fnmatch
+import tempfile
 from pathlib import Path
-from typing import Optional, List
+from typing import BinaryIO, Optional, List
 from datetime import datetime
-from .storage_backend import StorageBackend
+from .storage_backend import StorageBackend, StorageWriter
 
 logger = logging.getLogger(__name__)
 
+# Suffix of in-progress streamed writes (never listed)
+PARTIAL_SUFFIX = ".partial"
+
 
 class LocalStorageBackend(StorageBackend):
     """
@@ -150,6 +158,103 @@ class LocalStorageBackend(StorageBackend):
             logger.error(f"IO error writing file {filename}: {e}")
             raise IOError(f"Failed to write file {filename}: {e}")
 
+    def open_write(self, filename: str, metadata: Optional[dict] = None) -> StorageWriter:
+        """
+        Open a file for streaming writes
+
+        Bytes go to a temporary file next to the destination, which is moved
+        into place with os.replace on close. Readers never see a partially
+        written file, and an aborted write leaves any existing file untouched.
+
+        Args:
+            filename (str): Name of the file to save
+            metadata (dict, optional): Additional metadata (not used in local storage)
+
+        Returns:
+            StorageWriter: Writable file-like object; ``result`` matches save()
+
+        Raises:
+            ValueError: If filename is invalid
+            IOError: If the temporary file cannot be created
+            PermissionError: If insufficient permissions
+        """
+        # Validate filename for security
+        self.validate_filename(filename)
+
+        file_path = self.base_path / filename
+
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            partial = tempfile.NamedTemporaryFile(
+                dir=file_path.parent, prefix=f".{file_path.name}.", suffix=PARTIAL_SUFFIX, delete=False
+            )
+        except PermissionError as e:
+            logger.error(f"Permission denied writing file {filename}: {e}")
+            raise PermissionError(f"Cannot write file {filename}: {e}")
+        except IOError as e:
+            logger.error(f"IO error writing file {filename}: {e}")
+            raise IOError(f"Failed to write file {filename}: {e}")
+
+        def commit(stream: BinaryIO, size: int) -> dict:
+            try:
+                stream.flush()
+                os.fsync(stream.fileno())
+                stream.close()
+                os.replace(stream.name, file_path)
+            except OSError as e:
+                abort(stream)
+                logger.error(f"IO error writing file {filename}: {e}")
+                raise IOError(f"Failed to write file {filename}: {e}")
+
+            logger.info(f"File streamed successfully: {filename} ({size} bytes) at {file_path}")
+            return {
+                "file_path": str(file_path),
+                "filename": filename,
+                "storage_type": "local",
+                "file_size": size,
+                "timestamp": datetime.now().isoformat(),
+                "local_path": str(file_path),
+            }
+
+        def abort(stream: BinaryIO) -> None:
+            stream.close()
+            try:
+                os.unlink(stream.name)
+            except FileNotFoundError:
+                pass
+
+        return StorageWriter(partial, commit, abort)
+
+    def open_read(self, filename: str) -> BinaryIO:
+        """
+        Open a file for streaming reads
+
+        Args:
+            filename (str): Name of the file to read
+
+        Returns:
+            BinaryIO: File opened in binary read mode (close it when done)
+
+        Raises:
+            ValueError: If filename is invalid
+            FileNotFoundError: If file does not exist
+            PermissionError: If insufficient permissions
+        """
+        # Validate filename for security
+        self.validate_filename(filename)
+
+        file_path = self.base_path / filename
+
+        if not file_path.is_file():
+            logger.warning(f"File not found: {filename}")
+            raise FileNotFoundError(f"File not found: {filename}")
+
+        try:
+            return open(file_path, "rb")
+        except PermissionError as e:
+            logger.error(f"Permission denied reading file {filename}: {e}")
+            raise PermissionError(f"Cannot read file {filename}: {e}")
+
     def get(self, filename: str) -> bytes:
         """
         Retrieve file content from local filesystem
@@ -289,7 +394,8 @@ class LocalStorageBackend(StorageBackend):
         try:
             # Get all files in base path (non-recursive)
             all_files = [
-                f.name for f in self.base_path.iterdir() if f.is_file()
+                f.name for f in self.base_path.iterdir()
+                if f.is_file() and not f.name.endswith(PARTIAL_SUFFIX)
             ]
 
             # Apply prefix filter if provided
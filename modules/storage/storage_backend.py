@@ -30,14 +30,104 @@ Usage Example:
     # Check existence
     if storage.exists('resume_2025.docx'):
         storage.delete('resume_2025.docx')
+
+    # Stream a large file in and out without holding it in memory
+    with storage.open_write('resume_2025.docx') as writer:
+        shutil.copyfileobj(source, writer)
+    print(writer.result['file_path'])
+
+    with storage.open_read('resume_2025.docx') as reader:
+        shutil.copyfileobj(reader, destination)
 """
 
+import io
+import tempfile
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Any, BinaryIO, Callable, Dict, Optional, List
 import logging
 
 logger = logging.getLogger(__name__)
 
+# In-memory buffer size before streamed writes spill to a temporary file
+SPOOL_MAX_BYTES = 1024 * 1024
+
+
+class StorageWriter(io.RawIOBase):
+    """
+    Writable file-like object returned by StorageBackend.open_write
+
+    Bytes go to an underlying stream; closing the writer commits the file to
+    the backend and stores the save() style result in ``result``. Leaving a
+    ``with`` block through an exception aborts instead, so a partial file is
+    never stored. A writer that is garbage-collected without an explicit
+    close() is aborted as well.
+
+    Attributes:
+        result (dict): Storage information (same keys as save()), set on close
+        bytes_written (int): Number of bytes written so far
+    """
+
+    def __init__(self, stream: BinaryIO, commit: Callable[[BinaryIO, int], dict],
+                 abort: Optional[Callable[[BinaryIO], Any]] = None):
+        """
+        Args:
+            stream: Stream that receives the written bytes
+            commit: Called with (stream, size) on close; returns the storage result
+            abort: Called with the stream when the write is abandoned
+        """
+        super().__init__()
+        self._stream = stream
+        self._commit = commit
+        self._abort = abort
+        self.result: Optional[dict] = None
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed StorageWriter")
+        written = self._stream.write(data)
+        written = len(data) if written is None else written
+        self.bytes_written += written
+        return written
+
+    def close(self) -> None:
+        """Commit the written bytes to storage"""
+        if self.closed:
+            return
+        try:
+            self.result = self._commit(self._stream, self.bytes_written)
+        finally:
+            super().close()
+
+    def abort(self) -> None:
+        """Discard the written bytes"""
+        if self.closed:
+            return
+        try:
+            if self._abort:
+                self._abort(self._stream)
+            else:
+                self._stream.close()
+        finally:
+            super().close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+        return False
+
+    def __del__(self):
+        # IOBase.__del__ would call close() and commit an unfinished write
+        try:
+            self.abort()
+        except Exception:
+            pass
+
 
 class StorageBackend(ABC):
     """
@@ -201,6 +291,79 @@ class StorageBackend(ABC):
         """
         pass
 
+    def delete_many(self, filenames: List[str]) -> Dict[str, bool]:
+        """
+        Delete several files
+
+        Backends with a batch API override this; the default calls delete()
+        for each file.
+
+        Args:
+            filenames (List[str]): Names of files to delete
+
+        Returns:
+            Dict[str, bool]: Filename -> True if deleted, False if not found
+
+        Raises:
+            ValueError: If any filename is invalid
+        """
+        return {filename: self.delete(filename) for filename in filenames}
+
+    def open_write(self, filename: str, metadata: Optional[dict] = None) -> StorageWriter:
+        """
+        Open a file for streaming writes
+
+        The file is stored when the writer is closed (or its ``with`` block
+        exits normally); the storage information is then available as
+        ``writer.result``. Backends that can stream natively override this;
+        the default buffers in a spooled temporary file and calls save().
+
+        Args:
+            filename (str): Name of the file to save
+            metadata (dict, optional): Additional metadata (as for save())
+
+        Returns:
+            StorageWriter: Writable file-like object
+
+        Raises:
+            ValueError: If filename is invalid
+
+        Example:
+            >>> with storage.open_write('resume.docx') as writer:
+            ...     shutil.copyfileobj(source, writer)
+            >>> writer.result['file_size']
+            48213
+        """
+        self.validate_filename(filename)
+
+        def commit(stream: BinaryIO, size: int) -> dict:
+            try:
+                stream.seek(0)
+                return self.save(filename, stream.read(), metadata)
+            finally:
+                stream.close()
+
+        return StorageWriter(tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES), commit)
+
+    def open_read(self, filename: str) -> BinaryIO:
+        """
+        Open a file for streaming reads
+
+        Backends that can stream natively override this; the default wraps
+        get() in a BytesIO.
+
+        Args:
+            filename (str): Name of the file to read
+
+        Returns:
+            Readable binary file-like object (close it when done)
+
+        Raises:
+            ValueError: If filename is invalid
+            FileNotFoundError: If file does not exist in storage
+        """
+        return io.BytesIO(self.get(filename))
+
     def validate_filename(self, filename: str) -> None:
         """
         Validate filename for security
@@ -14,6 +14,10 @@ Configuration:
     Set environment variables to control storage backend:
     - STORAGE_BACKEND: Type of storage ('local', 's3', 'gcs', etc.)
     - LOCAL_STORAGE_PATH: Path for local filesystem storage
+    - STORAGE_WRITE_BEHIND: 'true' to save locally and replicate to the
+      remote backend in the background
+    - STORAGE_CONTENT_ADDRESSED: 'true' to store generated documents once
+      per unique content (CONTENT_STORE_PATH sets the store directory)
 
 Usage:
     from modules.storage import get_storage_backend
@@ -26,6 +30,8 @@ import logging
 from typing import Optional
 from .storage_backend import StorageBackend
 from .local_storage import LocalStorageBackend
+from .write_behind_storage import WriteBehindStorageBackend
+from .content_store import ContentAddressedStore
 
 # Import Google Drive backend (may not be available if dependencies not installed)
 try:
@@ -38,6 +44,7 @@ logger = logging.getLogger(__name__)
 
 # Singleton instance for storage backend
 _storage_instance: Optional[StorageBackend] = None
+_content_store_instance: Optional[ContentAddressedStore] = None
 
 
 def get_storage_backend(force_new: bool = False) -> StorageBackend:
@@ -67,6 +74,11 @@ def get_storage_backend(force_new: bool = False) -> StorageBackend:
         GOOGLE_DRIVE_TOKEN_PATH: Path to store OAuth token
             - Default: './storage/google_drive_token.json'
 
+        STORAGE_WRITE_BEHIND: Write-behind mode for remote backends
+            - 'true': saves go to LOCAL_STORAGE_PATH and return immediately;
+              a background uploader replicates them to the remote backend
+            - Default: 'false' (ignored for the local backend)
+
     Args:
         force_new (bool): If True, create a new instance even if one exists.
             Useful for testing. Default: False
@@ -98,17 +110,7 @@ def get_storage_backend(force_new: bool = False) -> StorageBackend:
     # Create storage backend based on type
     try:
         if backend_type == "local":
-            # Get base path from environment or use default
-            base_path = os.getenv("LOCAL_STORAGE_PATH")
-
-            if base_path:
-                logger.info(f"Using configured local storage path: {base_path}")
-            else:
-                # Use default path relative to project root
-                base_path = os.path.join(os.getcwd(), "storage", "generated_documents")
-                logger.info(f"Using default local storage path: {base_path}")
-
-            _storage_instance = LocalStorageBackend(base_path=base_path)
+            _storage_instance = _create_local_backend()
 
         elif backend_type == "google_drive":
             # Google Drive API storage
@@ -122,11 +124,20 @@ def get_storage_backend(force_new: bool = False) -> StorageBackend:
             credentials_path = os.getenv("GOOGLE_DRIVE_CREDENTIALS_PATH")
             token_path = os.getenv("GOOGLE_DRIVE_TOKEN_PATH")
 
-            _storage_instance = GoogleDriveStorageBackend(
+            drive_backend = GoogleDriveStorageBackend(
                 credentials_path=credentials_path,
                 token_path=token_path
             )
 
+            if _write_behind_enabled():
+                logger.info("Write-behind mode enabled: saving locally, replicating to Google Drive")
+                _storage_instance = WriteBehindStorageBackend(
+                    local=_create_local_backend(),
+                    remote=drive_backend
+                )
+            else:
+                _storage_instance = drive_backend
+
         else:
             logger.error(f"Unknown storage backend type: {backend_type}")
             raise ValueError(
@@ -142,6 +153,70 @@ def get_storage_backend(force_new: bool = False) -> StorageBackend:
         raise RuntimeError(f"Storage backend initialization failed: {e}")
 
 
+def get_content_store(force_new: bool = False) -> Optional[ContentAddressedStore]:
+    """
+    Get the content-addressed document store, if enabled
+
+    Environment Variables:
+        STORAGE_CONTENT_ADDRESSED: 'true' to enable (default: 'false')
+        CONTENT_STORE_PATH: Store directory
+            - Default: './storage/content_store'
+
+    When STORAGE_BACKEND is a remote backend, each unique blob is also
+    uploaded to it once.
+
+    Args:
+        force_new (bool): If True, create a new instance even if one exists
+
+    Returns:
+        ContentAddressedStore: Store instance, or None when disabled
+
+    Raises:
+        RuntimeError: If the store or its backend cannot be initialized
+    """
+    global _content_store_instance
+
+    if os.getenv("STORAGE_CONTENT_ADDRESSED", "false").lower() not in ("true", "1", "yes"):
+        return None
+
+    if _content_store_instance is not None and not force_new:
+        return _content_store_instance
+
+    try:
+        backend = None
+        if os.getenv("STORAGE_BACKEND", "local").lower() != "local":
+            backend = get_storage_backend()
+
+        _content_store_instance = ContentAddressedStore(
+            base_path=os.getenv("CONTENT_STORE_PATH"),
+            backend=backend
+        )
+        return _content_store_instance
+
+    except Exception as e:
+        logger.error(f"Failed to initialize content store: {e}")
+        raise RuntimeError(f"Content store initialization failed: {e}")
+
+
+def _create_local_backend() -> LocalStorageBackend:
+    """Create the local backend from LOCAL_STORAGE_PATH (or the default path)"""
+    # Get base path from environment or use default
+    base_path = os.getenv("LOCAL_STORAGE_PATH")
+
+    if base_path:
+        logger.info(f"Using configured local storage path: {base_path}")
+    else:
+        # Use default path relative to project root
+        base_path = os.path.join(os.getcwd(), "storage", "generated_documents")
+        logger.info(f"Using default local storage path: {base_path}")
+
+    return LocalStorageBackend(base_path=base_path)
+
+
+def _write_behind_enabled() -> bool:
+    return os.getenv("STORAGE_WRITE_BEHIND", "false").lower() in ("true", "1", "yes")
+
+
 def reset_storage_instance() -> None:
     """
     Reset the singleton storage instance
@@ -159,8 +234,9 @@ def reset_storage_instance() -> None:
         >>> reset_storage_instance()
         >>> storage = get_storage_backend()  # Creates new instance
     """
-    global _storage_instance
+    global _storage_instance, _content_store_instance
     _storage_instance = None
+    _content_store_instance = None
     logger.debug("Storage backend instance reset")
 
 
@@ -210,6 +286,7 @@ def validate_storage_configuration() -> dict:
         config["app_version"] = app_version or "NOT SET"
         config["credentials_path"] = credentials_path
         config["token_path"] = token_path
+        config["write_behind"] = _write_behind_enabled()
 
         if not app_version:
             errors.append("APP_VERSION environment variable required for Google Drive backend")
@@ -0,0 +1,418 @@
+"""
+Write-Behind Storage Backend
+
+This module layers a remote storage backend (e.g. Google Drive) behind local
+disk. Saves are written to local storage and return immediately; a background
+uploader then replicates each file to the remote backend, streaming it from
+disk in chunks and retrying failed uploads with exponential backoff.
+
+Features:
+- save()/open_write() return as soon as the file is on local disk
+- Background replication with retry, backoff and a maximum attempt count
+- Re-saving a file that is still queued uploads only the newest version
+- Replication metrics (pending, uploaded, failed, retries, bytes) and
+  per-file progress
+- Reads fall back to the remote backend for files that are not local
+
+Usage Example:
+    from modules.storage.write_behind_storage import WriteBehindStorageBackend
+
+    storage = WriteBehindStorageBackend(
+        local=LocalStorageBackend('/workspace/storage/generated_documents'),
+        remote=GoogleDriveStorageBackend(),
+    )
+    result = storage.save('resume_2025.docx', content)   # returns immediately
+    print(result['replication_status'])                 # 'pending'
+
+    storage.flush(timeout=60)                           # wait for uploads
+    print(storage.get_replication_stats())
+
+Note:
+    Replication state is held in memory. Files that were still queued when the
+    process stopped can be re-queued with replicate_missing().
+"""
+
+import heapq
+import inspect
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import BinaryIO, Dict, List, Optional
+
+from .storage_backend import StorageBackend, StorageWriter
+
+logger = logging.getLogger(__name__)
+
+# Bytes copied per read when streaming a local file to the remote backend
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Replication statuses
+PENDING = "pending"
+UPLOADING = "uploading"
+UPLOADED = "uploaded"
+FAILED = "failed"
+
+
+class WriteBehindStorageBackend(StorageBackend):
+    """
+    Local-first storage with background replication to a remote backend
+
+    Attributes:
+        local (StorageBackend): Backend that receives every write synchronously
+        remote (StorageBackend): Backend that files are replicated to
+        max_attempts (int): Upload attempts per file before it is marked failed
+        retry_base_delay (float): Delay before the first retry, doubled per attempt
+        retry_max_delay (float): Upper bound for the retry delay
+    """
+
+    def __init__(self, local: StorageBackend, remote: StorageBackend,
+                 max_attempts: int = 5, retry_base_delay: float = 2.0,
+                 retry_max_delay: float = 300.0):
+        """
+        Initialize write-behind storage and start the background uploader
+
+        Args:
+            local (StorageBackend): Local backend (written synchronously)
+            remote (StorageBackend): Remote backend (written in the background)
+            max_attempts (int): Upload attempts per file before giving up
+            retry_base_delay (float): Seconds before the first retry
+            retry_max_delay (float): Maximum seconds between retries
+        """
+        super().__init__()
+        self.local = local
+        self.remote = remote
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+
+        # Per-file replication state and the retry schedule (ready_time, seq, filename)
+        self._files: Dict[str, dict] = {}
+        self._schedule: List[tuple] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._stats = {"uploaded": 0, "retries": 0, "bytes_uploaded": 0}
+
+        self._remote_accepts_progress = "progress_callback" in inspect.signature(
+            remote.open_write
+        ).parameters
+
+        self._worker = threading.Thread(target=self._run, name="storage-write-behind", daemon=True)
+        self._worker.start()
+
+        logger.info(
+            f"Write-behind storage initialized: {local.backend_name} -> {remote.backend_name}"
+        )
+
+    def save(self, filename: str, content: bytes, metadata: Optional[dict] = None) -> dict:
+        """
+        Save file locally and queue it for replication
+
+        Args:
+            filename (str): Name of the file to save
+            content (bytes): Binary content
+            metadata (dict, optional): Passed to both backends
+
+        Returns:
+            dict: Local storage information plus ``replication_status``
+
+        Raises:
+            ValueError: If filename is invalid
+            IOError: If the local write fails
+        """
+        result = self.local.save(filename, content, metadata)
+        return self._queue(filename, metadata, result)
+
+    def open_write(self, filename: str, metadata: Optional[dict] = None) -> StorageWriter:
+        """
+        Open a file for streaming writes
+
+        The file is written to local storage and queued for replication when
+        the writer is closed.
+
+        Args:
+            filename (str): Name of the file to save
+            metadata (dict, optional): Passed to both backends
+
+        Returns:
+            StorageWriter: Writable file-like object; ``result`` includes
+                ``replication_status``
+        """
+        local_writer = self.local.open_write(filename, metadata)
+
+        def commit(stream: StorageWriter, size: int) -> dict:
+            stream.close()
+            return self._queue(filename, metadata, stream.result)
+
+        return StorageWriter(local_writer, commit, lambda stream: stream.abort())
+
+    def open_read(self, filename: str) -> BinaryIO:
+        """Open a file for streaming reads (local copy first, then remote)"""
+        try:
+            return self.local.open_read(filename)
+        except FileNotFoundError:
+            return self.remote.open_read(filename)
+
+    def get(self, filename: str) -> bytes:
+        """Retrieve file content (local copy first, then remote)"""
+        try:
+            return self.local.get(filename)
+        except FileNotFoundError:
+            return self.remote.get(filename)
+
+    def delete(self, filename: str) -> bool:
+        """
+        Delete file from both backends
+
+        A queued upload of the file is cancelled. Remote failures are logged
+        rather than raised, since the local copy is already gone.
+
+        Returns:
+            bool: True if the file existed in either backend
+        """
+        with self._condition:
+            self._files.pop(filename, None)
+
+        deleted = self.local.delete(filename)
+        try:
+            deleted = self.remote.delete(filename) or deleted
+        except Exception as e:
+            logger.error(f"Remote delete failed for {filename}: {e}")
+        return deleted
+
+    def exists(self, filename: str) -> bool:
+        """Check if file exists locally or in the remote backend"""
+        return self.local.exists(filename) or self.remote.exists(filename)
+
+    def list(self, prefix: Optional[str] = None, pattern: Optional[str] = None) -> List[str]:
+        """List files from both backends"""
+        filenames = set(self.local.list(prefix=prefix, pattern=pattern))
+        try:
+            filenames.update(self.remote.list(prefix=prefix, pattern=pattern))
+        except Exception as e:
+            logger.warning(f"Remote listing failed, returning local files only: {e}")
+        return sorted(filenames)
+
+    def get_replication_status(self, filename: str) -> Optional[dict]:
+        """
+        Get replication progress for one file
+
+        Returns:
+            dict: status, attempts, bytes_uploaded, file_size, last_error and
+                remote (the remote save() result once uploaded), or None if the
+                file was never queued
+        """
+        with self._condition:
+            state = self._files.get(filename)
+            return dict(state) if state else None
+
+    def get_replication_stats(self) -> dict:
+        """
+        Get replication metrics
+
+        Returns:
+            dict: Counts of pending, uploading, uploaded and failed files,
+                total retries and bytes uploaded
+        """
+        with self._condition:
+            statuses = [state["status"] for state in self._files.values()]
+            return {
+                "pending": statuses.count(PENDING),
+                "uploading": statuses.count(UPLOADING),
+                "uploaded": self._stats["uploaded"],
+                "failed": statuses.count(FAILED),
+                "retries": self._stats["retries"],
+                "bytes_uploaded": self._stats["bytes_uploaded"],
+            }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no file is pending or uploading
+
+        Failed files do not block the flush; see retry_failed().
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait
+
+        Returns:
+            bool: True if every queued file finished within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while any(state["status"] in (PENDING, UPLOADING) for state in self._files.values()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def retry_failed(self) -> int:
+        """
+        Re-queue files whose uploads ran out of attempts
+
+        Returns:
+            int: Number of files re-queued
+        """
+        with self._condition:
+            failed = [name for name, state in self._files.items() if state["status"] == FAILED]
+            for filename in failed:
+                self._files[filename].update({"status": PENDING, "attempts": 0})
+                self._schedule_upload(filename, 0)
+            self._condition.notify_all()
+        return len(failed)
+
+    def replicate_missing(self) -> int:
+        """
+        Queue local files that are missing from the remote backend
+
+        Use after a restart to finish replication that was interrupted.
+
+        Returns:
+            int: Number of files queued
+        """
+        queued = 0
+        for filename in self.local.list():
+            if filename not in self._files and not self.remote.exists(filename):
+                self._queue(filename, None, None)
+                queued += 1
+        return queued
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush queued uploads and stop the background uploader
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait for the flush
+        """
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout)
+
+    def _queue(self, filename: str, metadata: Optional[dict], local_result: Optional[dict]) -> dict:
+        """Record a new local version of a file and schedule its upload"""
+        with self._condition:
+            state = self._files.get(filename)
+            if state and state["status"] == UPLOADING:
+                # Upload the new version once the running upload finishes
+                state["stale"] = True
+                state["metadata"] = metadata
+            else:
+                self._files[filename] = {
+                    "status": PENDING,
+                    "attempts": 0,
+                    "bytes_uploaded": 0,
+                    "file_size": (local_result or {}).get("file_size"),
+                    "last_error": None,
+                    "remote": None,
+                    "metadata": metadata,
+                    "stale": False,
+                    "queued_at": datetime.now().isoformat(),
+                }
+                if not state or state["status"] != PENDING:
+                    self._schedule_upload(filename, 0)
+            self._condition.notify_all()
+
+        result = dict(local_result or {})
+        result["replication_status"] = PENDING
+        return result
+
+    def _schedule_upload(self, filename: str, delay: float) -> None:
+        heapq.heappush(self._schedule, (time.monotonic() + delay, next(self._sequence), filename))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                filename = None
+                while filename is None:
+                    if self._closed:
+                        return
+                    if not self._schedule:
+                        self._condition.wait()
+                        continue
+                    ready_at, _, candidate = self._schedule[0]
+                    wait = ready_at - time.monotonic()
+                    if wait > 0:
+                        self._condition.wait(wait)
+                        continue
+                    heapq.heappop(self._schedule)
+                    state = self._files.get(candidate)
+                    if state and state["status"] == PENDING:
+                        filename = candidate
+
+                state["status"] = UPLOADING
+                state["attempts"] += 1
+                state["bytes_uploaded"] = 0
+                metadata = state["metadata"]
+
+            try:
+                remote_result, size = self._upload(filename, metadata)
+                error = None
+            except Exception as e:
+                remote_result, size, error = None, 0, e
+
+            with self._condition:
+                self._finish(filename, state, remote_result, size, error)
+                self._condition.notify_all()
+
+    def _upload(self, filename: str, metadata: Optional[dict]) -> tuple:
+        """Stream one file from local storage to the remote backend"""
+        def progress(uploaded: int, total: int) -> None:
+            with self._condition:
+                state = self._files.get(filename)
+                if state:
+                    state["bytes_uploaded"] = uploaded
+
+        def open_remote():
+            if self._remote_accepts_progress:
+                return self.remote.open_write(filename, metadata, progress_callback=progress)
+            return self.remote.open_write(filename, metadata)
+
+        # Open the local source first so a missing file never creates a remote writer
+        with self.local.open_read(filename) as source, open_remote() as writer:
+            while True:
+                chunk = source.read(COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                writer.write(chunk)
+                if not self._remote_accepts_progress:
+                    progress(writer.bytes_written, 0)
+
+        return writer.result, writer.bytes_written
+
+    def _finish(self, filename: str, state: dict, remote_result: Optional[dict],
+                size: int, error: Optional[Exception]) -> None:
+        """Record an upload outcome (caller holds the condition)"""
+        if self._files.get(filename) is not state:
+            # Deleted while uploading
+            return
+
+        if error is None:
+            self._stats["uploaded"] += 1
+            self._stats["bytes_uploaded"] += size
+            state.update({"status": UPLOADED, "bytes_uploaded": size, "file_size": size,
+                          "remote": remote_result, "last_error": None})
+            logger.info(f"Replicated {filename} to {self.remote.backend_name} ({size} bytes)")
+        elif isinstance(error, FileNotFoundError):
+            # Local copy removed before it could be uploaded; nothing to replicate
+            state.update({"status": FAILED, "last_error": str(error)})
+            logger.warning(f"Replication skipped for {filename}: {error}")
+        elif state["attempts"] < self.max_attempts:
+            delay = min(self.retry_base_delay * 2 ** (state["attempts"] - 1), self.retry_max_delay)
+            self._stats["retries"] += 1
+            state.update({"status": PENDING, "last_error": str(error)})
+            self._schedule_upload(filename, delay)
+            logger.warning(
+                f"Replication of {filename} failed (attempt {state['attempts']}), retrying in {delay:.1f}s: {error}"
+            )
+        else:
+            state.update({"status": FAILED, "last_error": str(error)})
+            logger.error(f"Replication of {filename} failed after {state['attempts']} attempts: {error}")
+
+        if state["stale"]:
+            # A newer local version arrived during the upload
+            state.update({"status": PENDING, "attempts": 0, "stale": False})
+            self._schedule_upload(filename, 0)
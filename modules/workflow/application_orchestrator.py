@@ -3,14 +3,15 @@
 Module: application_orchestrator.py
 Purpose: End-to-end workflow orchestration for automated job applications
 Created: 2024-08-26
-Modified: 2025-10-21
+Modified: 2026-10-18
 Dependencies: user_profile_loader, database_manager, document_generator, resilience
-Related: workflow_api.py, email_application_sender.py, modules/resilience/
+Related: workflow_api.py, email_application_sender.py, application_pipeline.py, modules/resilience/
 Description: Manages complete application workflow: job discovery from analyzed_jobs,
              user preference matching with Steve Glen's profile, eligibility determination
-             with rejection reasoning, document generation for eligible jobs, email
-             composition/sending, application status tracking. Integrates failure
-             recovery, retry strategies, and data consistency validation.
+             with rejection reasoning, then a staged pipeline (document render,
+             security scan, email compose, send, status write) with per-stage
+             concurrency, the daily send cap and checkpointed resume. Integrates
+             failure recovery, retry strategies, and data consistency validation.
 """
 
 import logging
@@ -26,11 +27,28 @@ import os
 # Import existing system components
 from modules.user_management.user_profile_loader import SteveGlenProfileLoader
 from modules.database.database_manager import DatabaseManager
+from modules.database.materialized_view_refresher import notify_table_write
 
 # Import failure recovery components for Step 2.3
 from modules.resilience.failure_recovery import FailureRecoveryManager
-from modules.resilience.retry_strategy_manager import retry_manager, with_retry
+from modules.resilience.retry_strategy_manager import retry_manager
 from modules.resilience.data_consistency_validator import DataConsistencyValidator
+from modules.resilience.timeout_manager import OperationType, deadline_scope, timeout_config
+
+# Staged application pipeline
+from modules.workflow.application_pipeline import (
+    DOCUMENT_RENDER,
+    SECURITY_SCAN,
+    EMAIL_COMPOSE,
+    SEND,
+    STATUS_WRITE,
+    APPLICATION_STAGES,
+    DailySendCap,
+    PipelineCheckpointer,
+    PipelineStage,
+    StagedPipeline,
+    new_application_item,
+)
 
 # Document generation (correct path)
 try:
@@ -44,7 +62,7 @@ except ImportError as e:
 
     # Create a mock document generator for testing
     class MockDocumentGenerator:
-        def generate_document(self, data):
+        def generate_document(self, data, application_id=None):
             return {
                 "success": True,
                 "file_path": f'/mock/path/{data.get("document_type", "document")}.docx',
@@ -54,23 +72,29 @@ except ImportError as e:
 
     DocumentGenerator = MockDocumentGenerator
 
-# Email integration - DISABLED FOR SAFETY
-try:
-    from modules.email_integration.email_disabled import DisabledEmailSender
+# Email integration: bulk Gmail sender, mocked while sending is DISABLED FOR SAFETY
+from modules.email_integration.gmail_bulk_sender import ApplicationStatusBatch
 
-    EnhancedGmailSender = DisabledEmailSender
+try:
+    from modules.email_integration.email_disabled import DisabledEmailSender, is_email_sending_disabled
 except ImportError:
     # Create a simple email interface for workflow testing
     class MockEmailSender:
-        def send_email_with_attachments(self, recipient, subject, body, attachments=None):
+        def send(self, to_email, subject, body, attachments=None):
             return {
-                "success": True,
-                "message_id": f'mock_message_{datetime.now().strftime("%Y%m%d_%H%M%S")}',
+                "status": "success",
+                "gmail_message_id": f'mock_message_{datetime.now().strftime("%Y%m%d_%H%M%S")}',
                 "sent_at": datetime.now().isoformat(),
                 "mock_mode": True,
             }
 
-    EnhancedGmailSender = MockEmailSender
+    DisabledEmailSender = MockEmailSender
+
+    def is_email_sending_disabled():
+        return True
+
+# Test recipient for application emails
+APPLICATION_EMAIL_RECIPIENT = "therealstevenglen@gmail.com"
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +124,7 @@ class ApplicationOrchestrator:
         self.db_url = os.environ.get("DATABASE_URL")
         self.user_profile = SteveGlenProfileLoader()
         self.document_generator = DocumentGenerator()
-        self.email_sender = EnhancedGmailSender()
+        self.email_sender = self.create_email_sender()
 
         # Initialize email application sender for automated application sending
         from modules.workflow.email_application_sender import EmailApplicationSender
@@ -114,6 +138,17 @@ class ApplicationOrchestrator:
         self.min_compatibility_score = 50  # Lower threshold for testing - jobs should meet 50+ score
         self.max_batch_size = 10
 
+        # Staged application pipeline: workers per stage and inter-stage queue capacity
+        self.stage_concurrency = {
+            DOCUMENT_RENDER: 4,
+            SECURITY_SCAN: 2,
+            EMAIL_COMPOSE: 2,
+            SEND: 1,
+            STATUS_WRITE: 2,
+        }
+        self.pipeline_queue_size = 10
+        self.status_batch_size = 25
+
         # Steve Glen's target job titles for eligibility filtering
         self.steve_glen_target_titles = [
             "Brand Strategist",
@@ -160,6 +195,15 @@ class ApplicationOrchestrator:
             self.logger.error(f"Job application error: {e}")
             return {"success": False, "reason": f"Application error: {str(e)}", "status": "error"}
 
+    def create_email_sender(self):
+        """Bulk Gmail sender (shared keep-alive session), or the mock while sending is disabled"""
+        if is_email_sending_disabled():
+            return DisabledEmailSender()
+
+        from modules.email_integration.gmail_oauth import get_gmail_bulk_sender
+
+        return get_gmail_bulk_sender()
+
     @contextmanager
     def get_db_connection(self):
         """Get database connection with proper error handling"""
@@ -192,39 +236,35 @@ class ApplicationOrchestrator:
 
         self.logger.info(f"Starting workflow execution {workflow_id} with batch size {batch_size}")
 
+        # One budget for the whole run: retries and API waits stop at the deadline
+        workflow_timeout = timeout_config.get_timeout(OperationType.WORKFLOW)
         try:
-            # Step 1: Job Discovery
-            eligible_jobs = self.discover_eligible_jobs(batch_size)
-            self.logger.info(f"Discovered {len(eligible_jobs)} eligible jobs")
-
-            # Step 2: Preference Matching and Eligibility
-            matched_jobs = self.apply_preference_matching(eligible_jobs)
-            self.logger.info(f"Matched {len(matched_jobs)} jobs after preference filtering")
+            with deadline_scope(workflow_timeout, f"workflow_{workflow_id}"):
+                # Step 1: Job Discovery
+                eligible_jobs = self.discover_eligible_jobs(batch_size)
+                self.logger.info(f"Discovered {len(eligible_jobs)} eligible jobs")
+
+                # Step 2: Preference Matching and Eligibility
+                matched_jobs = self.apply_preference_matching(eligible_jobs)
+                self.logger.info(f"Matched {len(matched_jobs)} jobs after preference filtering")
+
+                # Step 3: Application Workflow Execution (staged pipeline)
+                items = [new_application_item(job, str(uuid.uuid4())) for job in matched_jobs]
+                application_results = self.run_application_pipeline(workflow_id, items)
+
+                # Step 4: Compile Results
+                workflow_results = self.compile_workflow_results(
+                    workflow_id, start_time, eligible_jobs, matched_jobs, application_results
+                )
 
-            # Step 3: Application Workflow Execution
-            application_results = []
-            for job in matched_jobs:
+                # Step 5: Release stored documents of applications that no longer exist
                 try:
-                    result = self.process_single_application(job, workflow_id)
-                    application_results.append(result)
+                    self.reconcile_document_store()
                 except Exception as e:
-                    self.logger.error(f"Failed to process application for job {job.get('id', 'unknown')}: {e}")
-                    application_results.append(
-                        {
-                            "job_id": job.get("id"),
-                            "status": "failed",
-                            "error": str(e),
-                            "stage": "application_processing",
-                        }
-                    )
-
-            # Step 4: Compile Results
-            workflow_results = self.compile_workflow_results(
-                workflow_id, start_time, eligible_jobs, matched_jobs, application_results
-            )
+                    self.logger.warning(f"Document store reconciliation failed: {e}")
 
-            self.logger.info(f"Workflow {workflow_id} completed successfully")
-            return workflow_results
+                self.logger.info(f"Workflow {workflow_id} completed successfully")
+                return workflow_results
 
         except Exception as e:
             self.logger.error(f"Workflow {workflow_id} failed: {e}")
@@ -236,6 +276,167 @@ class ApplicationOrchestrator:
                 "completed_at": datetime.now().isoformat(),
             }
 
+    def resume_workflow(self, workflow_id: str) -> Dict:
+        """
+        Resume an interrupted workflow from its latest checkpoint
+
+        Applications continue after the last stage they completed; applications
+        deferred by the daily send cap are retried at the send stage.
+
+        Args:
+            workflow_id: Workflow to resume
+
+        Returns:
+            Dict: Workflow execution results for the resumed applications
+        """
+        start_time = datetime.now()
+        checkpoint = self.failure_recovery.get_latest_checkpoint(workflow_id)
+        if not checkpoint or "applications" not in (checkpoint.data or {}):
+            return {
+                "workflow_id": workflow_id,
+                "status": "not_found",
+                "error": "No application pipeline checkpoint found",
+            }
+
+        items = []
+        for item in checkpoint.data["applications"]:
+            if item.get("status") == "failed" or item.get("completed_stage") == APPLICATION_STAGES[-1]:
+                continue
+            if item.get("status") == "deferred":
+                item.update({"status": "pending", "stage": None})
+            items.append(item)
+
+        self.logger.info(f"Resuming workflow {workflow_id}: {len(items)} applications pending")
+
+        try:
+            application_results = self.run_application_pipeline(workflow_id, items)
+            jobs = [item["job"] for item in items]
+            return self.compile_workflow_results(workflow_id, start_time, jobs, jobs, application_results)
+        except Exception as e:
+            self.logger.error(f"Workflow {workflow_id} resume failed: {e}")
+            return {
+                "workflow_id": workflow_id,
+                "status": "failed",
+                "error": str(e),
+                "started_at": start_time.isoformat(),
+                "completed_at": datetime.now().isoformat(),
+            }
+
+    def run_application_pipeline(self, workflow_id: str, items: List[Dict]) -> List[Dict]:
+        """
+        Run application work items through the staged pipeline
+
+        Stages: document render -> security scan -> email compose -> send -> status write,
+        each with its own worker pool (stage_concurrency) and bounded queues in between.
+        Send outcomes are written to job_applications status_batch_size rows at a time.
+        Progress is checkpointed through FailureRecoveryManager.create_checkpoint.
+
+        Args:
+            workflow_id: Unique identifier for this workflow run
+            items: Work items from new_application_item (or a checkpoint)
+
+        Returns:
+            List[Dict]: Application processing results
+        """
+        if not items:
+            return []
+
+        send_cap = DailySendCap(self.max_applications_per_day - self.get_daily_application_count())
+        checkpointer = PipelineCheckpointer(
+            lambda stage, data: self.failure_recovery.create_checkpoint(workflow_id, stage, data), items
+        )
+        status_batch = ApplicationStatusBatch(batch_size=self.status_batch_size)
+        pipeline = StagedPipeline(
+            self.build_application_stages(workflow_id, send_cap, status_batch),
+            queue_size=self.pipeline_queue_size,
+            on_progress=checkpointer.record,
+        )
+
+        checkpointer.start()
+        try:
+            finished = pipeline.run(items)
+        finally:
+            status_batch.flush()
+            checkpointer.close()
+
+        self.logger.info(f"Application pipeline {workflow_id} stage statistics: {pipeline.stage_stats}")
+        return [self._application_result(item) for item in finished]
+
+    def build_application_stages(
+        self, workflow_id: str, send_cap: DailySendCap, status_batch: ApplicationStatusBatch
+    ) -> List[PipelineStage]:
+        """Build the application pipeline stages for a workflow run"""
+
+        def render_documents(item: Dict) -> None:
+            if not item.get("app_record_id"):
+                item["app_record_id"] = str(
+                    self.create_application_record(item["job"], item["application_id"], workflow_id)
+                )
+            item["documents"] = self.generate_job_specific_documents(item["job"], item["application_id"])
+
+        def scan_documents(item: Dict) -> None:
+            safe_documents = self.scan_application_documents(item["documents"], item["application_id"])
+            item["documents_blocked"] = len(item["documents"]) - len(safe_documents)
+            item["documents"] = safe_documents
+
+        def compose_email(item: Dict) -> None:
+            item["email"] = self.compose_application_email(item["job"], item["documents"])
+
+        def send_email(item: Dict) -> None:
+            if not send_cap.try_acquire():
+                self.logger.info(f"Daily send limit reached, deferring application {item['application_id']}")
+                item.update({"status": "deferred", "stage": SEND})
+                return
+
+            # Checkpoints are written asynchronously, so the database is the record of what was sent
+            blocking_status = self.claim_application_send(item["app_record_id"])
+            if blocking_status is not None:
+                send_cap.release()
+                if blocking_status == "sent":
+                    self.logger.info(f"Application {item['application_id']} already sent, not resending")
+                    item["email_result"] = {"status": "success", "already_sent": True}
+                    return
+                raise RuntimeError(
+                    f"Application {item['application_id']} cannot be sent (status: {blocking_status}); "
+                    "an earlier send may have been interrupted"
+                )
+            item["email_result"] = self.deliver_application_email(item["email"], item["application_id"])
+
+        def write_status(item: Dict) -> None:
+            email_result = item["email_result"] or {}
+            if not email_result.get("already_sent"):
+                status_batch.record(item["app_record_id"], item["email"]["to_email"], email_result)
+            item.update({"status": "success", "stage": "completed"})
+
+        handlers = {
+            DOCUMENT_RENDER: render_documents,
+            SECURITY_SCAN: scan_documents,
+            EMAIL_COMPOSE: compose_email,
+            SEND: send_email,
+            STATUS_WRITE: write_status,
+        }
+        return [
+            PipelineStage(name, handlers[name], self.stage_concurrency.get(name, 1)) for name in APPLICATION_STAGES
+        ]
+
+    def _application_result(self, item: Dict) -> Dict:
+        """Application result for compile_workflow_results from a pipeline work item"""
+        result = {
+            "job_id": item["job"].get("id"),
+            "application_id": item["application_id"],
+            "status": item["status"],
+            "compatibility_score": item["job"].get("compatibility_score"),
+            "processing_time": item.get("processing_time", 0.0),
+            "stage": item.get("stage"),
+        }
+        if item["status"] == "failed":
+            result["error"] = item.get("error")
+        else:
+            result["documents_generated"] = len(item.get("documents", []))
+            result["documents_blocked"] = item.get("documents_blocked", 0)
+            result["email_sent"] = (item.get("email_result") or {}).get("status") == "success"
+        return result
+
     def discover_eligible_jobs(self, batch_size: int) -> List[Dict]:
         """
         Discover jobs from analyzed_jobs table that haven't been processed
@@ -505,57 +706,6 @@ class ApplicationOrchestrator:
         else:
             return 5  # Not ideal but possible
 
-    @with_retry("workflow_execution")
-    def process_single_application(self, job: Dict, workflow_id: str) -> Dict:
-        """
-        Process a single job application through complete workflow
-
-        Args:
-            job: Job record with compatibility score
-            workflow_id: Unique identifier for this workflow run
-
-        Returns:
-            Dict: Application processing results
-        """
-        application_id = str(uuid.uuid4())
-        start_time = datetime.now()
-
-        try:
-            # Step 1: Create application record
-            app_record_id = self.create_application_record(job, application_id, workflow_id)
-
-            # Step 2: Generate customized documents
-            documents = self.generate_job_specific_documents(job, application_id)
-
-            # Step 3: Compose and send application email
-            email_result = self.send_application_email(job, documents, application_id)
-
-            # Step 4: Update application status
-            self.update_application_status(app_record_id, "sent", email_result)
-
-            return {
-                "job_id": job.get("id"),
-                "application_id": application_id,
-                "status": "success",
-                "compatibility_score": job.get("compatibility_score"),
-                "documents_generated": len(documents),
-                "email_sent": email_result.get("success", False),
-                "processing_time": (datetime.now() - start_time).total_seconds(),
-                "stage": "completed",
-            }
-
-        except Exception as e:
-            self.logger.error(f"Application processing failed for job {job.get('id')}: {e}")
-            return {
-                "job_id": job.get("id"),
-                "application_id": application_id,
-                "status": "failed",
-                "error": str(e),
-                "compatibility_score": job.get("compatibility_score"),
-                "processing_time": (datetime.now() - start_time).total_seconds(),
-                "stage": "failed",
-            }
-
     def create_application_record(self, job: Dict, application_id: str, workflow_id: str) -> str:
         """Create application record in database"""
         with self.get_db_connection() as conn:
@@ -578,8 +728,11 @@ class ApplicationOrchestrator:
                     ),
                 )
 
+                record_id = cursor.fetchone()[0]
                 conn.commit()
-                return cursor.fetchone()[0]
+
+        notify_table_write("job_applications")
+        return record_id
 
     def generate_job_specific_documents(self, job: Dict, application_id: str) -> List[Dict]:
         """Generate customized resume and cover letter for specific job"""
@@ -604,7 +757,9 @@ class ApplicationOrchestrator:
                 "title": f"Resume - {document_data['job_title']} at {document_data['company_name']}",
             }
 
-            resume_result = self.document_generator.generate_document(resume_webhook_data)
+            resume_result = self.document_generator.generate_document(
+                resume_webhook_data, application_id=application_id
+            )
             if resume_result.get("success"):
                 documents.append(
                     {
@@ -622,7 +777,9 @@ class ApplicationOrchestrator:
                 "title": f"Cover Letter - {document_data['job_title']} at {document_data['company_name']}",
             }
 
-            cover_letter_result = self.document_generator.generate_document(cover_letter_webhook_data)
+            cover_letter_result = self.document_generator.generate_document(
+                cover_letter_webhook_data, application_id=application_id
+            )
             if cover_letter_result.get("success"):
                 documents.append(
                     {
@@ -639,43 +796,58 @@ class ApplicationOrchestrator:
             self.logger.error(f"Document generation failed for application {application_id}: {e}")
             return []
 
-    def send_application_email(self, job: Dict, documents: List[Dict], application_id: str) -> Dict:
-        """Compose and send application email with attachments"""
-        try:
-            # Compose email content
-            subject = f"Application for {job.get('job_title', 'Marketing Position')} - Steve Glen"
-
-            email_body = self.compose_application_email_body(job)
-
-            # Prepare attachments
-            attachments = []
-            for doc in documents:
-                if doc.get("file_path"):
-                    attachments.append(doc["file_path"])
-
-            # Send email using available email sender
-            if hasattr(self.email_sender, "send_email_with_attachments"):
-                email_result = self.email_sender.send_email_with_attachments(
-                    recipient="therealstevenglen@gmail.com",  # Test recipient
-                    subject=subject,
-                    body=email_body,
-                    attachments=attachments,
-                )
+    def scan_application_documents(self, documents: List[Dict], application_id: str) -> List[Dict]:
+        """Security-scan generated documents; returns the documents that are safe to attach"""
+        from modules.content.document_generation.docx_security_scanner import scan_docx_file
+
+        safe_documents = []
+        for doc in documents:
+            if not doc.get("file_path"):
+                safe_documents.append(doc)
+                continue
+
+            # Generated documents are ours; only critical threats block them
+            is_safe, report = scan_docx_file(doc["file_path"], strict_mode=False)
+            if is_safe:
+                safe_documents.append(doc)
             else:
-                # Mock email result for testing
-                email_result = {
-                    "success": True,
-                    "message_id": f"mock_message_{application_id}",
-                    "sent_at": datetime.now().isoformat(),
-                    "attachments_count": len(attachments),
-                }
+                self.logger.warning(
+                    f"Blocked {doc.get('type')} for application {application_id}: "
+                    f"{report.get('total_threats', 0)} threats"
+                )
+
+        return safe_documents
 
-            self.logger.info(f"Email sent for application {application_id} with {len(attachments)} attachments")
-            return email_result
+    def compose_application_email(self, job: Dict, documents: List[Dict]) -> Dict:
+        """Compose application email (recipient, subject, body, attachments)"""
+        return {
+            "to_email": APPLICATION_EMAIL_RECIPIENT,
+            "subject": f"Application for {job.get('job_title', 'Marketing Position')} - Steve Glen",
+            "body": self.compose_application_email_body(job),
+            "attachments": [
+                {"path": doc["file_path"], "filename": os.path.basename(doc["file_path"])}
+                for doc in documents
+                if doc.get("file_path")
+            ],
+        }
 
+    def deliver_application_email(self, email: Dict, application_id: str) -> Dict:
+        """Send a composed application email through the bulk sender"""
+        try:
+            email_result = self.email_sender.send(
+                email["to_email"], email["subject"], email["body"], email["attachments"]
+            )
         except Exception as e:
             self.logger.error(f"Email sending failed for application {application_id}: {e}")
-            return {"success": False, "error": str(e)}
+            return {"status": "error", "message": str(e)}
+
+        if email_result.get("status") == "success":
+            self.logger.info(
+                f"Email sent for application {application_id} with {len(email['attachments'])} attachments"
+            )
+        else:
+            self.logger.error(f"Email sending failed for application {application_id}: {email_result.get('message')}")
+        return email_result
 
     def compose_application_email_body(self, job: Dict) -> str:
         """Compose personalized application email body"""
@@ -705,28 +877,63 @@ Application ID: {job.get('id', 'N/A')}
 """
         return email_body
 
-    def update_application_status(self, app_record_id: str, status: str, details: Dict) -> None:
-        """Update application record with final status"""
+    def reconcile_document_store(self) -> Optional[Dict]:
+        """
+        Garbage-collect the content store against job_applications
+
+        References held by applications without a record are released, then
+        blobs nobody references are deleted (locally and remotely).
+
+        Returns:
+            Dict: GC result, or None when the content store is disabled
+        """
+        content_store = getattr(self.document_generator, "content_store", None)
+        if content_store is None:
+            return None
+
+        listed_at = datetime.now()
+        with self.get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT id::text FROM job_applications")
+                active_application_ids = [row[0] for row in cursor.fetchall()]
+
+        result = content_store.gc(active_application_ids=active_application_ids, listed_at=listed_at)
+        self.logger.info(
+            f"Content store reconciled against {len(active_application_ids)} applications: "
+            f"{result['released_references']} references released, {result['deleted_blobs']} blobs deleted"
+        )
+        return result
+
+    def claim_application_send(self, app_record_id: str) -> Optional[str]:
+        """
+        Mark an application as sending, committed before its email goes out
+
+        A resumed workflow whose last checkpoint predates the send finds the
+        claim and does not send the email again.
+
+        Returns:
+            None if the claim succeeded, otherwise the status that blocked it
+            ('sending', 'sent', or 'missing' if the record does not exist)
+        """
         with self.get_db_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     """
-                    UPDATE job_applications 
-                    SET application_status = %s,
-                        notes = COALESCE(notes, '') || %s
+                    UPDATE job_applications
+                    SET application_status = 'sending'
                     WHERE id = %s
+                    AND application_status NOT IN ('sending', 'sent')
+                    RETURNING id
                 """,
-                    (
-                        status,
-                        (
-                            f" | Email sent: {datetime.now().isoformat()}"
-                            if details.get("success")
-                            else f" | Email failed: {details.get('error', 'Unknown error')}"
-                        ),
-                        app_record_id,
-                    ),
+                    (app_record_id,),
                 )
-                conn.commit()
+                if cursor.fetchone():
+                    conn.commit()
+                    return None
+
+                cursor.execute("SELECT application_status FROM job_applications WHERE id = %s", (app_record_id,))
+                row = cursor.fetchone()
+                return row[0] if row else "missing"
 
     def compile_workflow_results(
         self,
@@ -742,6 +949,7 @@ Application ID: {job.get('id', 'N/A')}
 
         successful_applications = [r for r in application_results if r.get("status") == "success"]
         failed_applications = [r for r in application_results if r.get("status") == "failed"]
+        deferred_applications = [r for r in application_results if r.get("status") == "deferred"]
 
         return {
             "workflow_id": workflow_id,
@@ -758,6 +966,7 @@ Application ID: {job.get('id', 'N/A')}
                 "total_processed": len(application_results),
                 "successful_applications": len(successful_applications),
                 "failed_applications": len(failed_applications),
+                "deferred_applications": len(deferred_applications),
                 "success_rate": len(successful_applications) / len(application_results) if application_results else 0,
             },
             "performance_metrics": {
@@ -787,14 +996,14 @@ Application ID: {job.get('id', 'N/A')}
         }
 
     def get_daily_application_count(self) -> int:
-        """Get number of applications sent today"""
+        """Get number of applications sent today (including interrupted sends)"""
         with self.get_db_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     """
                     SELECT COUNT(*) FROM job_applications 
                     WHERE DATE(application_date) = CURRENT_DATE
-                    AND application_status = 'sent'
+                    AND application_status IN ('sending', 'sent')
                 """
                 )
                 return cursor.fetchone()[0]
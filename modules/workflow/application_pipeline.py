@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Module: application_pipeline.py
+Purpose: Staged, concurrent execution of job applications
+Created: 2026-10-18
+Modified: 2026-10-18
+Dependencies: threading, queue
+Related: application_orchestrator.py, modules/resilience/failure_recovery.py
+Description: Runs applications through a chain of stages connected by bounded
+             queues (document render -> security scan -> email compose -> send
+             -> status write). Each stage has its own worker pool, so a run is
+             bounded by the slowest stage instead of the sum of every latency.
+             Progress snapshots are handed to a checkpoint writer after each
+             stage so an interrupted run resumes where each application left
+             off; the send stage enforces the daily send cap.
+"""
+
+import contextvars
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Stage names, in pipeline order
+DOCUMENT_RENDER = "document_render"
+SECURITY_SCAN = "security_scan"
+EMAIL_COMPOSE = "email_compose"
+SEND = "send"
+STATUS_WRITE = "status_write"
+
+APPLICATION_STAGES = (DOCUMENT_RENDER, SECURITY_SCAN, EMAIL_COMPOSE, SEND, STATUS_WRITE)
+
+# Item statuses that skip the remaining stages
+TERMINAL_STATUSES = ("failed", "deferred")
+
+_END_OF_STREAM = object()
+
+
+def new_application_item(job: Dict, application_id: str) -> Dict:
+    """
+    Work item for one application (JSON-serializable so it can be checkpointed)
+
+    Args:
+        job: Job record with compatibility score
+        application_id: Application identifier (also the job_applications id)
+    """
+    return {
+        "job": json.loads(json.dumps(job, default=str)),
+        "application_id": application_id,
+        "app_record_id": None,
+        "completed_stage": None,
+        "status": "pending",
+        "error": None,
+        "stage": None,
+        "documents": [],
+        "documents_blocked": 0,
+        "email": None,
+        "email_result": None,
+        "processing_time": 0.0,
+    }
+
+
+class PipelineStage:
+    """One stage of the pipeline: a handler run by a fixed number of workers"""
+
+    def __init__(self, name: str, handler: Callable[[Dict], None], concurrency: int = 1):
+        """
+        Args:
+            name: Stage name (recorded as the item's completed_stage)
+            handler: Called with the work item; updates it in place, raises on failure
+            concurrency: Number of worker threads for this stage
+        """
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+
+
+class DailySendCap:
+    """Thread-safe count of sends still allowed today"""
+
+    def __init__(self, remaining: int):
+        self.remaining = max(0, remaining)
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take one send slot; False once the cap is reached"""
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+    def release(self) -> None:
+        """Return a slot taken for a send that did not happen"""
+        with self._lock:
+            self.remaining += 1
+
+
+class PipelineCheckpointer:
+    """
+    Coalescing checkpoint writer
+
+    Workers only record the latest state of an item; a background thread
+    writes the newest snapshot of all items whenever something changed, so
+    workers never wait on checkpoint I/O and bursts of progress become one
+    write. Snapshots are written in order, so the latest checkpoint is always
+    the most recent state.
+    """
+
+    def __init__(self, write: Callable[[str, Dict], None], items: List[Dict]):
+        """
+        Args:
+            write: Called with (stage, data); e.g. FailureRecoveryManager.create_checkpoint
+                   bound to a workflow_id
+            items: Work items of the run (initial state)
+        """
+        self._write = write
+        self._states = {item["application_id"]: dict(item) for item in items}
+        self._last_stage = "pipeline_start"
+        self._dirty = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="application-checkpointer", daemon=True)
+        self.writes = 0
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def record(self, item: Dict, stage: str) -> None:
+        """Record an item's state after a stage"""
+        with self._condition:
+            self._states[item["application_id"]] = dict(item)
+            self._last_stage = stage
+            self._dirty = True
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Write any pending snapshot and stop the writer"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def snapshot(self) -> Dict:
+        with self._condition:
+            return {"applications": list(self._states.values())}
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._dirty and not self._closed:
+                    self._condition.wait()
+                if not self._dirty:
+                    return
+                stage = self._last_stage
+                data = {"applications": list(self._states.values())}
+                self._dirty = False
+
+            try:
+                self._write(stage, data)
+                self.writes += 1
+            except Exception as e:
+                logger.warning(f"Application pipeline checkpoint failed: {e}")
+
+
+class StagedPipeline:
+    """
+    Chain of stages connected by bounded queues
+
+    Items flow through every stage in order. A stage skips items that already
+    completed it (resumed runs) and items in a terminal status; a handler
+    exception marks the item failed at that stage. Items leave the pipeline in
+    completion order.
+    """
+
+    def __init__(self, stages: List[PipelineStage], queue_size: int = 10,
+                 on_progress: Optional[Callable[[Dict, str], None]] = None):
+        """
+        Args:
+            stages: Stages in pipeline order
+            queue_size: Capacity of each inter-stage queue (backpressure)
+            on_progress: Called with (item, stage name) after each stage that ran
+        """
+        self.stages = stages
+        self.queue_size = queue_size
+        self.on_progress = on_progress
+        self._stage_index = {stage.name: index for index, stage in enumerate(stages)}
+        self.stage_stats = {stage.name: {"processed": 0, "failed": 0, "busy_seconds": 0.0} for stage in stages}
+        self._stats_lock = threading.Lock()
+
+    def run(self, items: List[Dict]) -> List[Dict]:
+        """
+        Run items through all stages
+
+        Returns:
+            The items after the last stage
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        # The main thread drains the last queue, so it can be unbounded
+        queues.append(queue.Queue())
+
+        threads = []
+        for index, stage in enumerate(self.stages):
+            remaining = [stage.concurrency]
+            lock = threading.Lock()
+            for worker in range(stage.concurrency):
+                # Run in a copy of the caller's context so workflow deadlines reach the stages
+                thread = threading.Thread(
+                    target=contextvars.copy_context().run,
+                    args=(self._worker, stage, index, queues[index], queues[index + 1], remaining, lock),
+                    name=f"{stage.name}-{worker}",
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+        def feed():
+            for item in items:
+                queues[0].put(item)
+            queues[0].put(_END_OF_STREAM)
+
+        feeder = threading.Thread(
+            target=contextvars.copy_context().run, args=(feed,), name="application-pipeline-feeder", daemon=True
+        )
+        feeder.start()
+
+        finished = []
+        while True:
+            item = queues[-1].get()
+            if item is _END_OF_STREAM:
+                break
+            finished.append(item)
+
+        feeder.join()
+        for thread in threads:
+            thread.join()
+        return finished
+
+    def _worker(self, stage: PipelineStage, index: int, inbox: queue.Queue, outbox: queue.Queue,
+                remaining: List[int], lock: threading.Lock) -> None:
+        while True:
+            item = inbox.get()
+            if item is _END_OF_STREAM:
+                # Let sibling workers see the end too; the last one forwards it
+                inbox.put(_END_OF_STREAM)
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    outbox.put(_END_OF_STREAM)
+                return
+
+            if self._should_run(item, index):
+                self._run_stage(stage, item)
+            outbox.put(item)
+
+    def _should_run(self, item: Dict, index: int) -> bool:
+        if item.get("status") in TERMINAL_STATUSES:
+            return False
+        completed = item.get("completed_stage")
+        return completed is None or self._stage_index.get(completed, -1) < index
+
+    def _run_stage(self, stage: PipelineStage, item: Dict) -> None:
+        started = time.perf_counter()
+        try:
+            stage.handler(item)
+            if item.get("status") not in TERMINAL_STATUSES:
+                item["completed_stage"] = stage.name
+            failed = False
+        except Exception as e:
+            logger.error(f"Stage {stage.name} failed for application {item.get('application_id')}: {e}")
+            item.update({"status": "failed", "error": str(e), "stage": stage.name})
+            failed = True
+
+        elapsed = time.perf_counter() - started
+        item["processing_time"] = item.get("processing_time", 0.0) + elapsed
+        with self._stats_lock:
+            stats = self.stage_stats[stage.name]
+            stats["processed"] += 1
+            stats["failed"] += int(failed)
+            stats["busy_seconds"] += elapsed
+
+        if self.on_progress:
+            self.on_progress(item, stage.name)
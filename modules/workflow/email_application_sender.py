@@ -66,6 +66,7 @@ except ImportError:
     DocumentGenerator = MockDocumentGenerator
 
 from modules.database.database_manager import DatabaseManager
+from modules.database.materialized_view_refresher import notify_table_write
 from modules.email_integration.signature_generator import get_signature_generator
 from modules.email_integration.email_content_builder import get_email_content_builder
 from modules.email_integration.email_validator import get_email_validator
@@ -538,6 +539,7 @@ Automated Job Application System"""
                 )
 
                 conn.commit()
+                notify_table_write("job_applications")
                 logger.info(f"Updated application status for job {job_id}: {status} (recipient: {recipient})")
 
         except Exception as e:
@@ -14,7 +14,7 @@ import sys
 import unittest
 import asyncio
 import json
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from datetime import datetime, timedelta
 
 # Add project root to path
@@ -418,6 +418,86 @@ class TestCopywritingEvaluatorPipeline(unittest.TestCase):
         self.assertIsNotNone(stats.start_time)
         self.assertIsNotNone(stats.end_time)
 
+    def test_batched_stage_result_update(self):
+        """Test stage results are written with one UPDATE per table"""
+        pipeline = CopywritingEvaluatorPipeline(self.test_config)
+        results = [
+            {'id': 'test_001', 'table_name': 'sentence_bank_cover_letter', 'status': 'approved', 'model_used': 'm'},
+            {'id': 'test_002', 'table_name': 'sentence_bank_resume', 'status': 'rejected', 'model_used': 'm'},
+            {'id': 'test_003', 'table_name': 'sentence_bank_cover_letter', 'status': 'error',
+             'model_used': 'm', 'error_message': 'timeout'}
+        ]
+
+        with patch.object(pipeline, 'db') as mock_db:
+            asyncio.run(pipeline._update_stage_results(ProcessingStage.TRUTHFULNESS, results))
+
+            self.assertEqual(mock_db.execute_query.call_count, 2)
+            cover_query, cover_params = mock_db.execute_query.call_args_list[0][0]
+            self.assertIn("FROM (VALUES (%s, %s, %s, %s), (%s, %s, %s, %s))", cover_query)
+            self.assertIn("truthfulness_model = v.model_used", cover_query)
+            self.assertIn("truthfulness_error_message = COALESCE", cover_query)
+            self.assertEqual(cover_params, ('test_001', 'approved', 'm', None, 'test_003', 'error', 'm', 'timeout'))
+
+            resume_query, resume_params = mock_db.execute_query.call_args_list[1][0]
+            self.assertNotIn("error_message =", resume_query)
+            self.assertEqual(len(resume_params), 4)
+
+    def test_stage_status_propagation_and_timing(self):
+        """Test stage statuses reach the in-memory sentences and timings are recorded"""
+        pipeline = CopywritingEvaluatorPipeline(self.test_config)
+        processor = Mock()
+        processor.process_batch = AsyncMock(side_effect=lambda batch, session_id: [
+            {'id': s['id'], 'table_name': s['table_name'], 'status': 'approved'} for s in batch
+        ])
+        pipeline._stage_processors[ProcessingStage.CANADIAN_SPELLING] = processor
+        sentences = [dict(sentence) for sentence in self.test_sentences]
+
+        with patch.object(pipeline, 'db'):
+            stage_stats = asyncio.run(pipeline._process_stage(
+                ProcessingStage.CANADIAN_SPELLING, sentences, "test_session"
+            ))
+
+        self.assertEqual(stage_stats['approved'], 3)
+        self.assertTrue(all(s['canadian_spelling_status'] == 'approved' for s in sentences))
+        self.assertGreaterEqual(stage_stats['processor_seconds'], 0.0)
+        self.assertGreaterEqual(stage_stats['db_seconds'], 0.0)
+
+    def test_pipelined_stages_run_concurrently(self):
+        """Test pipelined stages overlap AI batches and drop keyword rejections"""
+        pipeline = CopywritingEvaluatorPipeline(PipelineConfig(batch_size=1, ai_concurrency=3))
+        in_flight = {'current': 0, 'peak': 0}
+
+        def make_processor(stage, delay=0.0, reject_id=None):
+            async def process_batch(batch, session_id):
+                in_flight['current'] += 1
+                in_flight['peak'] = max(in_flight['peak'], in_flight['current'])
+                await asyncio.sleep(delay)
+                in_flight['current'] -= 1
+                return [
+                    {'id': s['id'], 'table_name': s['table_name'],
+                     'status': 'rejected' if s['id'] == reject_id else 'approved'}
+                    for s in batch
+                ]
+            processor = Mock()
+            processor.process_batch = process_batch
+            pipeline._stage_processors[stage] = processor
+
+        make_processor(ProcessingStage.KEYWORD_FILTER, reject_id='test_002')
+        make_processor(ProcessingStage.TRUTHFULNESS, delay=0.01)
+        sentences = [dict(sentence) for sentence in self.test_sentences]
+
+        with patch.object(pipeline, 'db'):
+            stage_results, remaining = asyncio.run(pipeline._process_stages_pipelined(
+                [ProcessingStage.KEYWORD_FILTER, ProcessingStage.TRUTHFULNESS], sentences, "test_session"
+            ))
+
+        self.assertEqual(sorted(s['id'] for s in remaining), ['test_001', 'test_003'])
+        self.assertEqual(stage_results['keyword_filter']['rejected'], 1)
+        self.assertEqual(stage_results['truthfulness']['approved'], 2)
+        self.assertTrue(all(s['truthfulness_status'] == 'approved' for s in remaining))
+        self.assertEqual(sentences[1]['truthfulness_status'], 'pending')
+        self.assertGreater(in_flight['peak'], 1)
+
     def test_restart_capability(self):
         """Test pipeline restart from specific stages"""
         pipeline = CopywritingEvaluatorPipeline(self.test_config)
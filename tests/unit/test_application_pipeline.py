@@ -0,0 +1,195 @@
+"""
+Unit tests for the Staged Application Pipeline
+
+Tests stage ordering, per-stage concurrency limits, failure and deferral
+pass-through, resuming after the last completed stage, the daily send cap
+and coalesced checkpoint writes.
+"""
+
+import threading
+import time
+
+import pytest
+from modules.workflow.application_pipeline import (
+    DailySendCap,
+    PipelineCheckpointer,
+    PipelineStage,
+    StagedPipeline,
+    new_application_item,
+)
+
+
+def make_items(count):
+    return [new_application_item({"id": f"job-{i}", "job_title": "Writer"}, f"app-{i}") for i in range(count)]
+
+
+class ConcurrencyProbe:
+    """Stage handler that records the peak number of concurrent calls"""
+
+    def __init__(self, name, delay=0.01):
+        self.name = name
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, item):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(item["application_id"])
+        time.sleep(self.delay)
+        item.setdefault("trace", []).append(self.name)
+        with self._lock:
+            self.active -= 1
+
+
+@pytest.mark.unit
+class TestStagedPipeline:
+    """Test the bounded-queue stage chain"""
+
+    def test_all_stages_in_order(self):
+        """Test every item passes every stage once, in stage order"""
+        probes = [ConcurrencyProbe(name, delay=0) for name in ("render", "scan", "send")]
+        pipeline = StagedPipeline([PipelineStage(p.name, p, 2) for p in probes], queue_size=2)
+
+        finished = pipeline.run(make_items(12))
+
+        assert sorted(item["application_id"] for item in finished) == sorted(f"app-{i}" for i in range(12))
+        assert all(item["trace"] == ["render", "scan", "send"] for item in finished)
+        assert all(item["completed_stage"] == "send" for item in finished)
+        assert pipeline.stage_stats["scan"]["processed"] == 12
+
+    def test_stage_concurrency_limits(self):
+        """Test each stage runs at most its own number of items at once"""
+        render, send = ConcurrencyProbe("render"), ConcurrencyProbe("send")
+        pipeline = StagedPipeline([PipelineStage("render", render, 4), PipelineStage("send", send, 1)])
+
+        pipeline.run(make_items(16))
+
+        assert send.peak == 1
+        assert 1 < render.peak <= 4
+
+    def test_failed_item_skips_later_stages(self):
+        """Test a handler exception marks the item failed at that stage"""
+        def scan(item):
+            if item["application_id"] == "app-1":
+                raise ValueError("remote template")
+
+        send = ConcurrencyProbe("send", delay=0)
+        pipeline = StagedPipeline([PipelineStage("scan", scan), PipelineStage("send", send)])
+
+        finished = {item["application_id"]: item for item in pipeline.run(make_items(3))}
+
+        assert finished["app-1"]["status"] == "failed"
+        assert finished["app-1"]["stage"] == "scan"
+        assert finished["app-1"]["error"] == "remote template"
+        assert "app-1" not in send.calls
+        assert pipeline.stage_stats["scan"]["failed"] == 1
+
+    def test_resume_skips_completed_stages(self):
+        """Test resumed items continue after their last completed stage"""
+        probes = [ConcurrencyProbe(name, delay=0) for name in ("render", "scan", "send")]
+        pipeline = StagedPipeline([PipelineStage(p.name, p) for p in probes])
+        items = make_items(2)
+        items[0]["completed_stage"] = "scan"
+
+        finished = {item["application_id"]: item for item in pipeline.run(items)}
+
+        assert finished["app-0"]["trace"] == ["send"]
+        assert finished["app-1"]["trace"] == ["render", "scan", "send"]
+
+    def test_deferred_item_keeps_last_completed_stage(self):
+        """Test a deferred item stays resumable at the stage that deferred it"""
+        cap = DailySendCap(1)
+
+        def send(item):
+            if not cap.try_acquire():
+                item["status"] = "deferred"
+
+        pipeline = StagedPipeline([PipelineStage("compose", lambda item: None), PipelineStage("send", send)])
+
+        finished = pipeline.run(make_items(3))
+
+        deferred = [item for item in finished if item["status"] == "deferred"]
+        assert len(deferred) == 2
+        assert all(item["completed_stage"] == "compose" for item in deferred)
+
+    def test_empty_run(self):
+        pipeline = StagedPipeline([PipelineStage("render", lambda item: None, 3)])
+
+        assert pipeline.run([]) == []
+
+
+@pytest.mark.unit
+class TestDailySendCap:
+    """Test the send cap"""
+
+    def test_cap_shared_across_threads(self):
+        cap = DailySendCap(5)
+        granted = []
+
+        def worker():
+            for _ in range(10):
+                granted.append(cap.try_acquire())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert granted.count(True) == 5
+
+    def test_negative_remaining(self):
+        """Test a day already over the limit allows nothing"""
+        assert DailySendCap(-2).try_acquire() is False
+
+    def test_release_returns_slot(self):
+        """Test a slot released for a skipped send can be taken again"""
+        cap = DailySendCap(1)
+        assert cap.try_acquire() is True
+        cap.release()
+        assert cap.try_acquire() is True
+        assert cap.try_acquire() is False
+
+
+@pytest.mark.unit
+class TestPipelineCheckpointer:
+    """Test coalesced checkpoint writes"""
+
+    def test_final_snapshot_written(self):
+        """Test the last write holds the latest state of every item"""
+        writes = []
+        items = make_items(3)
+        checkpointer = PipelineCheckpointer(lambda stage, data: writes.append((stage, data)), items)
+        pipeline = StagedPipeline(
+            [PipelineStage("render", lambda item: None, 2), PipelineStage("send", lambda item: None)],
+            on_progress=checkpointer.record,
+        )
+
+        checkpointer.start()
+        pipeline.run(items)
+        checkpointer.close()
+
+        stage, data = writes[-1]
+        assert stage == "send"
+        assert [item["completed_stage"] for item in data["applications"]] == ["send"] * 3
+        assert 1 <= checkpointer.writes <= 6
+
+    def test_write_failure_does_not_stop_writer(self):
+        calls = []
+
+        def write(stage, data):
+            calls.append(stage)
+            raise RuntimeError("database unavailable")
+
+        items = make_items(1)
+        checkpointer = PipelineCheckpointer(write, items)
+        checkpointer.start()
+        checkpointer.record(items[0], "render")
+        checkpointer.close()
+
+        assert calls == ["render"]
+        assert checkpointer.writes == 0
@@ -0,0 +1,132 @@
+"""
+Unit tests for Canadian Spelling Converter
+
+Tests single-pass case-aware conversion, change tracking, and the shared
+service's version-based reloading.
+"""
+
+import pytest
+from modules.content.copywriting_evaluator.canadian_spelling_converter import (
+    CanadianSpellingService,
+    SpellingConverter,
+    SPELLINGS_QUERY,
+    SPELLINGS_VERSION_QUERY,
+)
+
+
+class FakeDatabase:
+    """Serves canadian_spellings rows and a version checksum"""
+
+    def __init__(self, conversions):
+        self.conversions = dict(conversions)
+        self.queries = []
+
+    def execute_query(self, query, params=()):
+        self.queries.append(query)
+        if query == SPELLINGS_VERSION_QUERY:
+            checksum = '|'.join(f"{a}={c}" for a, c in sorted(self.conversions.items()))
+            return [{'total': len(self.conversions), 'checksum': checksum}]
+        if query == SPELLINGS_QUERY:
+            return [
+                {'american_spelling': american, 'canadian_spelling': canadian}
+                for american, canadian in self.conversions.items()
+            ]
+        raise AssertionError(f"Unexpected query: {query}")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestSpellingConverter:
+    """Test compiled conversion"""
+
+    def test_case_variants(self):
+        """Test exact, capitalized and uppercase forms are converted"""
+        converter = SpellingConverter({'color': 'colour', 'center': 'centre'})
+
+        text, changes = converter.convert('Color at the center of the COLOR CENTER')
+
+        assert text == 'Colour at the centre of the COLOUR CENTRE'
+        assert [change['match_type'] for change in changes] == ['capitalized', 'exact_case', 'uppercase', 'uppercase']
+        assert changes[0] == {'original': 'Color', 'replacement': 'Colour', 'position': 0, 'match_type': 'capitalized'}
+
+    def test_word_boundaries(self):
+        """Test spellings inside longer words are left alone"""
+        converter = SpellingConverter({'color': 'colour'})
+
+        text, changes = converter.convert('multicolored colorful color')
+
+        assert text == 'multicolored colorful colour'
+        assert len(changes) == 1
+
+    def test_longest_entry_wins(self):
+        """Test multi-word and longer entries take precedence"""
+        converter = SpellingConverter({'program': 'programme', 'program director': 'programme director'})
+
+        text, changes = converter.convert('The program director ran the program')
+
+        assert text == 'The programme director ran the programme'
+        assert [change['original'] for change in changes] == ['program director', 'program']
+
+    def test_short_words_have_no_uppercase_variant(self):
+        """Test two-letter spellings are not matched in uppercase"""
+        converter = SpellingConverter({'ax': 'axe'})
+
+        assert converter.convert('ax AX')[0] == 'axe AX'
+
+    def test_empty_dictionary(self):
+        """Test an empty dictionary passes text through"""
+        assert SpellingConverter({}).convert('color') == ('color', [])
+
+
+@pytest.mark.unit
+class TestCanadianSpellingService:
+    """Test the shared service's loading and reloading"""
+
+    def test_loads_once_within_interval(self):
+        """Test conversions are compiled once and reused"""
+        db = FakeDatabase({'color': 'colour'})
+        clock = FakeClock()
+        service = CanadianSpellingService(db=db, check_interval_seconds=60, clock=clock)
+
+        for _ in range(5):
+            assert service.convert('color')[0] == 'colour'
+
+        assert db.queries == [SPELLINGS_VERSION_QUERY, SPELLINGS_QUERY]
+        assert service.reload_count == 1
+
+    def test_reloads_only_when_table_changes(self):
+        """Test an unchanged checksum skips the reload and a changed one recompiles"""
+        db = FakeDatabase({'color': 'colour'})
+        clock = FakeClock()
+        service = CanadianSpellingService(db=db, check_interval_seconds=60, clock=clock)
+        first = service.get_converter()
+
+        clock.now = 61
+        assert service.get_converter() is first
+        assert service.reload_count == 1
+
+        db.conversions['favor'] = 'favour'
+        clock.now = 122
+        assert service.convert('favor')[0] == 'favour'
+        assert service.reload_count == 2
+
+    def test_database_failure_keeps_last_converter(self):
+        """Test a failed version check keeps serving the compiled dictionary"""
+        db = FakeDatabase({'color': 'colour'})
+        clock = FakeClock()
+        service = CanadianSpellingService(db=db, check_interval_seconds=60, clock=clock)
+        service.get_converter()
+
+        def failing_query(query, params=()):
+            raise RuntimeError("database unavailable")
+
+        db.execute_query = failing_query
+        clock.now = 61
+        assert service.convert('color')[0] == 'colour'
@@ -0,0 +1,229 @@
+"""
+Unit tests for the Content-Addressed Document Store
+
+Tests the timestamp-insensitive .docx digest, one physical copy per unique
+document, hard-linked per-application aliases, reference release, GC of
+unreferenced blobs only, single uploads to a backend outside the manifest
+lock, manifest
+persistence and sharing a store directory between processes.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from docx import Document
+from modules.storage.content_store import ContentAddressedStore, content_digest
+from modules.storage.storage_backend import StorageBackend
+
+
+class RecordingBackend(StorageBackend):
+    def __init__(self):
+        super().__init__()
+        self.files = {}
+        self.uploads = 0
+
+    def save(self, filename, content, metadata=None):
+        self.uploads += 1
+        self.files[filename] = content
+        return {"file_path": f"remote/{filename}", "filename": filename, "file_size": len(content)}
+
+    def get(self, filename):
+        return self.files[filename]
+
+    def delete(self, filename):
+        return self.files.pop(filename, None) is not None
+
+    def exists(self, filename):
+        return filename in self.files
+
+    def list(self, prefix=None, pattern=None):
+        return sorted(self.files)
+
+
+def make_docx(path, text, created=None):
+    document = Document()
+    document.add_paragraph(text)
+    document.core_properties.created = created or datetime.now()
+    document.core_properties.modified = datetime.now()
+    document.save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentAddressedStore(base_path=str(tmp_path / "content_store"))
+
+
+@pytest.mark.unit
+class TestContentDigest:
+    """Test content hashing"""
+
+    def test_regenerated_docx_matches(self, tmp_path):
+        """Test timestamps and zip entry dates do not change the digest"""
+        first = make_docx(tmp_path / "a.docx", "Marketing resume", created=datetime(2025, 1, 1))
+        time.sleep(1.1)
+        second = make_docx(tmp_path / "b.docx", "Marketing resume", created=datetime(2025, 6, 1))
+
+        assert open(first, "rb").read() != open(second, "rb").read()
+        assert content_digest(first) == content_digest(second)
+
+    def test_different_content_differs(self, tmp_path):
+        first = make_docx(tmp_path / "a.docx", "Marketing resume")
+        second = make_docx(tmp_path / "b.docx", "Data resume")
+
+        assert content_digest(first) != content_digest(second)
+
+    def test_plain_files_hashed_by_bytes(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_bytes(b"abc")
+
+        assert content_digest(str(path)) == "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+
+
+@pytest.mark.unit
+class TestContentAddressedStore:
+    """Test deduplicated storage and garbage collection"""
+
+    def test_repeated_document_stored_once(self, store, tmp_path):
+        first = store.put(make_docx(tmp_path / "a.docx", "Resume"), "resume_app1.docx", "app1")
+        second = store.put(make_docx(tmp_path / "b.docx", "Resume"), "resume_app2.docx", "app2")
+
+        assert first["deduplicated"] is False
+        assert second["deduplicated"] is True
+        assert first["sha256"] == second["sha256"]
+        assert os.path.samefile(first["file_path"], second["file_path"])
+
+        stats = store.get_stats()
+        assert stats["blobs"] == 1
+        assert stats["references"] == 2
+        assert stats["saved_bytes"] == stats["physical_bytes"]
+
+    def test_replace_source_links_generated_file(self, store, tmp_path):
+        """Test the generated path stays valid and shares the blob's storage"""
+        source = make_docx(tmp_path / "generated.docx", "Resume")
+
+        result = store.put(source, "resume_app1.docx", "app1", replace_source=True)
+
+        assert os.path.samefile(source, result["blob_path"])
+
+    def test_gc_keeps_referenced_blobs(self, store, tmp_path):
+        shared = store.put(make_docx(tmp_path / "a.docx", "Resume"), "resume_app1.docx", "app1")
+        store.put(make_docx(tmp_path / "b.docx", "Resume"), "resume_app2.docx", "app2")
+        unique = store.put(make_docx(tmp_path / "c.docx", "Cover letter"), "letter_app1.docx", "app1")
+
+        assert store.release("app1") == 2
+        result = store.gc()
+
+        assert result["deleted_blobs"] == 1
+        assert not os.path.exists(unique["blob_path"])
+        assert os.path.exists(shared["blob_path"])
+        assert store.get_path("resume_app1.docx") is None
+        assert store.get_path("resume_app2.docx") is not None
+
+    def test_gc_releases_inactive_and_expired_references(self, store, tmp_path):
+        store.put(make_docx(tmp_path / "a.docx", "One"), "one.docx", "app1")
+        store.put(make_docx(tmp_path / "b.docx", "Two"), "two.docx", "app2")
+        store.put(make_docx(tmp_path / "c.docx", "Three"), "three.docx", "app3")
+        with store._locked_manifest():
+            store._manifest["refs"]["app3"]["three.docx"]["created_at"] = (
+                datetime.now() - timedelta(hours=48)
+            ).isoformat()
+            store._save_manifest()
+
+        result = store.gc(active_application_ids=["app2", "app3"], max_age_hours=24)
+
+        assert result["released_references"] == 2
+        assert result["remaining_blobs"] == 1
+        assert store.get_path("two.docx") is not None
+
+    def test_gc_keeps_references_created_after_listing(self, store, tmp_path):
+        """Test an application created after the ID list was read keeps its documents"""
+        store.put(make_docx(tmp_path / "a.docx", "One"), "one.docx", "app1")
+        listed_at = datetime.now()
+        store.put(make_docx(tmp_path / "b.docx", "Two"), "two.docx", "app2")
+
+        result = store.gc(active_application_ids=[], listed_at=listed_at)
+
+        assert result["released_references"] == 1
+        assert store.get_path("two.docx") is not None
+
+    def test_backend_receives_each_blob_once(self, tmp_path):
+        backend = RecordingBackend()
+        store = ContentAddressedStore(base_path=str(tmp_path / "store"), backend=backend)
+
+        for i in range(3):
+            result = store.put(make_docx(tmp_path / f"{i}.docx", "Resume"), f"resume_{i}.docx", f"app{i}")
+
+        assert backend.uploads == 1
+        assert result["remote"]["file_path"] == f"remote/blob_{result['sha256']}.docx"
+
+        for i in range(3):
+            store.release(f"app{i}")
+        store.gc()
+        assert backend.files == {}
+
+    def test_upload_runs_outside_manifest_lock(self, tmp_path):
+        """Test another process can use the manifest while a blob uploads"""
+        other = ContentAddressedStore(base_path=str(tmp_path / "store"))
+        manifest_available = []
+        reads_during_upload = []
+
+        class CheckingBackend(RecordingBackend):
+            def save(self, filename, content, metadata=None):
+                reader = threading.Thread(target=lambda: manifest_available.append(other.get_stats()))
+                reader.daemon = True
+                reader.start()
+                reader.join(timeout=2)
+                reads_during_upload.append(list(manifest_available))
+                return super().save(filename, content, metadata)
+
+        backend = CheckingBackend()
+        store = ContentAddressedStore(base_path=str(tmp_path / "store"), backend=backend)
+        result = store.put(make_docx(tmp_path / "a.docx", "Resume"), "resume_app1.docx", "app1")
+
+        assert [[stats["references"] for stats in reads] for reads in reads_during_upload] == [[1]]
+        assert result["remote"]["file_path"] == f"remote/blob_{result['sha256']}.docx"
+
+        # The upload was recorded, so a put from another store does not repeat it
+        reopened = ContentAddressedStore(base_path=str(tmp_path / "store"), backend=backend)
+        reopened.put(make_docx(tmp_path / "b.docx", "Resume"), "resume_app2.docx", "app2")
+        assert backend.uploads == 1
+
+    def test_shared_filename_alias_kept(self, store, tmp_path):
+        """Test releasing one application keeps an alias another still references"""
+        path = make_docx(tmp_path / "a.docx", "Resume")
+        store.put(path, "Resume.docx", "app1")
+        store.put(path, "Resume.docx", "app2")
+
+        store.release("app1")
+
+        assert store.get_path("Resume.docx") is not None
+
+    def test_manifest_persists(self, store, tmp_path):
+        store.put(make_docx(tmp_path / "a.docx", "Resume"), "resume_app1.docx", "app1")
+
+        reopened = ContentAddressedStore(base_path=str(store.base_path))
+        result = reopened.put(make_docx(tmp_path / "b.docx", "Resume"), "resume_app2.docx", "app2")
+
+        assert result["deduplicated"] is True
+        assert reopened.get_stats()["references"] == 2
+
+    def test_stores_sharing_directory_see_each_others_references(self, store, tmp_path):
+        """Test a second process's references survive the first one's writes and GC"""
+        other = ContentAddressedStore(base_path=str(store.base_path))
+        store.put(make_docx(tmp_path / "a.docx", "Resume"), "resume_app1.docx", "app1")
+        theirs = other.put(make_docx(tmp_path / "b.docx", "Cover letter"), "letter_app2.docx", "app2")
+        store.put(make_docx(tmp_path / "c.docx", "Other resume"), "resume_app3.docx", "app3")
+
+        result = store.gc(active_application_ids=["app1", "app2", "app3"])
+
+        assert result["deleted_blobs"] == 0
+        assert os.path.exists(theirs["blob_path"])
+        assert other.get_stats()["references"] == 3
+
+    def test_invalid_filename(self, store, tmp_path):
+        with pytest.raises(ValueError):
+            store.put(make_docx(tmp_path / "a.docx", "Resume"), "../escape.docx", "app1")
@@ -0,0 +1,272 @@
+"""
+Unit tests for the Data Consistency Validator
+
+Tests that checks become full-scan or watermark-filtered queries, that the
+watermark only advances when every check succeeded, that checks run
+concurrently on a shared pool, and that corrections are applied in batched
+statements in one transaction. The database is replaced by a scripted fake
+connection.
+"""
+
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from modules.resilience import data_consistency_validator as dcv
+from modules.resilience.data_consistency_validator import (
+    CONSISTENCY_CHECKS,
+    ConsistencyIssue,
+    DataConsistencyValidator,
+)
+
+PREVIOUS_RUN = {"watermark_txid": 1000, "started_at": datetime(2026, 1, 1, 2, 0), "full_scan_due": False}
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.db.statements.append((" ".join(sql.split()), params, threading.current_thread().name))
+        self.rows, self.rowcount = self.db.respond(sql, params)
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+        self.autocommit = False
+
+    def cursor(self, cursor_factory=None):
+        return FakeCursor(self.db)
+
+    def commit(self):
+        self.db.commits += 1
+
+
+class FakeDatabase:
+    """Answers check queries from a map of issue_type -> violating keys"""
+
+    def __init__(self, violations=None, previous_run=None, failing=()):
+        self.violations = violations or {}
+        self.previous_run = previous_run
+        self.failing = set(failing)
+        self.statements = []
+        self.commits = 0
+        self.check_threads = set()
+
+    def respond(self, sql, params):
+        if "FROM validation_runs" in sql:
+            return ([self.previous_run] if self.previous_run else []), 0
+        for check in CONSISTENCY_CHECKS:
+            # Everything before the first row filter identifies the check
+            if " ".join(sql.split()).startswith(" ".join(check.query.split("{")[0].split())):
+                self.check_threads.add(threading.current_thread().name)
+                if check.issue_type in self.failing:
+                    raise RuntimeError("relation does not exist")
+                return [(key,) for key in self.violations.get(check.issue_type, [])], 0
+        return [], len(params) if isinstance(params, list) else 1
+
+
+@pytest.fixture
+def make_validator(monkeypatch):
+    def factory(db, **kwargs):
+        monkeypatch.setattr(DataConsistencyValidator, "_initialize_validation_tables", lambda self: None)
+        monkeypatch.setattr(dcv, "execute_values", lambda cursor, sql, rows: cursor.execute(sql, rows))
+        validator = DataConsistencyValidator(**kwargs)
+
+        @contextmanager
+        def connection():
+            yield FakeConnection(db)
+
+        validator.get_db_connection = connection
+        return validator
+
+    return factory
+
+
+def check_named(issue_type):
+    return next(check for check in CONSISTENCY_CHECKS if check.issue_type == issue_type)
+
+
+@pytest.mark.unit
+class TestCheckQueries:
+    """Test full-scan and incremental query construction"""
+
+    @pytest.mark.parametrize("check", CONSISTENCY_CHECKS, ids=lambda check: check.issue_type)
+    def test_full_scan_has_no_row_filter(self, make_validator, check):
+        query = make_validator(FakeDatabase())._build_check_query(check, None)
+
+        assert "xmin" not in query
+        assert "%(" not in query
+        assert "{" not in query
+
+    @pytest.mark.parametrize("check", CONSISTENCY_CHECKS, ids=lambda check: check.issue_type)
+    def test_incremental_filters_changed_rows(self, make_validator, check):
+        query = make_validator(FakeDatabase())._build_check_query(check, PREVIOUS_RUN)
+
+        assert "xmin) <= age(%(watermark_xid)s::xid)" in query
+        assert "txid_current()" not in query
+        assert "{" not in query
+
+    def test_time_based_check_includes_rows_crossing_threshold(self, make_validator):
+        query = make_validator(FakeDatabase())._build_check_query(check_named("stalled_workflows"), PREVIOUS_RUN)
+
+        assert "j.created_at >= %(since)s - INTERVAL '24 hours'" in query
+        assert "age(j.xmin)" in query
+
+
+@pytest.mark.unit
+class TestValidationRun:
+    """Test watermark handling and concurrent checks"""
+
+    def test_first_run_is_full_scan(self, make_validator):
+        db = FakeDatabase(violations={"orphaned_job_applications": ["a1"]})
+        results = make_validator(db).validate_complete_workflow()
+
+        assert results["full_scan"] is True
+        assert results["checked_since"] is None
+        assert not any("xmin" in sql for sql, _, _ in db.statements if "AS key" in sql)
+        assert results["issues"][0]["affected_records"] == ["a1"]
+
+    def test_incremental_run_passes_watermark(self, make_validator):
+        db = FakeDatabase(previous_run=PREVIOUS_RUN)
+        results = make_validator(db).validate_complete_workflow()
+
+        assert results["full_scan"] is False
+        check_params = [params for sql, params, _ in db.statements if "AS key" in sql]
+        assert len(check_params) == len(CONSISTENCY_CHECKS)
+        assert all(params["watermark_xid"] == "1000" for params in check_params)
+
+    def test_full_scan_when_due(self, make_validator):
+        db = FakeDatabase(previous_run=dict(PREVIOUS_RUN, full_scan_due=True))
+        assert make_validator(db).validate_complete_workflow()["full_scan"] is True
+
+    def test_watermark_advances_only_when_all_checks_succeed(self, make_validator):
+        db = FakeDatabase(previous_run=PREVIOUS_RUN)
+        make_validator(db).validate_complete_workflow()
+        assert any(sql.startswith("UPDATE validation_runs SET completed_at") for sql, _, _ in db.statements)
+
+        db = FakeDatabase(previous_run=PREVIOUS_RUN, failing={"orphaned_job_applications"})
+        results = make_validator(db).validate_complete_workflow()
+        assert not any(sql.startswith("UPDATE validation_runs") for sql, _, _ in db.statements)
+        assert results["issues"][0]["issue_type"] == "validation_error"
+
+    def test_silent_check_failure_not_reported(self, make_validator):
+        db = FakeDatabase(failing={"missing_document_tracking"})
+        results = make_validator(db).validate_complete_workflow()
+
+        assert results["total_issues"] == 0
+        assert not any(sql.startswith("UPDATE validation_runs") for sql, _, _ in db.statements)
+
+    def test_checks_run_concurrently(self, make_validator):
+        db = FakeDatabase()
+        make_validator(db, max_workers=4).validate_complete_workflow()
+
+        assert all(name.startswith("consistency-check") for name in db.check_threads)
+
+
+@pytest.mark.unit
+class TestSharedPool:
+    """Test validators share one lazily opened pool"""
+
+    def test_one_pool_per_database(self, monkeypatch):
+        created = []
+
+        class FakePool:
+            def __init__(self, minconn, maxconn, db_url):
+                created.append((minconn, maxconn, db_url))
+
+            def closeall(self):
+                pass
+
+        monkeypatch.setattr(dcv, "ThreadedConnectionPool", FakePool)
+        monkeypatch.setattr(dcv, "_pools", {})
+
+        first = dcv._get_shared_pool("postgresql://db")
+        assert dcv._get_shared_pool("postgresql://db") is first
+        assert created == [(1, dcv.POOL_MAX_CONNECTIONS, "postgresql://db")]
+
+        dcv.close_connection_pools()
+        assert dcv._get_shared_pool("postgresql://db") is not first
+
+    def test_getconn_waits_for_free_connection(self, monkeypatch):
+        class FakePool:
+            def __init__(self, minconn, maxconn, db_url):
+                self.in_use = 0
+
+            def getconn(self):
+                self.in_use += 1
+                return object()
+
+            def putconn(self, conn):
+                self.in_use -= 1
+
+        monkeypatch.setattr(dcv, "ThreadedConnectionPool", FakePool)
+        pool = dcv._SharedConnectionPool("postgresql://db", 1)
+        conn = pool.getconn()
+
+        waiter = threading.Thread(target=lambda: pool.putconn(pool.getconn()))
+        waiter.start()
+        waiter.join(0.1)
+        assert waiter.is_alive()
+
+        pool.putconn(conn)
+        waiter.join(1)
+        assert not waiter.is_alive()
+
+
+@pytest.mark.unit
+class TestBulkCorrections:
+    """Test corrections are batched into one transaction"""
+
+    def test_keys_applied_in_batches(self, make_validator, monkeypatch):
+        monkeypatch.setattr(dcv, "CORRECTION_BATCH_SIZE", 2)
+        db = FakeDatabase()
+        issue = ConsistencyIssue("orphaned_job_applications", "critical", "", ["a1", "a2", "a3", "a4", "a5"], True)
+
+        [result] = make_validator(db)._apply_corrections([issue], "run-1")
+
+        deletes = [params for sql, params, _ in db.statements if sql.startswith("DELETE FROM job_applications")]
+        assert deletes == [["a1", "a2"], ["a3", "a4"], ["a5"]]
+        assert result["success"] and result["records_affected"] == 5
+        assert db.commits == 1
+
+    def test_missing_applications_inserted_in_one_statement(self, make_validator):
+        db = FakeDatabase()
+        issue = ConsistencyIssue("missing_job_applications", "warning", "", ["j1", "j2", "j3"], True)
+
+        make_validator(db)._apply_corrections([issue], "run-1")
+
+        inserts = [sql for sql, _, _ in db.statements if sql.startswith("INSERT INTO job_applications")]
+        assert len(inserts) == 1
+        assert re.search(r"IN \(%s,%s,%s\)", inserts[0])
+
+    def test_corrections_logged_in_one_statement(self, make_validator):
+        db = FakeDatabase()
+        issues = [
+            ConsistencyIssue("inconsistent_analysis_state", "warning", "", ["j1"], True),
+            ConsistencyIssue("missing_analysis_data", "critical", "", ["j2"], True),
+        ]
+
+        results = make_validator(db)._apply_corrections(issues, "run-1")
+
+        logs = [params for sql, params, _ in db.statements if sql.startswith("INSERT INTO data_corrections")]
+        assert len(logs) == 1 and len(logs[0]) == 2
+        assert [r["correction_type"] for r in results] == ["inconsistent_analysis_state", "missing_analysis_data"]
+        assert sum(1 for sql, _, _ in db.statements if sql == "SAVEPOINT correction") == 2
@@ -0,0 +1,191 @@
+"""
+Unit tests for Deadline Propagation and Hedged Requests
+
+Tests that nested deadline scopes only shorten the budget, that deadlines
+reach worker threads and bound timeouts, sleeps and retries, and that
+hedged calls start the backup after the p95 delay and return whichever
+acceptable result arrives first.
+"""
+
+import contextvars
+import threading
+import time
+
+import pytest
+from modules.resilience.retry_strategy_manager import RetryStrategyManager
+from modules.resilience.timeout_manager import (
+    LatencyTracker,
+    ResilienceTimeoutError,
+    bounded_timeout,
+    check_deadline,
+    deadline_exceeded,
+    deadline_scope,
+    get_current_deadline,
+    get_hedge_stats,
+    get_latency_tracker,
+    hedged_call,
+    remaining_time,
+    sleep_within_deadline,
+)
+
+
+@pytest.mark.unit
+class TestDeadlineScope:
+    """Test deadline nesting and propagation"""
+
+    def test_unbounded_by_default(self):
+        assert get_current_deadline() is None
+        assert remaining_time() is None
+        assert bounded_timeout(30) == 30
+        assert not deadline_exceeded()
+
+    def test_nested_scope_cannot_extend(self):
+        with deadline_scope(5, "outer") as outer:
+            with deadline_scope(60, "inner") as inner:
+                assert inner is outer
+                assert remaining_time() <= 5
+            with deadline_scope(1, "inner") as inner:
+                assert inner.name == "inner"
+                assert remaining_time() <= 1
+            assert get_current_deadline() is outer
+        assert get_current_deadline() is None
+
+    def test_bounded_timeout_caps_and_raises(self):
+        with deadline_scope(2):
+            assert bounded_timeout(30) <= 2
+        with deadline_scope(0, "nightly"):
+            assert deadline_exceeded()
+            with pytest.raises(ResilienceTimeoutError, match="nightly"):
+                bounded_timeout(30, "gemini_request")
+            with pytest.raises(ResilienceTimeoutError):
+                check_deadline()
+
+    def test_sleep_skipped_past_deadline(self):
+        with deadline_scope(0.5):
+            start = time.monotonic()
+            assert not sleep_within_deadline(30)
+            assert time.monotonic() - start < 0.1
+            assert sleep_within_deadline(0.01)
+
+    def test_deadline_reaches_worker_threads(self):
+        seen = []
+        with deadline_scope(10, "workflow"):
+            thread = threading.Thread(
+                target=contextvars.copy_context().run, args=(lambda: seen.append(get_current_deadline()),)
+            )
+            thread.start()
+            thread.join()
+        assert seen[0].name == "workflow"
+
+    def test_retries_stop_at_deadline(self):
+        manager = RetryStrategyManager()
+        manager.register_strategy("flaky", base_delay=5.0, max_attempts=5)
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            raise ConnectionError("connection reset")
+
+        start = time.monotonic()
+        with deadline_scope(1):
+            with pytest.raises(ConnectionError):
+                manager.execute_with_retry("flaky", flaky)
+
+        assert calls == [1]
+        assert time.monotonic() - start < 1
+
+
+@pytest.mark.unit
+class TestHedgedCall:
+    """Test hedge timing and winner selection"""
+
+    def test_fast_primary_not_hedged(self):
+        hedged = []
+        result = hedged_call(lambda: "primary", lambda: hedged.append(1), "fast_op", hedge_delay=1.0)
+
+        assert result == "primary"
+        assert hedged == []
+
+    def test_slow_primary_loses_to_hedge(self):
+        before = get_hedge_stats()
+        start = time.monotonic()
+
+        result = hedged_call(lambda: time.sleep(1.0) or "primary", lambda: "hedge", "slow_op", hedge_delay=0.05)
+
+        assert result == "hedge"
+        assert time.monotonic() - start < 0.5
+        after = get_hedge_stats()
+        assert after["hedged"] == before["hedged"] + 1
+        assert after["hedge_wins"] == before["hedge_wins"] + 1
+
+    def test_failed_primary_hedges_immediately(self):
+        def primary():
+            raise ConnectionError("overloaded")
+
+        start = time.monotonic()
+        assert hedged_call(primary, lambda: "hedge", "failing_op", hedge_delay=5.0) == "hedge"
+        assert time.monotonic() - start < 1
+
+    def test_unaccepted_result_waits_for_other(self):
+        result = hedged_call(
+            lambda: 503, lambda: time.sleep(0.05) or 200, "status_op", hedge_delay=1.0, accept=lambda code: code == 200
+        )
+        assert result == 200
+
+    def test_both_unaccepted_returns_primary(self):
+        assert hedged_call(lambda: 503, lambda: 429, "overloaded_op", hedge_delay=0.0, accept=lambda c: c == 200) == 503
+
+    def test_both_fail_raises_primary_error(self):
+        def primary():
+            raise ConnectionError("primary down")
+
+        def hedge():
+            raise TimeoutError("hedge slow")
+
+        with pytest.raises(ConnectionError):
+            hedged_call(primary, hedge, "down_op", hedge_delay=0.0)
+
+    def test_only_primary_latency_recorded(self):
+        hedged_call(lambda: time.sleep(0.3) or "primary", lambda: "hedge", "tracked_op", hedge_delay=0.01)
+        tracker = get_latency_tracker("tracked_op")
+
+        assert len(tracker) == 0
+        time.sleep(0.4)
+        assert len(tracker) == 1
+
+    def test_no_hedge_until_latencies_recorded(self):
+        hedged = []
+        for _ in range(3):
+            hedged_call(lambda: "primary", lambda: hedged.append(1), "cold_op")
+        assert hedged == []
+
+    def test_hedge_runs_under_callers_deadline(self):
+        with deadline_scope(10, "workflow"):
+            deadline = hedged_call(
+                lambda: time.sleep(1.0), lambda: get_current_deadline(), "deadline_op", hedge_delay=0.0,
+                accept=lambda result: result is not None
+            )
+        assert deadline.name == "workflow"
+
+
+@pytest.mark.unit
+class TestLatencyTracker:
+    """Test percentile estimation"""
+
+    def test_percentile_needs_min_samples(self):
+        tracker = LatencyTracker(min_samples=5)
+        for latency in [0.1, 0.2, 0.3, 0.4]:
+            tracker.record(latency)
+        assert tracker.percentile(0.95) is None
+
+        tracker.record(0.5)
+        assert tracker.percentile(0.95) == 0.5
+
+    def test_p95_of_window(self):
+        tracker = LatencyTracker(window=100, min_samples=1)
+        for latency in range(1, 201):
+            tracker.record(latency / 100)
+
+        assert len(tracker) == 100
+        assert tracker.percentile(0.95) == pytest.approx(1.96)
+        assert tracker.percentile(0.5) == pytest.approx(1.51)
@@ -0,0 +1,68 @@
+"""
+Unit tests for Gemini Dispatcher
+
+Tests the shared token bucket pacing and that blocking calls run off the
+event loop.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from modules.content.copywriting_evaluator.gemini_dispatcher import (
+    GeminiRateLimiter,
+    call_gemini,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestGeminiRateLimiter:
+    """Test token bucket reservations"""
+
+    def test_burst_then_paced(self):
+        """Test the burst is free and further requests are spaced at the rate"""
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(requests_per_minute=60, burst=2, clock=clock)
+
+        waits = [limiter._reserve() for _ in range(4)]
+
+        assert waits == [0.0, 0.0, 1.0, 2.0]
+        assert limiter.get_stats()['total_acquired'] == 4
+
+    def test_refills_over_time(self):
+        """Test tokens refill at the configured rate up to the burst size"""
+        clock = FakeClock()
+        limiter = GeminiRateLimiter(requests_per_minute=120, burst=1, clock=clock)
+
+        assert limiter._reserve() == 0.0
+        clock.now = 10.0
+        assert limiter._reserve() == 0.0
+        assert limiter._reserve() == pytest.approx(0.5)
+
+
+@pytest.mark.unit
+class TestCallGemini:
+    """Test dispatching blocking calls"""
+
+    def test_runs_in_worker_thread(self):
+        """Test the blocking call does not run on the event loop thread"""
+        limiter = GeminiRateLimiter(requests_per_minute=6000, burst=10)
+        loop_thread = threading.get_ident()
+
+        async def run():
+            return await asyncio.gather(*(
+                call_gemini(threading.get_ident, limiter=limiter) for _ in range(3)
+            ))
+
+        thread_ids = asyncio.run(run())
+
+        assert loop_thread not in thread_ids
+        assert limiter.get_stats()['total_acquired'] == 3
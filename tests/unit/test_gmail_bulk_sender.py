@@ -0,0 +1,252 @@
+"""
+Unit tests for Gmail Bulk Sending
+
+Tests the streaming MIME builder against the email parser, attachment cache
+reuse, upload protocol selection, token refresh and batched status writes,
+using a fake HTTP session.
+"""
+
+import email
+import os
+
+import pytest
+from modules.email_integration import gmail_bulk_sender
+from modules.email_integration.gmail_bulk_sender import (
+    ApplicationStatusBatch,
+    AttachmentCache,
+    GmailApiSession,
+    GmailBulkSender,
+    StreamingMimeBuilder,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.headers = headers or {}
+        self.text = str(self._payload)
+
+    def json(self):
+        return self._payload
+
+
+class FakeHttpSession:
+    """Records requests; answers 401 for tokens listed in expired"""
+
+    def __init__(self, expired=()):
+        self.requests = []
+        self.expired = set(expired)
+        self.closed = False
+
+    def _respond(self, method, url, headers, data):
+        body = data.read() if hasattr(data, "read") else data
+        self.requests.append((method, url, headers, body))
+        if headers["Authorization"].split()[-1] in self.expired:
+            return FakeResponse(401)
+        if "uploadType=resumable" in url:
+            return FakeResponse(200, headers={"Location": "https://upload/session-1"})
+        return FakeResponse(200, {"id": f"msg-{len(self.requests)}", "threadId": "t1"})
+
+    def post(self, url, headers=None, data=None, json=None, timeout=None):
+        return self._respond("POST", url, headers, data)
+
+    def put(self, url, headers=None, data=None, timeout=None):
+        return self._respond("PUT", url, headers, data)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeOAuthManager:
+    def __init__(self, token="token-1"):
+        self.token = token
+        self.refreshes = 0
+
+    def get_valid_token(self):
+        return self.token
+
+    def refresh_access_token(self):
+        self.refreshes += 1
+        return {"status": "success", "tokens": {"access_token": "token-2"}}
+
+
+@pytest.fixture
+def resume_file(tmp_path):
+    path = tmp_path / "resume.docx"
+    path.write_bytes(os.urandom(200000))
+    return path
+
+
+@pytest.mark.unit
+class TestStreamingMimeBuilder:
+    """Test message construction"""
+
+    def test_round_trip(self, resume_file):
+        """Test the parsed message carries the headers, body and exact attachment bytes"""
+        builder = StreamingMimeBuilder()
+
+        message, size = builder.build(
+            "hr@example.com", "Application for Marketing Manager", "Dear Hiring Manager,",
+            [{"path": str(resume_file), "filename": "Steve Glen Resume.docx"}],
+        )
+        raw = message.read()
+
+        assert len(raw) == size
+        parsed = email.message_from_bytes(raw)
+        assert parsed["To"] == "hr@example.com"
+        parts = parsed.get_payload()
+        assert parts[0].get_payload(decode=True) == b"Dear Hiring Manager,"
+        assert parts[1].get_filename() == "Steve Glen Resume.docx"
+        assert parts[1].get_payload(decode=True) == resume_file.read_bytes()
+
+    def test_missing_attachment_skipped(self, tmp_path):
+        builder = StreamingMimeBuilder()
+
+        message, _ = builder.build("a@b.c", "s", "b", [{"path": str(tmp_path / "gone.docx"), "filename": "x"}])
+
+        assert len(email.message_from_bytes(message.read()).get_payload()) == 1
+
+    def test_attachment_cache_reused_until_modified(self, resume_file):
+        """Test a document is read once until it changes"""
+        cache = AttachmentCache()
+        builder = StreamingMimeBuilder(cache)
+        attachments = [{"path": str(resume_file), "filename": "r.docx"}]
+
+        builder.build("a@b.c", "s", "b", attachments)
+        builder.build("a@b.c", "s", "b", attachments)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        resume_file.write_bytes(b"regenerated")
+        os.utime(resume_file, ns=(1, 1))
+        message, _ = builder.build("a@b.c", "s", "b", attachments)
+
+        assert cache.misses == 2
+        assert email.message_from_bytes(message.read()).get_payload()[1].get_payload(decode=True) == b"regenerated"
+
+    def test_cache_evicts_to_budget(self, tmp_path):
+        cache = AttachmentCache(max_bytes=3000)
+        for i in range(3):
+            path = tmp_path / f"doc{i}.docx"
+            path.write_bytes(b"x" * 1500)
+            cache.get_encoded(str(path))
+
+        assert cache.get_stats()["bytes"] <= 3000
+
+
+@pytest.mark.unit
+class TestGmailApiSession:
+    """Test upload protocol and connection reuse"""
+
+    def test_media_upload_sends_raw_bytes(self):
+        """Test small messages go as one message/rfc822 upload (no JSON/base64 wrapper)"""
+        http = FakeHttpSession()
+        session = GmailApiSession(FakeOAuthManager(), session=http)
+        message, size = StreamingMimeBuilder().build("a@b.c", "s", "body")
+        expected = message.read()
+        message.seek(0)
+
+        result = session.send_message(message, size, "token-1")
+
+        method, url, headers, body = http.requests[0]
+        assert result["status"] == "success"
+        assert url.endswith("uploadType=media")
+        assert headers["Content-Type"] == "message/rfc822"
+        assert body == expected
+
+    def test_resumable_upload_for_large_messages(self, monkeypatch):
+        monkeypatch.setattr(gmail_bulk_sender, "RESUMABLE_UPLOAD_THRESHOLD", 10)
+        http = FakeHttpSession()
+        session = GmailApiSession(FakeOAuthManager(), session=http)
+        message, size = StreamingMimeBuilder().build("a@b.c", "s", "body")
+
+        result = session.send_message(message, size, "token-1")
+
+        assert result["status"] == "success"
+        assert [(r[0], r[1]) for r in http.requests] == [
+            ("POST", f"{gmail_bulk_sender.GMAIL_UPLOAD_URL}?uploadType=resumable"),
+            ("PUT", "https://upload/session-1"),
+        ]
+        assert http.requests[0][2]["X-Upload-Content-Length"] == str(size)
+
+    def test_expired_token_refreshed_and_message_resent(self):
+        http = FakeHttpSession(expired={"token-1"})
+        oauth = FakeOAuthManager()
+        session = GmailApiSession(oauth, session=http)
+        message, size = StreamingMimeBuilder().build("a@b.c", "s", "body")
+
+        result = session.send_message(message, size, "token-1")
+
+        assert result["status"] == "success"
+        assert oauth.refreshes == 1
+        assert http.requests[0][3] == http.requests[1][3]
+
+
+@pytest.mark.unit
+class TestGmailBulkSender:
+    """Test the send queue"""
+
+    def test_statuses_written_in_batches(self, resume_file):
+        """Test one shared session for all sends and status writes per batch"""
+        http = FakeHttpSession()
+        oauth = FakeOAuthManager()
+        writes = []
+        sender = GmailBulkSender(
+            oauth, api_session=GmailApiSession(oauth, session=http),
+            status_writer=writes.append, status_batch_size=2,
+        )
+        for i in range(5):
+            sender.enqueue(f"app-{i}", "hr@example.com", "s", "b",
+                           [{"path": str(resume_file), "filename": "r.docx"}])
+
+        summary = sender.flush()
+
+        assert summary["sent"] == 5
+        assert [len(batch) for batch in writes] == [2, 2, 1]
+        assert {update["status"] for batch in writes for update in batch} == {"sent"}
+        assert summary["attachment_cache"]["misses"] == 1
+        assert len(http.requests) == 5
+
+    def test_failed_sends_recorded(self):
+        http = FakeHttpSession(expired={"token-1", "token-2"})
+        oauth = FakeOAuthManager()
+        writes = []
+        sender = GmailBulkSender(oauth, api_session=GmailApiSession(oauth, session=http),
+                                 status_writer=writes.append)
+        sender.enqueue("app-0", "hr@example.com", "s", "b")
+
+        summary = sender.flush()
+        sender.close()
+
+        assert summary["failed"] == 1
+        assert writes[0][0]["status"] == "send_failed"
+        assert http.closed
+
+
+@pytest.mark.unit
+class TestApplicationStatusBatch:
+    """Test buffered status writes"""
+
+    def test_written_when_batch_full_or_flushed(self):
+        writes = []
+        batch = ApplicationStatusBatch(writes.append, batch_size=2)
+
+        batch.record("app-0", "hr@example.com", {"status": "success", "gmail_message_id": "m0"})
+        assert writes == []
+        batch.record("app-1", "hr@example.com", {"status": "error", "message": "quota"})
+        batch.record("app-2", "hr@example.com", {"status": "success"})
+        batch.flush()
+
+        assert [[update["application_id"] for update in chunk] for chunk in writes] == [["app-0", "app-1"], ["app-2"]]
+        assert [update["status"] for update in writes[0]] == ["sent", "send_failed"]
+        assert "(m0)" in writes[0][0]["note"]
+        assert "quota" in writes[0][1]["note"]
+
+    def test_writer_failure_logged(self):
+        def failing_writer(chunk):
+            raise RuntimeError("database unavailable")
+
+        batch = ApplicationStatusBatch(failing_writer)
+        batch.record("app-0", "hr@example.com", {"status": "success"})
+        batch.flush()
+        batch.flush()
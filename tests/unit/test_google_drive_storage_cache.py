@@ -0,0 +1,315 @@
+"""
+Unit tests for the Google Drive Storage metadata cache
+
+Tests folder ID caching, fully paginated listing, index-backed
+exists/get/delete, freshness through the changes API, the relist fallback
+and batched deletes, against a fake Drive service.
+"""
+
+import re
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+from modules.storage import google_drive_storage
+from modules.storage.google_drive_storage import GoogleDriveStorageBackend
+
+FOLDER_MIME = "application/vnd.google-apps.folder"
+
+
+class FakeHttpError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.resp = SimpleNamespace(status=status)
+
+
+class FakeRequest:
+    def __init__(self, action):
+        self.action = action
+
+    def execute(self):
+        return self.action()
+
+
+class FakeMediaUpload:
+    def __init__(self, stream, mimetype=None, chunksize=None, resumable=False):
+        self.stream = stream
+        self.chunksize = chunksize
+
+
+class FakeUploadRequest:
+    """Resumable upload: one next_chunk() call per chunk"""
+
+    def __init__(self, drive, body, media):
+        self.drive = drive
+        self.body = body
+        self.media = media
+        self.received = b""
+
+    def next_chunk(self, num_retries=0):
+        chunk = self.media.stream.read(self.media.chunksize)
+        self.received += chunk
+        self.drive.calls["upload_chunk"] += 1
+        if len(chunk) == self.media.chunksize:
+            return SimpleNamespace(resumable_progress=len(self.received), total_size=None), None
+        file_id = self.drive.add_file(self.body["name"], self.body["parents"][0], self.received)
+        return None, {"id": file_id, "webViewLink": f"https://drive/{file_id}", "size": str(len(self.received))}
+
+
+class FakeMediaDownload:
+    def __init__(self, destination, request):
+        self.destination = destination
+        self.request = request
+
+    def next_chunk(self):
+        self.destination.write(self.request.execute())
+        return None, True
+
+
+class FakeBatch:
+    def __init__(self, drive, callback):
+        self.drive = drive
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.drive.calls["batch"] += 1
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except FakeHttpError as e:
+                self.callback(request_id, None, e)
+
+
+class FakeFiles:
+    def __init__(self, drive):
+        self.drive = drive
+
+    def list(self, q, spaces=None, fields=None, pageSize=100, pageToken=None):
+        drive = self.drive
+        parent = re.search(r"'([^']+)' in parents", q).group(1)
+        name = re.search(r"name='([^']+)'", q)
+        folders_only = FOLDER_MIME in q
+        drive.calls["folder_lookup" if folders_only else "list_page"] += 1
+
+        matches = [
+            {"id": file_id, "name": f["name"]}
+            for file_id, f in drive.stored.items()
+            if parent in f["parents"] and not f["trashed"]
+            and (not name or f["name"] == name.group(1))
+            and (f["mimeType"] == FOLDER_MIME) == folders_only
+        ]
+        offset = int(pageToken or 0)
+        page = {"files": matches[offset:offset + pageSize]}
+        if offset + pageSize < len(matches):
+            page["nextPageToken"] = str(offset + pageSize)
+        return FakeRequest(lambda: page)
+
+    def create(self, body, fields=None, media_body=None):
+        if media_body is None:
+            return FakeRequest(lambda: {"id": self.drive.add_file(
+                body["name"], (body.get("parents") or ["root"])[0], mime_type=FOLDER_MIME)})
+        return FakeUploadRequest(self.drive, body, media_body)
+
+    def get_media(self, fileId):
+        def download():
+            if fileId not in self.drive.stored:
+                raise FakeHttpError(404)
+            return self.drive.stored[fileId]["content"]
+        return FakeRequest(download)
+
+    def delete(self, fileId):
+        def remove():
+            if fileId not in self.drive.stored:
+                raise FakeHttpError(404)
+            self.drive.remove_file(fileId)
+        return FakeRequest(remove)
+
+
+class FakeChanges:
+    def __init__(self, drive):
+        self.drive = drive
+
+    def getStartPageToken(self):
+        return FakeRequest(lambda: {"startPageToken": str(len(self.drive.change_log))})
+
+    def list(self, pageToken, spaces=None, fields=None, pageSize=100):
+        def changes():
+            self.drive.calls["changes"] += 1
+            if self.drive.changes_broken:
+                raise FakeHttpError(500)
+            return {"changes": self.drive.change_log[int(pageToken):],
+                    "newStartPageToken": str(len(self.drive.change_log))}
+        return FakeRequest(changes)
+
+
+class FakeDriveService:
+    """In-memory Drive with a change log and per-call counters"""
+
+    def __init__(self):
+        self.stored = {}
+        self.change_log = []
+        self.calls = Counter()
+        self.changes_broken = False
+        self._next_id = 0
+
+    def add_file(self, name, parent, content=b"", mime_type="application/octet-stream"):
+        self._next_id += 1
+        file_id = f"id{self._next_id}"
+        self.stored[file_id] = {"name": name, "parents": [parent], "trashed": False,
+                               "content": content, "mimeType": mime_type}
+        self.change_log.append({"fileId": file_id, "removed": False,
+                                "file": {"name": name, "parents": [parent], "trashed": False}})
+        return file_id
+
+    def remove_file(self, file_id):
+        del self.stored[file_id]
+        self.change_log.append({"fileId": file_id, "removed": True})
+
+    def files(self):
+        return FakeFiles(self)
+
+    def changes(self):
+        return FakeChanges(self)
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self, callback)
+
+
+@pytest.fixture
+def drive():
+    return FakeDriveService()
+
+
+@pytest.fixture
+def storage(drive, monkeypatch):
+    monkeypatch.setenv("APP_VERSION", "4.1")
+    monkeypatch.setattr(google_drive_storage, "GOOGLE_APIS_AVAILABLE", True)
+    monkeypatch.setattr(google_drive_storage, "HttpError", FakeHttpError, raising=False)
+    monkeypatch.setattr(google_drive_storage, "MediaIoBaseUpload", FakeMediaUpload, raising=False)
+    monkeypatch.setattr(google_drive_storage, "MediaIoBaseDownload", FakeMediaDownload, raising=False)
+    monkeypatch.setattr(GoogleDriveStorageBackend, "_authenticate",
+                        lambda self: setattr(self, "service", drive))
+    return GoogleDriveStorageBackend()
+
+
+def seed(storage, drive, count):
+    folder_id = storage._ensure_version_folder()
+    for i in range(count):
+        drive.add_file(f"merlin_v4.1_doc_{i:03d}.docx", folder_id, f"content {i}".encode())
+    return folder_id
+
+
+@pytest.mark.unit
+class TestDriveMetadataCache:
+    """Test folder and file ID caching"""
+
+    def test_list_is_fully_paginated(self, storage, drive, monkeypatch):
+        """Test listings over one page are no longer truncated"""
+        monkeypatch.setattr(google_drive_storage, "LIST_PAGE_SIZE", 100)
+        seed(storage, drive, 250)
+
+        files = storage.list()
+
+        assert len(files) == 250
+        assert files[0] == "doc_000.docx"
+        assert drive.calls["list_page"] == 3
+
+    def test_list_filters(self, storage, drive):
+        folder_id = seed(storage, drive, 3)
+        drive.add_file("merlin_v4.1_resume_a.pdf", folder_id)
+
+        assert storage.list(prefix="resume_") == ["resume_a.pdf"]
+        assert storage.list(pattern="doc_00[12].docx") == ["doc_001.docx", "doc_002.docx"]
+
+    def test_operations_reuse_index(self, storage, drive):
+        """Test exists/get/delete make no lookup queries once the index is loaded"""
+        seed(storage, drive, 5)
+
+        assert storage.exists("doc_001.docx")
+        assert not storage.exists("missing.docx")
+        assert storage.get("doc_002.docx") == b"content 2"
+        assert storage.delete("doc_003.docx") is True
+        assert storage.delete("doc_003.docx") is False
+
+        assert drive.calls["list_page"] == 1
+        assert drive.calls["folder_lookup"] == 2
+
+    def test_save_updates_index(self, storage, drive, monkeypatch):
+        """Test an upload is chunked and visible without relisting"""
+        monkeypatch.setattr(google_drive_storage, "UPLOAD_CHUNK_SIZE", 4)
+        storage.list()
+        progress = []
+
+        with storage.open_write("resume.docx", progress_callback=lambda done, total: progress.append(done)) as writer:
+            writer.write(b"0123456789")
+
+        assert writer.result["file_size"] == 10
+        assert drive.calls["upload_chunk"] == 3
+        assert progress[-1] == 10
+        assert storage.exists("resume.docx")
+        assert storage.open_read("resume.docx").read() == b"0123456789"
+        assert drive.calls["list_page"] == 1
+
+    def test_external_changes_applied_after_ttl(self, storage, drive):
+        """Test files added or removed elsewhere show up through the changes API"""
+        folder_id = seed(storage, drive, 2)
+        storage.index_ttl = 0
+        storage.list()
+
+        drive.add_file("merlin_v4.1_external.docx", folder_id, b"x")
+        removed_id = next(i for i, f in drive.stored.items() if f["name"] == "merlin_v4.1_doc_000.docx")
+        drive.remove_file(removed_id)
+        drive.add_file("merlin_v4.1_elsewhere.docx", "other-folder")
+
+        assert storage.list() == ["doc_001.docx", "external.docx"]
+        assert drive.calls["list_page"] == 1
+        assert drive.calls["changes"] >= 1
+
+    def test_changes_failure_falls_back_to_relist(self, storage, drive):
+        folder_id = seed(storage, drive, 1)
+        storage.index_ttl = 0
+        storage.list()
+        drive.changes_broken = True
+        drive.add_file("merlin_v4.1_new.docx", folder_id)
+
+        assert "new.docx" in storage.list()
+        assert drive.calls["list_page"] == 2
+
+    def test_stale_entry_forgotten_on_404(self, storage, drive):
+        """Test a file deleted elsewhere within the TTL reports not found"""
+        seed(storage, drive, 1)
+        storage.list()
+        drive.stored.clear()
+
+        with pytest.raises(FileNotFoundError):
+            storage.get("doc_000.docx")
+        assert not storage.exists("doc_000.docx")
+
+
+@pytest.mark.unit
+class TestDriveBatchDelete:
+    """Test batched deletes"""
+
+    def test_delete_many_batches_requests(self, storage, drive):
+        seed(storage, drive, 150)
+        names = [f"doc_{i:03d}.docx" for i in range(150)] + ["missing.docx"]
+
+        results = storage.delete_many(names)
+
+        assert drive.calls["batch"] == 2
+        assert sum(results.values()) == 150
+        assert results["missing.docx"] is False
+        assert storage.list() == []
+
+    def test_delete_many_not_found_during_batch(self, storage, drive):
+        seed(storage, drive, 2)
+        storage.list()
+        del drive.stored[next(iter(f for f, v in drive.stored.items() if v["name"].endswith("doc_000.docx")))]
+
+        results = storage.delete_many(["doc_000.docx", "doc_001.docx"])
+
+        assert results == {"doc_000.docx": False, "doc_001.docx": True}
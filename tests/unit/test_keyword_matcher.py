@@ -0,0 +1,71 @@
+"""
+Unit tests for Keyword Matcher
+
+Tests whole-word matching, prefix-overlapping keywords, and equivalence
+with the per-keyword regex search the KeywordFilter used previously.
+"""
+
+import random
+import re
+
+import pytest
+from modules.content.copywriting_evaluator.keyword_matcher import KeywordMatcher
+
+
+def per_keyword_search(text, keywords):
+    """Reference: one word-boundary regex search per keyword"""
+    text_lower = text.lower()
+    return {
+        keyword for keyword in keywords
+        if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower)
+    }
+
+
+@pytest.mark.unit
+class TestKeywordMatcher:
+    """Test compiled keyword matching"""
+
+    def test_whole_words_only(self):
+        """Test keywords inside longer words are not matched"""
+        matcher = KeywordMatcher({'meticulous'})
+
+        assert matcher.find_all('a meticulous review') == ['meticulous']
+        assert matcher.find_all('an unmeticulous review') == []
+        assert matcher.find_all('meticulousness') == []
+
+    def test_prefix_keywords_both_reported(self):
+        """Test a keyword that is a prefix of another is still found"""
+        matcher = KeywordMatcher({'meticulous', 'meticulously'})
+
+        assert matcher.find_all('worked meticulously') == ['meticulously']
+        assert set(matcher.find_all('meticulous and meticulously')) == {'meticulous', 'meticulously'}
+
+    def test_multi_word_and_overlapping_keywords(self):
+        """Test phrases and keywords starting inside another match"""
+        matcher = KeywordMatcher({'best in class', 'best', 'class leading', 'in'})
+
+        found = matcher.find_all('a best in class leading team')
+        assert set(found) == {'best in class', 'best', 'class leading', 'in'}
+
+    def test_empty_keywords(self):
+        """Test an empty keyword set never matches"""
+        matcher = KeywordMatcher(set())
+
+        assert len(matcher) == 0
+        assert matcher.find_all('anything at all') == []
+
+    def test_matches_per_keyword_search(self):
+        """Test results equal the per-keyword regex search on random input"""
+        rng = random.Random(7)
+        alphabet = 'ab -_.+1'
+
+        for _ in range(500):
+            keywords = {
+                ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))).strip()
+                for _ in range(rng.randint(1, 10))
+            } - {''}
+            matcher = KeywordMatcher(keywords)
+
+            for _ in range(10):
+                text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+                assert set(matcher.find_all(text.lower())) == per_keyword_search(text, keywords), (text, keywords)
@@ -0,0 +1,178 @@
+"""
+Unit tests for the Rate Limiter Engine
+
+Tests GCRA burst, refill and retry-after, the sliding window counter's
+weighting of the previous window, LRU bounding and expiry of the in-memory
+store, and limits shared between SQLite store instances on the same file,
+using an injected clock.
+"""
+
+import pytest
+from modules.security.limiter_engine import (
+    GCRALimiter,
+    MemoryLimiterStore,
+    SlidingWindowCounterLimiter,
+    SQLiteLimiterStore,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryLimiterStore()
+    return SQLiteLimiterStore(str(tmp_path / "limits.sqlite3"))
+
+
+@pytest.mark.unit
+class TestGCRALimiter:
+    """Test token bucket behaviour of GCRA"""
+
+    def test_burst_then_denied(self, store, clock):
+        limiter = GCRALimiter(rate=60, period=60, burst=5, store=store, clock=clock)
+
+        results = [limiter.check("client") for _ in range(6)]
+
+        assert [r.allowed for r in results] == [True] * 5 + [False]
+        assert [r.remaining for r in results[:5]] == [4, 3, 2, 1, 0]
+        assert results[5].retry_after == pytest.approx(1.0)
+
+    def test_refills_at_rate(self, store, clock):
+        limiter = GCRALimiter(rate=60, period=60, burst=2, store=store, clock=clock)
+        limiter.check("client")
+        limiter.check("client")
+
+        clock.advance(1.0)
+
+        assert limiter.check("client").allowed
+        assert not limiter.check("client").allowed
+
+    def test_denied_requests_not_counted(self, store, clock):
+        limiter = GCRALimiter(rate=10, period=10, burst=1, store=store, clock=clock)
+        limiter.check("client")
+        for _ in range(5):
+            limiter.check("client")
+
+        clock.advance(1.0)
+
+        assert limiter.check("client").allowed
+
+    def test_peek_and_reset(self, store, clock):
+        limiter = GCRALimiter(rate=60, period=60, burst=3, store=store, clock=clock)
+        limiter.check("a")
+        limiter.check("b")
+
+        assert limiter.peek("a").remaining == 2
+        limiter.reset("a")
+        assert limiter.peek("a").remaining == 3
+        limiter.reset()
+        assert limiter.peek("b").remaining == 3
+
+    def test_namespaces_are_independent(self, store, clock):
+        first = GCRALimiter(rate=1, period=60, store=store, namespace="one", clock=clock)
+        second = GCRALimiter(rate=1, period=60, store=store, namespace="two", clock=clock)
+
+        assert first.check("client").allowed
+        assert second.check("client").allowed
+        first.reset()
+        assert not second.check("client").allowed
+
+
+@pytest.mark.unit
+class TestSlidingWindowCounterLimiter:
+    """Test the weighted two-window counter"""
+
+    def test_limit_within_window(self, store, clock):
+        clock.now = 6000.0  # Start of a 60s window
+        limiter = SlidingWindowCounterLimiter(limit=3, window=60, store=store, clock=clock)
+
+        assert [limiter.check("ip").allowed for _ in range(4)] == [True, True, True, False]
+
+    def test_previous_window_weighted(self, store, clock):
+        clock.now = 6000.0
+        limiter = SlidingWindowCounterLimiter(limit=10, window=60, store=store, clock=clock)
+        for _ in range(10):
+            limiter.check("ip")
+
+        # Halfway through the next window half of the previous count still applies
+        clock.advance(90)
+        results = [limiter.check("ip") for _ in range(6)]
+
+        assert [r.allowed for r in results] == [True] * 5 + [False]
+        assert 0 < results[-1].retry_after <= 60
+
+    def test_old_windows_forgotten(self, store, clock):
+        clock.now = 6000.0
+        limiter = SlidingWindowCounterLimiter(limit=2, window=60, store=store, clock=clock)
+        limiter.check("ip")
+        limiter.check("ip")
+
+        clock.advance(120)
+
+        assert limiter.check("ip").remaining == 1
+
+
+@pytest.mark.unit
+class TestLimiterStores:
+    """Test store bounding and sharing"""
+
+    def test_memory_store_evicts_least_recently_used(self, clock):
+        store = MemoryLimiterStore(max_keys=4, shards=1)
+        limiter = GCRALimiter(rate=1, period=60, store=store, clock=clock)
+        for key in ["a", "b", "c", "d"]:
+            limiter.check(key)
+        limiter.check("a")
+
+        limiter.check("e")
+
+        assert len(store) == 4
+        assert store.evictions == 1
+        assert "gcra:b" not in store.keys()
+
+    def test_expired_state_reads_as_absent(self, clock):
+        store = MemoryLimiterStore()
+        limiter = GCRALimiter(rate=60, period=60, burst=1, store=store, clock=clock)
+        limiter.check("a")
+
+        clock.advance(1.5)
+
+        assert store.get("gcra:a", clock()) is None
+
+    def test_sqlite_limits_shared_between_stores(self, tmp_path, clock):
+        """Test two workers opening the same file enforce one limit"""
+        path = str(tmp_path / "limits.sqlite3")
+        worker_a = GCRALimiter(rate=60, period=60, burst=3, store=SQLiteLimiterStore(path), clock=clock)
+        worker_b = GCRALimiter(rate=60, period=60, burst=3, store=SQLiteLimiterStore(path), clock=clock)
+
+        assert worker_a.check("client").allowed
+        assert worker_b.check("client").allowed
+        assert worker_a.check("client").allowed
+        assert not worker_b.check("client").allowed
+
+    def test_sqlite_prune(self, tmp_path, clock):
+        store = SQLiteLimiterStore(str(tmp_path / "limits.sqlite3"), max_keys=2)
+        limiter = GCRALimiter(rate=60, period=60, store=store, clock=clock)
+        for key in ["a", "b", "c"]:
+            limiter.check(key)
+            clock.advance(0.1)
+
+        assert store.prune(clock()) == 1
+        assert sorted(store.keys()) == ["gcra:b", "gcra:c"]
+
+        clock.advance(120)
+        assert store.prune(clock()) == 2
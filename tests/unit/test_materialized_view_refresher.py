@@ -0,0 +1,192 @@
+"""
+Unit tests for MaterializedViewRefresher
+
+Tests debounce and max-staleness scheduling, advisory lock coordination,
+and refresh statistics using a fake DB-API connection.
+"""
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from modules.database.materialized_view_refresher import (
+    MaterializedViewRefresher, MaterializedViewSpec
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self._result = None
+
+    def execute(self, sql, params=None):
+        self.db.statements.append(sql)
+        if sql.startswith("REFRESH") and self.db.refresh_error:
+            raise self.db.refresh_error
+        if sql.startswith("SELECT pg_try_advisory_lock"):
+            self._result = (self.db.lock_available,)
+        else:
+            self._result = (True,)
+
+    def fetchone(self):
+        return self._result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+        self.autocommit = False
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def close(self):
+        pass
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.statements = []
+        self.lock_available = True
+        self.refresh_error = None
+
+    def connect(self):
+        return FakeConnection(self)
+
+    def refreshes(self):
+        return [s for s in self.statements if s.startswith("REFRESH")]
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_db():
+    return FakeDatabase()
+
+
+@pytest.fixture
+def refresher(clock, fake_db):
+    spec = MaterializedViewSpec(
+        name="application_summary_mv",
+        source_tables=("job_applications",),
+        debounce_seconds=5.0,
+        max_staleness=30.0,
+    )
+    instance = MaterializedViewRefresher(views=[spec], connection_factory=fake_db.connect, clock=clock)
+    # Drive scheduling manually instead of through the background thread
+    instance._ensure_worker = lambda: None
+    return instance
+
+
+@pytest.mark.unit
+class TestRefreshScheduling:
+    """Test debounce and staleness bounds"""
+
+    def test_clean_view_is_not_refreshed(self, refresher, fake_db):
+        refresher.run_pending()
+        assert fake_db.refreshes() == []
+
+    def test_burst_of_writes_is_coalesced(self, refresher, fake_db, clock):
+        for _ in range(10):
+            refresher.notify_table_write("job_applications")
+            clock.advance(1)
+
+        refresher.run_pending()
+        assert fake_db.refreshes() == []
+
+        clock.advance(5)
+        refresher.run_pending()
+        assert fake_db.refreshes() == ["REFRESH MATERIALIZED VIEW CONCURRENTLY application_summary_mv"]
+        assert refresher.get_stats()["application_summary_mv"]["dirty"] is False
+
+    def test_max_staleness_bounds_continuous_writes(self, refresher, fake_db, clock):
+        for _ in range(40):
+            refresher.notify_table_write("job_applications")
+            clock.advance(1)
+            refresher.run_pending()
+
+        assert len(fake_db.refreshes()) == 1
+        stats = refresher.get_stats()["application_summary_mv"]
+        assert stats["last_staleness_seconds"] == pytest.approx(30.0, abs=1.0)
+
+    def test_unrelated_table_does_not_dirty_view(self, refresher, fake_db, clock):
+        refresher.notify_table_write("raw_job_scrapes")
+        clock.advance(60)
+        refresher.run_pending()
+        assert fake_db.refreshes() == []
+
+    def test_failed_refresh_backs_off(self, refresher, fake_db, clock):
+        fake_db.refresh_error = RuntimeError("canceling statement due to lock timeout")
+        refresher.notify_table_write("job_applications")
+        clock.advance(5)
+
+        for _ in range(4):
+            refresher.run_pending()
+            clock.advance(1)
+        assert len(fake_db.refreshes()) == 1
+
+        clock.advance(refresher.FAILURE_BACKOFF_BASE)
+        refresher.run_pending()
+        assert len(fake_db.refreshes()) == 2
+        assert refresher.get_stats()["application_summary_mv"]["retry_in_seconds"] == pytest.approx(10.0)
+
+        fake_db.refresh_error = None
+        clock.advance(10)
+        refresher.run_pending()
+        stats = refresher.get_stats()["application_summary_mv"]
+        assert stats["dirty"] is False
+        assert stats["consecutive_failures"] == 0
+        assert stats["retry_in_seconds"] is None
+
+    def test_set_max_staleness(self, refresher):
+        refresher.set_max_staleness("application_summary_mv", 10.0)
+        assert refresher.get_stats()["application_summary_mv"]["max_staleness_seconds"] == 10.0
+
+
+@pytest.mark.unit
+class TestAdvisoryLock:
+    """Test cross-process coordination"""
+
+    def test_locked_view_stays_dirty(self, refresher, fake_db, clock):
+        fake_db.lock_available = False
+        refresher.notify_table_write("job_applications")
+        clock.advance(10)
+
+        result = refresher.refresh_view("application_summary_mv")
+
+        assert result["status"] == "skipped"
+        assert fake_db.refreshes() == []
+        stats = refresher.get_stats()["application_summary_mv"]
+        assert stats["dirty"] is True
+        assert stats["skipped_locked"] == 1
+
+    def test_lock_released_after_refresh(self, refresher, fake_db):
+        refresher.refresh_view("application_summary_mv")
+        assert fake_db.statements[-1].startswith("SELECT pg_advisory_unlock")
+
+    def test_stats_record_duration(self, refresher):
+        refresher.refresh_view("application_summary_mv")
+        stats = refresher.get_stats()["application_summary_mv"]
+        assert stats["refresh_count"] == 1
+        assert stats["last_refresh_duration_ms"] is not None
+        assert stats["last_refreshed_at"] is not None
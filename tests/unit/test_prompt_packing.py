@@ -0,0 +1,226 @@
+"""
+Unit tests for Prompt Packing
+
+Tests token-budgeted batch packing, halving on unparseable responses, token
+usage accounting and context cache reuse.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from modules.content.copywriting_evaluator.gemini_dispatcher import GeminiRateLimiter
+from modules.content.copywriting_evaluator.prompt_packing import (
+    GeminiContextCache,
+    ResponseParseError,
+    TokenBudget,
+    TokenUsage,
+    apply_prompt_prefix,
+    estimate_tokens,
+    process_packed,
+)
+
+
+def make_sentences(count, text='x' * 40):
+    return [{'id': f"s{i}", 'content_text': text} for i in range(count)]
+
+
+@pytest.fixture(autouse=True)
+def unlimited_gemini_rate(monkeypatch):
+    limiter = GeminiRateLimiter(requests_per_minute=600000, burst=1000)
+    monkeypatch.setattr(
+        'modules.content.copywriting_evaluator.gemini_dispatcher.get_gemini_rate_limiter',
+        lambda: limiter
+    )
+
+
+@pytest.mark.unit
+class TestTokenBudget:
+    """Test greedy packing against the budgets"""
+
+    def test_capped_by_max_sentences(self):
+        """Test batches never exceed max_sentences"""
+        budget = TokenBudget(max_output_tokens=100000, output_tokens_per_sentence=10, max_sentences=20)
+
+        batches = budget.pack(make_sentences(45))
+
+        assert [len(b) for b in batches] == [20, 20, 5]
+
+    def test_capped_by_output_budget(self):
+        """Test expected output per sentence limits the batch size"""
+        budget = TokenBudget(max_output_tokens=1000, output_tokens_per_sentence=100, max_sentences=50)
+
+        batches = budget.pack(make_sentences(10))
+
+        # 80% of 1000 tokens at 100 tokens per sentence
+        assert [len(b) for b in batches] == [8, 2]
+
+    def test_capped_by_input_budget(self):
+        """Test long sentences and the prefix count against the input budget"""
+        budget = TokenBudget(max_output_tokens=100000, output_tokens_per_sentence=10,
+                             max_input_tokens=1000, sentence_overhead_tokens=0)
+        # 400 chars = 100 tokens each; 800 usable - 300 prefix = 5 per batch
+        batches = budget.pack(make_sentences(7, 'y' * 400), prefix_tokens=300)
+
+        assert [len(b) for b in batches] == [5, 2]
+        assert [s['id'] for b in batches for s in b] == [f"s{i}" for i in range(7)]
+
+    def test_oversized_sentence_gets_own_batch(self):
+        """Test a sentence larger than the budget is still sent"""
+        budget = TokenBudget(max_output_tokens=1000, output_tokens_per_sentence=10, max_input_tokens=100)
+
+        batches = budget.pack(make_sentences(2, 'z' * 1000))
+
+        assert [len(b) for b in batches] == [1, 1]
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens('') == 0
+        assert estimate_tokens('abcde') == 2
+
+
+@pytest.mark.unit
+class TestProcessPacked:
+    """Test concurrent batch execution and halving"""
+
+    def test_halves_on_parse_error(self):
+        """Test an unparseable batch is retried in halves and order is kept"""
+        budget = TokenBudget(max_output_tokens=100000, output_tokens_per_sentence=10, max_sentences=8)
+        usage = TokenUsage()
+        calls = []
+
+        def run_batch(batch, strict):
+            calls.append((len(batch), strict))
+            if len(batch) > 2:
+                raise ResponseParseError("truncated JSON")
+            return [{'sentence_id': s['id']} for s in batch]
+
+        results = asyncio.run(process_packed(make_sentences(8), budget, 'prefix', run_batch, usage=usage))
+
+        assert [r['sentence_id'] for r in results] == [f"s{i}" for i in range(8)]
+        assert calls[0] == (8, True)
+        assert usage.split_batches == 3
+
+    def test_single_sentence_not_strict(self):
+        """Test a one-sentence batch is run non-strict so it cannot split further"""
+        budget = TokenBudget(max_output_tokens=1000, output_tokens_per_sentence=10)
+        seen = []
+
+        def run_batch(batch, strict):
+            seen.append(strict)
+            return [{'sentence_id': s['id']} for s in batch]
+
+        asyncio.run(process_packed(make_sentences(1), budget, '', run_batch))
+
+        assert seen == [False]
+
+
+@pytest.mark.unit
+class TestTokenUsage:
+    """Test per-stage token accounting"""
+
+    def test_snapshot(self):
+        usage = TokenUsage()
+        usage.record({'promptTokenCount': 1200, 'cachedContentTokenCount': 1000,
+                      'candidatesTokenCount': 400}, 10)
+        usage.record(None, 10)
+
+        snapshot = usage.snapshot()
+
+        assert snapshot['calls'] == 2
+        assert snapshot['sentences_per_call'] == 10.0
+        assert snapshot['tokens_per_sentence'] == 80.0
+        assert snapshot['uncached_tokens_per_sentence'] == 30.0
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+
+    def json(self):
+        return self._payload
+
+
+class FakePost:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.calls = []
+
+    def __call__(self, url, **kwargs):
+        self.calls.append((url, kwargs['json']))
+        return FakeResponse(self.status_code, {'name': f"cachedContents/c{len(self.calls)}"})
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestGeminiContextCache:
+    """Test explicit context cache creation and reuse"""
+
+    PREFIX = 'instructions ' * 400
+
+    def test_reuses_until_near_expiry(self):
+        """Test one cache per (model, prefix) refreshed before the TTL ends"""
+        post, clock = FakePost(), FakeClock()
+        cache = GeminiContextCache(post, 'https://api/v1beta/', 'key', ttl_seconds=600, clock=clock)
+
+        assert cache.get('gemini-2.5-flash', self.PREFIX) == 'cachedContents/c1'
+        assert cache.get('gemini-2.5-flash', self.PREFIX) == 'cachedContents/c1'
+        assert post.calls[0][0] == 'https://api/v1beta/cachedContents?key=key'
+        assert post.calls[0][1]['model'] == 'models/gemini-2.5-flash'
+
+        clock.now = 550
+        assert cache.get('gemini-2.5-flash', self.PREFIX) == 'cachedContents/c2'
+
+    def test_short_prefix_not_cached(self):
+        """Test prefixes below the minimum size are sent inline"""
+        post = FakePost()
+        cache = GeminiContextCache(post, 'https://api', 'key')
+
+        assert cache.get('gemini-2.5-flash', 'short prompt') is None
+        assert post.calls == []
+
+    def test_failure_remembered(self):
+        """Test a failed creation falls back inline without retrying every call"""
+        post = FakePost(status_code=400)
+        cache = GeminiContextCache(post, 'https://api', 'key')
+
+        assert cache.get('gemini-2.5-flash', self.PREFIX) is None
+        assert cache.get('gemini-2.5-flash', self.PREFIX) is None
+        assert len(post.calls) == 1
+
+    def test_creation_does_not_block_other_keys(self):
+        """Test the POST runs outside the lock and concurrent callers share it"""
+        release = threading.Event()
+        post = FakePost()
+
+        def slow_post(url, **kwargs):
+            if kwargs['json']['model'] == 'models/slow':
+                release.wait(5)
+            return post(url, **kwargs)
+
+        cache = GeminiContextCache(slow_post, 'https://api', 'key')
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get('slow', self.PREFIX)))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+
+        # Another model's cache is created while the slow POST is still in flight
+        assert cache.get('fast', self.PREFIX) == 'cachedContents/c1'
+
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert results == ['cachedContents/c2'] * 3
+        assert len(post.calls) == 2
+
+    def test_apply_prompt_prefix(self):
+        assert apply_prompt_prefix({}, 'p', 'cachedContents/c1') == {'cachedContent': 'cachedContents/c1'}
+        assert apply_prompt_prefix({}, 'p', None) == {'systemInstruction': {'parts': [{'text': 'p'}]}}
@@ -0,0 +1,112 @@
+"""
+Unit tests for Sentence Bank Index
+
+Tests that indexed scoring matches the per-sentence composite score and that
+the shared cache rebuilds only when a bank's signature changes.
+"""
+
+import pytest
+from modules.content.sentence_bank_index import (
+    SentenceBankIndex,
+    SentenceBankIndexCache,
+    strip_variables,
+)
+
+SENTENCES = [
+    {"id": 1, "category": "Opening", "text": "Excited to join {company_name} as {job_title}",
+     "tags": ["Communication", "marketing"]},
+    {"id": 2, "category": "Achievement", "text": "Grew email marketing revenue by 40%",
+     "tags": ["marketing", "analytics", "Marketing"]},
+    {"id": 3, "category": "Achievement", "text": "Led a team of designers",
+     "tags": ["leadership"]},
+    {"id": 4, "category": "Closing", "text": "", "tags": []},
+    {"id": 5, "category": "Closing", "text": "Company culture and team fit matter to me", "tags": None},
+]
+
+
+def reference_score(sentence, job_skills, job_keywords):
+    """Composite score as computed sentence by sentence in ContentManager"""
+    skill_score = 0.0
+    if job_skills and sentence.get("tags"):
+        skills = set(skill.lower() for skill in job_skills)
+        tags = set(tag.lower() for tag in sentence["tags"])
+        skill_score = len(skills & tags) / len(job_skills)
+
+    keyword_score = 0.0
+    text = sentence.get("text", "").lower()
+    if job_keywords and text:
+        processed = strip_variables(text)
+        keyword_score = sum(1 for keyword in job_keywords if keyword.lower() in processed) / len(job_keywords)
+
+    return min(skill_score, 1.0) * 0.7 + min(keyword_score, 1.0) * 0.3
+
+
+@pytest.mark.unit
+class TestSentenceBankIndex:
+    """Test indexed scoring and ranking"""
+
+    @pytest.mark.parametrize("job_skills,job_keywords", [
+        (["Marketing", "Analytics", "SQL"], ["marketing", "Team", "revenue", "team"]),
+        (["leadership"], []),
+        ([], ["company", "title"]),
+        ([], []),
+    ])
+    def test_scores_match_reference(self, job_skills, job_keywords):
+        """Test scores equal the per-sentence composite score"""
+        index = SentenceBankIndex(SENTENCES)
+
+        scores = index.score_all(job_skills, job_keywords)
+
+        assert scores == pytest.approx([reference_score(s, job_skills, job_keywords) for s in SENTENCES])
+
+    def test_variables_do_not_match_keywords(self):
+        """Test placeholder names are not matched as keywords"""
+        index = SentenceBankIndex(SENTENCES)
+
+        assert index.keyword_positions("job_title") == ()
+        assert index.keyword_positions("Company") == (4,)
+
+    def test_ranked_keeps_bank_order_on_ties(self):
+        """Test ranking is stable and restricted to the given positions"""
+        index = SentenceBankIndex(SENTENCES)
+
+        ranked = index.ranked(["leadership"], ["team"], limit=3)
+        closing = index.ranked(["leadership"], ["team"], positions=index.category_positions["Closing"])
+
+        assert [s["id"] for s in ranked] == [3, 5, 1]
+        assert [s["id"] for s in closing] == [5, 4]
+        ranked[0]["text"] = "changed"
+        assert SENTENCES[2]["text"] == "Led a team of designers"
+
+
+@pytest.mark.unit
+class TestSentenceBankIndexCache:
+    """Test rebuilds on bank changes"""
+
+    def test_rebuilds_only_on_signature_change(self):
+        clock = [0.0]
+        signature = ["v1"]
+        loads = []
+
+        def fetch_rows(table):
+            loads.append(table)
+            return list(SENTENCES)
+
+        cache = SentenceBankIndexCache(fetch_rows, lambda table: signature[0],
+                                       check_interval=30.0, clock=lambda: clock[0])
+
+        first = cache.get("sentence_bank_resume")
+        clock[0] = 60.0
+        assert cache.get("sentence_bank_resume") is first
+
+        signature[0] = "v2"
+        assert cache.get("sentence_bank_resume") is first  # within check_interval
+        cache.invalidate()
+        assert cache.get("sentence_bank_resume") is not first
+        assert loads == ["sentence_bank_resume", "sentence_bank_resume"]
+
+    def test_unknown_table_rejected(self):
+        cache = SentenceBankIndexCache(lambda table: [], lambda table: None)
+
+        with pytest.raises(ValueError):
+            cache.get("users")
@@ -0,0 +1,154 @@
+"""
+Unit tests for Sentence Bulk Loader
+
+Tests chunked streaming, in-chunk deduplication, COPY encoding and result
+counting against a fake psycopg2 connection that emulates the staging table
+and the content hash index.
+"""
+
+import pytest
+from modules.content.copywriting_evaluator.sentence_bulk_loader import (
+    SentenceBulkLoader,
+    _copy_value,
+)
+
+
+class FakeInvalidColumnReference(Exception):
+    pgcode = '42P10'
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._result = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.statements.append(query)
+        if 'INSERT INTO' not in query:
+            return
+        if self.conn.missing_index and 'ON CONFLICT' in query:
+            raise FakeInvalidColumnReference(
+                "there is no unique or exclusion constraint matching the ON CONFLICT specification"
+            )
+
+        inserted = []
+        for content_text in self.conn.staging:
+            if content_text not in self.conn.table:
+                self.conn.table[content_text] = f"id-{len(self.conn.table)}"
+                inserted.append(self.conn.table[content_text])
+        self._result = (len(self.conn.staging), len(inserted), inserted)
+
+    def copy_expert(self, sql, buffer):
+        self.conn.copy_sizes.append(0)
+        for line in buffer.read().splitlines():
+            self.conn.staging.append(line.split('\t')[0])
+            self.conn.copy_sizes[-1] += 1
+
+    def fetchone(self):
+        return self._result
+
+
+class FakeConnection:
+    """Holds a content_text -> id 'table' and a staging list cleared on commit"""
+
+    def __init__(self, existing=(), missing_index=False):
+        self.table = {content: f"existing-{i}" for i, content in enumerate(existing)}
+        self.staging = []
+        self.statements = []
+        self.copy_sizes = []
+        self.missing_index = missing_index
+        self.commits = 0
+        self.rollbacks = 0
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+        self.staging = []
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.staging = []
+
+    def close(self):
+        self.closed = True
+
+
+def make_rows(texts):
+    return ({'content_text': text, 'tone': None, 'variable': False} for text in texts)
+
+
+@pytest.mark.unit
+class TestSentenceBulkLoader:
+    """Test chunked bulk loading"""
+
+    def test_chunks_and_counts(self):
+        """Test rows are loaded in bounded chunks with counts from the merge"""
+        conn = FakeConnection(existing=['sentence 3'])
+        loader = SentenceBulkLoader(connection_factory=lambda: conn, chunk_size=4)
+
+        texts = [f"sentence {i}" for i in range(10)]
+        result = loader.load(make_rows(texts), 'sentence_bank_cover_letter')
+
+        assert result['rows_processed'] == 10
+        assert result['chunk_count'] == 3
+        assert conn.copy_sizes == [4, 4, 2]
+        assert result['inserted_count'] == 9
+        assert result['duplicate_count'] == 1
+        assert len(result['sentence_ids']) == 9
+        assert conn.closed
+
+    def test_in_chunk_duplicates_are_not_staged(self):
+        """Test repeated content within a chunk is dropped before COPY"""
+        conn = FakeConnection()
+        loader = SentenceBulkLoader(connection_factory=lambda: conn, chunk_size=100)
+
+        result = loader.load(make_rows(['a', 'b', 'a', 'a', 'c']), 'sentence_bank_resume')
+
+        assert conn.copy_sizes == [3]
+        assert result['inserted_count'] == 3
+        assert result['duplicate_count'] == 2
+
+    def test_cross_chunk_duplicates_resolved_by_merge(self):
+        """Test duplicates in different chunks are skipped by the conflict clause"""
+        conn = FakeConnection()
+        loader = SentenceBulkLoader(connection_factory=lambda: conn, chunk_size=2)
+
+        result = loader.load(make_rows(['a', 'b', 'a', 'c']), 'sentence_bank_resume')
+
+        assert result['inserted_count'] == 3
+        assert result['duplicate_count'] == 1
+
+    def test_missing_index_falls_back_to_anti_join(self):
+        """Test loading still works before migration 005 is applied"""
+        conn = FakeConnection(missing_index=True)
+        loader = SentenceBulkLoader(connection_factory=lambda: conn, chunk_size=2)
+
+        result = loader.load(make_rows(['a', 'b', 'c']), 'sentence_bank_cover_letter')
+
+        assert result['inserted_count'] == 3
+        assert result['error_count'] == 0
+        assert conn.rollbacks == 1
+        assert 'WHERE NOT EXISTS' in conn.statements[-1]
+
+    def test_unknown_table_rejected(self):
+        """Test only the sentence bank tables are accepted"""
+        loader = SentenceBulkLoader(connection_factory=FakeConnection)
+
+        with pytest.raises(ValueError):
+            loader.load([], 'users')
+
+    def test_copy_value_encoding(self):
+        """Test NULLs and COPY control characters are encoded"""
+        assert _copy_value(None) == '\\N'
+        assert _copy_value(True) == 'True'
+        assert _copy_value(0.5) == '0.5'
+        assert _copy_value('a\tb\nc\\d\r') == 'a\\tb\\nc\\\\d\\r'
@@ -0,0 +1,232 @@
+"""
+Unit tests for Shared Circuit Breaker State
+
+Tests that a breaker tripped in one process short-circuits the others, that
+only one process probes recovery, that recovery closes every breaker, the
+failure window shared across processes, and the lock-free CLOSED path.
+Separate SharedCircuitState instances on one file stand in for processes,
+plus one real forked process.
+"""
+
+import multiprocessing
+import threading
+
+import pytest
+from modules.resilience.circuit_breaker_manager import (
+    CircuitBreaker, CircuitBreakerConfig, CircuitBreakerError, CircuitBreakerManager, CircuitState
+)
+from modules.resilience import shared_circuit_state
+from modules.resilience.shared_circuit_state import (
+    STATE_OPEN, SharedCircuitState, SharedCircuitStateStore
+)
+
+
+def fail():
+    raise ConnectionError("service down")
+
+
+def make_breaker(path, **overrides):
+    """A breaker as one process would hold it"""
+    settings = dict(failure_threshold=2, failure_rate_threshold=1.0, timeout_duration=60.0,
+                    success_threshold=1, shared_refresh_interval=0.0)
+    settings.update(overrides)
+    return CircuitBreaker("gemini", CircuitBreakerConfig(**settings), SharedCircuitState(path))
+
+
+def trip(breaker, times=2):
+    for _ in range(times):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / "gemini.breaker")
+
+
+def trip_in_child(path):
+    breaker = make_breaker(path)
+    for _ in range(2):
+        try:
+            breaker.call(fail)
+        except ConnectionError:
+            pass
+
+
+@pytest.mark.unit
+class TestSharedCircuitState:
+    """Test state published across processes"""
+
+    def test_trip_short_circuits_other_processes(self, state_path):
+        worker_a = make_breaker(state_path)
+        worker_b = make_breaker(state_path)
+        calls = []
+
+        trip(worker_a)
+
+        with pytest.raises(CircuitBreakerError):
+            worker_b.call(lambda: calls.append(1))
+        assert calls == []
+        assert worker_b.get_state() == CircuitState.OPEN
+        assert worker_b.get_metrics()["circuit_opens"] == 0
+
+    def test_trip_in_forked_process(self, state_path):
+        context = multiprocessing.get_context("fork")
+        child = context.Process(target=trip_in_child, args=(state_path,))
+        child.start()
+        child.join(10)
+
+        parent = make_breaker(state_path)
+        assert SharedCircuitState(state_path).read().state == STATE_OPEN
+        with pytest.raises(CircuitBreakerError):
+            parent.call(lambda: "ok")
+
+    def test_single_recovery_probe(self, state_path):
+        """Test only one process goes HALF_OPEN after the timeout"""
+        worker_a = make_breaker(state_path, timeout_duration=0.0, half_open_timeout=30.0)
+        worker_b = make_breaker(state_path, timeout_duration=0.0, half_open_timeout=30.0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_probe():
+            started.set()
+            release.wait(5)
+            return "ok"
+
+        trip(worker_a)
+        probe = threading.Thread(target=worker_a.call, args=(slow_probe,))
+        probe.start()
+        started.wait(5)
+
+        with pytest.raises(CircuitBreakerError):
+            worker_b.call(lambda: "ok")
+
+        release.set()
+        probe.join(5)
+        assert worker_a.get_state() == CircuitState.CLOSED
+        assert worker_b.call(lambda: "ok") == "ok"
+        assert worker_b.get_state() == CircuitState.CLOSED
+
+    def test_failed_probe_reopens_everywhere(self, state_path):
+        worker_a = make_breaker(state_path, timeout_duration=0.0)
+        worker_b = make_breaker(state_path, timeout_duration=60.0)
+        trip(worker_a)
+
+        with pytest.raises(ConnectionError):
+            worker_a.call(fail)  # Probe fails
+
+        assert worker_a.get_state() == CircuitState.OPEN
+        with pytest.raises(CircuitBreakerError):
+            worker_b.call(lambda: "ok")
+
+    def test_failure_window_shared(self, state_path):
+        """Test failures spread across processes trip the failure rate"""
+        config = dict(failure_threshold=100, failure_rate_threshold=0.5, minimum_calls_for_rate=4)
+        worker_a = make_breaker(state_path, **config)
+        worker_b = make_breaker(state_path, **config)
+
+        trip(worker_a, times=2)
+        assert worker_a.get_state() == CircuitState.CLOSED
+        trip(worker_b, times=2)
+
+        assert worker_b.get_state() == CircuitState.OPEN
+        with pytest.raises(CircuitBreakerError):
+            worker_a.call(lambda: "ok")
+
+    def test_read_retries_when_writer_overlaps_copy(self, state_path, monkeypatch):
+        """Test a write landing while the fields are copied is not returned torn"""
+        reader, writer = SharedCircuitState(state_path), SharedCircuitState(state_path)
+        fields = shared_circuit_state._FIELDS
+        copies = []
+
+        class OverlappingFields:
+            pack_into = staticmethod(fields.pack_into)
+
+            def unpack_from(self, buffer, offset):
+                torn = fields.unpack_from(buffer, offset)
+                if not copies:
+                    writer.publish(STATE_OPEN, open_until=123.0)
+                copies.append(torn)
+                return torn
+
+        monkeypatch.setattr(shared_circuit_state, "_FIELDS", OverlappingFields())
+        snapshot = reader.read()
+
+        assert len(copies) == 2
+        assert snapshot.state == STATE_OPEN
+        assert snapshot.open_until == 123.0
+
+    def test_manager_uses_shared_store(self, tmp_path):
+        store = SharedCircuitStateStore(str(tmp_path))
+        first = CircuitBreakerManager(shared_store=store)
+        second = CircuitBreakerManager(shared_store=store)
+        first.configure_service("gmail", CircuitBreakerConfig(failure_threshold=1, shared_refresh_interval=0.0))
+        second.configure_service("gmail", CircuitBreakerConfig(shared_refresh_interval=0.0))
+
+        with pytest.raises(ConnectionError):
+            first.execute_with_breaker("gmail", fail)
+
+        with pytest.raises(CircuitBreakerError):
+            second.execute_with_breaker("gmail", lambda: "ok")
+        assert (tmp_path / "gmail.breaker").exists()
+
+
+class CountingLock:
+    def __init__(self, lock):
+        self.lock = lock
+        self.acquisitions = 0
+
+    def __enter__(self):
+        self.acquisitions += 1
+        return self.lock.__enter__()
+
+    def __exit__(self, *exc):
+        return self.lock.__exit__(*exc)
+
+
+@pytest.mark.unit
+class TestClosedFastPath:
+    """Test CLOSED-state calls skip the breaker lock"""
+
+    def test_successes_take_no_lock(self):
+        breaker = CircuitBreaker("svc")
+        breaker.call(lambda: "warm up")  # Registers this thread's tally
+        breaker._lock = CountingLock(breaker._lock)
+
+        for _ in range(100):
+            breaker.call(lambda: "ok")
+
+        assert breaker._lock.acquisitions == 0
+        assert breaker.get_metrics()["successful_calls"] == 101
+
+    def test_concurrent_successes_counted_exactly(self):
+        breaker = CircuitBreaker("svc")
+
+        def worker():
+            for _ in range(1000):
+                breaker.call(lambda: "ok")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = breaker.get_metrics()
+        assert metrics["total_calls"] == 8000
+        assert metrics["consecutive_successes"] == 8000
+        assert metrics["last_success"] is not None
+
+    def test_failure_resets_consecutive_successes(self):
+        breaker = CircuitBreaker("svc", CircuitBreakerConfig(failure_threshold=5))
+        for _ in range(3):
+            breaker.call(lambda: "ok")
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+        breaker.call(lambda: "ok")
+        breaker.call(lambda: "ok")
+
+        metrics = breaker.get_metrics()
+        assert metrics["consecutive_successes"] == 2
+        assert metrics["consecutive_failures"] == 0
+        assert metrics["failure_rate"] == pytest.approx(1 / 6)
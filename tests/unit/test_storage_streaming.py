@@ -0,0 +1,253 @@
+"""
+Unit tests for Streaming Storage and Write-Behind Replication
+
+Tests local open_write/open_read (atomic replace, aborted writes), the default
+spooled open_write of the base class, and the write-behind backend's
+immediate local saves, background replication, retries, coalescing of
+re-saved files and metrics, using an in-memory remote backend.
+"""
+
+import gc
+import io
+import shutil
+import threading
+
+import pytest
+from modules.storage.local_storage import LocalStorageBackend
+from modules.storage.storage_backend import StorageBackend
+from modules.storage.write_behind_storage import WriteBehindStorageBackend
+
+
+class MemoryBackend(StorageBackend):
+    """In-memory remote backend; fails the first `failures` uploads"""
+
+    def __init__(self, failures=0, gate=None):
+        super().__init__()
+        self.files = {}
+        self.failures = failures
+        self.gate = gate
+        self.uploads = []
+        self.writers = []
+
+    def open_write(self, filename, metadata=None):
+        self.writers.append(filename)
+        return super().open_write(filename, metadata)
+
+    def save(self, filename, content, metadata=None):
+        if self.gate:
+            self.gate.wait(5)
+        self.uploads.append(filename)
+        if self.failures:
+            self.failures -= 1
+            raise IOError("remote unavailable")
+        self.files[filename] = content
+        return {"file_path": f"remote/{filename}", "filename": filename,
+                "storage_type": "memory", "file_size": len(content)}
+
+    def get(self, filename):
+        if filename not in self.files:
+            raise FileNotFoundError(filename)
+        return self.files[filename]
+
+    def delete(self, filename):
+        return self.files.pop(filename, None) is not None
+
+    def exists(self, filename):
+        return filename in self.files
+
+    def list(self, prefix=None, pattern=None):
+        return sorted(f for f in self.files if not prefix or f.startswith(prefix))
+
+
+@pytest.fixture
+def local(tmp_path):
+    return LocalStorageBackend(base_path=str(tmp_path / "storage"))
+
+
+def make_write_behind(local, remote, **kwargs):
+    kwargs.setdefault("retry_base_delay", 0.01)
+    return WriteBehindStorageBackend(local, remote, **kwargs)
+
+
+@pytest.mark.unit
+class TestLocalStreaming:
+    """Test local streaming reads and writes"""
+
+    def test_round_trip(self, local):
+        content = b"x" * 300000
+
+        with local.open_write("resume.docx") as writer:
+            shutil.copyfileobj(io.BytesIO(content), writer, 65536)
+
+        assert writer.result["file_size"] == len(content)
+        with local.open_read("resume.docx") as reader:
+            assert reader.read() == content
+
+    def test_file_appears_only_on_close(self, local):
+        """Test readers never see a partially written file"""
+        writer = local.open_write("resume.docx")
+        writer.write(b"partial")
+
+        assert not local.exists("resume.docx")
+        assert local.list() == []
+
+        writer.close()
+        assert local.get("resume.docx") == b"partial"
+
+    def test_aborted_write_keeps_existing_file(self, local):
+        local.save("resume.docx", b"original")
+
+        with pytest.raises(RuntimeError):
+            with local.open_write("resume.docx") as writer:
+                writer.write(b"half")
+                raise RuntimeError("render failed")
+
+        assert local.get("resume.docx") == b"original"
+        assert list(local.base_path.iterdir()) == [local.base_path / "resume.docx"]
+
+    def test_open_read_missing(self, local):
+        with pytest.raises(FileNotFoundError):
+            local.open_read("missing.docx")
+
+    def test_unclosed_writer_is_discarded(self, local):
+        """Test a writer dropped without close() aborts instead of committing"""
+        local.save("resume.docx", b"original")
+
+        writer = local.open_write("resume.docx")
+        writer.write(b"partial")
+        del writer
+
+        assert local.get("resume.docx") == b"original"
+
+    def test_default_open_write_spools_to_save(self):
+        """Test backends without native streaming get open_write via save()"""
+        remote = MemoryBackend()
+
+        with remote.open_write("letter.docx") as writer:
+            writer.write(b"a")
+            writer.write(b"b")
+
+        assert remote.files == {"letter.docx": b"ab"}
+        assert remote.open_read("letter.docx").read() == b"ab"
+
+
+@pytest.mark.unit
+class TestWriteBehindStorage:
+    """Test local-first saves with background replication"""
+
+    def test_save_replicates_in_background(self, local):
+        remote = MemoryBackend()
+        storage = make_write_behind(local, remote)
+
+        result = storage.save("resume.docx", b"content")
+
+        assert result["replication_status"] == "pending"
+        assert local.get("resume.docx") == b"content"
+        assert storage.flush(timeout=5)
+        assert remote.files == {"resume.docx": b"content"}
+        status = storage.get_replication_status("resume.docx")
+        assert status["status"] == "uploaded"
+        assert status["remote"]["file_path"] == "remote/resume.docx"
+        storage.close()
+
+    def test_save_does_not_wait_for_upload(self, local):
+        """Test save returns while the remote upload is blocked"""
+        gate = threading.Event()
+        remote = MemoryBackend(gate=gate)
+        storage = make_write_behind(local, remote)
+
+        storage.save("resume.docx", b"content")
+
+        assert storage.get_replication_stats()["uploaded"] == 0
+        gate.set()
+        assert storage.flush(timeout=5)
+        storage.close()
+
+    def test_failed_uploads_retried(self, local):
+        remote = MemoryBackend(failures=2)
+        storage = make_write_behind(local, remote)
+
+        storage.save("resume.docx", b"content")
+        storage.flush(timeout=5)
+
+        stats = storage.get_replication_stats()
+        assert stats["uploaded"] == 1
+        assert stats["retries"] == 2
+        assert stats["bytes_uploaded"] == len(b"content")
+        assert storage.get_replication_status("resume.docx")["attempts"] == 3
+        storage.close()
+
+    def test_gives_up_after_max_attempts(self, local):
+        """Test a file is marked failed, then uploaded by retry_failed()"""
+        remote = MemoryBackend(failures=3)
+        storage = make_write_behind(local, remote, max_attempts=2)
+
+        storage.save("resume.docx", b"content")
+        storage.flush(timeout=5)
+
+        assert storage.get_replication_stats()["failed"] == 1
+        assert "remote unavailable" in storage.get_replication_status("resume.docx")["last_error"]
+
+        assert storage.retry_failed() == 1
+        storage.flush(timeout=5)
+        assert remote.files == {"resume.docx": b"content"}
+        storage.close()
+
+    def test_resave_during_upload_uploads_latest(self, local):
+        gate = threading.Event()
+        remote = MemoryBackend(gate=gate)
+        storage = make_write_behind(local, remote)
+
+        storage.save("resume.docx", b"v1")
+        while storage.get_replication_stats()["uploading"] == 0:
+            pass
+        storage.save("resume.docx", b"v2")
+        gate.set()
+        storage.flush(timeout=5)
+
+        assert remote.files["resume.docx"] == b"v2"
+        storage.close()
+
+    def test_streamed_write_and_remote_fallback(self, local):
+        remote = MemoryBackend()
+        remote.files["old.docx"] = b"archived"
+        storage = make_write_behind(local, remote)
+
+        with storage.open_write("resume.docx") as writer:
+            writer.write(b"streamed")
+        storage.flush(timeout=5)
+
+        assert writer.result["replication_status"] == "pending"
+        assert remote.files["resume.docx"] == b"streamed"
+        assert storage.get("old.docx") == b"archived"
+        assert storage.list() == ["old.docx", "resume.docx"]
+        storage.close()
+
+    def test_replicate_missing(self, local):
+        local.save("a.docx", b"a")
+        local.save("b.docx", b"b")
+        remote = MemoryBackend()
+        remote.files["a.docx"] = b"a"
+        storage = make_write_behind(local, remote)
+
+        assert storage.replicate_missing() == 1
+        storage.flush(timeout=5)
+        assert remote.uploads == ["b.docx"]
+        storage.close()
+
+    def test_missing_local_file_keeps_remote_copy(self, local):
+        """Test a local file removed before its retry never overwrites the remote copy"""
+        remote = MemoryBackend(failures=1)
+        remote.files["ghost.docx"] = b"archived"
+        storage = make_write_behind(local, remote, retry_base_delay=0.5)
+
+        storage.save("ghost.docx", b"content")
+        while storage.get_replication_stats()["retries"] == 0:
+            pass
+        local.delete("ghost.docx")
+        storage.close(timeout=5)
+        gc.collect()
+
+        assert remote.writers == ["ghost.docx"]
+        assert remote.files == {"ghost.docx": b"archived"}
+        assert storage.get_replication_status("ghost.docx")["status"] == "failed"
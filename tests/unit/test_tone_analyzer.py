@@ -0,0 +1,105 @@
+"""
+Unit tests for Tone Analyzer
+
+Tests that the distance-matrix scoring matches the pairwise definitions and
+that the sequence optimizers find the optimum found by brute force.
+"""
+
+import itertools
+import random
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from modules.content.tone_analyzer import TONES, ToneAnalyzer
+
+
+@pytest.fixture
+def analyzer():
+    with patch("modules.content.tone_analyzer.DatabaseClient"):
+        return ToneAnalyzer()
+
+
+def make_sentences(rng, count, tones=TONES + ["Unknown"]):
+    return [{"text": f"s{i}", "tone": rng.choice(tones), "tone_strength": round(rng.random(), 2)}
+            for i in range(count)]
+
+
+def travel(analyzer, sentences):
+    return sum(analyzer.calculate_tone_jump_score(a, b) for a, b in zip(sentences, sentences[1:]))
+
+
+@pytest.mark.unit
+class TestToneScoring:
+    """Test matrix-based tone jump scoring"""
+
+    def test_matrix_matches_pairwise_distances(self, analyzer):
+        matrix = analyzer.get_distance_matrix()
+
+        for tone1, tone2 in itertools.product(TONES + ["Unknown", "Other"], repeat=2):
+            assert matrix[analyzer._tone_code(tone1), analyzer._tone_code(tone2)] == \
+                analyzer.get_tone_distance(tone1, tone2)
+
+    def test_document_analysis_matches_pairwise(self, analyzer):
+        sentences = make_sentences(random.Random(7), 40)
+
+        analysis = analyzer.analyze_document_tone(sentences)
+
+        expected = [analyzer.calculate_tone_jump_score(a, b) for a, b in zip(sentences, sentences[1:])]
+        assert analysis["tone_jump_scores"] == expected
+        assert analysis["total_tone_travel"] == pytest.approx(sum(expected))
+
+
+@pytest.mark.unit
+class TestSequenceOptimization:
+    """Test the dynamic programming optimizers against brute force"""
+
+    def test_optimal_tone_sequence_is_exact(self, analyzer):
+        rng = random.Random(3)
+        for _ in range(5):
+            tones = [rng.choice(TONES) for _ in range(6)]
+
+            sequence = analyzer.get_optimal_tone_sequence(tones)
+
+            def cost(order):
+                return sum(analyzer.get_tone_distance(a, b) for a, b in zip(order, order[1:]))
+
+            best = min(cost([tones[0]] + list(p)) for p in itertools.permutations(tones[1:]))
+            assert sequence[0] == tones[0]
+            assert sorted(sequence) == sorted(tones)
+            assert cost(sequence) == pytest.approx(best)
+
+    def test_select_coherent_sequence_minimizes_travel(self, analyzer):
+        rng = random.Random(11)
+        sections = [make_sentences(rng, 5) for _ in range(4)]
+
+        result = analyzer.select_coherent_sequence(sections)
+
+        best = min(travel(analyzer, list(choice)) for choice in itertools.product(*sections))
+        assert [s in section for s, section in zip(result["sentences"], sections)] == [True] * 4
+        assert result["analysis"]["total_tone_travel"] == pytest.approx(best)
+        assert result["objective"] == pytest.approx(-best)
+
+    def test_relevance_trade_off(self, analyzer):
+        rng = random.Random(5)
+        sections = [make_sentences(rng, 4) for _ in range(3)]
+        for section in sections:
+            for sentence in section:
+                sentence["score"] = rng.random()
+
+        result = analyzer.select_coherent_sequence(sections, relevance_key="score", coherence_weight=0.5)
+
+        def objective(choice):
+            return sum(s["score"] for s in choice) - 0.5 * travel(analyzer, list(choice))
+
+        best = max(objective(choice) for choice in itertools.product(*sections))
+        assert result["objective"] == pytest.approx(best)
+
+    def test_empty_sections_skipped(self, analyzer):
+        sentence = {"text": "a", "tone": "Warm", "tone_strength": 0.5}
+
+        result = analyzer.select_coherent_sequence([[], [sentence], []])
+
+        assert result["sentences"] == [sentence]
@@ -0,0 +1,84 @@
+"""
+Unit tests for the Compiled Typography Pipeline
+
+Golden outputs in tests/fixtures/typography_golden.json were produced by the
+rule-by-rule SmartTypography.apply_all; the compiled pipeline must reproduce
+them exactly and agree with the individual apply_* methods on random input.
+"""
+
+import itertools
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("docx")
+
+from modules.content.document_generation.smart_typography import SmartTypography
+from modules.content.document_generation.typography_pipeline import (
+    apply_typography_steps,
+    compile_typography_steps,
+)
+
+GOLDEN_PATH = Path(__file__).parent.parent / "fixtures" / "typography_golden.json"
+
+FRAGMENTS = list("aZb'\"- .,!?:;()[]{}<>\n\t1234/x%") + [
+    "--", "...", "Dr. ", "Mrs. ", "J. S", "10 MB", "50 %", "(TM)", "(c)", "degrees",
+    " degrees", "1/2", "3/4", "2/3", "May-June", "don't", "x'y'z", "DMD. ", "5 x 6",
+]
+
+
+def apply_rule_by_rule(typography, text):
+    """The original apply_all: each enabled rule group in sequence"""
+    for enabled, method in [
+        (typography.enable_smart_quotes, typography.apply_smart_quotes),
+        (typography.enable_smart_dashes, typography.apply_smart_dashes),
+        (typography.enable_smart_ellipsis, typography.apply_smart_ellipsis),
+        (typography.enable_non_breaking_spaces, typography.apply_non_breaking_spaces),
+        (typography.enable_special_characters, typography.apply_special_characters),
+    ]:
+        if enabled:
+            text = method(text)
+    return text
+
+
+@pytest.mark.unit
+class TestTypographyPipeline:
+    """Test the compiled pipeline reproduces the rule-by-rule output"""
+
+    def test_golden_outputs(self):
+        typography = SmartTypography()
+
+        for case in json.loads(GOLDEN_PATH.read_text(encoding="utf-8")):
+            assert typography.apply_all(case["input"])[0] == case["output"], case["input"]
+
+    @pytest.mark.parametrize("flags", list(itertools.product([True, False], repeat=5))[::3])
+    def test_random_text_matches_rule_by_rule(self, flags):
+        typography = SmartTypography(*flags)
+        rng = random.Random(sum(flags))
+
+        for _ in range(2000):
+            text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 14)))
+            assert typography.apply_all(text)[0] == apply_rule_by_rule(typography, text), repr(text)
+
+    def test_stats_unchanged(self):
+        typography = SmartTypography()
+
+        enhanced, stats = typography.apply_all('"Hello" -- 2020-2023...')
+
+        assert enhanced == "“Hello” — 2020–2023…"
+        assert stats["smart_quotes"] == 2
+        assert stats["transformations_applied"] == 5
+        stats["smart_quotes"] = 99
+        assert typography.apply_all('"Hello" -- 2020-2023...')[1]["smart_quotes"] == 2
+
+    def test_repeated_text_memoized(self):
+        steps = compile_typography_steps(True, True, True, True, True)
+        text = "Boilerplate -- repeated in every cover letter..."
+        apply_typography_steps(steps, text)
+        hits = apply_typography_steps.cache_info().hits
+
+        apply_typography_steps(steps, text)
+
+        assert apply_typography_steps.cache_info().hits == hits + 1
@@ -0,0 +1,142 @@
+"""
+Unit tests for Verdict Cache
+
+Tests text normalization, cache hits without processor calls, in-batch
+duplicate fan-out and prompt-version invalidation against a fake database.
+"""
+
+import asyncio
+import json
+
+import pytest
+from modules.content.copywriting_evaluator.verdict_cache import (
+    VerdictCache,
+    normalize_text,
+    prompt_version,
+    text_hash,
+)
+
+
+class FakeDatabase:
+    """Emulates copywriting_verdict_cache for the three statements the cache issues"""
+
+    def __init__(self):
+        self.rows = {}
+        self.queries = []
+
+    def execute_query(self, query, params=()):
+        self.queries.append(query)
+        if query.strip().startswith('SELECT'):
+            stage, version, model, *hashes = params
+            return [
+                {'text_hash': digest, 'verdict': self.rows[(digest, stage, version, model)]}
+                for digest in hashes if (digest, stage, version, model) in self.rows
+            ]
+        if query.strip().startswith('INSERT'):
+            for i in range(0, len(params), 5):
+                digest, stage, version, model, verdict = params[i:i + 5]
+                self.rows[(digest, stage, version, model)] = json.loads(verdict)
+        return []
+
+
+class FakeProcessor:
+    primary_model = 'gemini-2.5-flash'
+
+    def __init__(self, prompt_prefix='You are a truthfulness evaluator.', status='approved'):
+        self.prompt_prefix = prompt_prefix
+        self.status = status
+        self.calls = []
+
+    async def process_batch(self, sentences, session_id):
+        self.calls.append([s['id'] for s in sentences])
+        return [
+            {'id': s['id'], 'table_name': s['table_name'], 'status': self.status,
+             'model_used': self.primary_model, 'truthfulness_score': 0.9,
+             'evaluation_timestamp': '2026-10-18T00:00:00'}
+            for s in sentences
+        ]
+
+
+def make_sentences(*texts):
+    return [{'id': f"s{i}", 'table_name': 'sentence_bank_resume', 'content_text': text}
+            for i, text in enumerate(texts)]
+
+
+def run(cache, processor, sentences):
+    return asyncio.run(cache.process_batch('truthfulness', processor, sentences, 'session'))
+
+
+@pytest.mark.unit
+class TestVerdictCache:
+    """Test cache lookups around stage processors"""
+
+    def test_normalization(self):
+        """Test case and whitespace differences hash the same"""
+        assert normalize_text('  Led  a\tTEAM ') == 'led a team'
+        assert text_hash('Led a team') == text_hash('led  a team ')
+        assert text_hash('Led a team') != text_hash('Led a team.')
+
+    def test_hits_skip_processor(self):
+        """Test a second batch with the same texts makes no processor call"""
+        db = FakeDatabase()
+        cache = VerdictCache(db)
+        processor = FakeProcessor()
+
+        first = run(cache, processor, make_sentences('Led a team', 'Shipped a product'))
+        second = run(cache, processor, [
+            {'id': 'new-1', 'table_name': 'sentence_bank_cover_letter', 'content_text': 'led a  team'}
+        ])
+
+        assert first['cache_hits'] == 0
+        assert second['cache_hits'] == 1
+        assert processor.calls == [['s0', 's1']]
+        assert second['results'][0]['id'] == 'new-1'
+        assert second['results'][0]['table_name'] == 'sentence_bank_cover_letter'
+        assert second['results'][0]['status'] == 'approved'
+        assert 'evaluation_timestamp' not in second['results'][0]
+        assert cache.get_stats()['hit_rate'] == pytest.approx(33.3)
+
+    def test_batch_duplicates_sent_once(self):
+        """Test repeated texts in one batch are evaluated once and fanned out"""
+        cache = VerdictCache(FakeDatabase())
+        processor = FakeProcessor()
+
+        result = run(cache, processor, make_sentences('Led a team', 'Led a Team', 'Other'))
+
+        assert processor.calls == [['s0', 's2']]
+        assert sorted(r['id'] for r in result['results']) == ['s0', 's1', 's2']
+        assert result['batch_duplicates'] == 1
+
+    def test_errors_not_cached(self):
+        """Test error verdicts are retried on the next run"""
+        cache = VerdictCache(FakeDatabase())
+        processor = FakeProcessor(status='error')
+
+        run(cache, processor, make_sentences('Led a team'))
+        run(cache, processor, make_sentences('Led a team'))
+
+        assert len(processor.calls) == 2
+
+    def test_prompt_change_invalidates(self):
+        """Test a different prompt prefix does not reuse old verdicts"""
+        db = FakeDatabase()
+        cache = VerdictCache(db)
+        run(cache, FakeProcessor(prompt_prefix='v1'), make_sentences('Led a team'))
+
+        processor = FakeProcessor(prompt_prefix='v2')
+        result = run(cache, processor, make_sentences('Led a team'))
+
+        assert result['cache_hits'] == 0
+        assert prompt_version(FakeProcessor('v1')) != prompt_version(FakeProcessor('v2'))
+
+    def test_lookup_failure_is_a_miss(self):
+        """Test database errors fall through to the processor"""
+        class BrokenDatabase:
+            def execute_query(self, query, params=()):
+                raise RuntimeError('relation "copywriting_verdict_cache" does not exist')
+
+        processor = FakeProcessor()
+        result = run(VerdictCache(BrokenDatabase()), processor, make_sentences('Led a team'))
+
+        assert len(result['results']) == 1
+        assert processor.calls == [['s0']]
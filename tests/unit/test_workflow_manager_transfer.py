@@ -0,0 +1,185 @@
+"""
+Unit tests for the set-based cleaned -> pre_analyzed_jobs transfer
+
+Tests batch deduplication, bulk company resolution, ON CONFLICT skipping and
+consumed-row marking against a fake session that emulates the three tables.
+"""
+
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+from modules.database.workflow_manager import WorkflowManager
+
+
+class FakeRow(tuple):
+    def __new__(cls, mapping):
+        row = super().__new__(cls, mapping.values())
+        row._mapping = mapping
+        return row
+
+
+class FakeResult:
+    def __init__(self, rows=()):
+        self._rows = [FakeRow(row) for row in rows]
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeSession:
+    """Emulates cleaned_job_scrapes, companies and the pre_analyzed_jobs dedup index"""
+
+    def __init__(self, cleaned, companies=(), existing_keys=()):
+        self.cleaned = cleaned
+        self.companies = {name: f"company-{i}" for i, name in enumerate(companies)}
+        self.pre_analyzed_keys = set(existing_keys)
+        self.statements = []
+        self.last_company_ids = []
+
+    def execute(self, clause, params=None):
+        query = str(clause)
+        self.statements.append(query)
+        params = params or {}
+
+        if query.strip().startswith('SELECT') and 'FROM cleaned_job_scrapes' in query:
+            pending = [row for row in self.cleaned if row.get('pre_analyzed_at') is None]
+            return FakeResult(
+                {k: v for k, v in row.items() if k != 'pre_analyzed_at'}
+                for row in pending[:params['batch_size']]
+            )
+
+        if 'FROM companies' in query:
+            return FakeResult(
+                {'id': company_id, 'name': name}
+                for name, company_id in self.companies.items()
+                if name.lower() in params['names']
+            )
+
+        if 'INSERT INTO companies' in query:
+            created = []
+            for name in params['names']:
+                self.companies[name] = f"company-{len(self.companies)}"
+                created.append({'id': self.companies[name], 'name': name})
+            return FakeResult(created)
+
+        if 'INSERT INTO pre_analyzed_jobs' in query:
+            inserted = []
+            i = 0
+            while f"deduplication_key_{i}" in params:
+                self.last_company_ids.append(params[f"company_id_{i}"])
+                if params[f"deduplication_key_{i}"] not in self.pre_analyzed_keys:
+                    self.pre_analyzed_keys.add(params[f"deduplication_key_{i}"])
+                    inserted.append({'cleaned_scrape_id': params[f"cleaned_scrape_id_{i}"]})
+                i += 1
+            return FakeResult(inserted)
+
+        if 'UPDATE cleaned_job_scrapes' in query:
+            for row in self.cleaned:
+                if row['cleaned_job_id'] in params['cleaned_job_ids']:
+                    row['pre_analyzed_at'] = 'now'
+            return FakeResult()
+
+        raise AssertionError(f"Unexpected query: {query}")
+
+
+class FakeDatabaseClient:
+    def __init__(self, session):
+        self.session = session
+
+    @contextmanager
+    def get_session(self):
+        yield self.session
+
+
+def cleaned_job(job_id, title, company='Acme', city='Edmonton'):
+    return {
+        'cleaned_job_id': job_id, 'job_title': title, 'company_name': company,
+        'location_city': city, 'location_province': 'AB', 'location_country': 'Canada',
+        'work_arrangement': None, 'salary_min': None, 'salary_max': None,
+        'salary_currency': None, 'salary_period': None, 'job_description': 'desc',
+        'requirements': None, 'benefits': None, 'industry': None, 'job_type': None,
+        'experience_level': None, 'posting_date': None, 'application_deadline': None,
+        'external_job_id': None, 'source_website': 'indeed', 'application_url': None,
+        'application_email': None, 'confidence_score': 0.9, 'pre_analyzed_at': None,
+    }
+
+
+def make_manager(session):
+    with patch('modules.database.workflow_manager.get_database_client',
+               return_value=FakeDatabaseClient(session)):
+        return WorkflowManager()
+
+
+@pytest.mark.unit
+class TestTransferCleanedToPreAnalyzed:
+    """Test the set-based transfer"""
+
+    def test_batch_and_existing_duplicates(self):
+        """Test in-batch repeats and existing keys are skipped but still consumed"""
+        session = FakeSession([
+            cleaned_job('c1', 'Marketing Manager'),
+            cleaned_job('c2', 'marketing manager '),
+            cleaned_job('c3', 'Data Analyst', company='Globex'),
+            cleaned_job('c4', 'Writer', company='Initech'),
+        ])
+        manager = make_manager(session)
+        session.pre_analyzed_keys.add(
+            manager._create_pre_analyzed_dedup_key('Writer', 'Initech', 'Edmonton', 'AB')
+        )
+
+        result = manager.transfer_cleaned_to_pre_analyzed(batch_size=10)
+
+        assert result['success'] is True
+        assert result['transferred'] == 2
+        assert result['duplicates_found'] == 2
+        assert result['processed'] == 4
+        assert all(row['pre_analyzed_at'] for row in session.cleaned)
+
+        # One insert statement for the whole batch
+        assert sum('INSERT INTO pre_analyzed_jobs' in q for q in session.statements) == 1
+
+    def test_consumed_rows_not_selected_again(self):
+        """Test a second run finds nothing once duplicates have been marked"""
+        session = FakeSession([cleaned_job('c1', 'Writer'), cleaned_job('c2', 'Writer')])
+        manager = make_manager(session)
+
+        manager.transfer_cleaned_to_pre_analyzed()
+        result = manager.transfer_cleaned_to_pre_analyzed()
+
+        assert result['transferred'] == 0
+        assert result['message'] == "No new cleaned job scrapes to process"
+
+    def test_companies_resolved_in_bulk(self):
+        """Test existing companies match case-insensitively and new ones are created once"""
+        session = FakeSession(
+            [
+                cleaned_job('c1', 'Writer', company='ACME'),
+                cleaned_job('c2', 'Editor', company='Globex'),
+                cleaned_job('c3', 'Designer', company='globex'),
+                cleaned_job('c4', 'Intern', company=None),
+            ],
+            companies=['Acme'],
+        )
+        manager = make_manager(session)
+
+        manager.transfer_cleaned_to_pre_analyzed()
+
+        assert sum('INSERT INTO companies' in q for q in session.statements) == 1
+        assert list(session.companies) == ['Acme', 'Globex']
+        assert session.last_company_ids == ['company-0', 'company-1', 'company-1', None]
+
+    def test_database_error_reported(self):
+        """Test SQL errors are returned as a failed result"""
+        from sqlalchemy.exc import SQLAlchemyError
+
+        class FailingSession(FakeSession):
+            def execute(self, clause, params=None):
+                raise SQLAlchemyError("connection lost")
+
+        manager = make_manager(FailingSession([]))
+
+        result = manager.transfer_cleaned_to_pre_analyzed()
+
+        assert result['success'] is False
+        assert result['transferred'] == 0
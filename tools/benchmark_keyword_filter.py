@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Keyword Filter Benchmark
+
+Compares the previous per-keyword regex search against the compiled
+KeywordMatcher over the seed sentence files in the repository root
+(marketing_automation_*.txt), replicated up to the requested sentence count.
+
+The keyword set is the seeded forbidden words plus words sampled from the
+corpus vocabulary so that a realistic fraction of sentences produce hits.
+Both implementations must return identical hits for every sentence.
+
+Usage:
+    python tools/benchmark_keyword_filter.py
+    python tools/benchmark_keyword_filter.py --sentences 50000 --keywords 500
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from modules.content.copywriting_evaluator.keyword_matcher import KeywordMatcher
+
+SEED_KEYWORDS = {'meticulous', 'meticulously'}
+EMPLOYER_TAG = re.compile(r'^\[[^\]]+\]\s*')
+
+
+def load_seed_sentences() -> list:
+    """Sentence lines from the seed files (headers and separators skipped)"""
+    sentences = []
+    for path in sorted(REPO_ROOT.glob('marketing_automation_*.txt')):
+        for line in path.read_text(encoding='utf-8').splitlines():
+            line = EMPLOYER_TAG.sub('', line.strip().lstrip('-•* '))
+            if len(line.split()) >= 5 and line.endswith('.'):
+                sentences.append(line)
+    return sentences
+
+
+def build_keywords(sentences: list, count: int, seed: int) -> set:
+    """Seeded forbidden words plus sampled corpus words and two-word phrases"""
+    rng = random.Random(seed)
+    words = sorted({word for sentence in sentences for word in re.findall(r'[a-z]{4,}', sentence.lower())})
+    keywords = set(SEED_KEYWORDS)
+    keywords.update(rng.sample(words, min(count // 2, len(words))))
+    while len(keywords) < count:
+        sentence = rng.choice(sentences).lower().split()
+        index = rng.randrange(len(sentence) - 1)
+        keywords.add(' '.join(sentence[index:index + 2]).strip('.,;:'))
+    return keywords
+
+
+def per_keyword_search(text: str, keywords: set) -> list:
+    """Previous KeywordFilter._contains_keyword implementation"""
+    text_lower = text.lower()
+    found_keywords = []
+    for keyword in keywords:
+        pattern = r'\b' + re.escape(keyword) + r'\b'
+        if re.search(pattern, text_lower):
+            found_keywords.append(keyword)
+    return found_keywords
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark keyword filter matching')
+    parser.add_argument('--sentences', type=int, default=20000, help='Sentences to filter')
+    parser.add_argument('--keywords', type=int, default=200, help='Active keyword count')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for keyword sampling')
+    args = parser.parse_args()
+
+    corpus = load_seed_sentences()
+    if not corpus:
+        print("No seed sentences found in the repository root")
+        sys.exit(1)
+
+    sentences = (corpus * (args.sentences // len(corpus) + 1))[:args.sentences]
+    keywords = build_keywords(corpus, args.keywords, args.seed)
+
+    start = time.perf_counter()
+    legacy_hits = [per_keyword_search(sentence, keywords) for sentence in sentences]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(keywords)
+    compile_seconds = time.perf_counter() - start
+    compiled_hits = [matcher.find_all(sentence.lower()) for sentence in sentences]
+    compiled_seconds = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(legacy_hits, compiled_hits) if set(a) != set(b))
+    rejected = sum(1 for hits in compiled_hits if hits)
+
+    print(f"{len(sentences)} sentences ({len(corpus)} unique seeds), {len(keywords)} keywords, "
+          f"{rejected} sentences with hits")
+    print(f"  per-keyword regex   {legacy_seconds:8.3f}s  {len(sentences) / legacy_seconds:>12,.0f} sentences/sec")
+    print(f"  compiled matcher    {compiled_seconds:8.3f}s  {len(sentences) / compiled_seconds:>12,.0f} sentences/sec"
+          f"  (compile {compile_seconds * 1000:.1f} ms)")
+    print(f"  speedup             {legacy_seconds / compiled_seconds:8.1f}x")
+    print(f"  mismatched results  {mismatches}")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
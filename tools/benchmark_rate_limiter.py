@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Benchmark
+
+Measures rate limit checks/sec under thread contention for the limiter
+engine (GCRA and sliding window counter, in-memory and shared SQLite stores)
+against the original timestamp-list sliding window that link tracking used.
+Keys are drawn from a fixed pool so most checks hit existing state, with a
+few hot keys taking a large share of traffic.
+
+Usage:
+    python tools/benchmark_rate_limiter.py
+    python tools/benchmark_rate_limiter.py --threads 16 --checks 20000 --keys 5000
+    python tools/benchmark_rate_limiter.py --limit 5000  # old cost grows with the limit
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.security.limiter_engine import (
+    GCRALimiter,
+    MemoryLimiterStore,
+    SlidingWindowCounterLimiter,
+    SQLiteLimiterStore,
+)
+
+
+class TimestampListLimiter:
+    """Reference implementation: the list-of-timestamps window link tracking used"""
+
+    def __init__(self, limit: int, window: int):
+        self.limit = limit
+        self.window = window
+        self.storage = {}
+        self.lock = threading.Lock()
+
+    def check(self, key: str) -> bool:
+        with self.lock:
+            now = time.time()
+            timestamps = [t for t in self.storage.get(key, []) if now - t < self.window]
+            self.storage[key] = timestamps
+            if len(timestamps) >= self.limit:
+                return False
+            timestamps.append(now)
+            return True
+
+
+def build_keys(count: int, pool: int, seed: int) -> list:
+    """20% of traffic goes to 10 hot keys, the rest spreads over the pool"""
+    rng = random.Random(seed)
+    return [
+        f"hot:{rng.randrange(10)}" if rng.random() < 0.2 else f"ip:10.0.{rng.randrange(pool) // 256}.{rng.randrange(256)}"
+        for _ in range(count)
+    ]
+
+
+def run(check, keys: list, threads: int) -> float:
+    """Run every key through check() on each thread, return checks/sec"""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for key in keys:
+            check(key)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return len(keys) * threads / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark rate limit checks under contention')
+    parser.add_argument('--threads', type=int, default=8, help='Concurrent checking threads')
+    parser.add_argument('--checks', type=int, default=20000, help='Checks per thread')
+    parser.add_argument('--keys', type=int, default=2000, help='Distinct client keys')
+    parser.add_argument('--limit', type=int, default=100, help='Requests allowed per window')
+    parser.add_argument('--window', type=int, default=3600, help='Window in seconds')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the key mix')
+    parser.add_argument('--skip-sqlite', action='store_true', help='Skip the shared SQLite store')
+    args = parser.parse_args()
+
+    keys = build_keys(args.checks, args.keys, args.seed)
+
+    candidates = [
+        ('timestamp list (old)', lambda: TimestampListLimiter(args.limit, args.window).check),
+        ('GCRA, memory', lambda: GCRALimiter(args.limit, args.window, store=MemoryLimiterStore()).check),
+        ('sliding counter, memory', lambda: SlidingWindowCounterLimiter(args.limit, args.window, store=MemoryLimiterStore()).check),
+    ]
+
+    tmpdir = tempfile.mkdtemp(prefix='limiter_bench_')
+    if not args.skip_sqlite:
+        candidates += [
+            ('GCRA, shared SQLite', lambda: GCRALimiter(
+                args.limit, args.window, store=SQLiteLimiterStore(os.path.join(tmpdir, 'gcra.sqlite3'))).check),
+            ('sliding counter, SQLite', lambda: SlidingWindowCounterLimiter(
+                args.limit, args.window, store=SQLiteLimiterStore(os.path.join(tmpdir, 'swc.sqlite3'))).check),
+        ]
+
+    print(f"{args.threads} threads x {args.checks} checks over {args.keys} keys, limit {args.limit}/{args.window}s")
+    baseline = None
+    for label, factory in candidates:
+        rate = run(factory(), keys, args.threads)
+        baseline = baseline or rate
+        print(f"  {label:<26} {rate:>12,.0f} checks/sec  ({rate / baseline:.0%} of old)")
+
+
+if __name__ == '__main__':
+    main()